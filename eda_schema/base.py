@@ -37,6 +37,14 @@ import networkx as nx
 import numpy as np
 from networkx.drawing.nx_agraph import graphviz_layout
 
+from eda_schema.graph import (
+    GRAPH_BACKENDS,
+    CSRGraph,
+    bfs_depths,
+    dfs_depths,
+    traverse_cones,
+)
+
 # ============================================================
 # Type helpers
 # ============================================================
@@ -531,7 +539,8 @@ class GraphEntity(BaseEntity):
     """
     Runtime graph-backed entity.
 
-    - Owns a directed NetworkX graph
+    - Owns a directed graph: a NetworkX DiGraph by default, or a CSRGraph
+      when loaded with ``backend="csr"``
     - Optionally enforces node typing
     """
 
@@ -638,7 +647,8 @@ class GraphEntity(BaseEntity):
             nodes: Iterable of node identifiers to include.
 
         Returns:
-            NetworkX DiGraph: Subgraph containing only the specified nodes.
+            NetworkX DiGraph view, or an independent CSRGraph for the CSR
+            backend, containing only the specified nodes.
         """
         return self._graph.subgraph(nodes)
 
@@ -656,13 +666,47 @@ class GraphEntity(BaseEntity):
             "edges": [[u, v] for u, v in self.edges],
         }
 
-    def load_graph_data(self, data: Dict[str, Any]) -> None:
+    @property
+    def graph_backend(self) -> str:
+        """
+        Get the backend of the underlying graph.
+
+        Returns:
+            str: "csr" for a CSRGraph, "networkx" otherwise.
+        """
+        return "csr" if isinstance(self._graph, CSRGraph) else "networkx"
+
+    def to_networkx(self) -> nx.DiGraph:
+        """
+        Get the graph as a NetworkX DiGraph.
+
+        Returns:
+            nx.DiGraph: The graph itself for the networkx backend, or a
+            converted copy for the CSR backend.
+        """
+        if isinstance(self._graph, CSRGraph):
+            return self._graph.to_networkx()
+        return self._graph
+
+    def load_graph_data(self, data: Dict[str, Any], backend: str = "networkx") -> None:
         """
         Load graph data from a dictionary format.
 
         Args:
             data: Dictionary containing "nodes", "node_types", and "edges" keys.
+            backend: Graph backend, "networkx" or "csr".
+
+        Raises:
+            ValueError: If the backend is not supported.
         """
+        if backend not in GRAPH_BACKENDS:
+            raise ValueError(
+                f"Unsupported graph backend '{backend}'. Expected one of {GRAPH_BACKENDS}"
+            )
+        if backend == "csr":
+            self._graph = CSRGraph.from_graph_data(data)
+            return
+
         g = nx.DiGraph()
         for node, ntype in zip(data["nodes"], data["node_types"]):
             g.add_node(node, type=ntype, entity=None)
@@ -672,86 +716,80 @@ class GraphEntity(BaseEntity):
 
     def bfs_traverse(
         self,
-        node: str,
+        node: Union[str, List[str]],
         fanin: bool = True,
         fanout: bool = True,
         depth_limit: int = -1,
-        _visited: Optional[List[str]] = None,
-        _level: int = 0,
-    ) -> List[str]:
+        with_depth: bool = False,
+    ) -> Union[List[str], Dict[str, int]]:
         """
         Traverse the graph using breadth-first search.
 
         Args:
-            node: Starting node identifier.
+            node: Starting node identifier, or a list of them for a
+                multi-source search.
             fanin: If True, traverse incoming edges (predecessors).
             fanout: If True, traverse outgoing edges (successors).
             depth_limit: Maximum depth to traverse (-1 for unlimited).
-            _visited: Internal parameter for tracking visited nodes.
-            _level: Internal parameter for tracking current depth.
+            with_depth: If True, return each node's shortest distance from
+                the start node(s).
 
         Returns:
-            list: List of visited node identifiers in BFS order.
+            list | dict: Visited node identifiers in BFS order, or a dict of
+            node -> depth in the same order when ``with_depth`` is True.
         """
-        if depth_limit == _level:
-            return []
-
-        visited = _visited or [node]
-        neighbors = []
-
-        if fanin:
-            neighbors.extend(self._graph.predecessors(node))
-        if fanout:
-            neighbors.extend(self._graph.successors(node))
-
-        new_nodes = [n for n in neighbors if n not in visited]
-        visited.extend(new_nodes)
-
-        for n in new_nodes:
-            self.bfs_traverse(n, fanin, fanout, depth_limit, visited, _level + 1)
-
-        return visited
+        sources = [node] if isinstance(node, str) else list(node)
+        depths = bfs_depths(self._graph, sources, fanin, fanout, depth_limit)
+        return depths if with_depth else list(depths)
 
     def dfs_traverse(
         self,
-        node: str,
+        node: Union[str, List[str]],
         fanin: bool = True,
         fanout: bool = True,
         depth_limit: int = -1,
-        _visited: Optional[List[str]] = None,
-        _level: int = 0,
-    ) -> List[str]:
+        with_depth: bool = False,
+    ) -> Union[List[str], Dict[str, int]]:
         """
         Traverse the graph using depth-first search.
 
         Args:
-            node: Starting node identifier.
+            node: Starting node identifier, or a list of them searched in
+                order with a shared visited set.
             fanin: If True, traverse incoming edges (predecessors).
             fanout: If True, traverse outgoing edges (successors).
             depth_limit: Maximum depth to traverse (-1 for unlimited).
-            _visited: Internal parameter for tracking visited nodes.
-            _level: Internal parameter for tracking current depth.
+            with_depth: If True, return each node's depth in the DFS tree.
 
         Returns:
-            list: List of visited node identifiers in DFS order.
+            list | dict: Visited node identifiers in DFS preorder, or a dict
+            of node -> depth in the same order when ``with_depth`` is True.
         """
-        if depth_limit == _level:
-            return []
-
-        visited = _visited or [node]
-        neighbors = []
+        sources = [node] if isinstance(node, str) else list(node)
+        depths = dfs_depths(self._graph, sources, fanin, fanout, depth_limit)
+        return depths if with_depth else list(depths)
 
-        if fanin:
-            neighbors.extend(self._graph.predecessors(node))
-        if fanout:
-            neighbors.extend(self._graph.successors(node))
+    def get_cones(
+        self,
+        nodes: List[str],
+        fanin: bool = True,
+        fanout: bool = False,
+        depth_limit: int = -1,
+    ) -> Dict[str, List[str]]:
+        """
+        Get the fan-in and/or fan-out cone of many nodes in one pass.
 
-        for n in neighbors:
-            if n not in visited:
-                visited.append(n)
-                self.dfs_traverse(n, fanin, fanout, depth_limit, visited, _level + 1)
+        Args:
+            nodes: Cone apex node identifiers.
+            fanin: If True, include the fan-in cone (predecessors).
+            fanout: If True, include the fan-out cone (successors).
+            depth_limit: Maximum depth of a cone (-1 for unlimited).
 
-        return visited
+        Returns:
+            dict: Node -> nodes of its cone, starting with the node itself
+            and ordered by distance from it.
+        """
+        return traverse_cones(self._graph, nodes, fanin, fanout, depth_limit)
 
     def plot(
         self,
@@ -767,13 +805,11 @@ class GraphEntity(BaseEntity):
             show: If True, display the plot using plt.show().
             filter_regex: Optional regex pattern to filter out nodes matching the pattern.
         """
-        graph = (
-            self._graph.subgraph(
+        graph = self.to_networkx()
+        if filter_regex:
+            graph = graph.subgraph(
                 [n for n in self.nodes if not re.match(filter_regex, n)]
             )
-            if filter_regex
-            else self._graph
-        )
 
         base_colors = [
             "#2CA02C",
@@ -0,0 +1,419 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : eda_schema/catalog.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""
+Dataset catalogs.
+
+A catalog (``catalog.json`` next to the data) is written by
+``Dataset.dump`` and describes a dumped dataset without reading it: the
+flows and their stages, row, graph and image counts per table and per
+(flow_id, stage), the files holding each table with their byte sizes, a
+fingerprint of the table's storage, and the schema version. Its layout is::
+
+    {
+        "catalog_version": 2,
+        "schema_version": "2.0.0",
+        "backend": "ParquetDB",
+        "flows": {
+            "<flow_id>": {
+                "rows": {"design_flows": 1, "constraints": 1},
+                "stages": {
+                    "<stage>": {
+                        "rows": {"gates": 812, ...},
+                        "graphs": {"netlists": 1, "timing_paths": 50, ...},
+                        "images": {"routability_metrics": {"rudy_net": 1}, ...}
+                    }
+                }
+            }
+        },
+        "tables": {
+            "<entity>": {
+                "rows": 812, "graphs": 0, "images": {},
+                "bytes": {"table": 40960, "graph": 0, "images": 0},
+                "files": {"gates/table.parquet": 40960},
+                "fingerprint": {"gates/table.parquet": [40960, 1718000000000000000]}
+            }
+        }
+    }
+
+``files`` lists the table and graph files (every fragment in the
+partitioned Parquet layout); image files are only summed in ``bytes``.
+``fingerprint`` holds the size and modification time of the few files and
+directories returned by ``BaseDB.catalog_files``; checking whether a
+catalog is up to date only compares it, so it never walks the fragments.
+"""
+
+import copy
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from eda_schema import entity
+
+CATALOG_FILE = "catalog.json"
+
+# Layout version of catalog.json; readers reject newer catalogs.
+CATALOG_VERSION = 2
+
+# Version of the entity schema the data was written with.
+SCHEMA_VERSION = "2.0.0"
+
+# Storage kinds whose files are listed one by one (images are only summed).
+LISTED_STORAGE_KINDS = ("table", "graph")
+
+
+def _add_counts(target: Dict[str, Any], source: Dict[str, Any]) -> None:
+    """
+    Add nested counts to another set of nested counts in place.
+
+    Args:
+        target (dict): Counts to add to; missing keys are created.
+        source (dict): Counts to add, nested dicts with int leaves.
+    """
+    for key, value in source.items():
+        if isinstance(value, dict):
+            _add_counts(target.setdefault(key, {}), value)
+        else:
+            target[key] = target.get(key, 0) + value
+
+
+class CatalogBuilder:
+    """
+    Collects the contents of a dataset from the writes that dump it.
+
+    ``Dataset.dump`` passes every batch of database writes (see
+    ``eda_schema.dataset.DBWrite``) to ``record``; ``to_dict`` then gives
+    the catalog without byte sizes, which the backend adds when it writes
+    the catalog.
+    """
+
+    def __init__(self):
+        """Initialize an empty catalog."""
+        self.flows: Dict[str, Dict[str, Any]] = {}
+        self.tables: Dict[str, Dict[str, Any]] = {
+            entity_name: {"rows": 0, "graphs": 0, "images": {}}
+            for entity_name, _ in entity.SchemaMetadata.items()
+        }
+
+    @classmethod
+    def from_catalog(cls, catalog: Dict[str, Any]) -> "CatalogBuilder":
+        """
+        Start from the counts of an existing catalog, e.g. to extend it with
+        the writes of an appending dump.
+
+        Args:
+            catalog (dict): Catalog read with ``BaseDB.read_catalog``.
+
+        Returns:
+            CatalogBuilder: Builder holding the catalog's flows and counts.
+        """
+        builder = cls()
+        builder.flows = copy.deepcopy(catalog["flows"])
+        for entity_name, table in catalog["tables"].items():
+            builder.tables[entity_name] = {
+                "rows": table["rows"],
+                "graphs": table["graphs"],
+                "images": dict(table["images"]),
+            }
+        return builder
+
+    def _stage(self, flow_id: str, stage: str) -> Dict[str, Any]:
+        """
+        Get the catalog entry of a (flow_id, stage), creating it if needed.
+
+        Args:
+            flow_id (str): Flow identifier.
+            stage (str): Stage name.
+
+        Returns:
+            dict: Entry with "rows", "graphs" and "images".
+        """
+        stages = self._flow(flow_id)["stages"]
+        return stages.setdefault(stage, {"rows": {}, "graphs": {}, "images": {}})
+
+    def _flow(self, flow_id: str) -> Dict[str, Any]:
+        """
+        Get the catalog entry of a flow, creating it if needed.
+
+        Args:
+            flow_id (str): Flow identifier.
+
+        Returns:
+            dict: Entry with flow-level "rows" and "stages".
+        """
+        return self.flows.setdefault(flow_id, {"rows": {}, "stages": {}})
+
+    def _scope(self, keys: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get the flow or stage entry that a row or graph belongs to.
+
+        Args:
+            keys (dict): Row values or graph key fields.
+
+        Returns:
+            dict | None: Stage entry if the keys have a stage, flow entry if
+            they only have a flow_id, None otherwise (e.g. standard cells).
+        """
+        flow_id = keys.get("flow_id")
+        if flow_id is None:
+            return None
+        stage = keys.get("stage")
+        if stage is None:
+            return self._flow(str(flow_id))
+        return self._stage(str(flow_id), str(stage))
+
+    def _add_rows(self, entity_name: str, rows: List[Dict[str, Any]]) -> None:
+        self.tables[entity_name]["rows"] += len(rows)
+        for row in rows:
+            scope = self._scope(row)
+            if scope is not None:
+                counts = scope["rows"]
+                counts[entity_name] = counts.get(entity_name, 0) + 1
+
+    def _add_graphs(self, entity_name: str, keys: List[Dict[str, Any]]) -> None:
+        self.tables[entity_name]["graphs"] += len(keys)
+        for key_fields in keys:
+            scope = self._scope(key_fields)
+            if scope is not None and "graphs" in scope:
+                counts = scope["graphs"]
+                counts[entity_name] = counts.get(entity_name, 0) + 1
+
+    def _add_images(
+        self,
+        entity_name: str,
+        images: Dict[str, Any],
+        dict_images: Dict[str, Any],
+        key_fields: Dict[str, Any],
+    ) -> None:
+        counts = {field: 1 for field, image in images.items() if image is not None}
+        for field, dict_value in dict_images.items():
+            stored = sum(1 for image in (dict_value or {}).values() if image is not None)
+            if stored:
+                counts[field] = stored
+        if not counts:
+            return
+
+        totals = self.tables[entity_name]["images"]
+        scope = self._scope(key_fields)
+        stage_counts = None
+        if scope is not None and "images" in scope:
+            stage_counts = scope["images"].setdefault(entity_name, {})
+        for field, count in counts.items():
+            totals[field] = totals.get(field, 0) + count
+            if stage_counts is not None:
+                stage_counts[field] = stage_counts.get(field, 0) + count
+
+    def record(self, writes: List[Tuple[str, tuple, Dict[str, Any]]]) -> None:
+        """
+        Count the rows, graphs and images of a batch of database writes.
+
+        Args:
+            writes (list[DBWrite]): (method name, args, kwargs) calls as
+                built by ``Dataset`` for ``apply_writes``. Calls other than
+                table, graph and image writes are ignored.
+        """
+        for method, args, kwargs in writes:
+            if method == "add_table_row":
+                self._add_rows(args[0], [args[1]])
+            elif method == "add_table_data":
+                self._add_rows(args[0], args[1])
+            elif method == "add_graph_data":
+                self._add_graphs(args[0], [kwargs])
+            elif method == "add_graph_data_batch":
+                self._add_graphs(args[0], args[1])
+            elif method == "add_images":
+                self._add_images(args[0], args[1], args[2], kwargs)
+
+    def merge(self, other: "CatalogBuilder") -> None:
+        """
+        Add the counts of another builder, e.g. one that recorded the writes
+        of a stage in a worker process of a parallel dump.
+
+        Args:
+            other (CatalogBuilder): Builder whose counts are added.
+        """
+        _add_counts(self.flows, other.flows)
+        _add_counts(self.tables, other.tables)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the catalog collected so far.
+
+        Returns:
+            dict: Catalog without the backend and storage sections.
+        """
+        return {
+            "catalog_version": CATALOG_VERSION,
+            "schema_version": SCHEMA_VERSION,
+            "flows": self.flows,
+            "tables": self.tables,
+        }
+
+
+def build_catalog(db: Any) -> Dict[str, Any]:
+    """
+    Rebuild the catalog of a database from its stored tables, e.g. once
+    concurrent writers, which do not write catalogs, are done.
+
+    Rows are counted from the primary-key columns of every created table.
+    Every row of a graph entity counts as one graph, as dumps store one
+    graph per row, and images are counted from the image manifests of
+    backends that keep them.
+
+    Args:
+        db (BaseDB): Database to describe.
+
+    Returns:
+        dict: Catalog without the backend and storage sections, as from
+        ``CatalogBuilder.to_dict``.
+    """
+    builder = CatalogBuilder()
+    for entity_name, _ in entity.SchemaMetadata.items():
+        pk_cols = entity.SchemaMetadata.get_pk_columns(entity_name)
+        if not pk_cols or not db.has_table(entity_name):
+            continue
+        keys = db.get_table_arrow(entity_name, columns=pk_cols).to_pylist()
+        writes = [("add_table_data", (entity_name, keys), {})]
+        if entity.SchemaMetadata.is_graph_entity(entity_name):
+            writes.append(("add_graph_data_batch", (entity_name, keys), {}))
+        for key_fields, manifest in zip(keys, db.get_image_manifests(entity_name, keys)):
+            images: Dict[str, Any] = {}
+            dict_images: Dict[str, Dict[str, Any]] = {}
+            for entry in manifest or []:
+                if entry["path"] is None:
+                    continue
+                if entry["dict_key"] is None:
+                    images[entry["image_field"]] = entry["path"]
+                else:
+                    dict_images.setdefault(entry["image_field"], {})[
+                        entry["dict_key"]
+                    ] = entry["path"]
+            if images or dict_images:
+                writes.append(("add_images", (entity_name, images, dict_images), key_fields))
+        builder.record(writes)
+    return builder.to_dict()
+
+
+def _relative_path(path: Path, root: Path) -> str:
+    """
+    Get a storage file's path relative to the catalog, with "/" separators.
+
+    Args:
+        path (Path): Storage file.
+        root (Path): Directory holding the catalog.
+
+    Returns:
+        str: Relative POSIX path.
+    """
+    return path.relative_to(root).as_posix()
+
+
+def storage_fingerprint(db: Any, entity_name: str) -> Dict[str, List[int]]:
+    """
+    Get the size and modification time of the paths that change whenever
+    an entity's table or graph data changes.
+
+    Args:
+        db (BaseDB): Database with a ``catalog_path``.
+        entity_name (str): Name of the entity.
+
+    Returns:
+        dict: Path relative to the catalog -> [size, mtime in nanoseconds].
+    """
+    root = db.catalog_path.parent
+    fingerprint = {}
+    for path in db.catalog_files(entity_name):
+        stat = path.stat()
+        fingerprint[_relative_path(path, root)] = [stat.st_size, stat.st_mtime_ns]
+    return fingerprint
+
+
+def add_storage_info(catalog: Dict[str, Any], db: Any) -> Dict[str, Any]:
+    """
+    Add the backend name and per-table files, byte sizes and storage
+    fingerprints to a catalog.
+
+    Args:
+        catalog (dict): Catalog from ``CatalogBuilder.to_dict``.
+        db (BaseDB): Database the catalog describes, with a ``catalog_path``.
+
+    Returns:
+        dict: Copy of the catalog with "backend" and, per table, "bytes",
+        "files" and "fingerprint".
+    """
+    root = db.catalog_path.parent
+    tables = {}
+    for entity_name, table in catalog["tables"].items():
+        storage = db.storage_files(entity_name)
+        sizes = {
+            kind: {_relative_path(path, root): path.stat().st_size for path in paths}
+            for kind, paths in storage.items()
+        }
+        tables[entity_name] = dict(
+            table,
+            bytes={kind: sum(files.values()) for kind, files in sizes.items()},
+            files={
+                path: size
+                for kind in LISTED_STORAGE_KINDS
+                for path, size in sizes.get(kind, {}).items()
+            },
+            fingerprint=storage_fingerprint(db, entity_name),
+        )
+    return dict(catalog, backend=type(db).__name__, tables=tables)
+
+
+def stale_files(catalog: Dict[str, Any], db: Any) -> List[str]:
+    """
+    Find storage paths that changed since the catalog was written.
+
+    Only the storage fingerprints are compared, so checking a catalog stats
+    a few files and directories per table but never reads or lists the
+    data files. Catalogs without fingerprints report every path as stale.
+
+    Args:
+        catalog (dict): Catalog read with ``BaseDB.read_catalog``.
+        db (BaseDB): Database the catalog describes.
+
+    Returns:
+        list[str]: Relative paths that were added, removed or modified.
+    """
+    stale = []
+    for entity_name, table in catalog["tables"].items():
+        recorded = table.get("fingerprint", {})
+        current = storage_fingerprint(db, entity_name)
+        stale += [
+            path
+            for path in sorted(set(recorded) | set(current))
+            if recorded.get(path) != current.get(path)
+        ]
+    return stale
+
+
+def stage_rows(catalog: Dict[str, Any], flow_id: str, stage: str) -> int:
+    """
+    Get the number of rows a (flow_id, stage) has across all tables.
+
+    Args:
+        catalog (dict): Dataset catalog.
+        flow_id (str): Flow identifier.
+        stage (str): Stage name.
+
+    Returns:
+        int: Total rows, 0 if the stage is not in the catalog.
+    """
+    stages = catalog["flows"].get(flow_id, {}).get("stages", {})
+    return sum(stages.get(stage, {}).get("rows", {}).values())
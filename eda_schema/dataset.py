@@ -16,13 +16,439 @@
 # expressly prohibited; derivative works must be shared under the same
 # license terms (ShareAlike).
 
+import multiprocessing
+import pickle
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import dill
+import numpy as np
+import pandas as pd
+import pyarrow as pa
 
 from eda_schema import entity
+from eda_schema.catalog import CatalogBuilder, stage_rows, stale_files
 from eda_schema.db.base import BaseDB
+from eda_schema.errors import DataNotFoundError, DuplicateKeyError
+from eda_schema.graph import GRAPH_BACKENDS
+from eda_schema.image_batch import load_image_batch
+from eda_schema.lazy import LazyDict, LazyMapping, LazyNetlist, NetlistCache
+from eda_schema.node_store import NODE_STORES, NodeTable
+
+# A deferred database call: (BaseDB method name, positional args, keyword args)
+DBWrite = Tuple[str, tuple, Dict[str, Any]]
+
+# Tables holding one row per design stage, read together by get_entities.
+STAGE_ENTITY_TABLES = [
+    "design_stages",
+    "cell_metrics",
+    "area_metrics",
+    "power_metrics",
+    "routability_metrics",
+    "timing_metrics",
+]
+
+# Tables whose scalar columns make up the stage_summaries table.
+STAGE_SUMMARY_SOURCES = [
+    "netlists",
+    "cell_metrics",
+    "area_metrics",
+    "power_metrics",
+    "timing_metrics",
+]
+
+# How Dataset reads entity tables: pandas DataFrames or Arrow tables.
+TABLE_FORMATS = ("pandas", "arrow")
+
+# How Dataset.dump treats stored data: recreate the tables or add new flows.
+DUMP_MODES = ("overwrite", "append")
+
+# Columns identifying a timing path (besides flow_id and stage).
+TIMING_PATH_KEYS = ["startpoint", "endpoint", "path_type"]
+
+# Netlist node type -> (entity table, entity class).
+NETLIST_NODE_TABLES = {
+    "PORT": ("ports", entity.PortEntity),
+    "PIN": ("pins", entity.PinEntity),
+    "GATE": ("gates", entity.GateEntity),
+    "NET": ("nets", entity.NetEntity),
+}
+
+
+def group_arc_records(
+    arc_df: pd.DataFrame, name_column: str
+) -> Dict[Tuple[str, str, str], Dict[str, Dict[str, Any]]]:
+    """
+    Group timing arc rows by the timing path they belong to.
+
+    Args:
+        arc_df (pd.DataFrame): Rows of the net_arcs or cell_arcs table.
+        name_column (str): Column naming the arc node ("net_name" or "gate_name").
+
+    Returns:
+        dict: (startpoint, endpoint, path_type) -> {arc name -> row dict}.
+    """
+    if arc_df.empty:
+        return {}
+
+    records = arc_df.to_dict("records")
+    names = arc_df[name_column].tolist()
+    return {
+        path_key: {names[i]: records[i] for i in indices}
+        for path_key, indices in arc_df.groupby(
+            TIMING_PATH_KEYS, sort=False
+        ).indices.items()
+    }
+
+
+def group_arc_rows(
+    records: List[Dict[str, Any]], name_column: str
+) -> Dict[Tuple[str, str, str], Dict[str, Dict[str, Any]]]:
+    """
+    Group timing arc row dicts by the timing path they belong to.
+
+    Args:
+        records (list[dict]): Rows of the net_arcs or cell_arcs table.
+        name_column (str): Column naming the arc node ("net_name" or "gate_name").
+
+    Returns:
+        dict: (startpoint, endpoint, path_type) -> {arc name -> row dict}.
+    """
+    grouped: Dict[Tuple[str, str, str], Dict[str, Dict[str, Any]]] = {}
+    for record in records:
+        path_key = tuple(record[k] for k in TIMING_PATH_KEYS)
+        grouped.setdefault(path_key, {})[record[name_column]] = record
+    return grouped
+
+
+def apply_writes(
+    db: BaseDB, writes: List[DBWrite], catalog: Optional[CatalogBuilder] = None
+) -> None:
+    """
+    Apply deferred database calls in order.
+
+    Args:
+        db (BaseDB): Database to write to.
+        writes (list[DBWrite]): (method name, args, kwargs) calls.
+        catalog (CatalogBuilder | None): Catalog recording the writes.
+    """
+    if catalog is not None:
+        catalog.record(writes)
+    for method, args, kwargs in writes:
+        getattr(db, method)(*args, **kwargs)
+
+
+def _summary_columns() -> List[str]:
+    """
+    Get the columns of the stage_summaries table.
+
+    Returns:
+        list[str]: Column names, keys first.
+    """
+    return [
+        col
+        for col in entity.SchemaMetadata.get_columns("stage_summaries")
+        if not col.startswith("_")
+    ]
+
+
+def stage_summary(
+    design_stage: entity.DesignStageEntity, flow_id: str, stage: str
+) -> entity.StageSummaryEntity:
+    """
+    Collect the scalar metrics of a design stage into a summary row.
+
+    Args:
+        design_stage (DesignStageEntity): Stage with its netlist and metrics.
+        flow_id (str): Flow identifier.
+        stage (str): Stage name.
+
+    Returns:
+        StageSummaryEntity: Summary of the stage; metrics of missing
+        entities are None.
+    """
+    columns = set(_summary_columns())
+    values = {"flow_id": flow_id, "stage": stage, "run_status": design_stage.run_status}
+    for source in STAGE_SUMMARY_SOURCES:
+        source_obj = getattr(design_stage, "netlist" if source == "netlists" else source)
+        if source_obj is None:
+            continue
+        for col, value in source_obj.get_tabular_data().items():
+            if col in columns and col not in values:
+                values[col] = value
+    return entity.StageSummaryEntity(**values)
+
+
+def build_stage_summaries(db: BaseDB, **filters: Any) -> pd.DataFrame:
+    """
+    Build stage summaries by joining the source tables.
+
+    Used for datasets dumped before the stage_summaries table existed.
+
+    Args:
+        db (BaseDB): Database holding the source tables.
+        **filters: ``flow_id`` / ``stage`` filters.
+
+    Returns:
+        pd.DataFrame: One row per design stage with the stage_summaries
+        columns.
+    """
+    columns = _summary_columns()
+    keys = ["flow_id", "stage"]
+    summary = db.get_table_data("design_stages", **filters)[keys + ["run_status"]]
+    for source in STAGE_SUMMARY_SOURCES:
+        df = db.get_table_data(source, **filters)
+        source_columns = [c for c in df.columns if c in columns and c not in summary]
+        summary = summary.merge(df[keys + source_columns], on=keys, how="left")
+    return summary.reindex(columns=columns)
+
+
+def stage_evolution(summary: pd.DataFrame) -> pd.DataFrame:
+    """
+    Pivot stage summaries to one row per flow.
+
+    Args:
+        summary (pd.DataFrame): Rows from ``Dataset.summary``.
+
+    Returns:
+        pd.DataFrame: Rows indexed by flow_id with (metric, stage) columns,
+        stages in flow order, e.g. ``evolution["worst_slack"]["cts"]``.
+    """
+    metrics = [c for c in summary.columns if c not in ("flow_id", "stage")]
+    evolution = summary.pivot(index="flow_id", columns="stage", values=metrics)
+    stages = [s for s in entity.DesignStages.tolist() if s in set(summary["stage"])]
+    return evolution.reindex(columns=pd.MultiIndex.from_product([metrics, stages]))
+
+
+def _image_writes(entity_name: str, entity_obj: Any) -> DBWrite:
+    """
+    Build the image write of an entity row (see ``BaseDB.add_entity_images``).
+
+    Args:
+        entity_name (str): Name of the entity.
+        entity_obj: A BaseEntity subclass instance.
+
+    Returns:
+        DBWrite: An ``add_images`` call.
+    """
+    key_fields = {pk: getattr(entity_obj, pk) for pk in entity_obj._primary_keys}
+    images = (entity_obj.get_image_data(), entity_obj.get_dict_image_data())
+    return ("add_images", (entity_name, *images), key_fields)
+
+
+def design_flow_writes(design_flow: entity.DesignFlowEntity) -> List[DBWrite]:
+    """
+    Build the writes of a design flow's own rows (not its stages).
+
+    Args:
+        design_flow (DesignFlowEntity): Flow to persist.
+
+    Returns:
+        list[DBWrite]: Writes of the flow and constraints rows.
+    """
+    return [
+        ("add_table_row", ("design_flows", design_flow.get_tabular_data()), {}),
+        (
+            "add_table_row",
+            ("constraints", design_flow.constraints.get_tabular_data()),
+            {},
+        ),
+    ]
+
+
+def design_stage_writes(
+    design_stage: entity.DesignStageEntity, flow_id: str, stage: str
+) -> List[DBWrite]:
+    """
+    Build the writes persisting a design stage, its netlist and all metrics.
+
+    Extraction only reads the entities, so it can run in another process
+    than the one applying the writes.
+
+    Args:
+        design_stage (DesignStageEntity): Stage containing netlist + metrics.
+        flow_id (str): Flow identifier.
+        stage (str): Stage name.
+
+    Returns:
+        list[DBWrite]: Writes in the order they must be applied.
+    """
+    summary = stage_summary(design_stage, flow_id, stage)
+    writes: List[DBWrite] = [
+        ("add_table_row", ("design_stages", design_stage.get_tabular_data()), {}),
+        ("add_table_row", ("stage_summaries", summary.get_tabular_data()), {}),
+    ]
+
+    netlist = design_stage.netlist
+    if netlist is None:
+        return writes
+
+    def table_row(entity_name: str, entity_obj: Any) -> DBWrite:
+        return ("add_table_row", (entity_name, entity_obj.get_tabular_data()), {})
+
+    def table_data(entity_name: str, rows: List[Dict[str, Any]]) -> DBWrite:
+        return ("add_table_data", (entity_name, rows), {})
+
+    # Persist stage-level metadata + metrics tables
+    writes += [
+        table_row("netlists", netlist),
+        table_row("cell_metrics", design_stage.cell_metrics),
+        table_row("area_metrics", design_stage.area_metrics),
+        table_row("power_metrics", design_stage.power_metrics),
+        table_row("routability_metrics", design_stage.routability_metrics),
+        table_row("timing_metrics", design_stage.timing_metrics),
+        _image_writes("routability_metrics", design_stage.routability_metrics),
+    ]
+
+    # Dump netlist graph
+    writes += [
+        (
+            "add_graph_data",
+            ("netlists", netlist.get_graph_data()),
+            {"flow_id": flow_id, "stage": stage},
+        ),
+        _image_writes("netlists", netlist),
+    ]
+
+    # Dump node entities (PORT / GATE / PIN / NET)
+    node_data = {"PORT": [], "GATE": [], "PIN": [], "NET": []}
+    for node in netlist.nodes:
+        node_rows = node_data.get(netlist.nodes[node]["type"])
+        if node_rows is not None:
+            node_rows.append(netlist.nodes[node]["entity"].get_tabular_data())
+
+    writes += [
+        table_data("ports", node_data["PORT"]),
+        table_data("gates", node_data["GATE"]),
+        table_data("pins", node_data["PIN"]),
+        table_data("nets", node_data["NET"]),
+    ]
+
+    # Dump timing paths + their graphs
+    timing_path_data = []
+    net_arc_data = []
+    cell_arc_data = []
+    timing_path_graphs = []
+
+    for timing_path in netlist.timing_paths.values():
+        timing_path_data.append(timing_path.get_tabular_data())
+        for node in timing_path.nodes:
+            tp_node_entity = timing_path.nodes[node]["entity"]
+            tp_node_type = timing_path.nodes[node]["type"]
+            if tp_node_type == "NET_ARC":
+                net_arc_data.append(tp_node_entity.get_tabular_data())
+            elif tp_node_type == "CELL_ARC":
+                cell_arc_data.append(tp_node_entity.get_tabular_data())
+        timing_path_graphs.append(
+            {
+                "data": timing_path.get_graph_data(),
+                "flow_id": flow_id,
+                "stage": stage,
+                "startpoint": timing_path.startpoint,
+                "endpoint": timing_path.endpoint,
+                "path_type": timing_path.path_type,
+            }
+        )
+
+    writes += [
+        table_data("net_arcs", net_arc_data),
+        table_data("cell_arcs", cell_arc_data),
+        table_data("timing_paths", timing_path_data),
+        ("add_graph_data_batch", ("timing_paths", timing_path_graphs), {}),
+    ]
+
+    # Dump clock trees
+    clock_tree_data = []
+    for clock_source, clock_tree in netlist.clock_trees.items():
+        clock_tree_data.append(clock_tree.get_tabular_data())
+        writes += [
+            (
+                "add_graph_data",
+                ("clock_trees", clock_tree.get_graph_data()),
+                {"flow_id": flow_id, "stage": stage, "clock_source": clock_source},
+            ),
+            _image_writes("clock_trees", clock_tree),
+        ]
+    writes.append(table_data("clock_trees", clock_tree_data))
+
+    # Dump power delivery network
+    writes += [
+        _image_writes("power_delivery_networks", netlist.power_delivery_network),
+        table_row("power_delivery_networks", netlist.power_delivery_network),
+    ]
+    return writes
+
+
+class WriterThread(threading.Thread):
+    """
+    Thread applying database writes from a bounded queue.
+
+    ``put`` blocks while the queue is full, which throttles whoever
+    produces the writes. After a failed write the thread keeps draining
+    the queue so producers never block forever; the error is re-raised by
+    the next ``put`` and by ``close``.
+
+    Attributes:
+        db (BaseDB): Database the writes are applied to.
+        error (BaseException | None): First error raised by a write.
+    """
+
+    def __init__(self, db: BaseDB, queue_size: int):
+        """
+        Initialize the (not yet started) writer.
+
+        Args:
+            db (BaseDB): Database to write to.
+            queue_size (int): Write batches that may wait in the queue.
+        """
+        super().__init__(name="eda-schema-writer", daemon=True)
+        self.db = db
+        self.error: Optional[BaseException] = None
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+
+    def run(self):
+        while True:
+            writes = self._queue.get()
+            if writes is None:
+                return
+            if self.error is None:
+                try:
+                    apply_writes(self.db, writes)
+                except BaseException as e:  # pylint: disable=broad-exception-caught
+                    self.error = e
+
+    def put(self, writes: List[DBWrite]) -> None:
+        """
+        Queue a batch of writes, waiting while the queue is full.
+
+        Args:
+            writes (list[DBWrite]): Writes to apply.
+
+        Raises:
+            BaseException: The error of an earlier failed write.
+        """
+        if self.error is not None:
+            raise self.error
+        self._queue.put(writes)
+
+    def close(self) -> None:
+        """
+        Apply all queued writes and stop the thread.
+
+        Raises:
+            BaseException: The error of a failed write.
+        """
+        if self.ident is None:
+            self.start()
+        self._queue.put(None)
+        self.join()
+        if self.error is not None:
+            raise self.error
 
 
 class StandardCellData(dict[str, entity.StandardCellEntity]):
@@ -65,20 +491,69 @@ class Dataset(dict):
     Attributes:
         standard_cells (dict): Dictionary to store standard cell data.
         db (FileDB): File-based database for storing EDA-related data.
+        netlist_cache (NetlistCache): LRU cache of netlists materialized
+            by lazy loads.
+        node_store (str): How loaded netlist node entities are held,
+            "object" or "columnar".
+        graph_backend (str): Backend of loaded netlist, timing path and
+            clock tree graphs, "networkx" or "csr".
+        table_format (str): How entity tables are read, "pandas" or "arrow".
     """
 
     standard_cells = {}
 
-    def __init__(self, db_obj: BaseDB) -> None:
+    def __init__(
+        self,
+        db_obj: BaseDB,
+        netlist_memory_budget: Optional[int] = None,
+        node_store: str = "object",
+        graph_backend: str = "networkx",
+        table_format: str = "pandas",
+    ) -> None:
         """
         Initialize a Dataset tied to a database backend.
 
         Args:
             db_obj (FileDB): Database interface used for persistence.
+            netlist_memory_budget (int | None): Approximate number of bytes
+                of netlists kept in memory by lazy loads before the least
+                recently used ones are evicted. None keeps all of them.
+            node_store (str): "object" attaches one entity dataclass per
+                netlist node. "columnar" keeps each node type's rows in a
+                NodeTable and attaches read-only NodeView row views that
+                materialize the dataclass on ``to_entity()``.
+            graph_backend (str): "networkx" loads graphs as NetworkX
+                DiGraphs. "csr" loads them as compact CSRGraphs; use
+                ``to_networkx()`` on an entity for full NetworkX algorithms.
+            table_format (str): "pandas" reads node, arc and graph entity
+                rows with ``get_table_data``. "arrow" reads them with
+                ``get_table_arrow`` and builds entities and node tables
+                straight from Arrow, without DataFrame conversion.
+
+        Raises:
+            ValueError: If the node store, graph backend or table format
+                is unknown.
         """
+        if node_store not in NODE_STORES:
+            raise ValueError(
+                f"Unknown node store '{node_store}'. Expected one of {NODE_STORES}"
+            )
+        if graph_backend not in GRAPH_BACKENDS:
+            raise ValueError(
+                f"Unknown graph backend '{graph_backend}'. "
+                f"Expected one of {GRAPH_BACKENDS}"
+            )
+        if table_format not in TABLE_FORMATS:
+            raise ValueError(
+                f"Unknown table format '{table_format}'. Expected one of {TABLE_FORMATS}"
+            )
         super().__init__()
         self.db: BaseDB = db_obj
         self.standard_cells: StandardCellData = StandardCellData()
+        self.netlist_cache = NetlistCache(netlist_memory_budget)
+        self.node_store = node_store
+        self.graph_backend = graph_backend
+        self.table_format = table_format
 
     def save_to_pickle(self, filepath: str | Path) -> None:
         """
@@ -110,24 +585,167 @@ class Dataset(dict):
         loaded.db = db_obj
         return loaded
 
-    def dump_standard_cells(self):
+    @property
+    def catalog(self) -> Optional[Dict[str, Any]]:
+        """
+        Catalog of the dumped dataset (see ``eda_schema.catalog``).
+
+        Reading it stats a few files and directories per table (see
+        ``BaseDB.catalog_files``) but reads no data. A catalog whose
+        storage changed after it was written is ignored.
+
+        Returns:
+            dict | None: The catalog, or None if the database has no
+            up-to-date catalog.
+        """
+        catalog = self.db.read_catalog()
+        if catalog is None or stale_files(catalog, self.db):
+            return None
+        return catalog
+
+    def stored_flow_ids(self) -> List[str]:
+        """
+        Get the flows already stored in the database.
+
+        Returns:
+            list[str]: Flow identifiers of the design_flows table, empty if
+            the table was not created.
+        """
+        if not self.db.has_table("design_flows"):
+            return []
+        df = self.db.get_table_data("design_flows")
+        return [] if df.empty else [str(flow_id) for flow_id in df["flow_id"]]
+
+    def _check_new_flows(self, flow_ids: List[str]) -> None:
+        """
+        Check that none of the flows is stored yet.
+
+        Args:
+            flow_ids (list[str]): Flows about to be appended.
+
+        Raises:
+            DuplicateKeyError: If a flow is already in the database.
+        """
+        duplicates = sorted(set(flow_ids) & set(self.stored_flow_ids()))
+        if duplicates:
+            raise DuplicateKeyError(
+                entity_name="design_flows",
+                keys=duplicates,
+                message=f"Cannot append flows already stored in the dataset: {duplicates}",
+            )
+
+    def _append_catalog(self) -> Optional[CatalogBuilder]:
+        """
+        Prepare the catalog of a dump appending to stored tables.
+
+        An up-to-date catalog is extended with the appended writes; a
+        missing or stale one is removed, as it cannot be extended. Stage
+        summaries of the stored flows are backfilled first if needed.
+
+        Returns:
+            CatalogBuilder | None: Builder holding the stored catalog, or
+            None if no catalog is written after the dump.
+        """
+        stored = self.catalog
+        if stored is None:
+            self.db.remove_catalog()
+        catalog = CatalogBuilder.from_catalog(stored) if stored else None
+        self._backfill_stage_summaries(catalog)
+        return catalog
+
+    def _backfill_stage_summaries(self, catalog: Optional[CatalogBuilder] = None) -> None:
+        """
+        Write the stage summaries of the stored flows if the table is missing.
+
+        Datasets dumped before the stage_summaries table existed are
+        summarized by joining the source tables. Once flows are appended
+        the table exists, so the stored flows need their rows too.
+
+        Args:
+            catalog (CatalogBuilder | None): Catalog recording the rows.
+        """
+        if self.db.has_table("stage_summaries"):
+            return
+        df = build_stage_summaries(self.db)
+        rows = df.astype(object).where(df.notna(), None).to_dict("records")
+        if rows:
+            apply_writes(self.db, [("add_table_data", ("stage_summaries", rows), {})], catalog)
+
+    def dump_standard_cells(
+        self, catalog: Optional[CatalogBuilder] = None, skip_stored: bool = False
+    ):
         """
         Dump standard cell data into the database.
 
         Writes all standard cells from self.standard_cells to the database.
+
+        Args:
+            catalog (CatalogBuilder | None): Catalog recording the rows.
+            skip_stored (bool): Only write cells whose name is not stored yet.
         """
-        for std_cell in self.standard_cells.values():
-            self.db.add_table_row("standard_cells", std_cell.get_tabular_data())
+        cells = self.standard_cells.values()
+        if skip_stored and self.db.has_table("standard_cells"):
+            stored = set(self.db.get_table_data("standard_cells").get("name", []))
+            cells = [cell for cell in cells if cell.name not in stored]
+        rows = [std_cell.get_tabular_data() for std_cell in cells]
+        if skip_stored and not rows:
+            return
+        apply_writes(self.db, [("add_table_data", ("standard_cells", rows), {})], catalog)
 
-    def dump(self) -> None:
+    def dump(
+        self, workers: Optional[int] = None, queue_size: int = 4, mode: str = "overwrite"
+    ) -> None:
         """
         Create all database tables and serialize the entire dataset hierarchy.
-        """
-        # Create empty parquet tables for all entities
-        self.db.create_dataset_tables()
 
-        # Dump standard-cell definitions first (independent of flows)
-        self.dump_standard_cells()
+        With ``mode="append"`` the tables of an existing dataset are kept
+        and only this dataset's flows, and standard cells not stored yet,
+        are added. ``ParquetDB`` writes the new flows as new partition
+        fragments, or in the single layout as fragments next to each
+        table file, so stored files are never rewritten; ``compact()``
+        merges them.
+        A flow that is already stored raises ``DuplicateKeyError`` before
+        anything is written. Appending to a database without tables
+        creates them as in the default ``"overwrite"`` mode.
+
+        With ``workers`` > 1 the dump is pipelined: worker processes turn
+        each (flow_id, stage) into database writes (rows, graph data and
+        images), encoded with ``BaseDB.encode_writes`` (for ``ParquetDB``
+        Arrow tables and compressed images), and one writer thread applies
+        them in dataset order. Forked workers read the stages from the
+        dataset they inherit, so stages are never pickled.
+
+        Stages, netlists, timing paths and clock trees deferred by a lazy
+        load are loaded first, as the tables they are read from may be
+        recreated by the dump.
+
+        Every write is also recorded in a catalog of the dataset, written
+        with ``BaseDB.write_catalog`` once the dump is complete (by
+        ``ParquetDB`` when it is closed; a ``ParquetDB`` with a
+        ``writer_id`` removes it instead, and ``compact()`` rebuilds it).
+        Any existing catalog is removed first. When appending, an up-to-date catalog is extended with the
+        new flows and replaced in one rename; a missing or stale one is
+        removed and not rewritten.
+
+        Args:
+            workers (int | None): Number of worker processes extracting
+                stage rows. None or 1 dumps in this thread.
+            queue_size (int): Extracted stages that may wait for the writer
+                before extraction pauses (back-pressure).
+            mode (str): "overwrite" or "append" (see above).
+
+        Raises:
+            ValueError: If the dataset has no flows or an empty flow entry,
+                ``workers`` or ``queue_size`` is not positive, or ``mode``
+                is unknown.
+            DuplicateKeyError: If appending flows that are already stored.
+        """
+        if workers is not None and workers <= 0:
+            raise ValueError(f"workers must be positive, got {workers}")
+        if queue_size <= 0:
+            raise ValueError(f"queue_size must be positive, got {queue_size}")
+        if mode not in DUMP_MODES:
+            raise ValueError(f"Unknown dump mode '{mode}', expected one of {DUMP_MODES}")
 
         # Snapshot keys so iteration is safe even if dict mutates
         flow_ids = list(self.keys())
@@ -136,33 +754,151 @@ class Dataset(dict):
             raise ValueError(
                 "Dataset.dump_dataset() called but dataset contains no flows."
             )
+        self._materialize_lazy(flow_ids)
+
+        write_catalog = True
+        if mode == "append" and self.db.has_table("design_flows"):
+            self._check_new_flows(flow_ids)
+            catalog = self._append_catalog()
+            write_catalog = catalog is not None
+            catalog = catalog or CatalogBuilder()
+            self.dump_standard_cells(catalog, skip_stored=True)
+        else:
+            # Create empty parquet tables for all entities
+            self.db.remove_catalog()
+            self.db.create_dataset_tables()
+            catalog = CatalogBuilder()
+
+            # Dump standard-cell definitions first (independent of flows)
+            self.dump_standard_cells(catalog)
+
+        if workers not in (None, 1):
+            self._dump_parallel(flow_ids, workers, queue_size, catalog)
+        else:
+            # Dump each flow entry
+            for flow_id in flow_ids:
+                if self[flow_id] is None:
+                    raise ValueError(
+                        f"Dataset contains empty design flow entry: '{flow_id}'"
+                    )
+                self.dump_design_flow(flow_id, catalog)
+
+        if write_catalog:
+            self.db.write_catalog(catalog.to_dict())
+
+    def _dump_parallel(
+        self,
+        flow_ids: List[str],
+        workers: int,
+        queue_size: int,
+        catalog: CatalogBuilder,
+    ) -> None:
+        """
+        Dump flows with stage extraction in worker processes and a writer thread.
+
+        Where the "fork" start method is available, workers find the stage
+        to extract in the dataset they inherit, so tasks only carry
+        (flow_id, stage), and they return writes encoded by
+        ``BaseDB.encode_writes`` (Arrow tables, compressed images): this
+        process only unpickles them and the writer only appends. Elsewhere
+        each task carries its design stage, so worker memory does not grow
+        with the dataset, and the writer encodes.
 
-        # Dump each flow entry
+        Args:
+            flow_ids (list[str]): Flows to dump, in order.
+            workers (int): Number of worker processes.
+            queue_size (int): Capacity of the writer's queue.
+            catalog (CatalogBuilder): Catalog recording the writes.
+
+        Raises:
+            ValueError: If a flow entry is empty.
+        """
         for flow_id in flow_ids:
             if self[flow_id] is None:
                 raise ValueError(
                     f"Dataset contains empty design flow entry: '{flow_id}'"
                 )
-            self.dump_design_flow(flow_id)
 
-    def dump_design_flow(self, flow_id: str) -> None:
+        global _dump_dataset  # pylint: disable=global-statement
+        fork = "fork" in multiprocessing.get_all_start_methods()
+        if fork:
+            _dump_dataset = self
+        writer = WriterThread(self.db, queue_size)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("fork") if fork else None,
+            ) as pool:
+                # Bound submitted shards so finished extractions cannot pile
+                # up in memory while the writer is behind
+                pending = deque()
+                max_pending = workers + queue_size
+                for flow_id in flow_ids:
+                    design_flow = self[flow_id]
+                    pending.append(design_flow_writes(design_flow))
+                    for stage_enum in entity.DesignStages:
+                        stage = stage_enum.value
+                        stage_arg = () if fork else (design_flow.stages[stage],)
+                        pending.append(
+                            pool.submit(_dump_stage_worker, flow_id, stage, *stage_arg)
+                        )
+                        if writer.ident is None:
+                            # Start once the pool has created its processes
+                            writer.start()
+                        while len(pending) > max_pending:
+                            writer.put(_resolve_writes(pending.popleft(), catalog))
+                while pending:
+                    writer.put(_resolve_writes(pending.popleft(), catalog))
+        finally:
+            _dump_dataset = None
+            writer.close()
+
+    def dump_design_flow(
+        self,
+        flow_id: str,
+        catalog: Optional[CatalogBuilder] = None,
+        mode: str = "overwrite",
+    ) -> None:
         """
         Persist a complete design flow and all its stages.
 
         Args:
             flow_id (str): Flow identifier stored in this dataset.
+            catalog (CatalogBuilder | None): Catalog recording the writes.
+            mode (str): With "append", check first that the flow is not
+                stored yet. Without a ``catalog``, an up-to-date catalog
+                of the stored tables is then extended with the flow and
+                replaced in one rename; a missing or stale one is removed,
+                as in ``dump(mode="append")``.
+
+        Raises:
+            ValueError: If ``mode`` is unknown.
+            DuplicateKeyError: If appending a flow that is already stored.
         """
+        if mode not in DUMP_MODES:
+            raise ValueError(f"Unknown dump mode '{mode}', expected one of {DUMP_MODES}")
+        write_catalog = False
+        if mode == "append":
+            self._check_new_flows([flow_id])
+            if catalog is None and self.db.has_table("design_flows"):
+                catalog = self._append_catalog()
+                write_catalog = catalog is not None
         design_flow = self[flow_id]
-
-        self.db.add_table_row("design_flows", design_flow.get_tabular_data())
-        self.db.add_table_row("constraints", design_flow.constraints.get_tabular_data())
+        apply_writes(self.db, design_flow_writes(design_flow), catalog)
 
         for stage_enum in entity.DesignStages:
             stage = stage_enum.value
-            self.dump_design_stage(design_flow.stages[stage], flow_id, stage)
+            self.dump_design_stage(design_flow.stages[stage], flow_id, stage, catalog)
+
+        if write_catalog:
+            self.db.write_catalog(catalog.to_dict())
 
     def dump_design_stage(
-        self, design_stage: entity.DesignStageEntity, flow_id: str, stage: str
+        self,
+        design_stage: entity.DesignStageEntity,
+        flow_id: str,
+        stage: str,
+        catalog: Optional[CatalogBuilder] = None,
     ) -> None:
         """
         Persist a design-stage and associated netlist and all metrics.
@@ -171,115 +907,10 @@ class Dataset(dict):
             design_stage (DesignStageEntity): Stage containing netlist + metrics.
             flow_id (str): Flow identifier.
             stage (str): Stage name.
+            catalog (CatalogBuilder | None): Catalog recording the writes.
         """
-        self.db.add_table_row("design_stages", design_stage.get_tabular_data())
-
-        netlist = design_stage.netlist
-        if netlist is None:
-            return
-        # Persist stage-level metadata + metrics tables
-        self.db.add_table_row("netlists", netlist.get_tabular_data())
-        self.db.add_table_row(
-            "cell_metrics", design_stage.cell_metrics.get_tabular_data()
-        )
-        self.db.add_table_row(
-            "area_metrics", design_stage.area_metrics.get_tabular_data()
-        )
-        self.db.add_table_row(
-            "power_metrics", design_stage.power_metrics.get_tabular_data()
-        )
-        self.db.add_table_row(
-            "routability_metrics", design_stage.routability_metrics.get_tabular_data()
-        )
-        self.db.add_table_row(
-            "timing_metrics", design_stage.timing_metrics.get_tabular_data()
-        )
-
-        self.db.add_entity_images(
-            "routability_metrics", design_stage.routability_metrics
-        )
-
-        # Dump netlist graph
-        self.db.add_graph_data(
-            "netlists", netlist.get_graph_data(), flow_id=flow_id, stage=stage
-        )
-        self.db.add_entity_images("netlists", netlist)
-
-        # Dump node entities (PORT / GATE / PIN / NET)
-        port_data, gate_data, pin_data, net_data = (
-            [],
-            [],
-            [],
-            [],
-        )
-        for node in netlist.nodes:
-            node_entity = netlist.nodes[node]["entity"]
-            node_type = netlist.nodes[node]["type"]
-            if node_type == "PORT":
-                port_data.append(node_entity.get_tabular_data())
-            elif node_type == "GATE":
-                gate_data.append(node_entity.get_tabular_data())
-            elif node_type == "PIN":
-                pin_data.append(node_entity.get_tabular_data())
-            elif node_type == "NET":
-                net_data.append(node_entity.get_tabular_data())
-
-        self.db.add_table_data("ports", port_data)
-        self.db.add_table_data("gates", gate_data)
-        self.db.add_table_data("pins", pin_data)
-        self.db.add_table_data("nets", net_data)
-
-        # Dump timing paths + their graphs
-        timing_path_data = []
-        net_arc_data = []
-        cell_arc_data = []
-        timing_path_graphs = []
-
-        for timing_path in netlist.timing_paths.values():
-            timing_path_data.append(timing_path.get_tabular_data())
-            for node in timing_path.nodes:
-                tp_node_entity = timing_path.nodes[node]["entity"]
-                tp_node_type = timing_path.nodes[node]["type"]
-                if tp_node_type == "NET_ARC":
-                    net_arc_data.append(tp_node_entity.get_tabular_data())
-                elif tp_node_type == "CELL_ARC":
-                    cell_arc_data.append(tp_node_entity.get_tabular_data())
-            timing_path_graphs.append(
-                {
-                    "data": timing_path.get_graph_data(),
-                    "flow_id": flow_id,
-                    "stage": stage,
-                    "startpoint": timing_path.startpoint,
-                    "endpoint": timing_path.endpoint,
-                    "path_type": timing_path.path_type,
-                }
-            )
-
-        self.db.add_table_data("net_arcs", net_arc_data)
-        self.db.add_table_data("cell_arcs", cell_arc_data)
-        self.db.add_table_data("timing_paths", timing_path_data)
-        self.db.add_graph_data_batch("timing_paths", timing_path_graphs)
-
-        # Dump clock trees
-        clock_tree_data = []
-        for clock_source, clock_tree in netlist.clock_trees.items():
-            clock_tree_data.append(clock_tree.get_tabular_data())
-            self.db.add_graph_data(
-                "clock_trees",
-                clock_tree.get_graph_data(),
-                flow_id=flow_id,
-                stage=stage,
-                clock_source=clock_source,
-            )
-            self.db.add_entity_images("clock_trees", clock_tree)
-        self.db.add_table_data("clock_trees", clock_tree_data)
-
-        # Dump power delivery network
-        self.db.add_entity_images(
-            "power_delivery_networks", netlist.power_delivery_network
-        )
-        self.db.add_table_row(
-            "power_delivery_networks", netlist.power_delivery_network.get_tabular_data()
+        apply_writes(
+            self.db, design_stage_writes(design_stage, flow_id, stage), catalog
         )
 
     def load_standard_cells(self) -> None:
@@ -293,35 +924,117 @@ class Dataset(dict):
             if cell.is_sequential:
                 self.standard_cells.seq_cells.append(cell.name)
 
-    def load(self, flow_id: str | None = None, stage: str | None = None) -> None:
+    def load(
+        self,
+        flow_id: str | None = None,
+        stage: str | None = None,
+        lazy: bool = False,
+        workers: Optional[int] = None,
+    ) -> None:
         """
         Load the complete dataset—or a filtered subset—from the database.
 
+        With ``lazy=True`` only flow rows are read up front. Each flow's
+        ``stages`` loads a stage on first access, ``DesignStageEntity.netlist``
+        is a ``LazyNetlist`` proxy backed by ``netlist_cache``, and a
+        netlist's ``timing_paths`` and ``clock_trees`` load on first access.
+
+        With ``workers`` > 1, (flow_id, stage) shards are loaded by a pool
+        of worker processes, each with its own unpickled copy of ``db``
+        (a ``ParquetDB`` must have no uncommitted writes). Stages are
+        returned as protocol-5 pickles that this process unpickles one by
+        one. Unpickling a stage costs about a third of loading it (mostly
+        the timing paths' arc entities, with either graph backend;
+        ``graph_backend="csr"`` and ``node_store="columnar"`` only make the
+        netlist graph and node rows cheap), so the speed-up over a serial
+        load is bounded at about 2-3x however many workers are used.
+
         Args:
             flow_id (str | None): If provided, load only this flow.
             stage (str | None): If provided, restrict loading to this stage.
                 When provided, `flow_id` must also be supplied.
+            lazy (bool): Defer loading of stages, netlists, timing paths
+                and clock trees until they are accessed.
+            workers (int | None): Number of worker processes for eager
+                loads. None or 1 loads in this process.
 
         Returns:
             None. The Dataset instance is populated in-place.
+
+        Raises:
+            ValueError: If ``workers`` is not positive or is combined with
+                ``lazy=True``.
         """
+        if workers is not None and workers <= 0:
+            raise ValueError(f"workers must be positive, got {workers}")
+        if lazy and workers not in (None, 1):
+            raise ValueError("workers cannot be combined with lazy loading")
+
         # Load standard-cell library
         self.load_standard_cells()
 
-        # Determine which flows to load
+        # Determine which flows to load; the catalog lists them without a read
+        catalog = self.catalog
         if flow_id is not None:
             flow_ids = [flow_id]
+        elif catalog is not None:
+            flow_ids = list(catalog["flows"])
         else:
             df_flows = self.db.get_table_data("design_flows")
             flow_ids = list(df_flows["flow_id"])
 
+        if workers not in (None, 1):
+            self._load_parallel(flow_ids, stage, workers, catalog)
+            return
+
         # Fully load each design flow
         for _flow_id in flow_ids:
-            design_flow = self.load_design_flow(_flow_id, stage)
+            design_flow = self.load_design_flow(_flow_id, stage, lazy=lazy)
             self[_flow_id] = design_flow
 
+    def _load_parallel(
+        self,
+        flow_ids: List[str],
+        stage: str | None,
+        workers: int,
+        catalog: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Load design flows with their stages sharded across worker processes.
+
+        Args:
+            flow_ids (list[str]): Flows to load.
+            stage (str | None): Limit loading to this stage only.
+            workers (int): Number of worker processes.
+            catalog (dict | None): Dataset catalog; the largest shards are
+                submitted first so no worker is left with one at the end.
+        """
+        stages = [s.value for s in entity.DesignStages if not stage or stage == s.value]
+        options = {
+            "node_store": self.node_store,
+            "graph_backend": self.graph_backend,
+            "table_format": self.table_format,
+        }
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_load_worker,
+            initargs=(self.db, options),
+        ) as pool:
+            keys = [(_flow_id, _stage) for _flow_id in flow_ids for _stage in stages]
+            if catalog is not None:
+                keys.sort(key=lambda key: stage_rows(catalog, *key), reverse=True)
+            shards = {key: pool.submit(_load_stage_worker, *key) for key in keys}
+            # Flow rows are read here while the workers load stages
+            for _flow_id in flow_ids:
+                design_flow = self.db.get_entity("design_flows", flow_id=_flow_id)
+                for _stage in stages:
+                    design_flow.stages[_stage] = pickle.loads(
+                        shards[(_flow_id, _stage)].result()
+                    )
+                self[_flow_id] = design_flow
+
     def load_design_flow(
-        self, flow_id: str, stage: str | None = None
+        self, flow_id: str, stage: str | None = None, lazy: bool = False
     ) -> entity.DesignFlowEntity:
         """
         Load a full design flow (or a specific stage of it).
@@ -329,46 +1042,157 @@ class Dataset(dict):
         Args:
             flow_id (str): Flow identifier.
             stage (str | None): Limit reconstruction to this stage only.
+            lazy (bool): Load stages on first access instead of up front.
 
         Returns:
             DesignFlowEntity: Fully reconstructed design-flow object.
         """
         design_flow_entity = self.db.get_entity("design_flows", flow_id=flow_id)
-        for stage_enum in entity.DesignStages:
-            _stage = stage_enum.value
-            if stage and stage != _stage:
-                continue
-            design_flow_entity.stages[_stage] = self.load_design_stage(
-                flow_id=flow_id, stage=_stage
+        if lazy:
+            stored = set(
+                self.db.get_table_data("design_stages", flow_id=flow_id)["stage"]
+            )
+            design_flow_entity.stages = LazyDict(
+                [
+                    s.value
+                    for s in entity.DesignStages
+                    if s.value in stored and (not stage or stage == s.value)
+                ],
+                partial(self._pinned().load_design_stage, flow_id, lazy=True),
+            )
+            return design_flow_entity
+
+        stages = [s.value for s in entity.DesignStages if not stage or stage == s.value]
+        for _stage, stage_entities in zip(
+            stages, self._load_stage_entities(flow_id, stages)
+        ):
+            design_flow_entity.stages[_stage] = self._assemble_design_stage(
+                flow_id, _stage, stage_entities
             )
         return design_flow_entity
 
-    def load_design_stage(self, flow_id: str, stage: str) -> entity.DesignStageEntity:
+    def load_design_stage(
+        self, flow_id: str, stage: str, lazy: bool = False
+    ) -> entity.DesignStageEntity:
         """
         Load a design stage including netlist + all metric entities.
 
         Args:
             flow_id (str): Flow identifier.
             stage (str): Stage name.
+            lazy (bool): Attach a LazyNetlist proxy instead of loading the
+                netlist.
 
         Returns:
             DesignStageEntity: The reconstructed stage entity.
         """
-        design_stage_entity = self.db.get_entity(
-            "design_stages", flow_id=flow_id, stage=stage
-        )
-        design_stage_entity.netlist = self.load_netlist(flow_id=flow_id, stage=stage)
-        design_stage_entity.cell_metrics = self.db.get_entity(
-            "cell_metrics", flow_id=flow_id, stage=stage
-        )
-        design_stage_entity.area_metrics = self.db.get_entity(
-            "area_metrics", flow_id=flow_id, stage=stage
-        )
+        (stage_entities,) = self._load_stage_entities(flow_id, [stage])
+        return self._assemble_design_stage(flow_id, stage, stage_entities, lazy=lazy)
+
+    def _load_stage_entities(
+        self, flow_id: str, stages: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Read the stage-level entities of several stages of a flow, one
+        ``get_entities`` call per table.
+
+        Args:
+            flow_id (str): Flow identifier.
+            stages (list[str]): Stage names.
+
+        Returns:
+            list[dict]: Per stage, entity table name -> entity.
+        """
+        keys = [{"flow_id": flow_id, "stage": stage} for stage in stages]
+        entities = {
+            entity_name: self.db.get_entities(entity_name, keys)
+            for entity_name in STAGE_ENTITY_TABLES
+        }
+        return [
+            {entity_name: objs[i] for entity_name, objs in entities.items()}
+            for i in range(len(stages))
+        ]
+
+    def _pinned(self) -> "Dataset":
+        """
+        Get a dataset without flows that reads from the current database.
+
+        Loaders of lazy proxies are bound to it, so the proxies keep reading
+        from the database they were loaded from even if ``db`` is replaced
+        later, e.g. to dump the dataset elsewhere. It shares the netlist
+        cache and load options of this dataset.
+
+        Returns:
+            Dataset: Reader pinned to ``self.db``.
+        """
+        reader = Dataset.__new__(Dataset)
+        reader.__dict__.update(self.__dict__)
+        return reader
+
+    def _materialize_lazy(self, flow_ids: List[str]) -> None:
+        """
+        Load everything a lazy load deferred and replace the proxies with
+        the loaded stages, netlists, timing paths and clock trees.
+
+        Args:
+            flow_ids (list[str]): Flows to materialize.
+        """
+        for flow_id in flow_ids:
+            design_flow = self[flow_id]
+            if design_flow is None:
+                continue
+            if isinstance(design_flow.stages, LazyDict):
+                design_flow.stages = {
+                    stage: design_flow.stages[stage] for stage in design_flow.stages
+                }
+            for design_stage in design_flow.stages.values():
+                netlist = design_stage.netlist
+                if isinstance(netlist, LazyNetlist):
+                    netlist = design_stage.netlist = netlist.materialize()
+                if netlist is None:
+                    continue
+                for name in ["timing_paths", "clock_trees"]:
+                    graphs = getattr(netlist, name)
+                    if isinstance(graphs, LazyMapping):
+                        setattr(netlist, name, dict(graphs))
+
+    def _assemble_design_stage(
+        self,
+        flow_id: str,
+        stage: str,
+        stage_entities: Dict[str, Any],
+        lazy: bool = False,
+    ) -> entity.DesignStageEntity:
+        """
+        Build a design stage from its stage-level entities and netlist.
+
+        Args:
+            flow_id (str): Flow identifier.
+            stage (str): Stage name.
+            stage_entities (dict): Entity table name -> entity of the stage,
+                as returned by ``_load_stage_entities``.
+            lazy (bool): Attach a LazyNetlist proxy instead of loading the
+                netlist.
+
+        Returns:
+            DesignStageEntity: The reconstructed stage entity.
+        """
+        design_stage_entity = stage_entities["design_stages"]
+        if lazy:
+            design_stage_entity.netlist = LazyNetlist(
+                self.netlist_cache,
+                (flow_id, stage),
+                partial(self._pinned().load_netlist, flow_id, stage, lazy=True),
+            )
+        else:
+            design_stage_entity.netlist = self.load_netlist(
+                flow_id=flow_id, stage=stage
+            )
+        design_stage_entity.cell_metrics = stage_entities["cell_metrics"]
+        design_stage_entity.area_metrics = stage_entities["area_metrics"]
 
         # Load power metrics and apply migration (Watts -> μW) if needed
-        power_metrics = self.db.get_entity(
-            "power_metrics", flow_id=flow_id, stage=stage
-        )
+        power_metrics = stage_entities["power_metrics"]
         if power_metrics:
             # Migration: Convert from Watts to μW if values are in old format (< 1.0)
             # New parser outputs values in μW (typically > 100), old database has Watts (< 1.0)
@@ -404,15 +1228,13 @@ class Dataset(dict):
                     )
         design_stage_entity.power_metrics = power_metrics
 
-        design_stage_entity.routability_metrics = self.db.get_entity(
-            "routability_metrics", flow_id=flow_id, stage=stage
-        )
-        design_stage_entity.timing_metrics = self.db.get_entity(
-            "timing_metrics", flow_id=flow_id, stage=stage
-        )
+        design_stage_entity.routability_metrics = stage_entities["routability_metrics"]
+        design_stage_entity.timing_metrics = stage_entities["timing_metrics"]
         return design_stage_entity
 
-    def load_netlist(self, flow_id: str, stage: str) -> entity.NetlistEntity:
+    def load_netlist(
+        self, flow_id: str, stage: str, lazy: bool = False
+    ) -> entity.NetlistEntity:
         """
         Load a NetlistEntity and rebuild all node entities,
         timing paths, arcs, and clock trees.
@@ -420,22 +1242,63 @@ class Dataset(dict):
         Args:
             flow_id (str): Flow identifier.
             stage (str): Stage name.
+            lazy (bool): Load timing paths and clock trees on first access.
 
         Returns:
             NetlistEntity: Fully reconstructed netlist entity.
         """
         netlist_entity = self.db.get_entity(
-            "netlists", load_sub_entities=False, flow_id=flow_id, stage=stage
+            "netlists",
+            load_sub_entities=False,
+            graph_backend=self.graph_backend,
+            flow_id=flow_id,
+            stage=stage,
+        )
+
+        if self.node_store == "columnar":
+            self._attach_node_tables(netlist_entity, flow_id, stage)
+        else:
+            self._attach_node_entities(netlist_entity, flow_id, stage)
+
+        if lazy:
+            reader = self._pinned()
+            netlist_entity.timing_paths = LazyMapping(
+                partial(reader.load_timing_paths, flow_id, stage, netlist_entity)
+            )
+            netlist_entity.clock_trees = LazyMapping(
+                partial(reader.load_clock_trees, flow_id, stage, netlist_entity)
+            )
+        else:
+            netlist_entity.timing_paths = self.load_timing_paths(
+                flow_id, stage, netlist_entity
+            )
+            netlist_entity.clock_trees = self.load_clock_trees(
+                flow_id, stage, netlist_entity
+            )
+        netlist_entity.power_delivery_network = self.db.get_entity(
+            "power_delivery_networks", flow_id=flow_id, stage=stage
         )
 
-        port_df = self.db.get_table_data("ports", flow_id=flow_id, stage=stage)
-        port_dict = port_df.set_index("name").to_dict("index")
-        pin_df = self.db.get_table_data("pins", flow_id=flow_id, stage=stage)
-        pin_dict = pin_df.set_index("name").to_dict("index")
-        gate_df = self.db.get_table_data("gates", flow_id=flow_id, stage=stage)
-        gate_dict = gate_df.set_index("name").to_dict("index")
-        net_df = self.db.get_table_data("nets", flow_id=flow_id, stage=stage)
-        net_dict = net_df.set_index("name").to_dict("index")
+        return netlist_entity
+
+    def _attach_node_entities(
+        self, netlist_entity: entity.NetlistEntity, flow_id: str, stage: str
+    ) -> None:
+        """
+        Attach one entity dataclass per netlist node.
+
+        Args:
+            netlist_entity (NetlistEntity): Netlist with its graph loaded.
+            flow_id (str): Flow identifier.
+            stage (str): Stage name.
+        """
+        port_dict, pin_dict, gate_dict, net_dict = (
+            {
+                row.pop("name"): row
+                for row in self._read_records(table, flow_id=flow_id, stage=stage)
+            }
+            for table in ["ports", "pins", "gates", "nets"]
+        )
 
         for node in netlist_entity.nodes:
             node_type = netlist_entity.nodes[node]["type"]
@@ -456,17 +1319,34 @@ class Dataset(dict):
                     name=node, **net_dict[node]
                 )
 
-        netlist_entity.timing_paths = self.load_timing_paths(
-            flow_id, stage, netlist_entity
-        )
-        netlist_entity.clock_trees = self.load_clock_trees(
-            flow_id, stage, netlist_entity
-        )
-        netlist_entity.power_delivery_network = self.db.get_entity(
-            "power_delivery_networks", flow_id=flow_id, stage=stage
-        )
+    def _attach_node_tables(
+        self, netlist_entity: entity.NetlistEntity, flow_id: str, stage: str
+    ) -> None:
+        """
+        Attach NodeView row views backed by one NodeTable per node type.
 
-        return netlist_entity
+        Args:
+            netlist_entity (NetlistEntity): Netlist with its graph loaded.
+            flow_id (str): Flow identifier.
+            stage (str): Stage name.
+
+        Raises:
+            KeyError: If a graph node has no row in its node table.
+        """
+        names_by_type: Dict[str, List[str]] = {t: [] for t in NETLIST_NODE_TABLES}
+        for node, node_type in netlist_entity.nodes(data="type"):
+            if node_type in names_by_type:
+                names_by_type[node_type].append(node)
+
+        for node_type, (table_name, entity_cls) in NETLIST_NODE_TABLES.items():
+            names = names_by_type[node_type]
+            if not names:
+                continue
+            table = NodeTable(
+                entity_cls, self._read_table(table_name, flow_id=flow_id, stage=stage)
+            )
+            for node, row in zip(names, table.rows_for(names)):
+                netlist_entity.nodes[node]["entity"] = table.view(row)
 
     def load_timing_paths(
         self,
@@ -488,32 +1368,31 @@ class Dataset(dict):
             dict[tuple[str, str, str], TimingPathEntity]:
                 Mapping (startpoint, endpoint, path_type) → TimingPathEntity.
         """
-        net_arc_df = self.db.get_table_data("net_arcs", flow_id=flow_id, stage=stage)
-        net_arc_dict = {}
-        for _, row in net_arc_df.iterrows():
-            row_dict = row.to_dict()
-            key = (row.startpoint, row.endpoint, row.path_type, row.net_name)
-            net_arc_dict[key] = row_dict
-
-        cell_arc_df = self.db.get_table_data("cell_arcs", flow_id=flow_id, stage=stage)
-        cell_arc_dict = {}
-        for _, row in cell_arc_df.iterrows():
-            row_dict = row.to_dict()
-            key = (row.startpoint, row.endpoint, row.path_type, row.gate_name)
-            cell_arc_dict[key] = row_dict
+        if self.table_format == "arrow":
+            net_arcs = group_arc_rows(
+                self._read_records("net_arcs", flow_id=flow_id, stage=stage),
+                "net_name",
+            )
+            cell_arcs = group_arc_rows(
+                self._read_records("cell_arcs", flow_id=flow_id, stage=stage),
+                "gate_name",
+            )
+        else:
+            net_arcs = group_arc_records(
+                self.db.get_table_data("net_arcs", flow_id=flow_id, stage=stage),
+                "net_name",
+            )
+            cell_arcs = group_arc_records(
+                self.db.get_table_data("cell_arcs", flow_id=flow_id, stage=stage),
+                "gate_name",
+            )
 
         timing_paths = {}
-        df = self.db.get_table_data("timing_paths", flow_id=flow_id, stage=stage)
-        for row in df.itertuples(index=False):
-            timing_path_entity = self.db.get_entity(
-                "timing_paths",
-                flow_id=flow_id,
-                stage=stage,
-                startpoint=row.startpoint,
-                endpoint=row.endpoint,
-                path_type=row.path_type,
-                load_sub_entities=False,
-            )
+        for path_key, timing_path_entity in self._load_graph_entities(
+            "timing_paths", TIMING_PATH_KEYS, flow_id=flow_id, stage=stage
+        ).items():
+            path_net_arcs = net_arcs.get(path_key, {})
+            path_cell_arcs = cell_arcs.get(path_key, {})
 
             for node in timing_path_entity.nodes:
                 node_type = timing_path_entity.nodes[node]["type"]
@@ -526,21 +1405,17 @@ class Dataset(dict):
                         node
                     ]["entity"]
                 elif node_type == "NET_ARC":
-                    arc_key = (row.startpoint, row.endpoint, row.path_type, node)
-                    if arc_key in net_arc_dict:
+                    if node in path_net_arcs:
                         timing_path_entity.nodes[node]["entity"] = entity.NetArcEntity(
-                            **net_arc_dict[arc_key]
+                            **path_net_arcs[node]
                         )
                 elif node_type == "CELL_ARC":
-                    arc_key = (row.startpoint, row.endpoint, row.path_type, node)
-                    if arc_key in cell_arc_dict:
+                    if node in path_cell_arcs:
                         timing_path_entity.nodes[node]["entity"] = entity.CellArcEntity(
-                            **cell_arc_dict[arc_key]
+                            **path_cell_arcs[node]
                         )
 
-            timing_paths[(row.startpoint, row.endpoint, row.path_type)] = (
-                timing_path_entity
-            )
+            timing_paths[path_key] = timing_path_entity
 
         return timing_paths
 
@@ -561,20 +1436,259 @@ class Dataset(dict):
             dict[str, ClockTreeEntity]: Mapping of clock_source → reconstructed ClockTreeEntity.
         """
         clock_tree_entities = {}
-        df = self.db.get_table_data("clock_trees", flow_id=flow_id, stage=stage)
-        for row in df.itertuples(index=False):
-            clock_tree_entity = self.db.get_entity(
-                "clock_trees",
-                load_sub_entities=False,
-                flow_id=flow_id,
-                stage=stage,
-                clock_source=row.clock_source,
-            )
+        for (clock_source,), clock_tree_entity in self._load_graph_entities(
+            "clock_trees", ["clock_source"], flow_id=flow_id, stage=stage
+        ).items():
             for node in clock_tree_entity.nodes:
                 clock_tree_entity.nodes[node]["entity"] = netlist_entity.nodes[node][
                     "entity"
                 ]
 
-            clock_tree_entities[row.clock_source] = clock_tree_entity
+            clock_tree_entities[clock_source] = clock_tree_entity
 
         return clock_tree_entities
+
+    def _read_table(self, entity_name: str, **filters: Any) -> pd.DataFrame | pa.Table:
+        """
+        Read an entity table in the dataset's table format.
+
+        Args:
+            entity_name (str): Name of the entity table.
+            **filters: Column filters.
+
+        Returns:
+            pd.DataFrame | pa.Table: Matching rows.
+        """
+        if self.table_format == "arrow":
+            return self.db.get_table_arrow(entity_name, **filters)
+        return self.db.get_table_data(entity_name, **filters)
+
+    def _read_records(self, entity_name: str, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        Read entity table rows as dicts, skipping internal "_" columns.
+
+        Args:
+            entity_name (str): Name of the entity table.
+            **filters: Column filters.
+
+        Returns:
+            list[dict]: One dict per matching row.
+        """
+        table = self._read_table(entity_name, **filters)
+        if isinstance(table, pa.Table):
+            table = table.select([c for c in table.column_names if not c.startswith("_")])
+            return table.to_pylist()
+        table = table[[c for c in table.columns if not c.startswith("_")]]
+        return table.to_dict("records")
+
+    def load_image_batch(
+        self,
+        entity_name: str,
+        keys: List[Any],
+        fields: List[str],
+        shape: Tuple[int, int],
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """
+        Stack image fields of many entity rows into one ``(N, C, H, W)`` array.
+
+        Args:
+            entity_name (str): Name of the entity (e.g. "routability_metrics").
+            keys (list): Primary-key tuples (e.g. ``(flow_id, stage)``) or dicts.
+            fields (list[str]): Image fields, one channel each.
+            shape (tuple[int, int]): Target (height, width).
+            **kwargs: Options of ``eda_schema.image_batch.load_image_batch``
+                (mode, dtype, fill_value, missing, workers, cache_dir).
+
+        Returns:
+            np.ndarray: Array of shape ``(len(keys), len(fields), H, W)``.
+        """
+        return load_image_batch(self.db, entity_name, keys, fields, shape, **kwargs)
+
+    def summary(
+        self,
+        flow_id: str | List[str] | None = None,
+        stage: str | List[str] | None = None,
+        columns: Optional[List[str]] = None,
+        pivot: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Get the scalar metrics of every (flow_id, stage) from the stage
+        summary table, without loading any flow.
+
+        Datasets dumped before the table existed are summarized by joining
+        the netlist and metrics tables instead.
+
+        Args:
+            flow_id (str | list[str] | None): Flow(s) to include; None for all.
+            stage (str | list[str] | None): Stage(s) to include; None for all.
+            columns (list[str] | None): Metric columns to return (e.g.
+                ``["worst_slack", "total_power", "total_area"]``); None for all.
+            pivot (bool): Return one row per flow with (metric, stage)
+                columns instead (see ``stage_evolution``).
+
+        Returns:
+            pd.DataFrame: One row per stage, sorted by flow_id and stage
+            order, or the pivoted per-flow table.
+
+        Raises:
+            ValueError: If a column is not a stage summary column.
+        """
+        all_columns = _summary_columns()
+        if columns is not None:
+            unknown = [col for col in columns if col not in all_columns]
+            if unknown:
+                raise ValueError(
+                    f"Unknown summary columns {unknown}. Expected some of {all_columns}"
+                )
+
+        filters = {
+            key: value
+            for key, value in {"flow_id": flow_id, "stage": stage}.items()
+            if value is not None
+        }
+        try:
+            df = self.db.get_table_data("stage_summaries", **filters)
+        except (DataNotFoundError, FileNotFoundError):
+            df = build_stage_summaries(self.db, **filters)
+
+        keys = ["flow_id", "stage"]
+        df = df[keys + [col for col in columns or all_columns if col not in keys]]
+        stage_order = {s: i for i, s in enumerate(entity.DesignStages.tolist())}
+        df = df.sort_values(
+            keys,
+            key=lambda col: col.map(stage_order) if col.name == "stage" else col,
+            kind="stable",
+        ).reset_index(drop=True)
+        return stage_evolution(df) if pivot else df
+
+    def _load_graph_entities(
+        self, entity_name: str, key_columns: List[str], flow_id: str, stage: str
+    ) -> Dict[Tuple[str, ...], Any]:
+        """
+        Build all graph entities of a design stage from one table read and
+        one bulk graph read. Node sub-entities and Image2D fields are not
+        loaded, matching ``get_entity(..., load_sub_entities=False)``.
+
+        Args:
+            entity_name (str): Graph entity name (e.g. "timing_paths").
+            key_columns (list[str]): Primary-key columns identifying an
+                entity within the stage.
+            flow_id (str): Flow identifier.
+            stage (str): Stage name.
+
+        Returns:
+            dict[tuple, BaseEntity]: Key column values -> entity with graph.
+
+        Raises:
+            DataNotFoundError: If a table row has no stored graph.
+        """
+        model_cls = entity.SchemaMetadata.get_model(entity_name)
+        graphs = {
+            tuple(row[k] for k in key_columns): row["data"]
+            for row in self.db.get_graph_data_many(
+                entity_name, flow_id=flow_id, stage=stage
+            )
+        }
+
+        entities = {}
+        for row_dict in self._read_records(entity_name, flow_id=flow_id, stage=stage):
+            key = tuple(row_dict[k] for k in key_columns)
+            if key not in graphs:
+                raise DataNotFoundError(
+                    entity_name=entity_name,
+                    message=f"No graph data found for '{entity_name}' with keys: "
+                    f"flow_id={flow_id!r}, stage={stage!r}, {key!r}",
+                )
+            obj = model_cls(**row_dict)
+            obj.load_graph_data(graphs[key], backend=self.graph_backend)
+            if obj._dict_image_keys:
+                pk_fields = {pk: row_dict[pk] for pk in obj._primary_keys}
+                self.db.load_entity_dict_images(entity_name, obj, **pk_fields)
+            entities[key] = obj
+        return entities
+
+
+# Dataset of a parallel-load worker process, set by _init_load_worker
+_worker_dataset: Optional[Dataset] = None
+
+# Dataset being dumped with workers, inherited by forked dump workers
+_dump_dataset: Optional[Dataset] = None
+
+
+def _init_load_worker(db_obj: BaseDB, options: Dict[str, Any]) -> None:
+    """
+    Set up a worker process of ``Dataset.load(workers=...)``.
+
+    Args:
+        db_obj (BaseDB): The loading dataset's database.
+        options (dict): Dataset options (node store, graph backend, table format).
+    """
+    global _worker_dataset  # pylint: disable=global-statement
+    _worker_dataset = Dataset(db_obj, **options)
+
+
+def _load_stage_worker(flow_id: str, stage: str) -> bytes:
+    """
+    Load one design stage in a worker process.
+
+    Args:
+        flow_id (str): Flow identifier.
+        stage (str): Stage name.
+
+    Returns:
+        bytes: The pickled DesignStageEntity.
+    """
+    design_stage = _worker_dataset.load_design_stage(flow_id, stage)
+    return pickle.dumps(design_stage, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _dump_stage_worker(
+    flow_id: str,
+    stage: str,
+    design_stage: Optional[entity.DesignStageEntity] = None,
+) -> bytes:
+    """
+    Extract the writes of one design stage in a worker process of
+    ``Dataset.dump(workers=...)``.
+
+    The writes are counted for the catalog here, and encoded with the
+    dumping database's ``encode_writes`` when the dataset was inherited
+    from the parent.
+
+    Args:
+        flow_id (str): Flow identifier.
+        stage (str): Stage name.
+        design_stage (DesignStageEntity | None): Stage to extract, sent
+            with the task when the worker did not inherit ``_dump_dataset``.
+
+    Returns:
+        bytes: The pickled (writes, CatalogBuilder) pair.
+    """
+    if design_stage is None:
+        design_stage = _dump_dataset[flow_id].stages[stage]
+    writes = design_stage_writes(design_stage, flow_id, stage)
+    counts = CatalogBuilder()
+    counts.record(writes)
+    if _dump_dataset is not None:
+        writes = _dump_dataset.db.encode_writes(writes)
+    return pickle.dumps((writes, counts), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _resolve_writes(item: List[DBWrite] | Future, catalog: CatalogBuilder) -> List[DBWrite]:
+    """
+    Get the writes of a pipelined dump item and add them to the catalog.
+
+    Args:
+        item (list[DBWrite] | Future): Writes, or a worker's pending result.
+        catalog (CatalogBuilder): Catalog recording the writes.
+
+    Returns:
+        list[DBWrite]: The writes.
+    """
+    if isinstance(item, Future):
+        writes, counts = pickle.loads(item.result())
+        catalog.merge(counts)
+        return writes
+    catalog.record(item)
+    return item
@@ -1,4 +1,5 @@
 from eda_schema.db.base import BaseDB
+from eda_schema.db.caching import CachingDB
 from eda_schema.db.file import FileDB
 from eda_schema.db.mongo import MongoDB
 from eda_schema.db.parquet import ParquetDB
@@ -6,6 +7,7 @@ from eda_schema.db.sqlite_pkl import SQLitePickleDB
 
 __all__ = [
     "BaseDB",
+    "CachingDB",
     "FileDB",
     "MongoDB",
     "ParquetDB",
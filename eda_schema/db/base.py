@@ -16,16 +16,200 @@
 # expressly prohibited; derivative works must be shared under the same
 # license terms (ShareAlike).
 
+import json
+import os
+import tempfile
 import warnings
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import pandas as pd
+import pyarrow as pa
 
 from eda_schema import entity
 from eda_schema.base import Image2D
+from eda_schema.catalog import CATALOG_VERSION, add_storage_info
 from eda_schema.errors import DataNotFoundError
 
+# Default maximum number of rows per batch yielded by iter_table_batches
+DEFAULT_BATCH_SIZE = 64 * 1024
+
+# Dict[str, Image2D] keys tried for rows stored before image manifests existed
+LEGACY_DICT_IMAGE_KEYS = [
+    "met1",
+    "met2",
+    "met3",
+    "met4",
+    "met5",
+    "metal1",
+    "metal2",
+    "metal3",
+    "metal4",
+    "metal5",
+]
+
+
+def check_batch_size(batch_size: int) -> int:
+    """
+    Validate the batch size of a streaming table read.
+
+    Args:
+        batch_size (int): Maximum number of rows per batch.
+
+    Returns:
+        int: The batch size.
+
+    Raises:
+        ValueError: If ``batch_size`` is not positive.
+    """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    return batch_size
+
+
+def _manifest_entry(
+    image_field: str,
+    dict_key: Optional[str],
+    image_name: Optional[str],
+    image: Optional[Image2D],
+) -> Dict[str, Any]:
+    """
+    Build one image manifest entry.
+
+    Args:
+        image_field (str): Name of the entity image field.
+        dict_key (str | None): Key within a Dict[str, Image2D] field.
+        image_name (str | None): Stored image name, or None if nothing was stored.
+        image (Image2D | None): The stored image.
+
+    Returns:
+        dict: Manifest entry as passed to ``BaseDB.add_image_manifest``.
+    """
+    if image is None:
+        image_name = None
+    return {
+        "image_field": image_field,
+        "dict_key": dict_key,
+        "image_name": image_name,
+        "shape": None if image is None else [int(n) for n in image.shape],
+        "dtype": None if image is None else str(image.dtype),
+    }
+
+
+def existing_files(*paths: Path) -> List[Path]:
+    """
+    List the files at or under some paths.
+
+    Args:
+        *paths (Path): Files or directories; missing paths are skipped.
+
+    Returns:
+        list[Path]: Existing files, directories expanded recursively.
+    """
+    files = []
+    for path in paths:
+        if path.is_file():
+            files.append(path)
+        elif path.is_dir():
+            files += sorted(p for p in path.rglob("*") if p.is_file())
+    return files
+
+
+def _key_tuple(key: Dict[str, Any], pk_cols: List[str]) -> tuple:
+    """
+    Get the primary-key values of a row as a tuple of strings.
+
+    Keys are compared as strings because backends may return key columns
+    with a different scalar type than the caller passed in.
+
+    Args:
+        key (dict): Row or key fields.
+        pk_cols (list[str]): Primary-key columns.
+
+    Returns:
+        tuple: Stringified key values in column order.
+    """
+    return tuple(str(key[pk]) for pk in pk_cols)
+
+
+def _select_keys(
+    df: pd.DataFrame, pk_cols: List[str], keys: List[Dict[str, Any]]
+) -> pd.DataFrame:
+    """
+    Keep the rows whose full primary key is one of ``keys``.
+
+    Args:
+        df (pd.DataFrame): Candidate rows.
+        pk_cols (list[str]): Primary-key columns.
+        keys (list[dict]): Requested primary-key values.
+
+    Returns:
+        pd.DataFrame: The requested rows.
+    """
+    if df.empty:
+        return df
+    wanted = {_key_tuple(key, pk_cols) for key in keys}
+    mask = [
+        tuple(map(str, values)) in wanted
+        for values in df[pk_cols].itertuples(index=False, name=None)
+    ]
+    return df[mask]
+
+
+class _PrefetchedNodeTables:
+    """
+    Node rows for all entities of one ``get_entities`` call.
+
+    Each node table is read once for the key values of every requested
+    entity and grouped by them; calls then return one entity's rows.
+    """
+
+    def __init__(self, db: "BaseDB", keys: List[Dict[str, Any]]):
+        """
+        Args:
+            db (BaseDB): Database holding the node tables.
+            keys (list[dict]): Primary-key values of the requested entities.
+        """
+        self.db = db
+        self.keys = keys
+        self._groups: Dict[tuple, Dict[tuple, pd.DataFrame]] = {}
+
+    def __call__(self, node_entity_name: str, **filters) -> pd.DataFrame:
+        """
+        Get the node rows matching one entity's filters.
+
+        Args:
+            node_entity_name (str): Node table name.
+            **filters: Key column values, plus an optional "name" list.
+
+        Returns:
+            pd.DataFrame: Matching node rows.
+        """
+        key_cols = [col for col in filters if col != "name"]
+        cache_key = (node_entity_name, tuple(key_cols))
+        groups = self._groups.get(cache_key)
+        if groups is None:
+            in_filters = {
+                col: sorted({key[col] for key in self.keys}, key=str) for col in key_cols
+            }
+            df = self.db.get_table_data(node_entity_name, **in_filters)
+            if key_cols:
+                groups = {
+                    tuple(map(str, group_key)): group
+                    for group_key, group in df.groupby(key_cols, sort=False)
+                }
+            else:
+                groups = {(): df}
+            self._groups[cache_key] = groups
+
+        df = groups.get(tuple(str(filters[col]) for col in key_cols))
+        if df is None:
+            return pd.DataFrame()
+        if "name" in filters:
+            df = df[df["name"].isin(filters["name"])]
+        return df
+
 
 class BaseDB(metaclass=ABCMeta):
     """
@@ -51,6 +235,26 @@ class BaseDB(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def has_table(self, entity_name: str) -> bool:
+        """
+        Check whether the table of an entity was created.
+
+        The default implementation reads the table and treats
+        ``DataNotFoundError`` or ``FileNotFoundError`` as a missing table.
+        Backends that can check without reading rows override it.
+
+        Args:
+            entity_name (str): Name of the entity.
+
+        Returns:
+            bool: True if the table exists.
+        """
+        try:
+            self.get_table_data(entity_name)
+        except (DataNotFoundError, FileNotFoundError):
+            return False
+        return True
+
     # ------------------------------------------------------------------
     # Graph Storage
     # ------------------------------------------------------------------
@@ -82,6 +286,72 @@ class BaseDB(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def get_graph_data_many(
+        self, entity_name: str, **partial_keys
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve every stored graph whose primary keys match the given
+        subset of key fields (e.g. all timing paths of one flow/stage).
+
+        Each result has the same shape as an ``add_graph_data_batch`` row:
+        the full primary-key values plus the graph under ``"data"``.
+
+        The default implementation enumerates matching keys from the entity
+        table and calls ``get_graph_data`` once per key. Backends that can
+        fetch all graphs in a single scan or query override it.
+
+        Args:
+            entity_name (str): Name of the graph entity.
+            **partial_keys: Any subset of the entity's primary-key values.
+
+        Returns:
+            list[dict]: One ``{<pk>: value, ..., "data": graph}`` per graph.
+
+        Raises:
+            ValueError: If a key field is not a primary-key column.
+            DataNotFoundError: If a matching table row has no stored graph.
+        """
+        pk_cols = self._validate_partial_keys(entity_name, partial_keys)
+
+        keys_df = self.get_table_data(entity_name, **partial_keys)
+        results = []
+        for key_fields in keys_df[pk_cols].to_dict("records"):
+            graph_data = self.get_graph_data(entity_name, **key_fields)
+            results.append({**key_fields, "data": graph_data})
+        return results
+
+    @staticmethod
+    def _validate_partial_keys(
+        entity_name: str, partial_keys: Dict[str, Any]
+    ) -> List[str]:
+        """
+        Check that partial key fields only name primary-key columns.
+
+        Args:
+            entity_name (str): Name of the graph entity.
+            partial_keys (dict): Subset of primary-key values.
+
+        Returns:
+            list[str]: The entity's primary-key columns.
+
+        Raises:
+            ValueError: If the entity has no primary keys or a field is not
+                        a primary-key column.
+        """
+        pk_cols = entity.SchemaMetadata.get_pk_columns(entity_name)
+        if not pk_cols:
+            raise ValueError(
+                f"Entity '{entity_name}' has no defined primary-key fields"
+            )
+
+        extra = set(partial_keys) - set(pk_cols)
+        if extra:
+            raise ValueError(
+                f"Unexpected key fields for '{entity_name}': {sorted(extra)} "
+                f"(expected a subset of {sorted(pk_cols)})"
+            )
+        return pk_cols
+
     # ------------------------------------------------------------------
     # Tabular Data
     # ------------------------------------------------------------------
@@ -121,6 +391,28 @@ class BaseDB(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def get_table_arrow(
+        self, entity_name: str, columns: Optional[List[str]] = None, **filters: Any
+    ) -> pa.Table:
+        """
+        Retrieve filtered data from a table as an Arrow table.
+
+        Backends with columnar storage override this to skip pandas; this
+        fallback converts the result of ``get_table_data``.
+
+        Args:
+            entity_name (str): Name of the table.
+            columns (list[str] | None): Columns to return (all if None).
+            **filters: Arbitrary column=value filters.
+
+        Returns:
+            pa.Table: Rows matching the filtering criteria.
+        """
+        df = self.get_table_data(entity_name, **filters)
+        if columns is not None:
+            df = df[columns]
+        return pa.Table.from_pandas(df, preserve_index=False)
+
     @abstractmethod
     def get_table_row(self, entity_name: str, **filters: Any) -> pd.Series:
         """
@@ -135,6 +427,41 @@ class BaseDB(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def iter_table_batches(
+        self,
+        entity_name: str,
+        columns: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **filters: Any,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream filtered rows of a table in batches.
+
+        Backends override this to read incrementally; this fallback loads
+        the filtered table once and slices it.
+
+        Args:
+            entity_name (str): Name of the table.
+            columns (list[str] | None): Columns to return; None returns all.
+            batch_size (int): Maximum number of rows per batch.
+            **filters: Column=value filters, as for ``get_table_data``.
+
+        Returns:
+            Iterator[pd.DataFrame]: Non-empty batches of at most
+            ``batch_size`` rows.
+
+        Raises:
+            ValueError: If ``batch_size`` is not positive.
+        """
+        check_batch_size(batch_size)
+        df = self.get_table_data(entity_name, **filters)
+        if columns is not None:
+            df = df[columns]
+        return (
+            df.iloc[start : start + batch_size]
+            for start in range(0, len(df), batch_size)
+        )
+
     # ------------------------------------------------------------------
     # Image Storage
     # ------------------------------------------------------------------
@@ -169,33 +496,108 @@ class BaseDB(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def get_image_source(
+        self, entity_name: str, image_name: str, **key_fields
+    ) -> Optional[str]:
+        """
+        Identify the stored bytes of an image, e.g. for cache keys.
+
+        Args:
+            entity_name (str): Name of the entity (e.g. "netlists").
+            image_name (str): Name of the stored image.
+            **key_fields: Primary key values identifying the row.
+
+        Returns:
+            str | None: A string that changes whenever the image is
+            rewritten, or None if the backend cannot tell.
+        """
+        return None
+
+    def add_image_manifest(
+        self, entity_name: str, entries: List[Dict[str, Any]], **key_fields
+    ) -> None:
+        """
+        Record which images were stored for an entity row.
+
+        Backends without manifest support ignore the call; their images are
+        found by probing instead (see ``load_entity_dict_images``).
+
+        Args:
+            entity_name (str): Name of the entity (e.g. "netlists").
+            entries (list[dict]): One dict per image with "image_field",
+                "dict_key", "image_name", "shape" and "dtype". Empty fields
+                have ``image_name=None``.
+            **key_fields: Primary key values identifying the row.
+        """
+        return None
+
+    def get_image_manifest(
+        self, entity_name: str, **key_fields
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Retrieve the image manifest entries of an entity row.
+
+        Args:
+            entity_name (str): Name of the entity (e.g. "netlists").
+            **key_fields: Primary key values identifying the row.
+
+        Returns:
+            list[dict] | None: Entries with "image_field", "dict_key", "path",
+            "shape" and "dtype", or None if the row has no manifest.
+        """
+        return None
+
     def add_entity_images(self, entity_name: str, entity_obj: Any) -> None:
         """
-        Store all Image2D fields from an entity instance.
+        Store all Image2D fields from an entity instance and record them in
+        the entity's image manifest.
 
         Args:
             entity_name (str): Name of the entity (e.g. "netlists").
             entity_obj: A BaseEntity subclass instance.
         """
-        images = entity_obj.get_image_data()
-
         # Extract primary keys from the entity instance
         key_fields = {pk: getattr(entity_obj, pk) for pk in entity_obj._primary_keys}
+        self.add_images(
+            entity_name,
+            entity_obj.get_image_data(),
+            entity_obj.get_dict_image_data(),
+            **key_fields,
+        )
+
+    def add_images(
+        self,
+        entity_name: str,
+        images: Dict[str, Optional[Image2D]],
+        dict_images: Dict[str, Optional[Dict[str, Image2D]]],
+        **key_fields,
+    ) -> None:
+        """
+        Store the images of one entity row and record them in the entity's
+        image manifest.
 
+        Args:
+            entity_name (str): Name of the entity (e.g. "netlists").
+            images (dict): Image2D field name -> image (or None).
+            dict_images (dict): Dict[str, Image2D] field name -> images.
+            **key_fields: Primary key values of the row.
+        """
+        manifest = []
         for image_name, image_obj in images.items():
-            if image_obj is None:
-                continue
-            self.add_image(
-                entity_name,
-                image_name=image_name,
-                image=image_obj,
-                **key_fields,
-            )
+            if image_obj is not None:
+                self.add_image(
+                    entity_name,
+                    image_name=image_name,
+                    image=image_obj,
+                    **key_fields,
+                )
+            manifest.append(_manifest_entry(image_name, None, image_name, image_obj))
 
         # Handle Dict[str, Image2D] fields
-        dict_images = entity_obj.get_dict_image_data()
         for dict_field_name, dict_value in dict_images.items():
             if not dict_value:
+                # Record the field so loading does not fall back to probing
+                manifest.append(_manifest_entry(dict_field_name, None, None, None))
                 continue
             for key, image_obj in dict_value.items():
                 if image_obj is None:
@@ -208,6 +610,155 @@ class BaseDB(metaclass=ABCMeta):
                     image=image_obj,
                     **key_fields,
                 )
+                manifest.append(
+                    _manifest_entry(dict_field_name, key, image_name, image_obj)
+                )
+
+        self.add_image_manifest(entity_name, manifest, **key_fields)
+
+    def encode_writes(
+        self, writes: List[Tuple[str, tuple, Dict[str, Any]]]
+    ) -> List[Tuple[str, tuple, Dict[str, Any]]]:
+        """
+        Encode deferred writes ahead of applying them, e.g. in a worker
+        process of ``Dataset.dump(workers=...)``, so that applying the
+        result only appends already encoded data.
+
+        The default returns the writes unchanged.
+
+        Args:
+            writes (list[DBWrite]): (method name, args, kwargs) calls, as
+                applied by ``eda_schema.dataset.apply_writes``.
+
+        Returns:
+            list[DBWrite]: Calls with the same effect on this database.
+        """
+        return writes
+
+    def load_entity_images(
+        self,
+        entity_name: str,
+        entity_obj: Any,
+        load_images: bool = True,
+        **key_fields,
+    ) -> None:
+        """
+        Load the Image2D and Dict[str, Image2D] fields of an entity in place.
+
+        The entity's image manifest is read once and only the listed images
+        are loaded. Rows without a manifest fall back to per-field lookups.
+
+        Args:
+            entity_name (str): Name of the entity.
+            entity_obj: Entity instance whose image fields are set.
+            load_images (bool): Whether to load plain Image2D fields; dict
+                image fields are always loaded.
+            **key_fields: Primary-key values identifying the entity.
+        """
+        if not (entity_obj._image_keys if load_images else []) and not (
+            entity_obj._dict_image_keys
+        ):
+            return
+
+        manifest = self.get_image_manifest(entity_name, **key_fields)
+        self._load_images_from_manifest(
+            entity_name, entity_obj, manifest, load_images, key_fields
+        )
+
+    def _load_images_from_manifest(
+        self,
+        entity_name: str,
+        entity_obj: Any,
+        manifest: Optional[List[Dict[str, Any]]],
+        load_images: bool,
+        key_fields: Dict[str, Any],
+    ) -> None:
+        """
+        Load the image fields of an entity listed in its image manifest.
+
+        Listed images that no longer exist leave their field empty.
+
+        Args:
+            entity_name (str): Name of the entity.
+            entity_obj: Entity instance whose image fields are set.
+            manifest (list[dict] | None): Manifest entries of the row; None
+                falls back to per-field lookups.
+            load_images (bool): Whether to load plain Image2D fields.
+            key_fields (dict): Primary-key values identifying the entity.
+        """
+        image_keys = entity_obj._image_keys if load_images else []
+        if manifest is None:
+            for image_field in image_keys:
+                try:
+                    image = self.get_image(entity_name, image_field, **key_fields)
+                except DataNotFoundError:
+                    image = None
+                setattr(entity_obj, image_field, image)
+            self._probe_entity_dict_images(entity_name, entity_obj, key_fields)
+            return
+
+        for image_field in image_keys:
+            setattr(entity_obj, image_field, None)
+        for dict_image_field in entity_obj._dict_image_keys:
+            setattr(entity_obj, dict_image_field, {})
+
+        for item in manifest:
+            image_field, dict_key = item["image_field"], item["dict_key"]
+            if item["path"] is None:
+                continue
+            if dict_key is None and image_field in image_keys:
+                image_name = image_field
+            elif dict_key is not None and image_field in entity_obj._dict_image_keys:
+                image_name = f"{image_field}__{dict_key}"
+            else:
+                continue
+            try:
+                image = self.get_image(entity_name, image_name, **key_fields)
+            except DataNotFoundError:
+                continue  # listed image was removed; the field stays empty
+            if dict_key is None:
+                setattr(entity_obj, image_field, image)
+            else:
+                getattr(entity_obj, image_field)[dict_key] = image
+
+    def load_entity_dict_images(
+        self, entity_name: str, entity_obj: Any, **key_fields
+    ) -> None:
+        """
+        Load all Dict[str, Image2D] fields of an entity instance in place.
+
+        Args:
+            entity_name (str): Name of the entity.
+            entity_obj: Entity instance whose dict image fields are set.
+            **key_fields: Primary-key values identifying the entity.
+        """
+        self.load_entity_images(entity_name, entity_obj, load_images=False, **key_fields)
+
+    def _probe_entity_dict_images(
+        self, entity_name: str, entity_obj: Any, key_fields: Dict[str, Any]
+    ) -> None:
+        """
+        Discover Dict[str, Image2D] values of rows stored without a manifest.
+
+        Only the metal layer names below are tried, so other dict keys of
+        such rows are not found.
+
+        Args:
+            entity_name (str): Name of the entity.
+            entity_obj: Entity instance whose dict image fields are set.
+            key_fields (dict): Primary-key values identifying the entity.
+        """
+        for dict_image_field in entity_obj._dict_image_keys:
+            dict_value = {}
+            for dict_key in LEGACY_DICT_IMAGE_KEYS:
+                try:
+                    image = self.get_image(
+                        entity_name, f"{dict_image_field}__{dict_key}", **key_fields
+                    )
+                    dict_value[dict_key] = image
+                except DataNotFoundError:
+                    pass
+            setattr(entity_obj, dict_image_field, dict_value)
 
     # ------------------------------------------------------------------
     # Helper methods for graph key resolution
@@ -258,7 +809,11 @@ class BaseDB(metaclass=ABCMeta):
     # Combined entity
     # ------------------------------------------------------------------
     def get_entity(
-        self, entity_name: str, load_sub_entities: bool = True, **key_fields
+        self,
+        entity_name: str,
+        load_sub_entities: bool = True,
+        graph_backend: str = "networkx",
+        **key_fields,
     ) -> Any:
         """
         Retrieve a fully constructed entity instance, including its graph if applicable.
@@ -267,6 +822,8 @@ class BaseDB(metaclass=ABCMeta):
         Args:
             entity_name (str): Entity type.
             load_sub_entities (bool): Whether to load the sub-entities if applicable.
+            graph_backend (str): Graph backend of graph entities, "networkx"
+                or "csr".
             **key_fields: Mapping of primary-key columns → values.
 
         Returns:
@@ -276,28 +833,7 @@ class BaseDB(metaclass=ABCMeta):
             ValueError: If PKs are missing.
             DataNotFoundError: If no matching row exists.
         """
-        # --------------------------------------------------------------
-        # Validate entity type
-        # --------------------------------------------------------------
-        model_cls = entity.SchemaMetadata.get_model(entity_name)
-        if model_cls is None:
-            raise ValueError(f"Unknown entity '{entity_name}'")
-
-        # --------------------------------------------------------------
-        # Validate primary keys
-        # --------------------------------------------------------------
-        pk_cols = entity.SchemaMetadata.get_pk_columns(entity_name)
-        if not pk_cols:
-            raise ValueError(
-                f"Entity '{entity_name}' has no defined primary-key fields"
-            )
-
-        missing = [pk for pk in pk_cols if pk not in key_fields]
-        if missing:
-            raise ValueError(
-                f"Missing primary-key values for '{entity_name}': {missing}. "
-                f"Required: {pk_cols}"
-            )
+        model_cls, _ = self._validate_entity_keys(entity_name, [key_fields])
 
         # --------------------------------------------------------------
         # Load row from table using PKs
@@ -312,83 +848,364 @@ class BaseDB(metaclass=ABCMeta):
         # --------------------------------------------------------------
         if entity.SchemaMetadata.is_graph_entity(entity_name):
             graph_data = self.get_graph_data(entity_name, **key_fields)
-            obj.load_graph_data(graph_data)
+            obj.load_graph_data(graph_data, backend=graph_backend)
             if load_sub_entities:
-                for node_type, node_cls in obj.NODE_TYPES.items():
-                    node_entity_name = node_type.lower() + "s"
-                    node_fields = {
-                        k: v
-                        for k, v in key_fields.items()
-                        if k in entity.SchemaMetadata.get_columns(node_entity_name)
-                    }
-                    if (
-                        entity_name == "timing_paths"
-                        and node_type in ["PIN", "PORT"]
-                        or entity_name == "clock_trees"
-                    ):
-                        pins = [
-                            tp_node
-                            for tp_node, tp_node_type in zip(
-                                graph_data["nodes"], graph_data["node_types"]
-                            )
-                            if tp_node_type == node_type
-                        ]
-                        node_fields["name"] = pins
-
-                    node_data_id = "name"
-                    if node_type == "NET_ARC":
-                        node_data_id = "net_name"
-                    if node_type == "CELL_ARC":
-                        node_data_id = "gate_name"
-
-                    node_data = self.get_table_data(node_entity_name, **node_fields)
-                    for row in node_data.itertuples(index=False):
-                        row_dict = row._asdict()
-                        obj.nodes[row_dict[node_data_id]]["entity"] = node_cls(
-                            **row_dict
-                        )
+                self._attach_sub_entities(
+                    entity_name, obj, graph_data, key_fields, self.get_table_data
+                )
 
         # --------------------------------------------------------------
-        # Load Image2D fields for this entity (if any exist)
+        # Load Image2D and Dict[str, Image2D] fields (if any exist)
         # --------------------------------------------------------------
-        if load_sub_entities:
-            for image_field in obj._image_keys:
-                try:
-                    image = self.get_image(entity_name, image_field, **key_fields)
-                    setattr(obj, image_field, image)
-                except DataNotFoundError:
-                    setattr(obj, image_field, None)
+        self.load_entity_images(
+            entity_name, obj, load_images=load_sub_entities, **key_fields
+        )
+
+        return obj
+
+    def get_entities(
+        self,
+        entity_name: str,
+        keys: List[Dict[str, Any]],
+        load_sub_entities: bool = True,
+        graph_backend: str = "networkx",
+        fields: Optional[List[str]] = None,
+    ) -> List[Any]:
+        """
+        Retrieve many entity instances in one pass.
+
+        Rows of all keys are read with one ``get_table_rows`` call, graphs
+        with one ``get_graph_data_for_keys`` call, image manifests with one
+        ``get_image_manifests`` call and each sub-entity table once.
+
+        Args:
+            entity_name (str): Entity type.
+            keys (list[dict]): Primary-key values of each entity.
+            load_sub_entities (bool): Whether to load the sub-entities (and
+                Image2D fields) if applicable.
+            graph_backend (str): Graph backend of graph entities, "networkx"
+                or "csr".
+            fields (list[str] | None): Table columns to read; other fields
+                are set to None. Primary keys are always read. None reads
+                every column.
+
+        Returns:
+            list[BaseEntity]: One entity per key, in the order of ``keys``.
+
+        Raises:
+            ValueError: If the entity is unknown, a key misses primary-key
+                values or a field is not a column of the entity.
+            DataNotFoundError: If a key has no matching row.
+        """
+        model_cls, pk_cols = self._validate_entity_keys(entity_name, keys)
+        if not keys:
+            return []
+        keys = [{pk: key[pk] for pk in pk_cols} for key in keys]
+
+        columns = None
+        if fields is not None:
+            all_columns = [
+                col
+                for col in entity.SchemaMetadata.get_columns(entity_name)
+                if not col.startswith("_")
+            ]
+            unknown = [f for f in fields if f not in all_columns]
+            if unknown:
+                raise ValueError(f"Unknown fields for '{entity_name}': {unknown}")
+            columns = pk_cols + [f for f in fields if f not in pk_cols]
 
         # --------------------------------------------------------------
-        # Load Dict[str, Image2D] fields for this entity (if any exist)
+        # Join the requested keys with their rows
         # --------------------------------------------------------------
-        for dict_image_field in obj._dict_image_keys:
-            dict_value = {}
-            # Try to discover images by attempting to load with common patterns
-            # For now, we'll try a few common metal layer names
-            # A more robust solution would store a manifest, but this works for routing_by_metal
-            common_keys = [
-                "met1",
-                "met2",
-                "met3",
-                "met4",
-                "met5",
-                "metal1",
-                "metal2",
-                "metal3",
-                "metal4",
-                "metal5",
-            ]
-            for dict_key in common_keys:
-                try:
-                    image = self.get_image(
-                        entity_name, f"{dict_image_field}__{dict_key}", **key_fields
+        rows = self.get_table_rows(entity_name, keys, columns=columns)
+        rows = rows[[c for c in rows.columns if not c.startswith("_")]]
+        row_by_key = {_key_tuple(row, pk_cols): row for row in rows.to_dict("records")}
+        missing = [key for key in keys if _key_tuple(key, pk_cols) not in row_by_key]
+        if missing:
+            raise DataNotFoundError(
+                entity_name=entity_name,
+                message=f"No rows found in '{entity_name}' for keys: {missing}",
+            )
+
+        objs = []
+        for key in keys:
+            row = row_by_key[_key_tuple(key, pk_cols)]
+            if columns is not None:
+                row = {col: row.get(col) for col in all_columns}
+            objs.append(model_cls(**row))
+
+        # --------------------------------------------------------------
+        # Attach graphs (if graph entity)
+        # --------------------------------------------------------------
+        if entity.SchemaMetadata.is_graph_entity(entity_name):
+            graphs = self.get_graph_data_for_keys(entity_name, keys)
+            node_reader = _PrefetchedNodeTables(self, keys)
+            for obj, graph_data, key in zip(objs, graphs, keys):
+                obj.load_graph_data(graph_data, backend=graph_backend)
+                if load_sub_entities:
+                    self._attach_sub_entities(
+                        entity_name, obj, graph_data, key, node_reader
                     )
-                    dict_value[dict_key] = image
-                except DataNotFoundError:
-                    pass
-            # Also try to discover by listing files if the backend supports it
-            # This is backend-specific, so we'll handle it in subclasses if needed
-            setattr(obj, dict_image_field, dict_value)
 
-        return obj
+        # --------------------------------------------------------------
+        # Load Image2D and Dict[str, Image2D] fields (if any exist)
+        # --------------------------------------------------------------
+        image_keys = model_cls._image_keys if load_sub_entities else []
+        if image_keys or model_cls._dict_image_keys:
+            manifests = self.get_image_manifests(entity_name, keys)
+            for obj, manifest, key in zip(objs, manifests, keys):
+                self._load_images_from_manifest(
+                    entity_name, obj, manifest, load_sub_entities, key
+                )
+
+        return objs
+
+    @staticmethod
+    def _validate_entity_keys(
+        entity_name: str, keys: List[Dict[str, Any]]
+    ) -> tuple:
+        """
+        Check an entity name and that keys hold every primary-key value.
+
+        Args:
+            entity_name (str): Entity type.
+            keys (list[dict]): Primary-key values to check.
+
+        Returns:
+            tuple: (entity class, primary-key columns).
+
+        Raises:
+            ValueError: If the entity is unknown, has no primary key, or a
+                key misses primary-key values.
+        """
+        model_cls = entity.SchemaMetadata.get_model(entity_name)
+        if model_cls is None:
+            raise ValueError(f"Unknown entity '{entity_name}'")
+
+        pk_cols = entity.SchemaMetadata.get_pk_columns(entity_name)
+        if not pk_cols:
+            raise ValueError(
+                f"Entity '{entity_name}' has no defined primary-key fields"
+            )
+
+        for key_fields in keys:
+            missing = [pk for pk in pk_cols if pk not in key_fields]
+            if missing:
+                raise ValueError(
+                    f"Missing primary-key values for '{entity_name}': {missing}. "
+                    f"Required: {pk_cols}"
+                )
+        return model_cls, pk_cols
+
+    def _attach_sub_entities(
+        self,
+        entity_name: str,
+        obj: Any,
+        graph_data: Dict[str, Any],
+        key_fields: Dict[str, Any],
+        read_nodes: Callable[..., pd.DataFrame],
+    ) -> None:
+        """
+        Attach node entities to the nodes of a loaded graph entity.
+
+        Args:
+            entity_name (str): Graph entity type.
+            obj: Graph entity with its graph loaded.
+            graph_data (dict): Graph dictionary the graph was loaded from.
+            key_fields (dict): Primary-key values of the entity.
+            read_nodes (callable): ``read_nodes(node_entity_name, **filters)``
+                returning the matching node rows.
+        """
+        for node_type, node_cls in obj.NODE_TYPES.items():
+            node_entity_name = node_type.lower() + "s"
+            node_fields = {
+                k: v
+                for k, v in key_fields.items()
+                if k in entity.SchemaMetadata.get_columns(node_entity_name)
+            }
+            if (
+                entity_name == "timing_paths"
+                and node_type in ["PIN", "PORT"]
+                or entity_name == "clock_trees"
+            ):
+                pins = [
+                    tp_node
+                    for tp_node, tp_node_type in zip(
+                        graph_data["nodes"], graph_data["node_types"]
+                    )
+                    if tp_node_type == node_type
+                ]
+                node_fields["name"] = pins
+
+            node_data_id = "name"
+            if node_type == "NET_ARC":
+                node_data_id = "net_name"
+            if node_type == "CELL_ARC":
+                node_data_id = "gate_name"
+
+            node_data = read_nodes(node_entity_name, **node_fields)
+            # Skip internal columns of tables created from the full schema
+            node_data = node_data[[c for c in node_data.columns if not c.startswith("_")]]
+            for row in node_data.itertuples(index=False):
+                row_dict = row._asdict()
+                obj.nodes[row_dict[node_data_id]]["entity"] = node_cls(**row_dict)
+
+    def get_table_rows(
+        self,
+        entity_name: str,
+        keys: List[Dict[str, Any]],
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Retrieve the rows of many primary keys in one read.
+
+        The default implementation reads the table once with IN filters on
+        each primary-key column, then keeps the rows whose full key was
+        requested. Backends without IN filters override it.
+
+        Args:
+            entity_name (str): Name of the table.
+            keys (list[dict]): Primary-key values of each requested row.
+            columns (list[str] | None): Columns to return (all if None);
+                must include the primary-key columns.
+
+        Returns:
+            pd.DataFrame: Matching rows, in table order.
+        """
+        pk_cols = entity.SchemaMetadata.get_pk_columns(entity_name)
+        filters = {pk: sorted({key[pk] for key in keys}, key=str) for pk in pk_cols}
+        df = self.get_table_data(entity_name, **filters)
+        if columns is not None:
+            df = df[columns]
+        return _select_keys(df, pk_cols, keys)
+
+    def get_graph_data_for_keys(
+        self, entity_name: str, keys: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve the graphs of many primary keys.
+
+        The default implementation calls ``get_graph_data`` once per key;
+        backends that can fetch all graphs in one scan or query override it.
+
+        Args:
+            entity_name (str): Name of the graph entity.
+            keys (list[dict]): Primary-key values of each graph.
+
+        Returns:
+            list[dict]: One graph dictionary per key, in the order of ``keys``.
+
+        Raises:
+            DataNotFoundError: If a key has no stored graph.
+        """
+        return [self.get_graph_data(entity_name, **key) for key in keys]
+
+    def get_image_manifests(
+        self, entity_name: str, keys: List[Dict[str, Any]]
+    ) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        Read the image manifests of many entity rows.
+
+        Args:
+            entity_name (str): Name of the entity.
+            keys (list[dict]): Primary-key values of each row.
+
+        Returns:
+            list: One manifest (or None) per key, in the order of ``keys``.
+        """
+        return [self.get_image_manifest(entity_name, **key) for key in keys]
+
+    # ------------------------------------------------------------------
+    # Catalog
+    # ------------------------------------------------------------------
+    @property
+    def catalog_path(self) -> Optional[Path]:
+        """
+        Path of the dataset catalog (see ``eda_schema.catalog``).
+
+        Returns:
+            Path | None: Path of ``catalog.json``, or None if the backend
+            does not keep a catalog.
+        """
+        return None
+
+    def storage_files(self, entity_name: str, images: bool = True) -> Dict[str, List[Path]]:
+        """
+        List the files holding an entity's data.
+
+        Args:
+            entity_name (str): Name of the entity.
+            images (bool): Also list image files, which may be many.
+
+        Returns:
+            dict: Storage kind ("table", "graph", "images") -> existing files.
+            Empty for backends that do not store an entity in its own files.
+        """
+        return {}
+
+    def catalog_files(self, entity_name: str) -> List[Path]:
+        """
+        List the files and directories whose size and modification time
+        change whenever an entity's table or graph data changes.
+
+        Their stat is the fingerprint a catalog is checked against (see
+        ``eda_schema.catalog.stale_files``). This default lists the table
+        and graph files of ``storage_files``; backends storing many files
+        per entity list a few paths instead.
+
+        Args:
+            entity_name (str): Name of the entity.
+
+        Returns:
+            list[Path]: Existing files and directories.
+        """
+        storage = self.storage_files(entity_name, images=False)
+        return [*storage.get("table", []), *storage.get("graph", [])]
+
+    def write_catalog(self, catalog: Dict[str, Any]) -> None:
+        """
+        Write the dataset catalog, adding the size of every table's files.
+
+        The file is replaced atomically. Backends without a ``catalog_path``
+        ignore the call.
+
+        Args:
+            catalog (dict): Catalog from ``CatalogBuilder.to_dict``.
+        """
+        path = self.catalog_path
+        if path is None:
+            return
+        catalog = add_storage_info(catalog, self)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(catalog, f, indent=1)
+        os.replace(tmp, path)
+
+    def read_catalog(self) -> Optional[Dict[str, Any]]:
+        """
+        Read the dataset catalog without touching any data file.
+
+        Returns:
+            dict | None: The catalog, or None if there is none.
+
+        Raises:
+            ValueError: If the catalog was written by a newer release.
+        """
+        path = self.catalog_path
+        if path is None or not path.exists():
+            return None
+        with path.open() as f:
+            catalog = json.load(f)
+        if catalog.get("catalog_version", 0) > CATALOG_VERSION:
+            raise ValueError(
+                f"Catalog version {catalog['catalog_version']} of '{path}' is newer "
+                f"than the supported version {CATALOG_VERSION}"
+            )
+        return catalog
+
+    def remove_catalog(self) -> None:
+        """Delete the dataset catalog, e.g. before the data is rewritten."""
+        path = self.catalog_path
+        if path is not None:
+            path.unlink(missing_ok=True)
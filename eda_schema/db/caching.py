@@ -0,0 +1,659 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : eda_schema/db/caching.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""
+Read-through caching for any database backend.
+
+``CachingDB`` wraps a ``BaseDB`` and keeps the results of
+``get_table_data``, ``get_graph_data`` and ``get_image`` in a
+least-recently-used cache bounded by their size in bytes::
+
+    db = CachingDB(ParquetDB("dataset/test"), max_bytes=1 << 30)
+    dataset = Dataset(db)
+
+Writes made through the wrapper drop the cached results of the written
+entity. Writes made to the wrapped database directly, or by other
+processes, are not seen until ``clear()``.
+
+Graphs and images that are not stored are remembered as well, so repeated
+probes (e.g. for optional image fields) do not reach the backend again.
+
+With ``spill_dir``, entries evicted from memory are pickled to that
+directory and read back on the next miss instead of querying the backend.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from eda_schema.base import Image2D
+from eda_schema.db.base import DEFAULT_BATCH_SIZE, BaseDB
+from eda_schema.errors import DataNotFoundError
+
+DEFAULT_CACHE_BYTES = 512 * 1024 * 1024
+
+# Cache key: (method, entity_name, frozen arguments)
+CacheKey = Tuple[str, str, Hashable]
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters of a ``CachingDB``.
+
+    Attributes:
+        hits (int): Reads answered from memory.
+        misses (int): Reads passed to the wrapped database.
+        evictions (int): Entries dropped from memory to stay in budget.
+        spills (int): Evicted entries written to the spill directory.
+        spill_hits (int): Reads answered from the spill directory.
+        invalidations (int): Entries dropped because their entity was written.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    spills: int = 0
+    spill_hits: int = 0
+    invalidations: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """Get the counters as a dictionary."""
+        return asdict(self)
+
+
+def estimate_bytes(value: Any) -> int:
+    """
+    Estimate the memory held by a cached result.
+
+    DataFrames count their deep memory usage, arrays and Arrow tables
+    their buffers, and graph dictionaries every contained object.
+
+    Args:
+        value: Table, image or graph dictionary.
+
+    Returns:
+        int: Approximate size in bytes.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, pa.Table):
+        return value.nbytes
+
+    size = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set)):
+            stack.extend(item)
+        elif isinstance(item, np.ndarray):
+            size += item.nbytes
+    return size
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Turn call arguments into a hashable cache key component.
+
+    Args:
+        value: Argument value (scalars, lists, sets, dicts or predicates).
+
+    Returns:
+        Hashable: Equivalent hashable value.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted((_freeze(v) for v in value), key=repr))
+    return value
+
+
+@dataclass(frozen=True)
+class _Missing:
+    """Cached ``DataNotFoundError`` of a graph or image read."""
+
+    message: str
+
+    def raise_error(self):
+        """Raise the cached error again."""
+        raise DataNotFoundError(message=self.message)
+
+
+def _read_only(image: Optional[Image2D]) -> Optional[Image2D]:
+    """
+    Get a read-only view of a cached image.
+
+    Args:
+        image (Image2D | None): Cached image.
+
+    Returns:
+        Image2D | None: View that cannot modify the cached array.
+    """
+    if image is None:
+        return None
+    view = image.view()
+    view.flags.writeable = False
+    return view
+
+
+class CachingDB(BaseDB):
+    """
+    Wrapper caching the reads of another database in a byte-bounded LRU.
+
+    Cached DataFrames are copied on every read, so callers may modify
+    them. Images are returned as read-only views (call ``.copy()`` to
+    modify them) and graph dictionaries are shared with the cache and must
+    not be modified. Results larger than ``max_bytes`` are not cached.
+
+    Attributes not defined here (e.g. ``flush``, ``close`` or
+    ``data_home``) are those of the wrapped database.
+
+    Attributes:
+        db (BaseDB): Wrapped database.
+        max_bytes (int): Memory budget of cached results in bytes.
+        spill_dir (Path | None): Directory holding evicted entries.
+        max_spill_bytes (int | None): Budget of the spill directory in
+            bytes, or None for no limit.
+        stats (CacheStats): Hit, miss and eviction counters.
+    """
+
+    def __init__(
+        self,
+        db: BaseDB,
+        max_bytes: int = DEFAULT_CACHE_BYTES,
+        spill_dir: Optional[str | Path] = None,
+        max_spill_bytes: Optional[int] = None,
+    ):
+        """
+        Wrap a database.
+
+        Args:
+            db (BaseDB): Database to cache.
+            max_bytes (int): Memory budget of cached results in bytes.
+            spill_dir (str | Path | None): Directory for entries evicted
+                from memory; created on first spill. None drops them.
+            max_spill_bytes (int | None): Budget of the spill directory in
+                bytes, or None for no limit.
+
+        Raises:
+            ValueError: If a budget is not positive.
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        if max_spill_bytes is not None and max_spill_bytes <= 0:
+            raise ValueError(f"max_spill_bytes must be positive, got {max_spill_bytes}")
+        self.db = db
+        self.max_bytes = max_bytes
+        self.spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self.max_spill_bytes = max_spill_bytes
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[CacheKey, Tuple[Any, int]]" = OrderedDict()
+        self._nbytes = 0
+        self._spilled: "OrderedDict[CacheKey, Tuple[Path, int]]" = OrderedDict()
+        self._spill_nbytes = 0
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes missing on the wrapper
+        if name == "db" or name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.db, name)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop cached entries and the lock when pickled, e.g. for workers."""
+        state = self.__dict__.copy()
+        state.update(
+            stats=CacheStats(),
+            _entries=OrderedDict(),
+            _nbytes=0,
+            _spilled=OrderedDict(),
+            _spill_nbytes=0,
+            _lock=None,
+        )
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        """
+        Context manager entry.
+
+        Returns:
+            CachingDB: Self instance for use in 'with' statements.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the wrapped database if it can be closed."""
+        close = getattr(self.db, "close", None)
+        if close is not None:
+            close()
+        return False
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+    @property
+    def nbytes(self) -> int:
+        """int: Estimated size of the results cached in memory."""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _spill_path(self, key: CacheKey) -> Path:
+        """
+        Get the spill file of a cache key.
+
+        Args:
+            key (CacheKey): Cache key.
+
+        Returns:
+            Path: File holding the pickled entry.
+        """
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return self.spill_dir / f"{digest}.pkl"
+
+    def _spill(self, key: CacheKey, value: Any) -> None:
+        """
+        Write an evicted entry to the spill directory.
+
+        Must be called with the lock held.
+
+        Args:
+            key (CacheKey): Cache key.
+            value: Cached result.
+        """
+        path = self._spill_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+        size = path.stat().st_size
+        self._spilled[key] = (path, size)
+        self._spill_nbytes += size
+        self.stats.spills += 1
+        while self.max_spill_bytes is not None and self._spill_nbytes > self.max_spill_bytes:
+            self._drop_spilled(next(iter(self._spilled)))
+
+    def _drop_spilled(self, key: CacheKey) -> None:
+        """
+        Delete a spilled entry. Must be called with the lock held.
+
+        Args:
+            key (CacheKey): Cache key.
+        """
+        path, size = self._spilled.pop(key)
+        self._spill_nbytes -= size
+        path.unlink(missing_ok=True)
+
+    def _lookup(self, key: CacheKey) -> Tuple[bool, Any]:
+        """
+        Find a cached result in memory or in the spill directory.
+
+        Args:
+            key (CacheKey): Cache key.
+
+        Returns:
+            tuple: (found, value).
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return True, self._entries[key][0]
+            if key not in self._spilled:
+                self.stats.misses += 1
+                return False, None
+            path = self._spilled[key][0]
+            try:
+                with path.open("rb") as f:
+                    value = pickle.load(f)
+            except FileNotFoundError:
+                value = None
+            self._drop_spilled(key)
+            if value is None:
+                self.stats.misses += 1
+                return False, None
+            self.stats.spill_hits += 1
+        self._insert(key, value)
+        return True, value
+
+    def _insert(self, key: CacheKey, value: Any) -> None:
+        """
+        Cache a result, evicting least-recently-used entries over budget.
+
+        Args:
+            key (CacheKey): Cache key.
+            value: Result to cache.
+        """
+        nbytes = estimate_bytes(value)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._nbytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, nbytes)
+            self._nbytes += nbytes
+            while self._nbytes > self.max_bytes:
+                evicted_key, (evicted, evicted_nbytes) = self._entries.popitem(last=False)
+                self._nbytes -= evicted_nbytes
+                self.stats.evictions += 1
+                if self.spill_dir is not None:
+                    self._spill(evicted_key, evicted)
+
+    def _read_through(self, key: CacheKey, load: Callable[[], Any]) -> Any:
+        """
+        Get a cached graph or image, loading and caching it on a miss.
+
+        Args:
+            key (CacheKey): Cache key.
+            load (Callable): Reads the value from the wrapped database.
+
+        Returns:
+            The cached or loaded value.
+
+        Raises:
+            DataNotFoundError: If the value is not stored (also cached).
+        """
+        found, value = self._lookup(key)
+        if not found:
+            try:
+                value = load()
+            except DataNotFoundError as e:
+                value = _Missing(str(e))
+            self._insert(key, value)
+        if isinstance(value, _Missing):
+            value.raise_error()
+        return value
+
+    def invalidate(self, entity_name: str) -> None:
+        """
+        Drop every cached result of an entity.
+
+        Args:
+            entity_name (str): Name of the entity.
+        """
+        with self._lock:
+            for key in [k for k in self._entries if k[1] == entity_name]:
+                self._nbytes -= self._entries.pop(key)[1]
+                self.stats.invalidations += 1
+            for key in [k for k in self._spilled if k[1] == entity_name]:
+                self._drop_spilled(key)
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all cached results, including spilled ones."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            for key in list(self._spilled):
+                self._drop_spilled(key)
+
+    # ------------------------------------------------------------------
+    # Dataset / Table Management
+    # ------------------------------------------------------------------
+    def create_dataset_tables(self) -> None:
+        self.db.create_dataset_tables()
+        self.clear()
+
+    def has_table(self, entity_name: str) -> bool:
+        return self.db.has_table(entity_name)
+
+    # ------------------------------------------------------------------
+    # Write Sessions (backends with commit/rollback, e.g. ParquetDB)
+    # ------------------------------------------------------------------
+    def commit(self) -> None:
+        """Commit the wrapped database's writes and drop all cached results."""
+        self.db.commit()
+        self.clear()
+
+    def rollback(self) -> None:
+        """
+        Roll back the wrapped database's writes and drop all cached results,
+        which may include rows of the discarded session.
+        """
+        self.db.rollback()
+        self.clear()
+
+    def compact(self, *args: Any, **kwargs: Any) -> Any:
+        """Compact the wrapped database and drop all cached results."""
+        try:
+            return self.db.compact(*args, **kwargs)
+        finally:
+            self.clear()
+
+    # ------------------------------------------------------------------
+    # Graph Storage
+    # ------------------------------------------------------------------
+    def add_graph_data(self, entity_name: str, graph: Any, **key_fields) -> None:
+        self.db.add_graph_data(entity_name, graph, **key_fields)
+        self.invalidate(entity_name)
+
+    def add_graph_data_batch(self, entity_name: str, rows: List[Dict[str, Any]]) -> None:
+        """
+        Add multiple graph entries, in one write if the wrapped database
+        supports it.
+
+        Args:
+            entity_name (str): Graph entity name.
+            rows (list): ``{"data": graph, <pk>: value, ...}`` rows.
+        """
+        add_batch = getattr(self.db, "add_graph_data_batch", None)
+        if add_batch is not None:
+            add_batch(entity_name, rows)
+        else:
+            for row in rows:
+                key_fields = {k: v for k, v in row.items() if k != "data"}
+                self.db.add_graph_data(entity_name, row["data"], **key_fields)
+        self.invalidate(entity_name)
+
+    def get_graph_data(self, entity_name: str, **key_fields) -> Dict[str, Any]:
+        return self._read_through(
+            ("get_graph_data", entity_name, _freeze(key_fields)),
+            lambda: self.db.get_graph_data(entity_name, **key_fields),
+        )
+
+    def get_graph_data_for_keys(
+        self, entity_name: str, keys: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve the graphs of many primary keys, reading only the graphs
+        that are not cached in one call to the wrapped database.
+
+        Args:
+            entity_name (str): Name of the graph entity.
+            keys (list[dict]): Primary-key values of each graph.
+
+        Returns:
+            list[dict]: One graph dictionary per key, in the order of ``keys``.
+        """
+        cache_keys = [("get_graph_data", entity_name, _freeze(k)) for k in keys]
+        results = [self._lookup(cache_key) for cache_key in cache_keys]
+        missing = [i for i, (found, _) in enumerate(results) if not found]
+        if missing:
+            graphs = self.db.get_graph_data_for_keys(
+                entity_name, [keys[i] for i in missing]
+            )
+            for i, graph_data in zip(missing, graphs):
+                results[i] = (True, graph_data)
+                self._insert(cache_keys[i], graph_data)
+        for _, graph_data in results:
+            if isinstance(graph_data, _Missing):
+                graph_data.raise_error()
+        return [graph_data for _, graph_data in results]
+
+    def get_graph_data_many(
+        self, entity_name: str, **partial_keys
+    ) -> List[Dict[str, Any]]:
+        return self.db.get_graph_data_many(entity_name, **partial_keys)
+
+    # ------------------------------------------------------------------
+    # Tabular Data
+    # ------------------------------------------------------------------
+    def add_table_row(self, entity_name: str, row: Dict[str, Any]) -> None:
+        self.db.add_table_row(entity_name, row)
+        self.invalidate(entity_name)
+
+    def add_table_data(self, entity_name: str, data: List[Dict[str, Any]]) -> None:
+        self.db.add_table_data(entity_name, data)
+        self.invalidate(entity_name)
+
+    def get_table_data(self, entity_name: str, **filters: Any) -> pd.DataFrame:
+        """
+        Retrieve filtered data from a table, from the cache if possible.
+
+        Args:
+            entity_name (str): Name of the table.
+            **filters: Filters and options of the wrapped database
+                (e.g. ``columns=`` and ``where=`` for ``ParquetDB``).
+
+        Returns:
+            pd.DataFrame: A copy of the cached rows.
+        """
+        key = ("get_table_data", entity_name, _freeze(filters))
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable filter values cannot be cached
+            return self.db.get_table_data(entity_name, **filters)
+
+        found, df = self._lookup(key)
+        if not found:
+            df = self.db.get_table_data(entity_name, **filters)
+            self._insert(key, df)
+        return df.copy()
+
+    def get_table_arrow(
+        self, entity_name: str, columns: Optional[List[str]] = None, **filters: Any
+    ) -> pa.Table:
+        return self.db.get_table_arrow(entity_name, columns=columns, **filters)
+
+    def get_table_row(self, entity_name: str, **filters: Any) -> pd.Series:
+        return self.db.get_table_row(entity_name, **filters)
+
+    def get_table_rows(
+        self,
+        entity_name: str,
+        keys: List[Dict[str, Any]],
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        return self.db.get_table_rows(entity_name, keys, columns=columns)
+
+    def iter_table_batches(
+        self,
+        entity_name: str,
+        columns: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **filters: Any,
+    ) -> Iterator[pd.DataFrame]:
+        return self.db.iter_table_batches(
+            entity_name, columns=columns, batch_size=batch_size, **filters
+        )
+
+    # ------------------------------------------------------------------
+    # Image Storage
+    # ------------------------------------------------------------------
+    def add_image(
+        self, entity_name: str, image_name: str, image: Image2D, **key_fields
+    ) -> None:
+        self.db.add_image(entity_name, image_name, image, **key_fields)
+        self.invalidate(entity_name)
+
+    def add_images(
+        self,
+        entity_name: str,
+        images: Dict[str, Optional[Image2D]],
+        dict_images: Dict[str, Optional[Dict[str, Image2D]]],
+        **key_fields,
+    ) -> None:
+        self.db.add_images(entity_name, images, dict_images, **key_fields)
+        self.invalidate(entity_name)
+
+    def add_image_manifest(
+        self, entity_name: str, entries: List[Dict[str, Any]], **key_fields
+    ) -> None:
+        self.db.add_image_manifest(entity_name, entries, **key_fields)
+        self.invalidate(entity_name)
+
+    def get_image(self, entity_name: str, field: str, **key_fields) -> Image2D:
+        image = self._read_through(
+            ("get_image", entity_name, _freeze((field, key_fields))),
+            lambda: self.db.get_image(entity_name, field, **key_fields),
+        )
+        return _read_only(image)
+
+    def get_image_source(
+        self, entity_name: str, image_name: str, **key_fields
+    ) -> Optional[str]:
+        return self.db.get_image_source(entity_name, image_name, **key_fields)
+
+    def get_image_manifest(
+        self, entity_name: str, **key_fields
+    ) -> Optional[List[Dict[str, Any]]]:
+        return self.db.get_image_manifest(entity_name, **key_fields)
+
+    def get_image_manifests(
+        self, entity_name: str, keys: List[Dict[str, Any]]
+    ) -> List[Optional[List[Dict[str, Any]]]]:
+        return self.db.get_image_manifests(entity_name, keys)
+
+    # ------------------------------------------------------------------
+    # Catalog
+    # ------------------------------------------------------------------
+    @property
+    def catalog_path(self) -> Optional[Path]:
+        return self.db.catalog_path
+
+    def storage_files(self, entity_name: str, images: bool = True) -> Dict[str, List[Path]]:
+        return self.db.storage_files(entity_name, images=images)
+
+    def catalog_files(self, entity_name: str) -> List[Path]:
+        return self.db.catalog_files(entity_name)
+
+    def write_catalog(self, catalog: Dict[str, Any]) -> None:
+        self.db.write_catalog(catalog)
+
+    def read_catalog(self) -> Optional[Dict[str, Any]]:
+        return self.db.read_catalog()
+
+    def remove_catalog(self) -> None:
+        self.db.remove_catalog()
@@ -0,0 +1,352 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : eda_schema/db/compaction.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""
+Sorting and writing of compacted Parquet files for ``ParquetDB.compact``.
+
+Rows are sorted with an external merge sort: the input is cut into runs
+of at most ``CompactionOptions.memory_bytes``, each run is sorted and
+spilled to a temporary Parquet file, and the runs are merged batch by
+batch. Memory use therefore depends on the run size and the number of
+runs, not on the size of the table.
+
+The merged rows are written in row groups of exactly ``row_group_size``
+rows (the last one may be smaller). Codecs and dictionary encoding are
+chosen per column from the first sorted rows:
+
+- dictionary encoding for columns whose distinct values are at most
+  ``dictionary_ratio`` of the rows (names, cell types, stages);
+- ``snappy`` for floating-point columns, which general-purpose codecs
+  barely shrink but must still decode, and ``zstd`` for everything else.
+"""
+
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+# Uncompressed bytes per data page of compacted files.
+DEFAULT_DATA_PAGE_SIZE = 1024 * 1024
+
+# Rows held in memory per sorted run before it is spilled to disk.
+DEFAULT_COMPACTION_MEMORY = 256 * 1024 * 1024
+
+# Columns with at most this many distinct values per row are dictionary-encoded.
+DEFAULT_DICTIONARY_RATIO = 0.5
+
+# Codecs of the per-column policy (see the module docstring).
+FLOAT_CODEC = "snappy"
+DEFAULT_CODEC = "zstd"
+
+Ordering = List[Tuple[str, str]]
+
+
+@dataclass
+class CompactionOptions:
+    """
+    Settings of ``ParquetDB.compact``.
+
+    Attributes:
+        rewrite (bool): Rewrite every file, not only those with fragments
+            to merge, so all files are sorted and re-encoded.
+        data_page_size (int): Target uncompressed bytes per data page.
+        compression (str | None): Codec for every column, or None to pick
+            one per column.
+        dictionary_ratio (float): Distinct-to-row ratio up to which a
+            column is dictionary-encoded.
+        memory_bytes (int): Arrow bytes per sorted run; larger inputs are
+            sorted in several runs spilled to disk.
+        indexes (bool): Write a page index and primary-key bloom filters.
+    """
+
+    rewrite: bool = False
+    data_page_size: int = DEFAULT_DATA_PAGE_SIZE
+    compression: Optional[str] = None
+    dictionary_ratio: float = DEFAULT_DICTIONARY_RATIO
+    memory_bytes: int = DEFAULT_COMPACTION_MEMORY
+    indexes: bool = True
+
+    def __post_init__(self):
+        """
+        Validate the options.
+
+        Raises:
+            ValueError: If a size is not positive, the ratio is outside
+                [0, 1] or the codec is unavailable.
+        """
+        for name in ["data_page_size", "memory_bytes"]:
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be positive, got {getattr(self, name)}")
+        if not 0 <= self.dictionary_ratio <= 1:
+            raise ValueError(
+                f"dictionary_ratio must be between 0 and 1, got {self.dictionary_ratio}"
+            )
+        if self.compression is not None and self.compression != "none":
+            if not pa.Codec.is_available(self.compression):
+                raise ValueError(f"Compression codec '{self.compression}' is not available")
+
+
+def _leaf_paths(schema: pa.Schema) -> Dict[str, List[str]]:
+    """
+    Get the Parquet leaf column paths of every top-level field.
+
+    Writer options address nested columns by leaf path, e.g.
+    ``nodes.list.element`` for a list column ``nodes``.
+
+    Args:
+        schema (pa.Schema): Arrow schema.
+
+    Returns:
+        dict: Field name -> leaf column paths.
+    """
+    sink = pa.BufferOutputStream()
+    pq.write_table(schema.empty_table(), sink)
+    parquet_schema = pq.read_metadata(pa.BufferReader(sink.getvalue())).schema
+    paths: Dict[str, List[str]] = {}
+    for i in range(len(parquet_schema)):
+        path = parquet_schema.column(i).path
+        paths.setdefault(path.split(".")[0], []).append(path)
+    return paths
+
+
+def column_encodings(
+    sample: pa.Table, options: CompactionOptions
+) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Choose the codec and dictionary encoding of every column.
+
+    List columns are judged by their values.
+
+    Args:
+        sample (pa.Table): Rows the choice is based on.
+        options (CompactionOptions): Compaction settings.
+
+    Returns:
+        tuple: (leaf column path -> codec, dictionary-encoded leaf column
+        paths), as accepted by the ``compression`` and ``use_dictionary``
+        writer options.
+    """
+    codecs, dictionary = {}, []
+    for field_name, paths in _leaf_paths(sample.schema).items():
+        value_type = sample.schema.field(field_name).type
+        values = sample[field_name]
+        while pa.types.is_list(value_type) or pa.types.is_large_list(value_type) or (
+            pa.types.is_fixed_size_list(value_type)
+        ):
+            value_type = value_type.value_type
+            values = pc.list_flatten(values)
+
+        if options.compression is not None:
+            codec = options.compression
+        elif pa.types.is_floating(value_type):
+            codec = FLOAT_CODEC
+        else:
+            codec = DEFAULT_CODEC
+        codecs.update((path, codec) for path in paths)
+
+        if pa.types.is_dictionary(value_type):
+            use_dictionary = True
+        elif pa.types.is_boolean(value_type) or pa.types.is_nested(value_type):
+            use_dictionary = False
+        elif len(values) == 0:
+            use_dictionary = pa.types.is_string(value_type)
+        else:
+            distinct = pc.count_distinct(values).as_py()
+            use_dictionary = distinct <= options.dictionary_ratio * len(values)
+        if use_dictionary:
+            dictionary += paths
+    return codecs, dictionary
+
+
+def _key_at_most(table: pa.Table, columns: List[str], bound: Tuple[Any, ...]) -> pa.Array:
+    """
+    Mask the rows whose key is lexicographically at most a bound.
+
+    Args:
+        table (pa.Table): Rows to test.
+        columns (list[str]): Key columns, most significant first.
+        bound (tuple): Key values of the bound.
+
+    Returns:
+        pa.Array: Boolean mask.
+    """
+    mask = pc.less_equal(table[columns[-1]], bound[-1])
+    for column, value in zip(reversed(columns[:-1]), reversed(bound[:-1])):
+        mask = pc.or_(
+            pc.less(table[column], value),
+            pc.and_(pc.equal(table[column], value), mask),
+        )
+    return mask
+
+
+def _last_key(table: pa.Table, columns: List[str]) -> Tuple[Any, ...]:
+    """Key values of a table's last row."""
+    return tuple(table[column][-1].as_py() for column in columns)
+
+
+def _merge_runs(runs: List[Path], ordering: Ordering, batch_rows: int) -> Iterator[pa.Table]:
+    """
+    Merge sorted run files into sorted tables.
+
+    Each step emits every buffered row whose key is at most the smallest
+    last key of the runs' current batches; no later row of any run can
+    sort before those rows.
+
+    Args:
+        runs (list[Path]): Sorted Parquet files.
+        ordering (list[tuple[str, str]]): Sort keys, all ascending.
+        batch_rows (int): Rows read from a run at a time.
+
+    Yields:
+        pa.Table: Sorted tables, in order.
+    """
+    columns = [column for column, _ in ordering]
+    readers = [pq.ParquetFile(run).iter_batches(batch_size=batch_rows) for run in runs]
+
+    def next_batch(i: int) -> Optional[pa.Table]:
+        batch = next(readers[i], None)
+        return None if batch is None else pa.Table.from_batches([batch])
+
+    heads = [next_batch(i) for i in range(len(runs))]
+    while True:
+        active = [i for i, head in enumerate(heads) if head is not None]
+        if not active:
+            return
+        bound = min(_last_key(heads[i], columns) for i in active)
+        parts = []
+        for i in active:
+            mask = _key_at_most(heads[i], columns, bound)
+            parts.append(heads[i].filter(mask))
+            rest = heads[i].filter(pc.invert(mask))
+            heads[i] = rest if rest.num_rows else next_batch(i)
+        yield pa.concat_tables(parts).sort_by(ordering)
+
+
+def sort_batches(
+    batches: Iterable[pa.Table],
+    ordering: Ordering,
+    memory_bytes: int,
+    spill_dir: Path,
+    batch_rows: int,
+) -> Iterator[pa.Table]:
+    """
+    Sort a stream of tables with an external merge sort.
+
+    Args:
+        batches (Iterable[pa.Table]): Rows to sort, all with one schema.
+        ordering (list[tuple[str, str]]): Sort keys, all ascending. Key
+            values must not be null. Without keys the rows pass through.
+        memory_bytes (int): Arrow bytes per in-memory run.
+        spill_dir (Path): Directory for the temporary run files.
+        batch_rows (int): Rows read from a run at a time while merging.
+
+    Yields:
+        pa.Table: The rows in sorted order.
+    """
+    if not ordering:
+        yield from batches
+        return
+
+    with tempfile.TemporaryDirectory(dir=spill_dir, prefix="compact-") as tmp:
+        runs: List[Path] = []
+        pending: List[pa.Table] = []
+        pending_bytes = 0
+        for batch in batches:
+            pending.append(batch)
+            pending_bytes += batch.nbytes
+            if pending_bytes >= memory_bytes:
+                runs.append(Path(tmp) / f"run-{len(runs)}.parquet")
+                pq.write_table(pa.concat_tables(pending).sort_by(ordering), runs[-1])
+                pending, pending_bytes = [], 0
+
+        if not runs:
+            if pending:
+                yield pa.concat_tables(pending).sort_by(ordering)
+            return
+        if pending:
+            runs.append(Path(tmp) / f"run-{len(runs)}.parquet")
+            pq.write_table(pa.concat_tables(pending).sort_by(ordering), runs[-1])
+        yield from _merge_runs(runs, ordering, batch_rows)
+
+
+def write_row_groups(
+    batches: Iterable[pa.Table],
+    path: str | Path,
+    schema: pa.Schema,
+    row_group_size: int,
+    options: CompactionOptions,
+    writer_options: Dict[str, Any],
+) -> None:
+    """
+    Write tables to one Parquet file in row groups of ``row_group_size`` rows.
+
+    Column encodings are chosen from the first non-empty table.
+
+    Args:
+        batches (Iterable[pa.Table]): Rows to write, in order.
+        path (str | Path): Destination file.
+        schema (pa.Schema): Schema of the rows.
+        row_group_size (int): Rows per row group.
+        options (CompactionOptions): Compaction settings.
+        writer_options (dict): Further ``pq.ParquetWriter`` options (sort
+            order, page index, bloom filters).
+    """
+    writer = None
+    pending: List[pa.Table] = []
+    pending_rows = 0
+
+    def open_writer(sample: pa.Table) -> pq.ParquetWriter:
+        codecs, dictionary = column_encodings(sample, options)
+        return pq.ParquetWriter(
+            path,
+            schema,
+            compression=codecs,
+            use_dictionary=dictionary,
+            data_page_size=options.data_page_size,
+            write_statistics=True,
+            **writer_options,
+        )
+
+    try:
+        for batch in batches:
+            if batch.num_rows == 0:
+                continue
+            pending.append(batch)
+            pending_rows += batch.num_rows
+            if pending_rows < row_group_size:
+                continue
+            table = pa.concat_tables(pending)
+            full = table.num_rows - table.num_rows % row_group_size
+            if writer is None:
+                writer = open_writer(table)
+            writer.write_table(table.slice(0, full), row_group_size=row_group_size)
+            pending = [table.slice(full)] if full < table.num_rows else []
+            pending_rows = table.num_rows - full
+
+        table = pa.concat_tables(pending) if pending else schema.empty_table()
+        if writer is None:
+            writer = open_writer(table)
+        if table.num_rows:
+            writer.write_table(table, row_group_size=row_group_size)
+    finally:
+        if writer is not None:
+            writer.close()
@@ -20,14 +20,27 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional
 
 import numpy as np
 import pandas as pd
 
 from eda_schema import entity
 from eda_schema.base import Image2D
-from eda_schema.db.base import BaseDB
+from eda_schema.catalog import CATALOG_FILE
+from eda_schema.db.base import (
+    DEFAULT_BATCH_SIZE,
+    BaseDB,
+    check_batch_size,
+    existing_files,
+)
+from eda_schema.db.filters import (
+    Predicate,
+    combine_predicates,
+    ensure_predicate,
+    filters_to_predicate,
+)
+from eda_schema.db.image_store import ImageStore, image_source, validate_image_store
 from eda_schema.errors import DataNotFoundError
 
 
@@ -43,15 +56,31 @@ class FileDB(BaseDB):
         data_home (Path): Root directory where all entity folders are stored.
     """
 
-    def __init__(self, data_home: str | Path):
+    def __init__(
+        self,
+        data_home: str | Path,
+        image_store: str = "npz",
+        compressed_images: Optional[List[str]] = None,
+    ):
         """
         Initialize the file-backed database.
 
         Args:
             data_home (str | Path): Root directory for all stored data.
+            image_store (str): How new images are written, "npz" (one file
+                per image) or "chunked" (per-entity containers, see
+                ``ImageStore``). Both are read regardless of this setting.
+            compressed_images (list[str] | None): Image fields written as
+                compressed chunks by the chunked store.
+
+        Raises:
+            ValueError: If the image store is unknown.
         """
         self.data_home = Path(data_home)
         self.data_home.mkdir(parents=True, exist_ok=True)
+        self.image_store = validate_image_store(image_store)
+        self.compressed_images = set(compressed_images or [])
+        self._image_stores: Dict[str, ImageStore] = {}  # entity_name -> containers
 
     # ------------------------------------------------------------------
     # Helpers
@@ -142,6 +171,18 @@ class FileDB(BaseDB):
                 is_graph_entity=is_graph,
             )
 
+    def has_table(self, entity_name: str) -> bool:
+        """
+        Check whether the table of an entity was created.
+
+        Args:
+            entity_name (str): Name of the entity.
+
+        Returns:
+            bool: True if the table's CSV file exists.
+        """
+        return self._table_path(entity_name).exists()
+
     # ------------------------------------------------------------------
     # Graph Operations
     # ------------------------------------------------------------------
@@ -261,21 +302,36 @@ class FileDB(BaseDB):
             entity_name (str): Name of the entity.
             data (list): Rows to insert.
         """
-        df = pd.DataFrame(data)
+        if not data:
+            return
+        table_path = self._table_path(entity_name)
+
+        # Align rows with the table's column order, like add_table_row
+        if table_path.exists():
+            columns = pd.read_csv(table_path, nrows=0).columns.tolist()
+        else:
+            columns = entity.SchemaMetadata.get_columns(entity_name)
+
+        df = pd.DataFrame(data).reindex(columns=columns)
         df.to_csv(
-            self._table_path(entity_name),
+            table_path,
             mode="a",
             index=False,
             header=False,
         )
 
-    def get_table_data(self, entity_name: str, **filters: Any) -> pd.DataFrame:
+    def get_table_data(
+        self, entity_name: str, where: Optional[Predicate] = None, **filters: Any
+    ) -> pd.DataFrame:
         """
         Retrieve rows from a data table.
 
         Args:
             entity_name (str): Table to query.
-            **filters: Column=value filters.
+            where (Predicate | None): Additional filter expression built with
+                ``eda_schema.db.filters.col``.
+            **filters: Column=value filters (iterables are IN sets, None
+                matches nulls).
 
         Returns:
             pd.DataFrame: Filtered results.
@@ -286,13 +342,62 @@ class FileDB(BaseDB):
 
         df = pd.read_csv(table_path)
 
-        for col, val in filters.items():
+        for col in filters:
             if col not in df.columns:
                 raise KeyError(f"Column '{col}' not found in '{entity_name}' table.")
-            df = df[df[col] == val]
+
+        predicate = combine_predicates(
+            filters_to_predicate(filters), ensure_predicate(where)
+        )
+        if predicate is not None:
+            df = df[predicate.mask(df)]
 
         return df
 
+    def iter_table_batches(
+        self,
+        entity_name: str,
+        columns: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        where: Optional[Predicate] = None,
+        **filters: Any,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream filtered rows of a table by reading the CSV in chunks.
+
+        Args:
+            entity_name (str): Table to query.
+            columns (list[str] | None): Columns to return; None returns all.
+            batch_size (int): Maximum number of rows per batch (CSV chunk size).
+            where (Predicate | None): Additional filter expression.
+            **filters: Column=value filters.
+
+        Returns:
+            Iterator[pd.DataFrame]: Non-empty filtered batches.
+
+        Raises:
+            ValueError: If ``batch_size`` is not positive.
+            FileNotFoundError: If the table does not exist.
+        """
+        check_batch_size(batch_size)
+        predicate = combine_predicates(
+            filters_to_predicate(filters), ensure_predicate(where)
+        )
+        table_path = self._table_path(entity_name)
+        if not table_path.exists():
+            raise FileNotFoundError(f"No table found for entity: {entity_name}")
+
+        def batches():
+            for chunk in pd.read_csv(table_path, chunksize=batch_size):
+                if predicate is not None:
+                    chunk = chunk[predicate.mask(chunk)]
+                if columns is not None:
+                    chunk = chunk[columns]
+                if len(chunk):
+                    yield chunk
+
+        return batches()
+
     def get_table_row(self, entity_name: str, **filters: Any) -> pd.Series:
         """
         Retrieve one row matching filter conditions.
@@ -314,6 +419,37 @@ class FileDB(BaseDB):
     # ------------------------------------------------------------------
     # Image Storage
     # ------------------------------------------------------------------
+    def _chunked_images(self, entity_name: str) -> ImageStore:
+        """
+        Get the chunked image store of an entity.
+
+        Args:
+            entity_name: Name of the entity.
+
+        Returns:
+            ImageStore: Store rooted at the entity's image directory.
+        """
+        store = self._image_stores.get(entity_name)
+        if store is None:
+            store = ImageStore(self._image_dir(entity_name))
+            self._image_stores[entity_name] = store
+        return store
+
+    @staticmethod
+    def _image_id(image_name: str, key_fields: Dict[str, Any]) -> str:
+        """
+        Build the id of one stored image (the ``.npz`` file stem).
+
+        Args:
+            image_name: Image name (field, or ``field__dict_key``).
+            key_fields: Primary-key values identifying the row.
+
+        Returns:
+            str: Image id.
+        """
+        key_str = "__".join(f"{k}={v}" for k, v in sorted(key_fields.items()))
+        return f"{image_name}__{key_str}"
+
     def add_image(
         self, entity_name: str, image_name: str, image: Image2D, **key_fields
     ) -> None:
@@ -330,17 +466,46 @@ class FileDB(BaseDB):
         Returns:
             None
         """
+        if self.image_store == "chunked":
+            self._chunked_images(entity_name).put(
+                self._image_id(image_name, key_fields),
+                image,
+                compress=image_name.split("__")[0] in self.compressed_images,
+            )
+            return
+
         # Ensure the image directory exists
         image_dir = self._image_dir(entity_name)
         image_dir.mkdir(parents=True, exist_ok=True)
 
         # Construct filename from field + primary keys
-        key_str = "__".join(f"{k}={v}" for k, v in sorted(key_fields.items()))
-        path = image_dir / f"{image_name}__{key_str}.npz"
+        path = image_dir / f"{self._image_id(image_name, key_fields)}.npz"
 
         # Save as compressed numpy array
         np.savez_compressed(path, image)
 
+    def get_image_source(
+        self, entity_name: str, image_name: str, **key_fields
+    ) -> Optional[str]:
+        """
+        Identify the stored bytes of an image (container location, or
+        ``.npz`` path with modification time and size).
+
+        Args:
+            entity_name (str): Name of the entity.
+            image_name (str): Name of the stored image.
+            **key_fields: Primary-key values identifying the row.
+
+        Returns:
+            str | None: Source string, or None if the image is not stored.
+        """
+        image_id = self._image_id(image_name, key_fields)
+        return image_source(
+            self._chunked_images(entity_name),
+            image_id,
+            self._image_dir(entity_name) / f"{image_id}.npz",
+        )
+
     def get_image(self, entity_name: str, field: str, **key_fields) -> Image2D:
         """
         Retrieve an Image2D stored for a specific entity row.
@@ -356,10 +521,13 @@ class FileDB(BaseDB):
         Raises:
             DataNotFoundError: If the image file does not exist.
         """
+        # Chunked containers first, then one .npz file per image
+        image = self._chunked_images(entity_name).get(self._image_id(field, key_fields))
+        if image is not None:
+            return image
+
         # Construct expected path
-        image_dir = self._image_dir(entity_name)
-        key_str = "__".join(f"{k}={v}" for k, v in sorted(key_fields.items()))
-        path = image_dir / f"{field}__{key_str}.npz"
+        path = self._image_dir(entity_name) / f"{self._image_id(field, key_fields)}.npz"
 
         # Check if file exists
         if not path.exists():
@@ -369,3 +537,30 @@ class FileDB(BaseDB):
         data = np.load(path)
         arr = data["arr_0"]  # np.savez_compressed saves as 'arr_0'
         return Image2D(arr)
+
+    # ------------------------------------------------------------------
+    # Catalog
+    # ------------------------------------------------------------------
+    @property
+    def catalog_path(self) -> Path:
+        """Path of the dataset catalog, ``<data_home>/catalog.json``."""
+        return self.data_home / CATALOG_FILE
+
+    def storage_files(self, entity_name: str, images: bool = True) -> Dict[str, List[Path]]:
+        """
+        List the files holding an entity's data.
+
+        Args:
+            entity_name (str): Name of the entity.
+            images (bool): Also list image files.
+
+        Returns:
+            dict: "table", "graph" and (with ``images``) "images" -> files.
+        """
+        storage = {
+            "table": existing_files(self._table_path(entity_name)),
+            "graph": existing_files(self._graph_dir(entity_name)),
+        }
+        if images:
+            storage["images"] = existing_files(self._image_dir(entity_name))
+        return storage
@@ -0,0 +1,453 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : eda_schema/db/filters.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""
+Row filter expressions for table reads.
+
+Predicates are built from ``col``::
+
+    from eda_schema.db.filters import col
+
+    db.get_table_data(
+        "timing_paths",
+        where=(col("slack") < 0) & col("path_type").isin(["max", "min"]),
+    )
+
+They compile to ``pyarrow.dataset`` expressions (``to_expression``) for
+pushdown into Parquet scans and to boolean masks (``mask``) for backends
+that filter DataFrames. Predicates are immutable and hashable, so they can
+be part of cache keys.
+"""
+
+import operator
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+# Comparison operator name -> Python operator
+COMPARISONS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+class Predicate(ABC):
+    """
+    Base class of row filter expressions.
+
+    Combine predicates with ``&``, ``|`` and ``~``.
+    """
+
+    @abstractmethod
+    def to_expression(self) -> ds.Expression:
+        """
+        Compile the predicate to a PyArrow dataset expression.
+
+        Returns:
+            ds.Expression: Expression usable as a scan filter.
+        """
+
+    @abstractmethod
+    def truth(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Evaluate the predicate on a DataFrame with three-valued logic.
+
+        Comparisons with a null are null, and ``&``, ``|`` and ``~``
+        follow Kleene logic, as in the Arrow expression.
+
+        Args:
+            df (pd.DataFrame): Rows to test.
+
+        Returns:
+            pd.Series: Nullable boolean ("boolean" dtype) aligned with ``df``.
+        """
+
+    def mask(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Evaluate the predicate on a DataFrame.
+
+        Args:
+            df (pd.DataFrame): Rows to test.
+
+        Returns:
+            pd.Series: Boolean mask aligned with ``df``; rows where the
+            predicate is null never match, so ``~`` does not select them.
+        """
+        return self.truth(df).fillna(False).astype(bool)
+
+    def __and__(self, other: "Predicate") -> "Predicate":
+        return And((self, other))
+
+    def __or__(self, other: "Predicate") -> "Predicate":
+        return Or((self, other))
+
+    def __invert__(self) -> "Predicate":
+        return Not(self)
+
+
+@dataclass(frozen=True)
+class Compare(Predicate):
+    """``column <op> value`` for one of the ``COMPARISONS`` operators."""
+
+    column: str
+    op: str
+    value: Any
+
+    def __post_init__(self):
+        """
+        Validate the operator and value.
+
+        Raises:
+            ValueError: If the operator is unknown.
+            TypeError: If the value is not hashable.
+        """
+        if self.op not in COMPARISONS:
+            raise ValueError(
+                f"Unknown comparison '{self.op}'. Expected one of {list(COMPARISONS)}"
+            )
+        _check_hashable(self.column, self.value)
+
+    def to_expression(self) -> ds.Expression:
+        """Compile to ``field <op> value``; see ``Predicate.to_expression``."""
+        return COMPARISONS[self.op](ds.field(self.column), self.value)
+
+    def truth(self, df: pd.DataFrame) -> pd.Series:
+        """Compare the column with the value, null for nulls; see ``Predicate.truth``."""
+        values = df[self.column]
+        result = COMPARISONS[self.op](values, self.value).fillna(False).astype(bool)
+        return result.astype("boolean").mask(values.isna())
+
+
+@dataclass(frozen=True)
+class IsIn(Predicate):
+    """``column`` is one of ``values``."""
+
+    column: str
+    values: Tuple[Any, ...]
+
+    def __post_init__(self):
+        """
+        Validate the values.
+
+        Raises:
+            TypeError: If a value is not hashable.
+        """
+        _check_hashable(self.column, self.values)
+
+    def to_expression(self) -> ds.Expression:
+        """Compile to ``field.isin(values)``; see ``Predicate.to_expression``."""
+        if not self.values:
+            return ds.scalar(False)
+        return ds.field(self.column).isin(list(self.values))
+
+    def truth(self, df: pd.DataFrame) -> pd.Series:
+        """Test membership in the values; see ``Predicate.truth``."""
+        return df[self.column].isin(self.values).astype("boolean")
+
+
+@dataclass(frozen=True)
+class IsNull(Predicate):
+    """``column`` is null (or NaN)."""
+
+    column: str
+
+    def to_expression(self) -> ds.Expression:
+        """Compile to a null-or-NaN test; see ``Predicate.to_expression``."""
+        return ds.field(self.column).is_null(nan_is_null=True)
+
+    def truth(self, df: pd.DataFrame) -> pd.Series:
+        """Test for null or NaN values; see ``Predicate.truth``."""
+        return df[self.column].isna().astype("boolean")
+
+
+@dataclass(frozen=True)
+class StartsWith(Predicate):
+    """String ``column`` starts with ``prefix``."""
+
+    column: str
+    prefix: str
+
+    def to_expression(self) -> ds.Expression:
+        """
+        Compile to ``starts_with`` bounded by the prefix range, so row-group
+        statistics can be used; see ``Predicate.to_expression``.
+        """
+        field = ds.field(self.column)
+        expression = pc.starts_with(field, pattern=self.prefix)
+        upper = _prefix_upper_bound(self.prefix)
+        if self.prefix:
+            # Range bounds let row-group statistics skip non-matching groups
+            expression = (field >= self.prefix) & expression
+        if upper is not None:
+            expression = (field < upper) & expression
+        return expression
+
+    def truth(self, df: pd.DataFrame) -> pd.Series:
+        """Test the string prefix, null for nulls; see ``Predicate.truth``."""
+        values = df[self.column]
+        result = values.str.startswith(self.prefix).fillna(False).astype(bool)
+        return result.astype("boolean").mask(values.isna())
+
+
+@dataclass(frozen=True)
+class And(Predicate):
+    """All of ``predicates`` hold."""
+
+    predicates: Tuple[Predicate, ...]
+
+    def to_expression(self) -> ds.Expression:
+        """Compile to the conjunction; see ``Predicate.to_expression``."""
+        expression = self.predicates[0].to_expression()
+        for predicate in self.predicates[1:]:
+            expression = expression & predicate.to_expression()
+        return expression
+
+    def truth(self, df: pd.DataFrame) -> pd.Series:
+        """AND the predicates' values (Kleene); see ``Predicate.truth``."""
+        result = self.predicates[0].truth(df)
+        for predicate in self.predicates[1:]:
+            result = result & predicate.truth(df)
+        return result
+
+
+@dataclass(frozen=True)
+class Or(Predicate):
+    """Any of ``predicates`` holds."""
+
+    predicates: Tuple[Predicate, ...]
+
+    def to_expression(self) -> ds.Expression:
+        """Compile to the disjunction; see ``Predicate.to_expression``."""
+        expression = self.predicates[0].to_expression()
+        for predicate in self.predicates[1:]:
+            expression = expression | predicate.to_expression()
+        return expression
+
+    def truth(self, df: pd.DataFrame) -> pd.Series:
+        """OR the predicates' values (Kleene); see ``Predicate.truth``."""
+        result = self.predicates[0].truth(df)
+        for predicate in self.predicates[1:]:
+            result = result | predicate.truth(df)
+        return result
+
+
+@dataclass(frozen=True)
+class Not(Predicate):
+    """``predicate`` does not hold."""
+
+    predicate: Predicate
+
+    def to_expression(self) -> ds.Expression:
+        """Compile to the negation; see ``Predicate.to_expression``."""
+        return ~self.predicate.to_expression()
+
+    def truth(self, df: pd.DataFrame) -> pd.Series:
+        """Invert the predicate's value; null stays null; see ``Predicate.truth``."""
+        return ~self.predicate.truth(df)
+
+
+class Column:
+    """
+    Builder for predicates on one column, created by ``col``.
+
+    Comparison operators return predicates, so ``col("slack") < 0`` is a
+    ``Compare`` and ``col("x") == None`` is an ``IsNull``.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def _compare(self, op: str, value: Any) -> Predicate:
+        return Compare(self.name, op, value)
+
+    def __eq__(self, value: Any) -> Predicate:  # type: ignore[override]
+        if value is None:
+            return IsNull(self.name)
+        return self._compare("==", value)
+
+    def __ne__(self, value: Any) -> Predicate:  # type: ignore[override]
+        if value is None:
+            return Not(IsNull(self.name))
+        return self._compare("!=", value)
+
+    def __lt__(self, value: Any) -> Predicate:
+        return self._compare("<", value)
+
+    def __le__(self, value: Any) -> Predicate:
+        return self._compare("<=", value)
+
+    def __gt__(self, value: Any) -> Predicate:
+        return self._compare(">", value)
+
+    def __ge__(self, value: Any) -> Predicate:
+        return self._compare(">=", value)
+
+    __hash__ = None
+
+    def isin(self, values: Iterable) -> Predicate:
+        """
+        Match rows whose value is in ``values``.
+
+        Args:
+            values (Iterable): Allowed values.
+
+        Returns:
+            Predicate: The IN predicate.
+        """
+        return IsIn(self.name, tuple(values))
+
+    def is_null(self) -> Predicate:
+        """Match rows whose value is null."""
+        return IsNull(self.name)
+
+    def not_null(self) -> Predicate:
+        """Match rows whose value is not null."""
+        return Not(IsNull(self.name))
+
+    def startswith(self, prefix: str) -> Predicate:
+        """
+        Match rows whose string value starts with ``prefix``.
+
+        Args:
+            prefix (str): Required prefix.
+
+        Returns:
+            Predicate: The prefix predicate.
+        """
+        return StartsWith(self.name, prefix)
+
+
+def col(name: str) -> Column:
+    """
+    Refer to a table column in a filter expression.
+
+    Args:
+        name (str): Column name.
+
+    Returns:
+        Column: Predicate builder for the column.
+    """
+    return Column(name)
+
+
+def _check_hashable(column: str, value: Any) -> None:
+    """
+    Check that a predicate value can be part of a cache key.
+
+    Args:
+        column (str): Column the value is compared with.
+        value: Value (or tuple of values) of the predicate.
+
+    Raises:
+        TypeError: If the value is not hashable.
+    """
+    try:
+        hash(value)
+    except TypeError as e:
+        raise TypeError(
+            f"Filter values for column '{column}' must be hashable, "
+            f"got {type(value).__name__}: {e}"
+        ) from None
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """
+    Get the smallest string greater than every string starting with ``prefix``.
+
+    Args:
+        prefix (str): String prefix.
+
+    Returns:
+        str | None: Exclusive upper bound, or None if there is none.
+    """
+    stripped = prefix.rstrip(chr(0x10FFFF))
+    if not stripped:
+        return None
+    return stripped[:-1] + chr(ord(stripped[-1]) + 1)
+
+
+def filters_to_predicate(filters: Dict[str, Any]) -> Optional[Predicate]:
+    """
+    Convert keyword filters to a predicate.
+
+    Scalars (including booleans) become equality tests, iterables become
+    IN sets and ``None`` matches nulls.
+
+    Args:
+        filters (dict): Column -> value filters.
+
+    Returns:
+        Predicate | None: Conjunction of the filters, or None if empty.
+    """
+    predicates = []
+    for column, value in filters.items():
+        if isinstance(value, Iterable) and not isinstance(value, (str, bytes)):
+            predicates.append(col(column).isin(value))
+        else:
+            predicates.append(col(column) == value)
+    return combine_predicates(*predicates)
+
+
+def combine_predicates(*predicates: Optional[Predicate]) -> Optional[Predicate]:
+    """
+    AND together the given predicates, skipping None.
+
+    Args:
+        *predicates: Predicates (or None).
+
+    Returns:
+        Predicate | None: The conjunction, or None if nothing was given.
+    """
+    predicates = [p for p in predicates if p is not None]
+    if not predicates:
+        return None
+    if len(predicates) == 1:
+        return predicates[0]
+    return And(tuple(predicates))
+
+
+def ensure_predicate(where: Any) -> Optional[Predicate]:
+    """
+    Check a ``where=`` argument.
+
+    Args:
+        where: A Predicate, or None.
+
+    Returns:
+        Predicate | None: The predicate.
+
+    Raises:
+        TypeError: If ``where`` is not a Predicate.
+    """
+    if where is not None and not isinstance(where, Predicate):
+        raise TypeError(
+            f"where= expects a filter expression built with col(), got {type(where).__name__}"
+        )
+    return where
+
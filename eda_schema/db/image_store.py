@@ -0,0 +1,431 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : eda_schema/db/image_store.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""
+Chunked image containers.
+
+An ``ImageStore`` packs all images of one entity into a few container files
+(``chunk-NNNNN.bin``) and records the location of every image in an
+append-only index (``index.jsonl``). Uncompressed images are read as
+zero-copy views of a memory map of their container; compressed images are
+stored as zlib chunks and decompressed on read.
+
+``EncodedImage`` holds an image already compressed for storage, so the
+compression can run in another process than the one writing the store.
+"""
+
+import io
+import json
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from eda_schema.base import Image2D
+
+IMAGE_STORES = ("npz", "chunked")
+DEFAULT_IMAGE_CHUNK_BYTES = 256 * 1024 * 1024  # roll over to a new container
+IMAGE_ALIGNMENT = 64  # byte alignment of uncompressed images in a container
+
+
+def validate_image_store(image_store: str) -> str:
+    """
+    Check an image store name.
+
+    Args:
+        image_store (str): Image store name.
+
+    Returns:
+        str: The validated name.
+
+    Raises:
+        ValueError: If the name is not one of ``IMAGE_STORES``.
+    """
+    if image_store not in IMAGE_STORES:
+        raise ValueError(
+            f"Unknown image store '{image_store}' (expected one of {IMAGE_STORES})"
+        )
+    return image_store
+
+
+def image_source(store: "ImageStore", image_id: str, npz_path: Path) -> Optional[str]:
+    """
+    Identify the stored bytes of an image kept in a store or an ``.npz`` file.
+
+    Args:
+        store (ImageStore): Chunked store of the entity.
+        image_id (str): Image id.
+        npz_path (Path): Path of the image's ``.npz`` file.
+
+    Returns:
+        str | None: Source string that changes whenever the image is
+        rewritten, or None if the image is not stored.
+    """
+    source = store.source(image_id)
+    if source is None and npz_path.exists():
+        stat = npz_path.stat()
+        source = f"{npz_path}@{stat.st_mtime_ns}+{stat.st_size}"
+    return source
+
+
+class EncodedImage:
+    """
+    Image compressed ahead of storage.
+
+    Backends store the payload as is. ``shape`` and ``dtype`` describe the
+    original image, as needed for image manifests.
+
+    Attributes:
+        payload (bytes): Compressed bytes.
+        codec (str): "zlib" (an ``ImageStore`` chunk) or "npz" (the
+            contents of an ``.npz`` file).
+        shape (tuple[int, ...]): Shape of the image.
+        dtype (np.dtype): Data type of the image.
+    """
+
+    __slots__ = ("payload", "codec", "shape", "dtype")
+
+    def __init__(self, payload: bytes, codec: str, shape: tuple, dtype: np.dtype):
+        """
+        Wrap compressed image bytes.
+
+        Args:
+            payload (bytes): Compressed bytes.
+            codec (str): "zlib" or "npz".
+            shape (tuple[int, ...]): Shape of the image.
+            dtype (np.dtype): Data type of the image.
+        """
+        self.payload = payload
+        self.codec = codec
+        self.shape = shape
+        self.dtype = dtype
+
+    @classmethod
+    def encode(cls, image: Image2D, codec: str) -> "EncodedImage":
+        """
+        Compress an image.
+
+        Args:
+            image (Image2D): Image data.
+            codec (str): "zlib" or "npz".
+
+        Returns:
+            EncodedImage: The compressed image.
+        """
+        array = np.ascontiguousarray(image)
+        if codec == "zlib":
+            payload = zlib.compress(array.tobytes())
+        else:
+            buffer = io.BytesIO()
+            np.savez_compressed(buffer, array)
+            payload = buffer.getvalue()
+        return cls(payload, codec, array.shape, array.dtype)
+
+
+class ImageStore:
+    """
+    Container files holding every image of one entity.
+
+    Images are addressed by an image id (the backends use the former
+    ``.npz`` file stem, ``<image_name>__<keys>``). Writing an id again
+    appends a new copy and points the index at it.
+
+    Only one process may write to a store at a time; any number may read.
+
+    Attributes:
+        root (Path): Directory holding the containers and the index.
+        chunk_bytes (int): Container size after which a new one is started.
+    """
+
+    def __init__(self, root: str | Path, chunk_bytes: int = DEFAULT_IMAGE_CHUNK_BYTES):
+        """
+        Open (or prepare) the store in a directory.
+
+        Args:
+            root (str | Path): Directory of the store.
+            chunk_bytes (int): Container size after which a new one is started.
+
+        Raises:
+            ValueError: If ``chunk_bytes`` is not positive.
+        """
+        if chunk_bytes <= 0:
+            raise ValueError("chunk_bytes must be positive")
+        self.root = Path(root)
+        self.chunk_bytes = chunk_bytes
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._index_pos = 0  # bytes of index.jsonl already parsed
+        self._maps: Dict[int, np.memmap] = {}
+        self._data_file = None
+        self._data_chunk = -1
+        self._index_file = None
+        self._lock = threading.Lock()  # guards index refreshes and maps
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop open files, memory maps and the lock when pickled."""
+        state = self.__dict__.copy()
+        state.update(
+            _index={},
+            _index_pos=0,
+            _maps={},
+            _data_file=None,
+            _data_chunk=-1,
+            _index_file=None,
+            _lock=None,
+        )
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def index_path(self) -> Path:
+        """Path of the append-only image index."""
+        return self.root / "index.jsonl"
+
+    def chunk_path(self, chunk: int) -> Path:
+        """
+        Get the path of a container file.
+
+        Args:
+            chunk (int): Container number.
+
+        Returns:
+            Path: Path of the container.
+        """
+        return self.root / f"chunk-{chunk:05d}.bin"
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+    def _refresh(self):
+        """Parse index lines appended since the last refresh."""
+        if not self.index_path.exists():
+            return
+        with self._lock:
+            with self.index_path.open("rb") as f:
+                f.seek(self._index_pos)
+                data = f.read()
+            end = data.rfind(b"\n") + 1  # skip a partially written last line
+            for line in data[:end].splitlines():
+                record = json.loads(line)
+                self._index[record.pop("id")] = record
+            self._index_pos += end
+
+    def _lookup(self, image_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the index record of an image, re-reading the index if needed.
+
+        Args:
+            image_id (str): Image id.
+
+        Returns:
+            dict | None: Index record, or None if the image is not stored.
+        """
+        record = self._index.get(image_id)
+        if record is None:
+            self._refresh()
+            record = self._index.get(image_id)
+        return record
+
+    def __contains__(self, image_id: str) -> bool:
+        return self._lookup(image_id) is not None
+
+    def ids(self) -> List[str]:
+        """
+        List the stored image ids.
+
+        Returns:
+            list[str]: Image ids in first-write order.
+        """
+        self._refresh()
+        return list(self._index)
+
+    def location(self, image_id: str) -> Optional[str]:
+        """
+        Get the container file name holding an image.
+
+        Args:
+            image_id (str): Image id.
+
+        Returns:
+            str | None: Container file name, or None if the image is not stored.
+        """
+        record = self._lookup(image_id)
+        return None if record is None else self.chunk_path(record["chunk"]).name
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    def _open_for_write(self, nbytes: int):
+        """
+        Get the container to append ``nbytes`` to, starting a new one if
+        the current container would grow past ``chunk_bytes``.
+
+        Args:
+            nbytes (int): Size of the next record.
+        """
+        if self._index_file is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._refresh()
+            self._data_chunk = max(
+                (record["chunk"] for record in self._index.values()), default=0
+            )
+            self._index_file = self.index_path.open("ab")
+
+        if self._data_file is None:
+            self._data_file = self.chunk_path(self._data_chunk).open("ab")
+
+        size = self._data_file.tell()
+        if size and size + nbytes > self.chunk_bytes:
+            self._data_file.close()
+            self._data_chunk += 1
+            self._data_file = self.chunk_path(self._data_chunk).open("ab")
+
+    def put(
+        self, image_id: str, image: Image2D | EncodedImage, compress: bool = False
+    ) -> str:
+        """
+        Append an image to the store.
+
+        Args:
+            image_id (str): Image id.
+            image (Image2D | EncodedImage): Image data, or an image already
+                compressed with the "zlib" codec.
+            compress (bool): Store a zlib-compressed chunk instead of raw,
+                memory-mappable bytes. Implied by an ``EncodedImage``.
+
+        Returns:
+            str: Path of the container holding the image.
+
+        Raises:
+            ValueError: If an encoded image does not use the "zlib" codec.
+        """
+        if isinstance(image, EncodedImage):
+            if image.codec != "zlib":
+                raise ValueError(f"Cannot store an image encoded as '{image.codec}'")
+            array = image
+            compress = True
+            payload = image.payload
+        else:
+            array = np.ascontiguousarray(image)
+            payload = zlib.compress(array.tobytes()) if compress else array
+        nbytes = len(payload) if compress else array.nbytes
+
+        self._open_for_write(nbytes + IMAGE_ALIGNMENT)
+        offset = self._data_file.tell()
+        if not compress:
+            padding = -offset % IMAGE_ALIGNMENT
+            self._data_file.write(b"\0" * padding)
+            offset += padding
+        self._data_file.write(payload)
+        self._data_file.flush()
+
+        record = {
+            "chunk": self._data_chunk,
+            "offset": offset,
+            "nbytes": nbytes,
+            "shape": list(array.shape),
+            "dtype": array.dtype.str,
+            "codec": "zlib" if compress else "raw",
+        }
+        self._index_file.write(
+            json.dumps({"id": image_id, **record}).encode() + b"\n"
+        )
+        self._index_file.flush()
+        self._index[image_id] = record
+        return str(self.chunk_path(self._data_chunk))
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    def _map(self, chunk: int, end: int) -> np.memmap:
+        """
+        Get a read-only memory map of a container covering ``end`` bytes.
+
+        Args:
+            chunk (int): Container number.
+            end (int): Byte offset the map must reach.
+
+        Returns:
+            np.memmap: Map of the container.
+        """
+        with self._lock:
+            mapped = self._maps.get(chunk)
+            if mapped is None or len(mapped) < end:
+                # The container grew since it was mapped
+                mapped = np.memmap(self.chunk_path(chunk), dtype=np.uint8, mode="r")
+                self._maps[chunk] = mapped
+            return mapped
+
+    def source(self, image_id: str) -> Optional[str]:
+        """
+        Get a string identifying the stored bytes of an image.
+
+        Args:
+            image_id (str): Image id.
+
+        Returns:
+            str | None: ``<container>@<offset>+<nbytes>``, or None if the
+            image is not stored. Rewriting an image changes its source.
+        """
+        record = self._lookup(image_id)
+        if record is None:
+            return None
+        path = self.chunk_path(record["chunk"])
+        return f"{path}@{record['offset']}+{record['nbytes']}"
+
+    def get(self, image_id: str) -> Optional[Image2D]:
+        """
+        Read an image.
+
+        Uncompressed images are returned as read-only views of the
+        container's memory map; call ``.copy()`` to modify them.
+
+        Args:
+            image_id (str): Image id.
+
+        Returns:
+            Image2D | None: The image, or None if it is not stored.
+        """
+        record = self._lookup(image_id)
+        if record is None:
+            return None
+
+        offset, nbytes = record["offset"], record["nbytes"]
+        if nbytes == 0:
+            # Empty images take no bytes, and an empty container cannot be mapped
+            array = np.empty(record["shape"], dtype=np.dtype(record["dtype"]))
+            array.flags.writeable = False
+            return Image2D(array)
+        data = self._map(record["chunk"], offset + nbytes)[offset : offset + nbytes]
+        if record["codec"] == "zlib":
+            data = np.frombuffer(zlib.decompress(data), dtype=np.uint8)
+        array = data.view(np.dtype(record["dtype"])).reshape(record["shape"])
+        return Image2D(array)
+
+    def close(self):
+        """Close open container and index files and drop memory maps."""
+        for handle in [self._data_file, self._index_file]:
+            if handle is not None:
+                handle.close()
+        self._data_file = None
+        self._index_file = None
+        self._maps.clear()
@@ -16,13 +16,13 @@
 # expressly prohibited; derivative works must be shared under the same
 # license terms (ShareAlike).
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional
 
 import pandas as pd
 from pymongo import MongoClient
 
 from eda_schema import entity
-from eda_schema.db.base import BaseDB
+from eda_schema.db.base import DEFAULT_BATCH_SIZE, BaseDB, check_batch_size
 from eda_schema.errors import DataNotFoundError
 
 
@@ -59,6 +59,18 @@ class MongoDB(BaseDB, MongoClient):
 
         self.db["metadata"].insert_many(metadata)
 
+    def has_table(self, entity_name: str) -> bool:
+        """
+        Check whether the collections of an entity were initialized.
+
+        Args:
+            entity_name (str): Name of the entity.
+
+        Returns:
+            bool: True if the entity is listed in the metadata collection.
+        """
+        return self.db["metadata"].count_documents({"entity": entity_name}, limit=1) > 0
+
     def add_graph_data(
         self, entity_name: str, graph: Any, key: str = None, **key_fields
     ) -> None:
@@ -92,7 +104,11 @@ class MongoDB(BaseDB, MongoClient):
                 f"got {type(graph)}"
             )
 
-        self.db[f"{entity_name}_graph"].insert_one({"key": resolved_key, **graph_data})
+        # Key fields are stored alongside the key so that graphs can be
+        # queried by partial keys (see get_graph_data_many)
+        self.db[f"{entity_name}_graph"].insert_one(
+            {"key": resolved_key, "key_fields": key_fields, **graph_data}
+        )
 
     def get_graph_data(
         self, entity_name: str, key: str = None, **key_fields
@@ -130,6 +146,37 @@ class MongoDB(BaseDB, MongoClient):
             )
         return result
 
+    def get_graph_data_many(
+        self, entity_name: str, **partial_keys
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve every graph matching a subset of primary-key values with a
+        single query.
+
+        Only graphs stored with ``**key_fields`` can be matched; graphs
+        stored under a legacy ``key`` string are skipped.
+
+        Args:
+            entity_name (str): Name of the entity.
+            **partial_keys: Any subset of primary-key values.
+
+        Returns:
+            list[dict]: One ``{<pk>: value, ..., "data": graph}`` per graph.
+
+        Raises:
+            ValueError: If a key field is not a primary-key column.
+        """
+        self._validate_partial_keys(entity_name, partial_keys)
+
+        query = {"key_fields": {"$exists": True}}
+        query.update({f"key_fields.{k}": v for k, v in partial_keys.items()})
+
+        results = []
+        for doc in self.db[f"{entity_name}_graph"].find(query, {"_id": 0, "key": 0}):
+            key_fields = doc.pop("key_fields")
+            results.append({**key_fields, "data": doc})
+        return results
+
     def add_table_row(self, entity_name: str, row: Dict[str, Any]) -> None:
         """
         Insert a single row into an entity table.
@@ -162,12 +209,13 @@ class MongoDB(BaseDB, MongoClient):
 
         Args:
             entity_name (str): Name of the entity.
-            **filters: Column filters applied as equality matches.
+            **filters: Column filters; lists, tuples and sets are ``$in``
+                matches, other values equality matches.
 
         Returns:
             pd.DataFrame: Data rows as a DataFrame.
         """
-        rows = list(self.db[f"{entity_name}_tabular"].find(filters))
+        rows = list(self.db[f"{entity_name}_tabular"].find(self._query(filters)))
 
         # Remove MongoDB internal ID
         for row in rows:
@@ -179,6 +227,98 @@ class MongoDB(BaseDB, MongoClient):
 
         return pd.DataFrame(rows, columns=columns)
 
+    @staticmethod
+    def _query(filters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build a MongoDB query from column filters.
+
+        Args:
+            filters (dict): Column filters; lists, tuples and sets become
+                ``$in`` matches.
+
+        Returns:
+            dict: The query document.
+        """
+        return {
+            col: {"$in": list(value)} if isinstance(value, (list, tuple, set)) else value
+            for col, value in filters.items()
+        }
+
+    def get_table_rows(
+        self,
+        entity_name: str,
+        keys: List[Dict[str, Any]],
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Retrieve the rows of many primary keys with one ``$or`` query.
+
+        Args:
+            entity_name (str): Name of the entity.
+            keys (list[dict]): Primary-key values of each requested row.
+            columns (list[str] | None): Columns to return (all if None).
+
+        Returns:
+            pd.DataFrame: Matching rows.
+        """
+        pk_cols = entity.SchemaMetadata.get_pk_columns(entity_name)
+        query = {"$or": [{pk: key[pk] for pk in pk_cols} for key in keys]}
+        projection = {col: 1 for col in columns} if columns else None
+        rows = list(self.db[f"{entity_name}_tabular"].find(query, projection))
+        for row in rows:
+            row.pop("_id", None)
+
+        if columns is None:
+            metadata = self.db["metadata"].find_one({"entity": entity_name})
+            columns = metadata["columns"]
+        return pd.DataFrame(rows, columns=columns)
+
+    def iter_table_batches(
+        self,
+        entity_name: str,
+        columns: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **filters,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream matching rows of an entity table in cursor-sized batches.
+
+        Args:
+            entity_name (str): Name of the entity.
+            columns (list[str] | None): Columns to return; None returns all.
+            batch_size (int): Maximum number of rows per batch.
+            **filters: Column filters applied as equality matches.
+
+        Returns:
+            Iterator[pd.DataFrame]: Non-empty batches of at most
+            ``batch_size`` rows.
+
+        Raises:
+            ValueError: If ``batch_size`` is not positive.
+        """
+        check_batch_size(batch_size)
+        if columns is None:
+            metadata = self.db["metadata"].find_one({"entity": entity_name})
+            columns = metadata["columns"]
+        projection = {"_id": False, **{col: True for col in columns}}
+        cursor = (
+            self.db[f"{entity_name}_tabular"]
+            .find(self._query(filters), projection)
+            .batch_size(batch_size)
+        )
+
+        def batches():
+            rows = []
+            for row in cursor:
+                rows.append(row)
+                if len(rows) == batch_size:
+                    yield pd.DataFrame(rows, columns=columns)
+                    rows = []
+            if rows:
+                yield pd.DataFrame(rows, columns=columns)
+
+        return batches()
+
     def get_table_row(self, entity_name: str, **filters) -> pd.Series:
         """
         Retrieve a single matching row from an entity table.
@@ -17,20 +17,51 @@
 # license terms (ShareAlike).
 
 import json
+import os
+import pickle
+import re
+import shutil
+import tempfile
+import time
+import uuid
+import warnings
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote
 
 import numpy as np
 import pandas as pd
 import pyarrow as pa
-import pyarrow.compute as pc
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 
 from eda_schema import entity
 from eda_schema.base import Image2D, resolve_field_type_and_nullable
-from eda_schema.db.base import BaseDB
+from eda_schema.catalog import CATALOG_FILE, build_catalog, stale_files
+from eda_schema.db.base import (
+    DEFAULT_BATCH_SIZE,
+    BaseDB,
+    _key_tuple,
+    _select_keys,
+    check_batch_size,
+    existing_files,
+)
+from eda_schema.db.compaction import CompactionOptions, sort_batches, write_row_groups
+from eda_schema.db.filters import (
+    Predicate,
+    combine_predicates,
+    ensure_predicate,
+    filters_to_predicate,
+)
+from eda_schema.db.image_store import (
+    EncodedImage,
+    ImageStore,
+    image_source,
+    validate_image_store,
+)
 from eda_schema.errors import DataNotFoundError
 
 
@@ -93,36 +124,420 @@ def build_arrow_schema(entity_name: str) -> pa.Schema:
     return pa.schema(arrow_fields)
 
 
-def convert_filters_to_pyarrow(
-    filters: Dict[str, Any],
-) -> Optional[List[Tuple[str, str, Any]]]:
+GRAPH_FORMATS = ("columnar", "json")
+
+# Columnar graph payload: node names, node types, and edges as
+# (source, target) indices into the node list.
+COLUMNAR_GRAPH_FIELDS: Tuple[pa.Field, ...] = (
+    pa.field("nodes", pa.list_(pa.dictionary(pa.int32(), pa.string())), nullable=False),
+    pa.field(
+        "node_types", pa.list_(pa.dictionary(pa.int8(), pa.string())), nullable=False
+    ),
+    pa.field("edges", pa.list_(pa.list_(pa.int32(), 2)), nullable=False),
+)
+
+
+@lru_cache(maxsize=None)
+def build_graph_arrow_schema(
+    entity_name: str, graph_format: str = "columnar"
+) -> pa.Schema:
+    """
+    Build the Apache Arrow schema of a graph entity's graph table.
+
+    The schema holds the entity's primary-key columns followed by the graph
+    payload: either the columnar ``nodes``/``node_types``/``edges`` lists or a
+    single ``graph_json`` string (legacy format).
+
+    Args:
+        entity_name (str): Name of the graph entity.
+        graph_format (str): "columnar" or "json".
+
+    Returns:
+        pa.Schema: Arrow schema of the graph table.
+
+    Raises:
+        ValueError: If the entity defines no primary keys or the graph
+                    format is unknown.
+    """
+    if graph_format not in GRAPH_FORMATS:
+        raise ValueError(
+            f"Unknown graph format '{graph_format}'. Expected one of {GRAPH_FORMATS}"
+        )
+
+    pk_cols = entity.SchemaMetadata.get_pk_columns(entity_name)
+    if not pk_cols:
+        raise ValueError(f"Entity '{entity_name}' must define at least one primary key")
+
+    model_cls = entity.SchemaMetadata.get_model(entity_name)
+    model_fields = entity.SchemaMetadata.get_fields(entity_name)
+    field_map = {f.name: f for f in model_fields}
+
+    graph_fields: list[pa.Field] = []
+
+    for pk in pk_cols:
+        field = field_map[pk]
+        type_name, _, _ = resolve_field_type_and_nullable(model_cls, field)
+        arrow_type = arrow_from_type(type_name) or pa.string()
+
+        # Primary keys are never nullable
+        graph_fields.append(pa.field(pk, arrow_type, nullable=False))
+
+    if graph_format == "json":
+        # Serialized graph payload
+        graph_fields.append(pa.field("graph_json", pa.string(), nullable=False))
+    else:
+        graph_fields.extend(COLUMNAR_GRAPH_FIELDS)
+
+    return pa.schema(graph_fields)
+
+
+def get_graph_format(schema: pa.Schema) -> str:
+    """
+    Detect the graph payload format of a graph table schema.
+
+    Args:
+        schema (pa.Schema): Schema of a graph table or fragment.
+
+    Returns:
+        str: "json" for legacy graph_json files, otherwise "columnar".
+    """
+    return "json" if "graph_json" in schema.names else "columnar"
+
+
+# Payload columns of the per-entity image manifest.
+IMAGE_MANIFEST_FIELDS = [
+    pa.field("image_field", pa.string(), nullable=False),
+    pa.field("dict_key", pa.string()),
+    pa.field("path", pa.string()),
+    pa.field("shape", pa.list_(pa.int64())),
+    pa.field("dtype", pa.string()),
+]
+
+
+@lru_cache(maxsize=None)
+def build_image_manifest_schema(entity_name: str) -> pa.Schema:
+    """
+    Build the Apache Arrow schema of an entity's image manifest.
+
+    The manifest holds one row per stored image (or per empty image field)
+    keyed by the entity's primary-key columns.
+
+    Args:
+        entity_name (str): Name of the entity.
+
+    Returns:
+        pa.Schema: Arrow schema of the image manifest.
+    """
+    pk_cols = entity.SchemaMetadata.get_pk_columns(entity_name)
+    return pa.schema(
+        [pa.field(pk, pa.string(), nullable=False) for pk in pk_cols]
+        + IMAGE_MANIFEST_FIELDS
+    )
+
+
+def encode_graph_columns(graph_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Encode a graph dictionary into the columnar graph payload.
+
+    Edges are stored as int32 indices into the node list. Edge endpoints
+    missing from ``nodes`` are appended as untyped nodes.
+
+    Args:
+        graph_data (dict): Graph with "nodes", "node_types" and "edges".
+
+    Returns:
+        dict: Row fragment with "nodes", "node_types" and "edges" columns.
+    """
+    nodes = list(graph_data.get("nodes", []))
+    node_types = list(graph_data.get("node_types", [None] * len(nodes)))
+    index = {node: i for i, node in enumerate(nodes)}
+
+    edges = []
+    for u, v in graph_data.get("edges", []):
+        for node in (u, v):
+            if node not in index:
+                index[node] = len(nodes)
+                nodes.append(node)
+                node_types.append(None)
+        edges.append((index[u], index[v]))
+
+    return {"nodes": nodes, "node_types": node_types, "edges": edges}
+
+
+def decode_graph_table(table: pa.Table) -> List[Dict[str, Any]]:
+    """
+    Decode every row of a graph table into graph dictionaries.
+
+    Supports both the columnar payload and the legacy ``graph_json`` column.
+    Columnar rows are decoded straight from the Arrow buffers: node names are
+    gathered from the dictionary and edges are resolved with NumPy indexing.
+
+    Args:
+        table (pa.Table): Graph table rows.
+
+    Returns:
+        list[dict]: Graph dictionaries with "nodes", "node_types" and "edges".
+    """
+    if get_graph_format(table.schema) == "json":
+        return [json.loads(value) for value in table["graph_json"].to_pylist()]
+
+    graphs = []
+    for batch in table.to_batches():
+        nodes_col = batch.column("nodes")
+        types_col = batch.column("node_types")
+        edges_col = batch.column("edges")
+        for i in range(batch.num_rows):
+            nodes = nodes_col[i].values
+            if pa.types.is_dictionary(nodes.type):
+                names = nodes.dictionary.to_numpy(zero_copy_only=False)[
+                    nodes.indices.to_numpy(zero_copy_only=False)
+                ]
+            else:
+                names = nodes.to_numpy(zero_copy_only=False)
+            edge_index = (
+                edges_col[i]
+                .values.flatten()
+                .to_numpy(zero_copy_only=False)
+                .reshape(-1, 2)
+            )
+            graphs.append(
+                {
+                    "nodes": names.tolist(),
+                    "node_types": types_col[i].values.to_pylist(),
+                    "edges": names[edge_index].tolist(),
+                }
+            )
+    return graphs
+
+
+# Columns used for Hive-style directory partitioning, outermost first.
+PARTITION_COLUMNS: Tuple[str, ...] = ("flow_id", "stage")
+
+# Small per-stage tables partitioned by flow only, so a flow's rows share
+# one fragment instead of one single-row fragment per stage.
+FLOW_PARTITIONED_ENTITIES: Tuple[str, ...] = ("stage_summaries",)
+
+# Directory value used for null partition keys (Hive convention).
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+PARQUET_LAYOUTS = ("single", "partitioned")
+
+# Column dtypes of DataFrames returned by reads (see arrow_to_pandas).
+PANDAS_DTYPES = ("numpy", "arrow", "categorical")
+
+# Rows per Parquet row group. Scans filter on flow_id/stage, and rows are
+# written flow by flow, so row groups of this size cover few design stages
+# and their min/max statistics still prune most of a large table.
+DEFAULT_ROW_GROUP_SIZE = 64 * 1024
+
+# False-positive probability of primary-key bloom filters.
+BLOOM_FILTER_FPP = 0.05
+
+# Buffered rows or bytes per entity that trigger a flush to disk.
+DEFAULT_BUFFER_ROWS = DEFAULT_ROW_GROUP_SIZE
+DEFAULT_BUFFER_BYTES = 64 * 1024 * 1024
+
+# Directory under data_home holding the fragments of uncommitted sessions.
+STAGING_DIR = ".staging"
+
+# Writer ids name published fragments, so they cannot contain "-" or "/".
+WRITER_ID_PATTERN = re.compile(r"[A-Za-z0-9_.]+")
+
+
+class WriteBuffer:
+    """
+    In-memory buffer of Arrow tables waiting to be written for one entity.
+
+    Attributes:
+        num_rows (int): Buffered row count.
+        nbytes (int): Buffered Arrow buffer size in bytes.
+    """
+
+    def __init__(self):
+        """Initialize an empty buffer."""
+        self._tables: List[pa.Table] = []
+        self.num_rows = 0
+        self.nbytes = 0
+
+    def append(self, table: pa.Table) -> None:
+        """
+        Add rows to the buffer.
+
+        Args:
+            table (pa.Table): Rows to buffer.
+        """
+        self._tables.append(table)
+        self.num_rows += table.num_rows
+        self.nbytes += table.nbytes
+
+    def drain(self) -> Optional[pa.Table]:
+        """
+        Remove and return all buffered rows.
+
+        Returns:
+            pa.Table | None: The buffered rows as one table, or None if the
+            buffer is empty.
+        """
+        if not self._tables:
+            return None
+        table = pa.concat_tables(self._tables)
+        self._tables = []
+        self.num_rows = 0
+        self.nbytes = 0
+        return table
+
+
+def get_partition_columns(entity_name: str) -> List[str]:
+    """
+    Get the Hive partition columns of an entity.
+
+    Only primary-key columns listed in PARTITION_COLUMNS are used, so
+    ``standard_cells`` is not partitioned and ``design_flows`` is
+    partitioned by ``flow_id`` only, as are FLOW_PARTITIONED_ENTITIES.
+
+    Args:
+        entity_name (str): Name of the entity.
+
+    Returns:
+        list[str]: Partition column names, outermost first.
+    """
+    if entity_name in FLOW_PARTITIONED_ENTITIES:
+        return ["flow_id"]
+    pk_cols = entity.SchemaMetadata.get_pk_columns(entity_name)
+    return [col for col in PARTITION_COLUMNS if col in pk_cols]
+
+
+def partition_segment(column: str, value: Any) -> str:
+    """
+    Build a ``column=value`` directory name for a partition key.
+
+    Values are percent-encoded so that characters such as ``/`` cannot
+    escape the partition directory.
+
+    Args:
+        column (str): Partition column name.
+        value (Any): Partition value.
+
+    Returns:
+        str: Directory name for the partition.
+    """
+    if value is None:
+        return f"{column}={NULL_PARTITION}"
+    return f"{column}={quote(str(value), safe='')}"
+
+
+def list_partition_fragments(
+    root: Path, partition_cols: List[str], filters: Dict[str, Any]
+) -> List[Path]:
     """
-    Convert dict-based filters to PyArrow filter format for predicate pushdown.
+    List Parquet fragments under a partitioned directory, pruning
+    partition directories that cannot match the filters.
 
-    Only converts simple equality filters. Complex filters (IN operations, etc.)
-    are handled by falling back to post-load filtering.
+    Pruning walks the partition columns outermost first and stops at the
+    first column without a filter; everything below is scanned.
 
     Args:
-        filters: Dict of filters in format {column: value}
+        root (Path): Root directory of the partitioned table.
+        partition_cols (list[str]): Partition columns, outermost first.
+        filters (dict): Column filters (scalar or IN-list values).
 
     Returns:
-        List of PyArrow filters [(column, op, value), ...] or None if no convertible filters
+        list[Path]: Sorted paths of matching fragment files.
     """
-    pyarrow_filters = []
+    candidates = [root]
+    for col in partition_cols:
+        if col not in filters:
+            break
+        value = filters[col]
+        if isinstance(value, Iterable) and not isinstance(value, (str, bytes)):
+            values = list(value)
+        else:
+            values = [value]
+        candidates = [
+            directory / partition_segment(col, v)
+            for directory in candidates
+            for v in values
+        ]
+
+    fragments = []
+    for directory in candidates:
+        if directory.is_dir():
+            fragments.extend(directory.rglob("*.parquet"))
+    return sorted(fragments)
+
+
+def _filter_expression(
+    filters: Optional[Predicate | Tuple[Tuple[str, str, Any], ...] | List],
+) -> Optional[ds.Expression]:
+    """
+    Compile scan filters to a PyArrow dataset expression.
+
+    Args:
+        filters: A filter Predicate, or PyArrow filter tuples
+            [(column, op, value), ...], or None.
+
+    Returns:
+        ds.Expression | None: The scan filter.
+    """
+    if not filters:
+        return None
+    if isinstance(filters, Predicate):
+        return filters.to_expression()
+    return pq.filters_to_expression(list(filters))
+
+
+def arrow_to_pandas(table: pa.Table | pa.RecordBatch, pandas_dtypes: str) -> pd.DataFrame:
+    """
+    Convert Arrow data to a DataFrame with the requested column dtypes.
 
-    for key, value in filters.items():
-        # Only handle simple scalar equality filters for now
-        # Complex filters (IN operations, etc.) will be handled post-load
-        if isinstance(value, (str, int, float, bool)) and not isinstance(value, bool):
-            pyarrow_filters.append((key, "=", value))
+    Args:
+        table (pa.Table | pa.RecordBatch): Arrow data.
+        pandas_dtypes (str): One of ``PANDAS_DTYPES``.
 
-    return pyarrow_filters if pyarrow_filters else None
+    Returns:
+        pd.DataFrame: The converted rows.
+    """
+    if pandas_dtypes == "arrow":
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    if pandas_dtypes == "categorical":
+        return table.to_pandas(strings_to_categorical=True)
+    return table.to_pandas()
 
 
 @lru_cache(maxsize=128)
+def _read_arrow_table(
+    path: Path,
+    mtime_ns: int,
+    size: int,
+    pyarrow_filters_tuple: Optional[Predicate | Tuple[Tuple[str, str, Any], ...]] = None,
+    columns: Optional[Tuple[str, ...]] = None,
+) -> pa.Table:
+    """
+    Read a Parquet file (cached per file version).
+
+    ``mtime_ns`` and ``size`` are only part of the cache key, so a file
+    rewritten since it was cached is read again.
+
+    Args:
+        path: Path to the Parquet file.
+        mtime_ns: Modification time of the file in nanoseconds.
+        size: Size of the file in bytes.
+        pyarrow_filters_tuple: Optional filter Predicate, or PyArrow filter predicates as tuple of tuples [(column, op, value), ...]
+        columns: Optional tuple of column names to read. If None, reads all columns.
+
+    Returns:
+        pa.Table: Loaded (and optionally filtered) Arrow table with selected columns.
+    """
+    columns_list = list(columns) if columns else None
+
+    return pq.read_table(
+        path, filters=_filter_expression(pyarrow_filters_tuple), columns=columns_list
+    )
+
+
 def _load_arrow_table(
     path: Path,
-    pyarrow_filters_tuple: Optional[Tuple[Tuple[str, str, Any], ...]] = None,
+    pyarrow_filters_tuple: Optional[Predicate | Tuple[Tuple[str, str, Any], ...]] = None,
     columns: Optional[Tuple[str, ...]] = None,
 ) -> pa.Table:
     """
@@ -130,34 +545,272 @@ def _load_arrow_table(
 
     Args:
         path: Path to the Parquet file.
-        pyarrow_filters_tuple: Optional PyArrow filter predicates as tuple of tuples [(column, op, value), ...]
+        pyarrow_filters_tuple: Optional filter Predicate, or PyArrow filter predicates as tuple of tuples [(column, op, value), ...]
         columns: Optional tuple of column names to read. If None, reads all columns.
 
     Returns:
         pa.Table: Loaded (and optionally filtered) Arrow table with selected columns.
     """
-    # Convert tuple back to list for PyArrow
-    filters_list = list(pyarrow_filters_tuple) if pyarrow_filters_tuple else None
-    columns_list = list(columns) if columns else None
+    stat = Path(path).stat()
+    return _read_arrow_table(
+        path, stat.st_mtime_ns, stat.st_size, pyarrow_filters_tuple, columns
+    )
+
+
+def conform_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """
+    Reorder and cast columns to a schema, adding missing columns as nulls.
+
+    Args:
+        table (pa.Table): Rows written with an older or equal schema.
+        schema (pa.Schema): Target schema.
+
+    Returns:
+        pa.Table: The rows with exactly the columns of ``schema``.
+    """
+    if table.schema.equals(schema, check_metadata=False):
+        return table
+    columns = [
+        table[f.name].cast(f.type)
+        if f.name in table.column_names
+        else pa.nulls(table.num_rows, f.type)
+        for f in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _has_rows(path: Path) -> bool:
+    """
+    Check whether a Parquet file exists and holds rows.
+
+    Args:
+        path (Path): Parquet file.
+
+    Returns:
+        bool: True if the file's metadata counts at least one row.
+    """
+    return path.exists() and pq.read_metadata(path).num_rows > 0
+
+
+def touch_directory(path: Path) -> None:
+    """
+    Advance the modification time of a directory.
+
+    The new time is always later than the current one, even within one
+    tick of a coarse filesystem clock.
 
-    return pq.read_table(path, filters=filters_list, columns=columns_list)
+    Args:
+        path (Path): Existing directory.
+    """
+    mtime = max(time.time_ns(), path.stat().st_mtime_ns + 1)
+    os.utime(path, ns=(mtime, mtime))
+
+
+def write_empty_table(schema: pa.Schema, path: Path, overwrite: bool = True) -> None:
+    """
+    Write an empty Parquet file through a temporary file and a rename, so
+    concurrent writers creating the same table never see a partial file.
+
+    Args:
+        schema (pa.Schema): Schema of the table.
+        path (Path): Destination file.
+        overwrite (bool): Replace an existing file. If False, the file is
+            hard-linked into place and an existing one, possibly holding
+            another writer's rows, is kept.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    os.close(fd)
+    pq.write_table(schema.empty_table(), tmp)
+    if overwrite:
+        os.replace(tmp, path)
+        return
+    try:
+        os.link(tmp, path)
+    except FileExistsError:
+        pass
+    finally:
+        os.unlink(tmp)
+
+
+def _load_arrow_fragments(
+    paths: List[Path],
+    schema: pa.Schema,
+    pyarrow_filters: Optional[Predicate | List[Tuple[str, str, Any]]] = None,
+    columns: Optional[List[str]] = None,
+) -> pa.Table:
+    """
+    Load an Arrow table from a list of Parquet fragment files.
+
+    Args:
+        paths: Fragment files to scan.
+        schema: Arrow schema shared by all fragments.
+        pyarrow_filters: Optional filter Predicate, or PyArrow filter predicates [(column, op, value), ...]
+        columns: Optional list of column names to read. If None, reads all columns.
+
+    Returns:
+        pa.Table: Loaded (and optionally filtered) Arrow table with selected columns.
+    """
+    if not paths:
+        table = schema.empty_table()
+        return table.select(columns) if columns else table
+
+    dataset = ds.dataset([str(p) for p in paths], schema=schema, format="parquet")
+    return dataset.to_table(filter=_filter_expression(pyarrow_filters), columns=columns)
 
 
 class ParquetDB(BaseDB):
     """
     Parquet-backed storage for entities and graph data.
+
+    Two on-disk layouts are supported:
+
+    - ``"single"``: one ``<entity>/table.parquet`` and
+      ``<entity>/graph.parquet`` per entity.
+    - ``"partitioned"``: Hive-style fragments under
+      ``<entity>/table/flow_id=.../stage=.../part-N.parquet`` (and
+      ``<entity>/graph/...`` for graph entities). Reads filtered by
+      ``flow_id``/``stage`` only open the matching directories, and new
+      flows are appended as new fragments without touching existing files.
+
+    Reads understand both layouts regardless of the layout used for writing.
+
+    Graphs are stored either in the columnar format (``nodes`` and
+    ``node_types`` as dictionary-encoded lists, ``edges`` as int32 index
+    pairs) or, for datasets written by older releases, as one ``graph_json``
+    string per row. Both formats are read transparently.
+
+    Added rows are buffered per entity and written as one row group (or
+    fragment) when the buffer reaches ``buffer_rows`` rows or
+    ``buffer_bytes`` bytes, on ``flush()``/``close()``, and before any read.
+
+    Writes go to a write session: rows are written as fragment files under
+    ``<data_home>/.staging/<session>/`` and only published by ``commit()``
+    (or ``close()``, which commits). Reads through the same instance see
+    the committed data plus the session's fragments; other readers only
+    see committed data. A read ends the current fragment instead of the
+    session, so reads and writes can be interleaved freely, and
+    ``rollback()`` discards everything written since the last commit.
+    Committing moves partitioned fragments into their partition
+    directories. In the single layout the fragments are merged into an
+    entity file that holds no rows yet, which is replaced atomically;
+    commits to a file with rows publish ``<stem>-<session>-NNNNN.parquet``
+    fragments next to it instead, so stored rows are never rewritten, and
+    ``compact()`` merges them.
+
+    Several processes can write to one ``data_home`` at once if each is
+    given its own ``writer_id``. Their commits then only add fragments
+    named after the writer (``part-<writer_id>-NNNNN.parquet`` in partition
+    directories, ``table-<writer_id>-NNNNN.parquet`` next to the
+    single-layout files) and never rewrite shared files. Reads include
+    these fragments, and ``compact()`` merges them into sorted files once
+    the writers are done. Such writers remove the dataset catalog rather
+    than write one that misses the other writers' flows; ``compact()``
+    rebuilds it.
+
+    With ``sort_by_pk`` each flush is sorted by the entity's primary key, so
+    row-group min/max statistics on the key columns are narrow and point
+    lookups skip all but the matching row groups. ``pk_indexes`` adds a page
+    index and bloom filters on the key columns for readers that use them.
     """
 
-    def __init__(self, data_home: str | Path):
+    def __init__(
+        self,
+        data_home: str | Path,
+        layout: str = "single",
+        graph_format: str = "columnar",
+        buffer_rows: int = DEFAULT_BUFFER_ROWS,
+        buffer_bytes: int = DEFAULT_BUFFER_BYTES,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        sort_by_pk: bool = False,
+        pk_indexes: bool = False,
+        image_store: str = "npz",
+        compressed_images: Optional[List[str]] = None,
+        pandas_dtypes: str = "numpy",
+        writer_id: Optional[str] = None,
+    ):
         """
         Initialize the Parquet database.
 
         Args:
             data_home (str | Path): Root directory for all stored data.
+            layout (str): Layout used for writes, "single" or "partitioned".
+            graph_format (str): Graph payload format used for new graph
+                tables, "columnar" or "json". Appends to an existing
+                graph.parquet keep that file's format.
+            buffer_rows (int): Buffered rows per entity that trigger a
+                flush. Use 1 to write every add call immediately.
+            buffer_bytes (int): Buffered Arrow bytes per entity that
+                trigger a flush.
+            row_group_size (int): Maximum rows per written row group.
+            sort_by_pk (bool): Sort each flush by primary key and record
+                the order in the row-group metadata.
+            pk_indexes (bool): Write a page index and primary-key bloom
+                filters.
+            image_store (str): How new images are written, "npz" (one file
+                per image) or "chunked" (per-entity containers, see
+                ``ImageStore``). Both are read regardless of this setting.
+            compressed_images (list[str] | None): Image fields written as
+                compressed chunks by the chunked store; other fields are
+                stored raw and memory-mapped on read.
+            pandas_dtypes (str): Column dtypes of returned DataFrames:
+                "numpy" (pandas defaults), "arrow" (``pd.ArrowDtype``
+                columns) or "categorical" (strings as categoricals).
+            writer_id (str | None): Name of this writer among concurrent
+                writers of ``data_home``; commits publish fragments named
+                after it instead of merging into shared files, and
+                ``create_dataset_tables`` only adds missing tables. Letters,
+                digits, "_" and "." only.
+
+        Raises:
+            ValueError: If the layout, graph format, image store or pandas
+                dtypes are unknown, a buffer or row-group size is not
+                positive, or the writer id is invalid.
         """
+        if layout not in PARQUET_LAYOUTS:
+            raise ValueError(
+                f"Unknown ParquetDB layout '{layout}'. Expected one of {PARQUET_LAYOUTS}"
+            )
+        if graph_format not in GRAPH_FORMATS:
+            raise ValueError(
+                f"Unknown graph format '{graph_format}'. Expected one of {GRAPH_FORMATS}"
+            )
+        if pandas_dtypes not in PANDAS_DTYPES:
+            raise ValueError(
+                f"Unknown pandas dtypes '{pandas_dtypes}'. Expected one of {PANDAS_DTYPES}"
+            )
+        for name, value in [
+            ("buffer_rows", buffer_rows),
+            ("buffer_bytes", buffer_bytes),
+            ("row_group_size", row_group_size),
+        ]:
+            if value <= 0:
+                raise ValueError(f"{name} must be positive, got {value}")
+        if writer_id is not None and not WRITER_ID_PATTERN.fullmatch(writer_id):
+            raise ValueError(
+                f"writer_id may only contain letters, digits, '_' and '.', got {writer_id!r}"
+            )
         self.data_home = Path(data_home)
+        self.layout = layout
+        self.graph_format = graph_format
+        self.buffer_rows = buffer_rows
+        self.buffer_bytes = buffer_bytes
+        self.row_group_size = row_group_size
+        self.sort_by_pk = sort_by_pk
+        self.pk_indexes = pk_indexes
+        self.image_store = validate_image_store(image_store)
+        self.compressed_images = set(compressed_images or [])
+        self.pandas_dtypes = pandas_dtypes
+        self.writer_id = writer_id
         self._writers = {}  # entity_name -> ParquetWriter
         self._graph_writers = {}  # entity_name -> ParquetWriter
+        self._buffers: Dict[str, WriteBuffer] = {}  # entity_name -> table rows
+        self._graph_buffers: Dict[str, WriteBuffer] = {}  # entity_name -> graph rows
+        self._graph_schemas: Dict[str, pa.Schema] = {}  # entity_name -> write schema
+        self._manifest_writers = {}  # entity_name -> ParquetWriter
+        self._manifest_buffers: Dict[str, WriteBuffer] = {}  # entity_name -> manifest rows
+        self._image_stores: Dict[str, ImageStore] = {}  # entity_name -> containers
+        self._pending_catalog: Optional[Dict[str, Any]] = None  # written by close()
+        self._session_id: Optional[str] = None  # staging directory of uncommitted writes
 
     def _entity_path(self, entity_name: str) -> Path:
         """
@@ -195,115 +848,408 @@ class ParquetDB(BaseDB):
         """
         return self._entity_path(entity_name) / "images"
 
-    def _graph_path(self, entity_name: str) -> Path:
+    def _image_file(self, entity_name: str, image_name: str, key_fields: Dict[str, Any]) -> Path:
         """
-        Get the directory where graph files are stored.
+        Get the file path of one stored image.
 
         Args:
             entity_name (str): Name of the entity.
+            image_name (str): Image name (field, or ``field__dict_key``).
+            key_fields (dict): Primary-key values identifying the row.
 
         Returns:
-            Path: Directory containing graph JSON files.
+            Path: Path of the ``.npz`` image file.
         """
-        return self._entity_path(entity_name) / "graph.parquet"
+        return (
+            self._image_dir(entity_name) / f"{self._image_id(image_name, key_fields)}.npz"
+        )
 
-    def _create_table(self, entity_name: str, is_graph_entity: bool):
+    def _chunked_images(self, entity_name: str) -> ImageStore:
         """
-        Create an empty Parquet table for the entity.
+        Get the chunked image store of an entity.
 
         Args:
             entity_name (str): Name of the entity.
-            is_graph_entity (bool): Whether the entity has graph data.
-        """
-        entity_dir = self._entity_path(entity_name)
-        entity_dir.mkdir(parents=True, exist_ok=True)
-
-        schema = build_arrow_schema(entity_name)
-        empty_arrays = [pa.array([], type=field.type) for field in schema]
-        empty_table = pa.Table.from_arrays(empty_arrays, schema=schema)
-        pq.write_table(empty_table, self._table_path(entity_name))
-
-        # Create empty graph.parquet if needed
-        if is_graph_entity:
-            pk_cols = entity.SchemaMetadata.get_pk_columns(entity_name)
-            if not pk_cols:
-                raise ValueError(
-                    f"Entity '{entity_name}' must define at least one primary key"
-                )
-
-            model_cls = entity.SchemaMetadata.get_model(entity_name)
-            model_fields = entity.SchemaMetadata.get_fields(entity_name)
-            field_map = {f.name: f for f in model_fields}
 
-            graph_fields: list[pa.Field] = []
-
-            for pk in pk_cols:
-                field = field_map[pk]
-                type_name, _, _ = resolve_field_type_and_nullable(model_cls, field)
-                arrow_type = arrow_from_type(type_name) or pa.string()
+        Returns:
+            ImageStore: Store rooted at the entity's image directory.
+        """
+        store = self._image_stores.get(entity_name)
+        if store is None:
+            store = ImageStore(self._image_dir(entity_name))
+            self._image_stores[entity_name] = store
+        return store
+
+    @staticmethod
+    def _image_id(image_name: str, key_fields: Dict[str, Any]) -> str:
+        """
+        Build the id of one stored image (the ``.npz`` file stem).
 
-                # Primary keys are never nullable
-                graph_fields.append(pa.field(pk, arrow_type, nullable=False))
+        Args:
+            image_name (str): Image name (field, or ``field__dict_key``).
+            key_fields (dict): Primary-key values identifying the row.
 
-            # Serialized graph payload
-            graph_fields.append(pa.field("graph_json", pa.string(), nullable=False))
+        Returns:
+            str: Image id.
+        """
+        key_str = "__".join(f"{k}={v}" for k, v in key_fields.items())
+        return f"{image_name}__{key_str}"
 
-            gschema = pa.schema(graph_fields)
+    def _image_manifest_path(self, entity_name: str) -> Path:
+        """
+        Get the path of an entity's image manifest (single layout).
 
-            empty_arrays = [pa.array([], type=field.type) for field in graph_fields]
-            empty_graph_table = pa.Table.from_arrays(empty_arrays, schema=gschema)
+        Args:
+            entity_name (str): Name of the entity.
 
-            pq.write_table(empty_graph_table, self._graph_path(entity_name))
+        Returns:
+            Path: Path to the manifest Parquet file.
+        """
+        return self._image_dir(entity_name) / "manifest.parquet"
 
-    def create_dataset_tables(self):
+    def _image_manifest_dir(self, entity_name: str) -> Path:
         """
-        Create Parquet tables for all registered entities.
+        Get the root directory of an entity's partitioned image manifest.
+
+        Args:
+            entity_name (str): Name of the entity.
 
         Returns:
-            None
+            Path: Directory holding the Hive-partitioned manifest fragments.
         """
-        self.data_home.mkdir(parents=True, exist_ok=True)
-
-        for entity_name, _ in entity.SchemaMetadata.items():
-            self._create_table(
-                entity_name=entity_name,
-                is_graph_entity=entity.SchemaMetadata.is_graph_entity(entity_name),
-            )
+        return self._image_dir(entity_name) / "manifest"
 
-    def _append_to_table(self, entity_name: str, df: pd.DataFrame):
+    def _graph_path(self, entity_name: str) -> Path:
         """
-        Append DataFrame rows to the entity table.
+        Get the directory where graph files are stored.
 
         Args:
             entity_name (str): Name of the entity.
-            df (pd.DataFrame): Rows to append.
 
         Returns:
-            None
+            Path: Directory containing graph JSON files.
         """
-        if df.empty:
-            return
+        return self._entity_path(entity_name) / "graph.parquet"
 
-        table_path = self._table_path(entity_name)
-        schema = build_arrow_schema(entity_name)
-        table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+    def _table_dir(self, entity_name: str) -> Path:
+        """
+        Get the root directory of an entity's partitioned table.
 
-        writer = self._writers.get(entity_name)
-        if writer is None:
-            writer = pq.ParquetWriter(table_path, schema)
-            self._writers[entity_name] = writer
+        Args:
+            entity_name (str): Name of the entity.
 
-        writer.write_table(table)
+        Returns:
+            Path: Directory holding the Hive-partitioned table fragments.
+        """
+        return self._entity_path(entity_name) / "table"
 
-    def add_table_row(self, entity_name: str, row: Dict[str, Any]):
+    def _graph_dir(self, entity_name: str) -> Path:
         """
-        Add a single row to the entity table.
+        Get the root directory of an entity's partitioned graph table.
 
         Args:
             entity_name (str): Name of the entity.
-            row (dict): Row data.
-        """
-        self._append_to_table(entity_name, pd.DataFrame([row]))
+
+        Returns:
+            Path: Directory holding the Hive-partitioned graph fragments.
+        """
+        return self._entity_path(entity_name) / "graph"
+
+    def _create_table(self, entity_name: str, is_graph_entity: bool):
+        """
+        Create an empty Parquet table for the entity.
+
+        Rows stored in either layout, including writer fragments and the
+        image manifest, are removed. In the partitioned layout
+        only the table directories are created; fragments are added as rows
+        are written.
+
+        With a ``writer_id``, other writers may already have committed rows
+        to the dataset, so nothing is removed: only missing files and
+        directories are created.
+
+        Args:
+            entity_name (str): Name of the entity.
+            is_graph_entity (bool): Whether the entity has graph data.
+        """
+        entity_dir = self._entity_path(entity_name)
+        entity_dir.mkdir(parents=True, exist_ok=True)
+        shared = self.writer_id is not None
+        for path, root in [] if shared else self._file_kinds(entity_name):
+            if root.is_dir():
+                shutil.rmtree(root)
+            for fragment in self._committed_fragments(path):
+                fragment.unlink()
+            if self.layout == "partitioned" or path == self._image_manifest_path(entity_name):
+                path.unlink(missing_ok=True)
+
+        if self.layout == "partitioned":
+            self._table_dir(entity_name).mkdir(exist_ok=True)
+            if is_graph_entity:
+                build_graph_arrow_schema(entity_name, self.graph_format)
+                self._graph_dir(entity_name).mkdir(exist_ok=True)
+            return
+
+        write_empty_table(
+            build_arrow_schema(entity_name), self._table_path(entity_name), overwrite=not shared
+        )
+
+        # Create empty graph.parquet if needed
+        if is_graph_entity:
+            write_empty_table(
+                build_graph_arrow_schema(entity_name, self.graph_format),
+                self._graph_path(entity_name),
+                overwrite=not shared,
+            )
+
+    def create_dataset_tables(self):
+        """
+        Create Parquet tables for all registered entities.
+
+        Existing tables are emptied, unless the database has a
+        ``writer_id``: then only missing tables are created.
+
+        Returns:
+            None
+        """
+        self.data_home.mkdir(parents=True, exist_ok=True)
+
+        for entity_name, _ in entity.SchemaMetadata.items():
+            self._create_table(
+                entity_name=entity_name,
+                is_graph_entity=entity.SchemaMetadata.is_graph_entity(entity_name),
+            )
+
+    def has_table(self, entity_name: str) -> bool:
+        """
+        Check whether the table of an entity was created, in either layout.
+
+        Args:
+            entity_name (str): Name of the entity.
+
+        Returns:
+            bool: True if the table file or partition directory exists.
+        """
+        return (
+            self._table_path(entity_name).exists()
+            or self._table_dir(entity_name).is_dir()
+        )
+
+    def _write_partitioned(self, root: Path, entity_name: str, table: pa.Table):
+        """
+        Write rows as new fragments of a Hive-partitioned table.
+
+        Rows are grouped by the entity's partition columns and each group is
+        written to a new ``part-N.parquet`` file in its partition directory.
+        Existing fragments are never rewritten.
+
+        Args:
+            root (Path): Root directory of the partitioned table.
+            entity_name (str): Name of the entity.
+            table (pa.Table): Rows to write.
+        """
+        partition_cols = get_partition_columns(entity_name)
+
+        groups: Dict[Tuple[Any, ...], List[int]] = {}
+        if partition_cols:
+            partition_values = zip(*(table[col].to_pylist() for col in partition_cols))
+            for i, values in enumerate(partition_values):
+                groups.setdefault(values, []).append(i)
+        else:
+            groups[()] = list(range(table.num_rows))
+
+        for values, indices in groups.items():
+            directory = root
+            for col, value in zip(partition_cols, values):
+                directory = directory / partition_segment(col, value)
+            directory.mkdir(parents=True, exist_ok=True)
+
+            part_no = sum(1 for _ in directory.glob("part-*.parquet"))
+            part = table if len(indices) == table.num_rows else table.take(indices)
+            pq.write_table(
+                part,
+                directory / f"part-{part_no}.parquet",
+                row_group_size=self.row_group_size,
+                **self._write_options(entity_name, part),
+            )
+
+    def _append_to_table(self, entity_name: str, df: pd.DataFrame):
+        """
+        Buffer DataFrame rows for the entity table, flushing the buffer
+        once it is full.
+
+        Args:
+            entity_name (str): Name of the entity.
+            df (pd.DataFrame): Rows to append.
+
+        Returns:
+            None
+        """
+        if df.empty:
+            return
+
+        self.add_table_arrow(entity_name, self._rows_to_arrow(entity_name, df))
+
+    @staticmethod
+    def _rows_to_arrow(entity_name: str, df: pd.DataFrame) -> pa.Table:
+        """
+        Convert table rows to an Arrow table with the entity's schema.
+
+        Args:
+            entity_name (str): Name of the entity.
+            df (pd.DataFrame): Rows to convert.
+
+        Returns:
+            pa.Table: The rows.
+        """
+        schema = build_arrow_schema(entity_name)
+        return pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+
+    def add_table_arrow(self, entity_name: str, table: pa.Table):
+        """
+        Add rows given as an Arrow table to the entity table.
+
+        Args:
+            entity_name (str): Name of the entity.
+            table (pa.Table): Rows with the columns of the entity's schema.
+        """
+        if table.num_rows == 0:
+            return
+
+        table = conform_table(table, build_arrow_schema(entity_name))
+        self._buffer_rows(self._buffers, entity_name, table, self._flush_table)
+
+    def _buffer_rows(
+        self,
+        buffers: Dict[str, WriteBuffer],
+        entity_name: str,
+        table: pa.Table,
+        flush: Any,
+    ):
+        """
+        Add rows to an entity buffer and flush it when a limit is reached.
+
+        Args:
+            buffers (dict): Buffers of the table kind being written.
+            entity_name (str): Name of the entity.
+            table (pa.Table): Rows to buffer.
+            flush (Callable): Flush function for the table kind.
+        """
+        buffer = buffers.setdefault(entity_name, WriteBuffer())
+        buffer.append(table)
+        if buffer.num_rows >= self.buffer_rows or buffer.nbytes >= self.buffer_bytes:
+            flush(entity_name)
+
+    def _sort_by_pk(self, entity_name: str, table: pa.Table) -> pa.Table:
+        """
+        Sort rows by the entity's primary key when ``sort_by_pk`` is set.
+
+        Args:
+            entity_name (str): Name of the entity.
+            table (pa.Table): Rows to write.
+
+        Returns:
+            pa.Table: The rows, sorted if enabled.
+        """
+        pk_cols = entity.SchemaMetadata.get_pk_columns(entity_name)
+        if not self.sort_by_pk or not pk_cols:
+            return table
+        return table.sort_by([(col, "ascending") for col in pk_cols])
+
+    def _write_options(self, entity_name: str, table: pa.Table) -> Dict[str, Any]:
+        """
+        Build the Parquet writer options for the sort order and key indexes.
+
+        Args:
+            entity_name (str): Name of the entity.
+            table (pa.Table): First rows written with these options.
+
+        Returns:
+            dict: Keyword arguments for ``pq.ParquetWriter``/``pq.write_table``.
+        """
+        pk_cols = entity.SchemaMetadata.get_pk_columns(entity_name)
+        options: Dict[str, Any] = {}
+        if self.sort_by_pk and pk_cols:
+            options["sorting_columns"] = pq.SortingColumn.from_ordering(
+                table.schema, [(col, "ascending") for col in pk_cols]
+            )
+        if self.pk_indexes:
+            options["write_page_index"] = True
+            ndv = max(1, min(table.num_rows, self.row_group_size))
+            options["bloom_filter_options"] = {
+                col: {"ndv": ndv, "fpp": BLOOM_FILTER_FPP} for col in pk_cols
+            }
+        return options
+
+    def _flush_table(self, entity_name: str):
+        """
+        Write the buffered rows of an entity table.
+
+        Args:
+            entity_name (str): Name of the entity.
+        """
+        self._flush_buffer(
+            entity_name,
+            self._buffers,
+            self._writers,
+            self._table_path(entity_name),
+            self._table_dir(entity_name),
+        )
+
+    def _flush_buffer(
+        self,
+        entity_name: str,
+        buffers: Dict[str, WriteBuffer],
+        writers: Dict[str, pq.ParquetWriter],
+        path: Path,
+        root: Path,
+    ):
+        """
+        Write the buffered rows of one entity file.
+
+        Rows are staged in the write session: in the single layout they
+        are appended to a staged fragment of ``path`` through a
+        ParquetWriter kept open until the next read or commit; in the
+        partitioned layout they are written as new fragments under the
+        staged copy of ``root``.
+
+        Args:
+            entity_name (str): Name of the entity.
+            buffers (dict): Buffers of the file kind being written.
+            writers (dict): Open writers of the file kind being written.
+            path (Path): Single-layout Parquet file.
+            root (Path): Partitioned-layout root directory.
+        """
+        buffer = buffers.get(entity_name)
+        table = buffer.drain() if buffer is not None else None
+        if table is None:
+            return
+
+        table = self._sort_by_pk(entity_name, table)
+        if self.layout == "partitioned":
+            self._write_partitioned(self._staged_path(root), entity_name, table)
+            return
+
+        writer = writers.get(entity_name)
+        if writer is None:
+            fragment = self._next_staged_fragment(path)
+            fragment.parent.mkdir(parents=True, exist_ok=True)
+            writer = pq.ParquetWriter(
+                fragment, table.schema, **self._write_options(entity_name, table)
+            )
+            writers[entity_name] = writer
+
+        writer.write_table(table, row_group_size=self.row_group_size)
+
+    def add_table_row(self, entity_name: str, row: Dict[str, Any]):
+        """
+        Add a single row to the entity table.
+
+        Args:
+            entity_name (str): Name of the entity.
+            row (dict): Row data.
+        """
+        self._append_to_table(entity_name, pd.DataFrame([row]))
 
     def add_table_data(self, entity_name: str, data: List[Dict[str, Any]]):
         """
@@ -317,14 +1263,26 @@ class ParquetDB(BaseDB):
             self._append_to_table(entity_name, pd.DataFrame(data))
 
     def get_table_data(
-        self, entity_name: str, columns: Optional[List[str]] = None, **filters
+        self,
+        entity_name: str,
+        columns: Optional[List[str]] = None,
+        where: Optional[Predicate] = None,
+        **filters,
     ) -> pd.DataFrame:
         """
         Retrieve table data for an entity, optionally filtered and with column selection.
 
+        All filters are pushed down into the Parquet scan: scalars (including
+        booleans) are equality tests, iterables are IN sets and None matches
+        nulls. ``where`` adds an expression built with
+        ``eda_schema.db.filters.col``, e.g. ``(col("slack") < 0)``.
+
+        Column dtypes follow the ``pandas_dtypes`` option of the database.
+
         Args:
             entity_name (str): Name of the entity.
             columns (List[str] | None): Optional list of column names to read. If None, reads all columns.
+            where (Predicate | None): Additional filter expression.
             **filters: Column filters.
 
         Returns:
@@ -333,25 +1291,63 @@ class ParquetDB(BaseDB):
         Raises:
             FileNotFoundError: If the table file does not exist.
             DataNotFoundError: If the entity is not found.
+            TypeError: If ``where`` is not a filter expression.
+        """
+        table = self.get_table_arrow(entity_name, columns=columns, where=where, **filters)
+        return arrow_to_pandas(table, self.pandas_dtypes)
+
+    def get_table_arrow(
+        self,
+        entity_name: str,
+        columns: Optional[List[str]] = None,
+        where: Optional[Predicate] = None,
+        **filters,
+    ) -> pa.Table:
+        """
+        Retrieve table data for an entity as an Arrow table, without
+        converting to pandas.
+
+        Args:
+            entity_name (str): Name of the entity.
+            columns (List[str] | None): Columns to read; None reads all.
+            where (Predicate | None): Additional filter expression.
+            **filters: Column filters, as for ``get_table_data``.
+
+        Returns:
+            pa.Table: Filtered rows. Tables read from a single file are
+            shared with the read cache and must not be mutated.
+
+        Raises:
+            DataNotFoundError: If the entity is not found.
+            TypeError: If ``where`` is not a filter expression.
         """
-        # Ensure writers are closed before reading to prevent corruption errors
+        predicate = combine_predicates(
+            filters_to_predicate(filters), ensure_predicate(where)
+        )
+
+        # Finish staged fragments so this session's rows are readable
         self._ensure_writers_closed()
 
         table_path = self._table_path(entity_name)
-        if not table_path.exists():
+        paths = self._scan_files(
+            entity_name, table_path, self._table_dir(entity_name), filters
+        )
+        if paths is None:
             raise DataNotFoundError(
                 entity_name=entity_name,
                 message=f"Table file not found: {table_path}. "
                 f"Did you call create_dataset_tables() first?",
             )
 
-        # Try to use PyArrow filters for predicate pushdown (simple filters only)
-        pyarrow_filters = convert_filters_to_pyarrow(filters) if filters else None
-
         try:
-            filters_tuple = tuple(pyarrow_filters) if pyarrow_filters else None
-            columns_tuple = tuple(columns) if columns else None
-            table = _load_arrow_table(table_path, filters_tuple, columns_tuple)
+            if paths == [table_path]:
+                columns_tuple = tuple(columns) if columns else None
+                table = _load_arrow_table(table_path, predicate, columns_tuple)
+            else:
+                # Partitioned or staged fragments: partitions are already pruned
+                table = _load_arrow_fragments(
+                    paths, build_arrow_schema(entity_name), predicate, columns
+                )
         except Exception as e:
             raise DataNotFoundError(
                 entity_name=entity_name,
@@ -360,50 +1356,70 @@ class ParquetDB(BaseDB):
                 f"Use 'with ParquetDB(...) as db:' or call db.close() after writes.",
             ) from e
 
-        # Apply remaining complex filters in memory (if any filters weren't converted to PyArrow)
-        remaining_filters = {}
-        if filters and pyarrow_filters:
-            # Find which filters were NOT converted to PyArrow (complex ones)
-            pyarrow_filter_cols = {col for col, _, _ in pyarrow_filters}
-            remaining_filters = {
-                k: v for k, v in filters.items() if k not in pyarrow_filter_cols
-            }
-        elif filters and not pyarrow_filters:
-            # No filters were converted, apply all in memory
-            remaining_filters = filters
-
-        if remaining_filters:
-            mask = None
-
-            for key, value in filters.items():
-                col = table[key]
-                col_type = col.type
-
-                # -------------------------
-                # Iterable (IN filter)
-                # -------------------------
-                if isinstance(value, Iterable) and not isinstance(value, (str, bytes)):
-                    values = list(value)
+        return table
 
-                    # Empty IN → no rows
-                    if not values:
-                        return table.slice(0, 0).to_pandas()
+    def iter_table_batches(
+        self,
+        entity_name: str,
+        columns: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        where: Optional[Predicate] = None,
+        **filters,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream filtered rows of an entity table in batches.
 
-                    value_array = pa.array(values, type=col_type)
-                    cond = pc.is_in(col, value_set=value_array)
+        Rows are scanned with a PyArrow dataset scanner, so only one batch
+        per row group is held in memory at a time. Filters are pushed down
+        and partition directories are pruned as in ``get_table_data``.
 
-                # -------------------------
-                # Scalar (= filter)
-                # -------------------------
-                else:
-                    scalar = pa.scalar(value, type=col_type)
-                    cond = pc.equal(col, scalar)
+        Args:
+            entity_name (str): Name of the entity.
+            columns (List[str] | None): Columns to return; None returns all.
+            batch_size (int): Maximum number of rows per batch.
+            where (Predicate | None): Additional filter expression.
+            **filters: Column filters.
 
-                mask = cond if mask is None else pc.and_(mask, cond)
+        Returns:
+            Iterator[pd.DataFrame]: Non-empty batches of at most
+            ``batch_size`` rows.
 
-            table = table.filter(mask)
+        Raises:
+            ValueError: If ``batch_size`` is not positive.
+            DataNotFoundError: If the entity table does not exist.
+        """
+        check_batch_size(batch_size)
+        predicate = combine_predicates(
+            filters_to_predicate(filters), ensure_predicate(where)
+        )
+        self._ensure_writers_closed()
 
-        return table.to_pandas()
+        table_path = self._table_path(entity_name)
+        paths = self._scan_files(
+            entity_name, table_path, self._table_dir(entity_name), filters
+        )
+        if paths is None:
+            raise DataNotFoundError(
+                entity_name=entity_name,
+                message=f"Table file not found: {table_path}. "
+                f"Did you call create_dataset_tables() first?",
+            )
+        # A lone single-layout file keeps its own schema
+        schema = None if paths == [table_path] else build_arrow_schema(entity_name)
+        if not paths:
+            return iter(())
+
+        dataset = ds.dataset([str(p) for p in paths], schema=schema, format="parquet")
+        batches = dataset.to_batches(
+            columns=columns,
+            filter=_filter_expression(predicate),
+            batch_size=batch_size,
+        )
+        return (
+            arrow_to_pandas(batch, self.pandas_dtypes)
+            for batch in batches
+            if batch.num_rows
+        )
 
     def get_table_row(self, entity_name: str, **filters) -> pd.Series:
         """
@@ -481,7 +1497,8 @@ class ParquetDB(BaseDB):
         """
         Build a single graph-table row from graph data and primary-key fields.
 
-        Performs primary-key validation and JSON serialization of the graph.
+        Performs primary-key validation and encodes the graph in the format
+        of the table being written (columnar or JSON).
 
         Args:
             entity_name (str): Graph entity name.
@@ -494,19 +1511,60 @@ class ParquetDB(BaseDB):
         pk_cols = self._validate_graph_keys(entity_name, key_fields)
 
         row = {pk: str(key_fields[pk]) for pk in pk_cols}
-        row["graph_json"] = json.dumps(graph_data)
+        if self._resolve_graph_format(entity_name) == "json":
+            row["graph_json"] = json.dumps(graph_data)
+        else:
+            row.update(encode_graph_columns(graph_data))
 
         return row
 
+    def _resolve_graph_format(self, entity_name: str) -> str:
+        """
+        Get the graph format used when writing rows for an entity.
+
+        In the single layout, appends keep the format of the existing
+        graph.parquet so that legacy files stay readable.
+
+        Args:
+            entity_name (str): Graph entity name.
+
+        Returns:
+            str: "columnar" or "json".
+        """
+        return get_graph_format(self._graph_write_schema(entity_name))
+
+    def _graph_write_schema(self, entity_name: str) -> pa.Schema:
+        """
+        Get the schema used for new graph rows of an entity.
+
+        In the single layout this is the schema of the existing
+        graph.parquet, so appends keep the file's graph format.
+
+        Args:
+            entity_name (str): Graph entity name.
+
+        Returns:
+            pa.Schema: Graph table schema.
+        """
+        schema = self._graph_schemas.get(entity_name)
+        if schema is None:
+            gpath = self._graph_path(entity_name)
+            existing = [gpath] if gpath.exists() else self._committed_fragments(gpath)
+            if self.layout == "single" and existing:
+                schema = pq.read_schema(existing[0])
+            else:
+                schema = build_graph_arrow_schema(entity_name, self.graph_format)
+            self._graph_schemas[entity_name] = schema
+        return schema
+
     def _write_graph_rows(
         self,
         entity_name: str,
         rows: List[Dict[str, Any]],
     ):
         """
-        Append one or more graph rows to the entity's graph Parquet file.
-
-        Manages ParquetWriter lifecycle and ensures schema consistency.
+        Buffer one or more graph rows for the entity's graph table,
+        flushing the buffer once it is full.
 
         Args:
             entity_name (str): Graph entity name.
@@ -515,16 +1573,39 @@ class ParquetDB(BaseDB):
         if not rows:
             return
 
-        gpath = self._graph_path(entity_name)
+        table = pa.Table.from_pylist(rows, schema=self._graph_write_schema(entity_name))
+        self.add_graph_arrow(entity_name, table)
 
-        writer = self._graph_writers.get(entity_name)
-        if writer is None:
-            schema = pq.read_schema(gpath)
-            writer = pq.ParquetWriter(gpath, schema)
-            self._graph_writers[entity_name] = writer
+    def add_graph_arrow(self, entity_name: str, table: pa.Table):
+        """
+        Add graph rows given as an Arrow table, e.g. encoded in another
+        process by ``encode_writes``.
+
+        Args:
+            entity_name (str): Graph entity name.
+            table (pa.Table): Fully-built graph rows in the entity's graph
+                table format.
+        """
+        if table.num_rows == 0:
+            return
+
+        table = conform_table(table, self._graph_write_schema(entity_name))
+        self._buffer_rows(self._graph_buffers, entity_name, table, self._flush_graph)
+
+    def _flush_graph(self, entity_name: str):
+        """
+        Write the buffered rows of an entity graph table.
 
-        table = pa.Table.from_pylist(rows, schema=writer.schema)
-        writer.write_table(table)
+        Args:
+            entity_name (str): Graph entity name.
+        """
+        self._flush_buffer(
+            entity_name,
+            self._graph_buffers,
+            self._graph_writers,
+            self._graph_path(entity_name),
+            self._graph_dir(entity_name),
+        )
 
     def add_graph_data_batch(
         self,
@@ -546,9 +1627,24 @@ class ParquetDB(BaseDB):
             entity_name (str): Graph entity name.
             rows (list): List of graph row dictionaries.
         """
-        if not rows:
-            return
+        self._write_graph_rows(entity_name, self._build_graph_rows(entity_name, rows))
+
+    def _build_graph_rows(
+        self, entity_name: str, rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Build graph-table rows from ``add_graph_data_batch`` input rows.
+
+        Args:
+            entity_name (str): Graph entity name.
+            rows (list): Graph row dictionaries with a "data" field.
 
+        Returns:
+            list[dict]: Row dictionaries matching the graph table schema.
+
+        Raises:
+            ValueError: If a row has no "data" field.
+        """
         built_rows = []
         for row in rows:
             if "data" not in row:
@@ -560,8 +1656,7 @@ class ParquetDB(BaseDB):
             built_rows.append(
                 self._build_graph_row(entity_name, graph_data, key_fields)
             )
-
-        self._write_graph_rows(entity_name, built_rows)
+        return built_rows
 
     def add_graph_data(
         self,
@@ -582,7 +1677,7 @@ class ParquetDB(BaseDB):
 
     def get_graph_data(self, entity_name: str, **key_fields) -> Dict[str, Any]:
         """
-        Retrieve graph_json from graph.parquet using primary-key values.
+        Retrieve a graph from the entity's graph table using primary-key values.
 
         Args:
             entity_name (str): Entity type.
@@ -595,11 +1690,14 @@ class ParquetDB(BaseDB):
             ValueError: If PKs are missing.
             DataNotFoundError: If the graph data is not found.
         """
-        # Ensure writers are closed before reading
+        # Finish staged fragments so this session's graphs are readable
         self._ensure_writers_closed()
 
         graph_path = self._graph_path(entity_name)
-        if not graph_path.exists():
+        paths = self._scan_files(
+            entity_name, graph_path, self._graph_dir(entity_name), key_fields
+        )
+        if paths is None:
             raise DataNotFoundError(
                 entity_name=entity_name,
                 message=f"Graph file not found: {graph_path}. "
@@ -624,11 +1722,14 @@ class ParquetDB(BaseDB):
         pyarrow_filters = [(pk, "=", str(key_fields[pk])) for pk in pk_cols]
         filters_tuple = tuple(pyarrow_filters)
 
-        # Only read necessary columns: primary keys + graph_json
-        columns_tuple = tuple(pk_cols + ["graph_json"])
-
         try:
-            filtered = _load_arrow_table(graph_path, filters_tuple, columns_tuple)
+            if paths == [graph_path]:
+                tables = [_load_arrow_table(graph_path, filters_tuple)]
+            else:
+                tables = self._load_graph_fragments(
+                    entity_name, paths, pyarrow_filters
+                )
+            tables = [t for t in tables if t.num_rows > 0]
         except Exception as e:
             raise DataNotFoundError(
                 entity_name=entity_name,
@@ -637,44 +1738,346 @@ class ParquetDB(BaseDB):
                 f"Use 'with ParquetDB(...) as db:' or call db.close() after writes.",
             ) from e
 
-        if filtered.num_rows == 0:
+        if not tables:
             key_str = ", ".join(f"{k}={v!r}" for k, v in key_fields.items())
             raise DataNotFoundError(
                 entity_name=entity_name,
                 message=f"No graph data found for '{entity_name}' with keys: {key_str}",
             )
 
-        return json.loads(filtered["graph_json"][0].as_py())
+        return decode_graph_table(tables[0].slice(0, 1))[0]
 
-    def add_image(
-        self, entity_name: str, image_name: str, image: Image2D, **key_fields
-    ):
+    def get_graph_data_many(
+        self, entity_name: str, **partial_keys
+    ) -> List[Dict[str, Any]]:
         """
-        Store an image (NumPy array) associated with an entity row.
+        Retrieve every graph matching a subset of primary-key values in a
+        single scan of the entity's graph table.
 
         Args:
-            entity_name (str): Name of the entity.
-            image_name (str): Name of the image field (e.g. "cell_placement").
-            image (Image2D): Image data.
-            **key_fields: Primary-key values identifying the row
+            entity_name (str): Graph entity name.
+            **partial_keys: Any subset of primary-key values
                         (e.g. flow_id="X", stage="Y").
 
         Returns:
-            str: Filesystem path where the image was stored.
+            list[dict]: One ``{<pk>: value, ..., "data": graph}`` per graph.
+
+        Raises:
+            ValueError: If a key field is not a primary-key column.
+            DataNotFoundError: If the graph table does not exist.
         """
-        # Ensure the image directory exists
-        image_dir = self._image_dir(entity_name)
-        image_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_writers_closed()
+        pk_cols = self._validate_partial_keys(entity_name, partial_keys)
 
-        # Construct filename from field + primary keys
-        key_str = "__".join(f"{k}={v}" for k, v in key_fields.items())
-        path = image_dir / f"{image_name}__{key_str}"
+        graph_path = self._graph_path(entity_name)
+        paths = self._scan_files(
+            entity_name, graph_path, self._graph_dir(entity_name), partial_keys
+        )
+        if paths is None:
+            raise DataNotFoundError(
+                entity_name=entity_name,
+                message=f"Graph file not found: {graph_path}. "
+                f"Did you call create_dataset_tables() and add graph data?",
+            )
+
+        pyarrow_filters = [(k, "=", str(v)) for k, v in partial_keys.items()]
+        if paths == [graph_path]:
+            tables = [
+                _load_arrow_table(graph_path, tuple(pyarrow_filters) or None)
+            ]
+        else:
+            tables = self._load_graph_fragments(
+                entity_name, paths, pyarrow_filters or None
+            )
+
+        results = []
+        for table in tables:
+            keys = table.select(pk_cols).to_pylist()
+            for key_fields, graph_data in zip(keys, decode_graph_table(table)):
+                key_fields["data"] = graph_data
+                results.append(key_fields)
+        return results
+
+    def get_table_rows(
+        self,
+        entity_name: str,
+        keys: List[Dict[str, Any]],
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Retrieve the rows of many primary keys in one scan.
+
+        Primary-key IN filters are pushed into the scan (pruning partitions
+        and row groups) and the result is joined with the requested keys.
+
+        Args:
+            entity_name (str): Name of the entity.
+            keys (list[dict]): Primary-key values of each requested row.
+            columns (list[str] | None): Columns to read (all if None).
+
+        Returns:
+            pd.DataFrame: Matching rows.
+
+        Raises:
+            DataNotFoundError: If the entity is not found.
+        """
+        pk_cols = entity.SchemaMetadata.get_pk_columns(entity_name)
+        filters = {pk: sorted({key[pk] for key in keys}, key=str) for pk in pk_cols}
+        df = self.get_table_data(entity_name, columns=columns, **filters)
+        return _select_keys(df, pk_cols, keys)
+
+    def get_graph_data_for_keys(
+        self, entity_name: str, keys: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve the graphs of many primary keys in one scan of the
+        entity's graph table.
+
+        Args:
+            entity_name (str): Graph entity name.
+            keys (list[dict]): Primary-key values of each graph.
+
+        Returns:
+            list[dict]: One graph dictionary per key, in the order of ``keys``.
+
+        Raises:
+            DataNotFoundError: If the graph table or a key's graph is missing.
+        """
+        self._ensure_writers_closed()
+        if not keys:
+            return []
 
-        # Save as .npy
-        np.savez_compressed(path, image)
+        # Graph tables store key columns as strings
+        pk_cols = entity.SchemaMetadata.get_pk_columns(entity_name)
+        filters = {pk: sorted({str(key[pk]) for key in keys}) for pk in pk_cols}
+        predicate = filters_to_predicate(filters)
+
+        graph_path = self._graph_path(entity_name)
+        paths = self._scan_files(
+            entity_name, graph_path, self._graph_dir(entity_name), filters
+        )
+        if paths is None:
+            raise DataNotFoundError(
+                entity_name=entity_name,
+                message=f"Graph file not found: {graph_path}. "
+                f"Did you call create_dataset_tables() and add graph data?",
+            )
+        if paths == [graph_path]:
+            tables = [_load_arrow_table(graph_path, predicate)]
+        else:
+            tables = self._load_graph_fragments(entity_name, paths, predicate)
+
+        # Only decode the graphs that were requested
+        wanted = {_key_tuple(key, pk_cols) for key in keys}
+        graphs: Dict[tuple, Dict[str, Any]] = {}
+        for table in tables:
+            positions = [
+                i
+                for i, row in enumerate(table.select(pk_cols).to_pylist())
+                if _key_tuple(row, pk_cols) in wanted
+            ]
+            if not positions:
+                continue
+            table = table.take(positions)
+            row_keys = table.select(pk_cols).to_pylist()
+            for row_key, graph_data in zip(row_keys, decode_graph_table(table)):
+                graphs.setdefault(_key_tuple(row_key, pk_cols), graph_data)
+
+        missing = [key for key in keys if _key_tuple(key, pk_cols) not in graphs]
+        if missing:
+            raise DataNotFoundError(
+                entity_name=entity_name,
+                message=f"No graph data found for '{entity_name}' with keys: {missing}",
+            )
+        return [graphs[_key_tuple(key, pk_cols)] for key in keys]
+
+    def _load_graph_fragments(
+        self,
+        entity_name: str,
+        paths: List[Path],
+        pyarrow_filters: Optional[List[Tuple[str, str, Any]]] = None,
+    ) -> List[pa.Table]:
+        """
+        Load matching graph rows from graph files and fragments.
+
+        Fragments are grouped by graph format so that legacy graph_json
+        files and columnar fragments are scanned with their own schema.
+
+        Args:
+            entity_name (str): Graph entity name.
+            paths (list[Path]): Files to scan (see ``_scan_files``).
+            pyarrow_filters (list | None): PyArrow filter predicates.
+
+        Returns:
+            list[pa.Table]: One table per graph format present.
+        """
+        by_format: Dict[str, List[Path]] = {}
+        for path in paths:
+            by_format.setdefault(get_graph_format(pq.read_schema(path)), []).append(
+                path
+            )
+
+        return [
+            _load_arrow_fragments(
+                fmt_paths,
+                build_graph_arrow_schema(entity_name, fmt),
+                pyarrow_filters,
+            )
+            for fmt, fmt_paths in by_format.items()
+        ]
+
+    def add_image(
+        self,
+        entity_name: str,
+        image_name: str,
+        image: Image2D | EncodedImage,
+        **key_fields,
+    ):
+        """
+        Store an image (NumPy array) associated with an entity row.
+
+        Args:
+            entity_name (str): Name of the entity.
+            image_name (str): Name of the image field (e.g. "cell_placement").
+            image (Image2D | EncodedImage): Image data, or the image as
+                compressed by ``encode_image``.
+            **key_fields: Primary-key values identifying the row
+                        (e.g. flow_id="X", stage="Y").
+
+        Returns:
+            str: Filesystem path where the image was stored.
+
+        Raises:
+            ValueError: If an encoded image does not match the image store.
+        """
+        if self.image_store == "chunked":
+            return self._chunked_images(entity_name).put(
+                self._image_id(image_name, key_fields),
+                image,
+                compress=self._is_compressed(image_name),
+            )
+
+        path = self._image_file(entity_name, image_name, key_fields)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(image, EncodedImage):
+            if image.codec != "npz":
+                raise ValueError(f"Cannot store an image encoded as '{image.codec}'")
+            path.write_bytes(image.payload)
+        else:
+            np.savez_compressed(path, image)
 
         return str(path)
 
+    def _is_compressed(self, image_name: str) -> bool:
+        """
+        Check whether a chunked-store image is written zlib-compressed.
+
+        Args:
+            image_name (str): Image name (field, or ``field__dict_key``).
+
+        Returns:
+            bool: True if the image's field is in ``compressed_images``.
+        """
+        return image_name.split("__")[0] in self.compressed_images
+
+    def encode_image(self, image_name: str, image: Image2D) -> Image2D | EncodedImage:
+        """
+        Compress an image the way ``add_image`` stores it.
+
+        Args:
+            image_name (str): Image name (field, or ``field__dict_key``).
+            image (Image2D): Image data.
+
+        Returns:
+            Image2D | EncodedImage: ``.npz`` bytes, a zlib chunk for the
+            compressed fields of a chunked store, or the image itself if it
+            is stored uncompressed.
+        """
+        if self.image_store == "npz":
+            return EncodedImage.encode(image, "npz")
+        if self._is_compressed(image_name):
+            return EncodedImage.encode(image, "zlib")
+        return image
+
+    def encode_writes(
+        self, writes: List[Tuple[str, tuple, Dict[str, Any]]]
+    ) -> List[Tuple[str, tuple, Dict[str, Any]]]:
+        """
+        Encode table rows and graphs as Arrow tables and compress images.
+
+        Row writes become ``add_table_arrow`` calls and graph writes
+        ``add_graph_arrow`` calls; images are replaced by what
+        ``encode_image`` returns. Other writes are kept as they are.
+
+        Args:
+            writes (list[DBWrite]): (method name, args, kwargs) calls.
+
+        Returns:
+            list[DBWrite]: Calls with the same effect on this database.
+        """
+        encoded = []
+        for method, args, kwargs in writes:
+            if method in ("add_table_row", "add_table_data"):
+                entity_name, rows = args
+                if method == "add_table_row":
+                    rows = [rows]
+                if rows:
+                    table = self._rows_to_arrow(entity_name, pd.DataFrame(rows))
+                    encoded.append(("add_table_arrow", (entity_name, table), {}))
+            elif method in ("add_graph_data", "add_graph_data_batch"):
+                entity_name, rows = args
+                if method == "add_graph_data":
+                    rows = [{"data": rows, **kwargs}]
+                if rows:
+                    table = pa.Table.from_pylist(
+                        self._build_graph_rows(entity_name, rows),
+                        schema=self._graph_write_schema(entity_name),
+                    )
+                    encoded.append(("add_graph_arrow", (entity_name, table), {}))
+            elif method == "add_images":
+                entity_name, images, dict_images = args
+                images = {
+                    name: None if image is None else self.encode_image(name, image)
+                    for name, image in images.items()
+                }
+                dict_images = {
+                    field: {
+                        key: None
+                        if image is None
+                        else self.encode_image(f"{field}__{key}", image)
+                        for key, image in value.items()
+                    }
+                    if value
+                    else value
+                    for field, value in dict_images.items()
+                }
+                encoded.append((method, (entity_name, images, dict_images), kwargs))
+            else:
+                encoded.append((method, args, kwargs))
+        return encoded
+
+    def get_image_source(
+        self, entity_name: str, image_name: str, **key_fields
+    ) -> Optional[str]:
+        """
+        Identify the stored bytes of an image (container location, or
+        ``.npz`` path with modification time and size).
+
+        Args:
+            entity_name (str): Name of the entity.
+            image_name (str): Name of the stored image.
+            **key_fields: Primary-key values identifying the row.
+
+        Returns:
+            str | None: Source string, or None if the image is not stored.
+        """
+        image_id = self._image_id(image_name, key_fields)
+        return image_source(
+            self._chunked_images(entity_name),
+            image_id,
+            self._image_file(entity_name, image_name, key_fields),
+        )
+
     def get_image(self, entity_name: str, image_name: str, **key_fields) -> Image2D:
         """
         Retrieve an image associated with an entity row.
@@ -690,12 +2093,19 @@ class ParquetDB(BaseDB):
         Raises:
             DataNotFoundError: If the image file does not exist.
         """
+        # --------------------------------------------------------------
+        # Chunked containers first, then one .npz file per image
+        # --------------------------------------------------------------
+        image = self._chunked_images(entity_name).get(
+            self._image_id(image_name, key_fields)
+        )
+        if image is not None:
+            return image
+
         # --------------------------------------------------------------
         # Construct expected path
         # --------------------------------------------------------------
-        image_dir = self._image_dir(entity_name)
-        key_str = "__".join(f"{k}={v}" for k, v in key_fields.items())
-        path = image_dir / f"{image_name}__{key_str}.npz"
+        path = self._image_file(entity_name, image_name, key_fields)
 
         # --------------------------------------------------------------
         # Ensure the file exists
@@ -715,44 +2125,824 @@ class ParquetDB(BaseDB):
         arr = data["arr_0"]
         return entity.Image2D(arr)
 
+    def add_image_manifest(
+        self, entity_name: str, entries: List[Dict[str, Any]], **key_fields
+    ):
+        """
+        Record the images stored for an entity row in the image manifest.
+
+        Args:
+            entity_name (str): Name of the entity.
+            entries (list): One dict per image field or dict image with
+                "image_field", "dict_key", "image_name", "shape" and "dtype";
+                "image_name" is None for empty fields.
+            **key_fields: Primary-key values identifying the row.
+        """
+        if not entries:
+            return
+
+        keys = {pk: str(value) for pk, value in key_fields.items()}
+        rows = []
+        for item in entries:
+            image_name = item["image_name"]
+            rows.append(
+                {
+                    **keys,
+                    "image_field": item["image_field"],
+                    "dict_key": item["dict_key"],
+                    "path": None
+                    if image_name is None
+                    else self._image_location(entity_name, image_name, key_fields),
+                    "shape": item["shape"],
+                    "dtype": item["dtype"],
+                }
+            )
+
+        table = pa.Table.from_pylist(rows, schema=build_image_manifest_schema(entity_name))
+        self._buffer_rows(
+            self._manifest_buffers, entity_name, table, self._flush_manifest
+        )
+
+    def _image_location(
+        self, entity_name: str, image_name: str, key_fields: Dict[str, Any]
+    ) -> str:
+        """
+        Get the file holding a stored image, relative to the image directory.
+
+        Args:
+            entity_name (str): Name of the entity.
+            image_name (str): Image name (field, or ``field__dict_key``).
+            key_fields (dict): Primary-key values identifying the row.
+
+        Returns:
+            str: Container name for chunked images, else the ``.npz`` file name.
+        """
+        location = self._chunked_images(entity_name).location(
+            self._image_id(image_name, key_fields)
+        )
+        return location or self._image_file(entity_name, image_name, key_fields).name
+
+    def _flush_manifest(self, entity_name: str):
+        """
+        Write the buffered rows of an entity image manifest.
+
+        Args:
+            entity_name (str): Name of the entity.
+        """
+        self._flush_buffer(
+            entity_name,
+            self._manifest_buffers,
+            self._manifest_writers,
+            self._image_manifest_path(entity_name),
+            self._image_manifest_dir(entity_name),
+        )
+
+    def get_image_manifest(
+        self, entity_name: str, **key_fields
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Read the image manifest entries of an entity row.
+
+        Args:
+            entity_name (str): Name of the entity.
+            **key_fields: Primary-key values identifying the row.
+
+        Returns:
+            list[dict] | None: Manifest entries, or None if the row is not in
+            a manifest (e.g. datasets written before manifests existed).
+        """
+        self._ensure_writers_closed()
+
+        manifest_path = self._image_manifest_path(entity_name)
+        filters = [(pk, "=", str(value)) for pk, value in key_fields.items()]
+        paths = self._scan_files(
+            entity_name, manifest_path, self._image_manifest_dir(entity_name), key_fields
+        )
+
+        if paths is None:
+            return None
+        if paths == [manifest_path]:
+            table = _load_arrow_table(manifest_path, tuple(filters) or None)
+        else:
+            table = _load_arrow_fragments(
+                paths, build_image_manifest_schema(entity_name), filters or None
+            )
+
+        if table.num_rows == 0:
+            return None
+        return table.select([f.name for f in IMAGE_MANIFEST_FIELDS]).to_pylist()
+
+    def get_image_manifests(
+        self, entity_name: str, keys: List[Dict[str, Any]]
+    ) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        Read the image manifests of many entity rows in one scan.
+
+        Args:
+            entity_name (str): Name of the entity.
+            keys (list[dict]): Primary-key values of each row.
+
+        Returns:
+            list: One manifest (or None) per key, in the order of ``keys``.
+        """
+        self._ensure_writers_closed()
+        if not keys:
+            return []
+
+        manifest_path = self._image_manifest_path(entity_name)
+        pk_cols = entity.SchemaMetadata.get_pk_columns(entity_name)
+        filters = {pk: sorted({str(key[pk]) for key in keys}) for pk in pk_cols}
+        predicate = filters_to_predicate(filters)
+        paths = self._scan_files(
+            entity_name, manifest_path, self._image_manifest_dir(entity_name), filters
+        )
+
+        if paths is None:
+            return [None] * len(keys)
+        if paths == [manifest_path]:
+            table = _load_arrow_table(manifest_path, predicate)
+        else:
+            table = _load_arrow_fragments(
+                paths, build_image_manifest_schema(entity_name), predicate
+            )
+
+        entry_fields = [f.name for f in IMAGE_MANIFEST_FIELDS]
+        manifests: Dict[tuple, List[Dict[str, Any]]] = {}
+        for row in table.select(pk_cols + entry_fields).to_pylist():
+            entry = {field: row[field] for field in entry_fields}
+            manifests.setdefault(_key_tuple(row, pk_cols), []).append(entry)
+        return [manifests.get(_key_tuple(key, pk_cols)) for key in keys]
+
+    @property
+    def catalog_path(self) -> Path:
+        """Path of the dataset catalog, ``<data_home>/catalog.json``."""
+        return self.data_home / CATALOG_FILE
+
+    def storage_files(self, entity_name: str, images: bool = True) -> Dict[str, List[Path]]:
+        """
+        List the files holding an entity's data in either layout.
+
+        Args:
+            entity_name (str): Name of the entity.
+            images (bool): Also list image files and image manifests.
+
+        Returns:
+            dict: "table", "graph" and (with ``images``) "images" -> files.
+        """
+        table_path, graph_path = self._table_path(entity_name), self._graph_path(entity_name)
+        storage = {
+            "table": existing_files(
+                table_path,
+                *self._committed_fragments(table_path),
+                self._table_dir(entity_name),
+            ),
+            "graph": existing_files(
+                graph_path,
+                *self._committed_fragments(graph_path),
+                self._graph_dir(entity_name),
+            ),
+        }
+        if images:
+            storage["images"] = existing_files(self._image_dir(entity_name))
+        return storage
+
+    def catalog_files(self, entity_name: str) -> List[Path]:
+        """
+        List the paths fingerprinting an entity's table and graph data.
+
+        These are the single-layout files, their writer fragments and the
+        partitioned root directories, whose modification time is advanced
+        whenever fragments are published below them, so the fragments
+        themselves are never listed.
+
+        Args:
+            entity_name (str): Name of the entity.
+
+        Returns:
+            list[Path]: Existing files and directories.
+        """
+        paths = []
+        for path, root in [
+            (self._table_path(entity_name), self._table_dir(entity_name)),
+            (self._graph_path(entity_name), self._graph_dir(entity_name)),
+        ]:
+            paths += [path] if path.exists() else []
+            paths += self._committed_fragments(path)
+            paths += [root] if root.is_dir() else []
+        return paths
+
+    def write_catalog(self, catalog: Dict[str, Any]) -> None:
+        """
+        Write the dataset catalog once all added data is on disk.
+
+        Files only get their final size when their rows are committed, so
+        while rows are buffered or staged the catalog is kept and written
+        by ``close()``.
+
+        A writer with a ``writer_id`` only knows its own writes, so it
+        removes the catalog instead; ``compact()`` rebuilds it once the
+        writers are done.
+
+        Args:
+            catalog (dict): Catalog from ``CatalogBuilder.to_dict``.
+        """
+        if self.writer_id is not None:
+            self.remove_catalog()
+            return
+        if self._has_uncommitted_writes():
+            self._pending_catalog = catalog
+            return
+        self._pending_catalog = None
+        super().write_catalog(catalog)
+
+    def remove_catalog(self) -> None:
+        """Delete the dataset catalog and drop one waiting for ``close()``."""
+        self._pending_catalog = None
+        super().remove_catalog()
+
+    def _session_dir(self, create: bool = False) -> Optional[Path]:
+        """
+        Get the staging directory of the current write session.
+
+        Args:
+            create (bool): Start a session if none is open.
+
+        Returns:
+            Path | None: ``<data_home>/.staging/<session>``, or None if no
+            session is open and ``create`` is False.
+        """
+        if self._session_id is None:
+            if not create:
+                return None
+            self._session_id = uuid.uuid4().hex
+        return self.data_home / STAGING_DIR / self._session_id
+
+    def _staged_path(self, path: Path) -> Path:
+        """
+        Get the location of a data file or directory inside the session.
+
+        Args:
+            path (Path): Published path under ``data_home``.
+
+        Returns:
+            Path: The same relative path under the session directory.
+        """
+        return self._session_dir(create=True) / path.relative_to(self.data_home)
+
+    def _next_staged_fragment(self, path: Path) -> Path:
+        """
+        Get a new staged fragment of a single-layout file.
+
+        Args:
+            path (Path): Published single-layout Parquet file.
+
+        Returns:
+            Path: ``<stem>-NNNNN.parquet`` next to the staged copy of ``path``.
+        """
+        directory = self._staged_path(path).parent
+        number = len(list(directory.glob(f"{path.stem}-*.parquet")))
+        return directory / f"{path.stem}-{number:05d}.parquet"
+
+    def _staged_fragments(
+        self,
+        entity_name: str,
+        path: Path,
+        root: Path,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Path]:
+        """
+        List the finished fragments the session staged for one file.
+
+        Args:
+            entity_name (str): Name of the entity.
+            path (Path): Published single-layout Parquet file.
+            root (Path): Published partitioned-layout root directory.
+            filters (dict | None): Column filters used to prune staged
+                partition directories.
+
+        Returns:
+            list[Path]: Single-layout fragments in write order, then
+            partition fragments.
+        """
+        session_dir = self._session_dir()
+        if session_dir is None:
+            return []
+        staged_path = session_dir / path.relative_to(self.data_home)
+        staged_root = session_dir / root.relative_to(self.data_home)
+        fragments = sorted(staged_path.parent.glob(f"{path.stem}-*.parquet"))
+        if staged_root.is_dir():
+            fragments += list_partition_fragments(
+                staged_root, get_partition_columns(entity_name), filters or {}
+            )
+        return fragments
+
+    def _scan_files(
+        self, entity_name: str, path: Path, root: Path, filters: Dict[str, Any]
+    ) -> Optional[List[Path]]:
+        """
+        List the files a read scans: the committed single-layout file, its
+        writer fragments and the partition fragments, then the fragments
+        staged by this session.
+
+        Args:
+            entity_name (str): Name of the entity.
+            path (Path): Single-layout Parquet file.
+            root (Path): Partitioned-layout root directory.
+            filters (dict): Column filters used to prune partition directories.
+
+        Returns:
+            list[Path] | None: Files to scan, or None if the file was never
+            created or written.
+        """
+        staged = self._staged_fragments(entity_name, path, root, filters)
+        committed = self._committed_fragments(path)
+        if not path.exists() and not root.is_dir() and not staged and not committed:
+            return None
+        paths = [path] if path.exists() else []
+        paths += committed
+        if root.is_dir():
+            paths += list_partition_fragments(
+                root, get_partition_columns(entity_name), filters
+            )
+        return paths + staged
+
+    def _file_kinds(self, entity_name: str) -> List[Tuple[Path, Path]]:
+        """
+        Get the (single-layout file, partitioned root) pairs of an entity's
+        table, graph table and image manifest.
+
+        Args:
+            entity_name (str): Name of the entity.
+
+        Returns:
+            list[tuple[Path, Path]]: One pair per file kind.
+        """
+        return [
+            (self._table_path(entity_name), self._table_dir(entity_name)),
+            (self._graph_path(entity_name), self._graph_dir(entity_name)),
+            (
+                self._image_manifest_path(entity_name),
+                self._image_manifest_dir(entity_name),
+            ),
+        ]
+
+    def _publish_single(self, entity_name: str, path: Path, fragments: List[Path]):
+        """
+        Merge staged fragments into a single-layout file holding no rows.
+
+        The fragments are copied row group by row group into a temporary
+        file that then replaces ``path``. A lone fragment is just moved.
+
+        Args:
+            entity_name (str): Name of the entity.
+            path (Path): Published single-layout Parquet file.
+            fragments (list[Path]): Staged fragments in write order.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        sources = list(fragments)
+        if len(sources) == 1:
+            os.replace(sources[0], path)
+            return
+
+        schema = pq.read_schema(fragments[-1])
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        os.close(fd)
+        writer = None
+        try:
+            for source in sources:
+                parquet_file = pq.ParquetFile(source)
+                for i in range(parquet_file.num_row_groups):
+                    table = conform_table(parquet_file.read_row_group(i), schema)
+                    if writer is None:
+                        writer = pq.ParquetWriter(
+                            tmp, schema, **self._write_options(entity_name, table)
+                        )
+                    writer.write_table(table, row_group_size=self.row_group_size)
+            if writer is None:
+                pq.write_table(schema.empty_table(), tmp)
+        except BaseException:
+            if writer is not None:
+                writer.close()
+            os.unlink(tmp)
+            raise
+        if writer is not None:
+            writer.close()
+        os.replace(tmp, path)
+
+    def _publish_partitioned(self, staged_root: Path, root: Path):
+        """
+        Move staged partition fragments into the published table.
+
+        The modification time of ``root`` is advanced afterwards, so
+        catalogs notice the new fragments (see ``catalog_files``).
+
+        Args:
+            staged_root (Path): Staged partitioned root directory.
+            root (Path): Published partitioned root directory.
+        """
+        for fragment in sorted(staged_root.rglob("*.parquet")):
+            directory = root / fragment.parent.relative_to(staged_root)
+            directory.mkdir(parents=True, exist_ok=True)
+            if self.writer_id is None:
+                part_no = sum(1 for _ in directory.glob("part-*.parquet"))
+                os.replace(fragment, directory / f"part-{part_no}.parquet")
+            else:
+                os.replace(fragment, self._writer_fragment(directory, "part"))
+        if root.is_dir():
+            touch_directory(root)
+
+    def _writer_fragment(self, directory: Path, prefix: str) -> Path:
+        """
+        Get the next published fragment name of this writer.
+
+        Without a ``writer_id`` the session id names the fragments.
+
+        Args:
+            directory (Path): Directory the fragment is published to.
+            prefix (str): "part" in partition directories, or the stem of
+                the single-layout file.
+
+        Returns:
+            Path: ``<prefix>-<writer_id>-NNNNN.parquet`` numbered after the
+            writer's existing fragments.
+        """
+        writer_id = self.writer_id or self._session_id
+        numbers = [
+            int(fragment.stem.rsplit("-", 1)[1])
+            for fragment in directory.glob(f"{prefix}-{writer_id}-*.parquet")
+        ]
+        return directory / f"{prefix}-{writer_id}-{max(numbers, default=-1) + 1:05d}.parquet"
+
+    @staticmethod
+    def _committed_fragments(path: Path) -> List[Path]:
+        """
+        List the writer fragments published next to a single-layout file.
+
+        Args:
+            path (Path): Single-layout Parquet file.
+
+        Returns:
+            list[Path]: Sorted ``<stem>-<writer_id>-NNNNN.parquet`` files.
+        """
+        return sorted(path.parent.glob(f"{path.stem}-*.parquet"))
+
+    def commit(self):
+        """
+        Publish every row written since the last commit.
+
+        Buffered rows are flushed and the session's fragments are moved
+        into the partitioned tables. Single-layout fragments are merged
+        into a file that holds no rows yet; otherwise, or when
+        ``writer_id`` is set, they are published as fragments next to it,
+        so appending never rewrites stored rows.
+        Each published file appears atomically; readers never see partial
+        fragments.
+        """
+        self.flush()
+        self._close_writers()
+        session_dir = self._session_dir()
+        if session_dir is None:
+            return
+
+        for entity_name, _ in entity.SchemaMetadata.items():
+            for path, root in self._file_kinds(entity_name):
+                staged_path = self._staged_path(path)
+                fragments = sorted(staged_path.parent.glob(f"{path.stem}-*.parquet"))
+                if fragments and (self.writer_id is not None or _has_rows(path)):
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    for fragment in fragments:
+                        os.replace(fragment, self._writer_fragment(path.parent, path.stem))
+                elif fragments:
+                    self._publish_single(entity_name, path, fragments)
+                staged_root = self._staged_path(root)
+                if staged_root.is_dir():
+                    self._publish_partitioned(staged_root, root)
+
+        self._discard_session()
+
+    def rollback(self):
+        """Discard every row written since the last commit."""
+        for buffers in [self._buffers, self._graph_buffers, self._manifest_buffers]:
+            buffers.clear()
+        self._close_writers()
+        self._discard_session()
+
+    def _discard_session(self):
+        """Delete the session's staging directory and end the session."""
+        session_dir = self._session_dir()
+        if session_dir is None:
+            return
+        shutil.rmtree(session_dir, ignore_errors=True)
+        try:
+            session_dir.parent.rmdir()  # only succeeds once no session is left
+        except OSError:
+            pass
+        self._session_id = None
+
+    def compact(
+        self,
+        entities: Optional[List[str]] = None,
+        workers: Optional[int] = None,
+        options: Optional[CompactionOptions] = None,
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Merge the committed fragments of tables, graph tables and image
+        manifests into one file per single-layout file or partition
+        directory, sorted by primary key and written in row groups of
+        ``row_group_size`` rows.
+
+        Rows are streamed through an external merge sort, so memory use is
+        bounded by ``options.memory_bytes`` per worker. Codecs, dictionary
+        encoding, page size, statistics, the page index and primary-key
+        bloom filters are set as described in ``eda_schema.db.compaction``.
+        With ``options.rewrite`` every file is rewritten, not only those
+        with fragments to merge. Empty single-layout files left next to a
+        partitioned table are removed.
+
+        Writes of this instance are committed first. Compaction must not
+        run while other processes write to or read from ``data_home``:
+        merged files replace their fragments one group at a time. An
+        up-to-date catalog is rewritten with the new files; a missing or
+        stale one, e.g. after concurrent writers, is rebuilt from the
+        stored tables (see ``eda_schema.catalog.build_catalog``).
+
+        Args:
+            entities (list[str] | None): Entities to compact, all if None.
+            workers (int | None): Number of worker processes compacting
+                entities in parallel. None or 1 compacts in this process.
+            options (CompactionOptions | None): Compaction settings;
+                defaults if None.
+
+        Returns:
+            dict: Entity name -> {"files_before", "files_after",
+            "bytes_before", "bytes_after"}.
+
+        Raises:
+            ValueError: If ``workers`` is not positive.
+        """
+        if workers is not None and workers <= 0:
+            raise ValueError(f"workers must be positive, got {workers}")
+        options = options or CompactionOptions()
+        self.commit()
+        catalog = self.read_catalog()
+        if catalog is not None and stale_files(catalog, self):
+            catalog = None
+
+        names = entities or [entity_name for entity_name, _ in entity.SchemaMetadata.items()]
+        if workers in (None, 1):
+            results = [self._compact_entity(entity_name, options) for entity_name in names]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(
+                    pool.map(
+                        _compact_entity_worker,
+                        [self] * len(names),
+                        names,
+                        [options] * len(names),
+                    )
+                )
+
+        try:
+            (self.data_home / STAGING_DIR).rmdir()  # spill directory of the merges
+        except OSError:
+            pass
+        if catalog is None:
+            catalog = build_catalog(self)
+        # Written even with a writer_id, as no other writer may be running
+        super().write_catalog(catalog)
+        return dict(zip(names, results))
+
+    def _compact_entity(self, entity_name: str, options: CompactionOptions) -> Dict[str, int]:
+        """
+        Merge the fragments of one entity's files.
+
+        Args:
+            entity_name (str): Name of the entity.
+            options (CompactionOptions): Compaction settings.
+
+        Returns:
+            dict: Number and total size of the files before and after
+            compaction.
+        """
+        counts = dict.fromkeys(["files_before", "files_after", "bytes_before", "bytes_after"], 0)
+        for path, root in self._file_kinds(entity_name):
+            for target, sources in self._compaction_groups(entity_name, path, root):
+                counts["files_before"] += len(sources)
+                counts["bytes_before"] += sum(source.stat().st_size for source in sources)
+                if self._is_stale_file(target, sources, root):
+                    target.unlink()
+                    continue
+                if sources != [target] or options.rewrite:
+                    self._merge_files(entity_name, sources, target, options)
+                counts["files_after"] += 1
+                counts["bytes_after"] += target.stat().st_size
+            if root.is_dir():
+                touch_directory(root)
+        return counts
+
+    @staticmethod
+    def _is_stale_file(target: Path, sources: List[Path], root: Path) -> bool:
+        """
+        Check whether a group is an empty single-layout file left next to
+        a partitioned table, e.g. by ``create_dataset_tables``.
+
+        Args:
+            target (Path): Merged file of the group.
+            sources (list[Path]): Files of the group.
+            root (Path): Partitioned root directory of the same file kind.
+
+        Returns:
+            bool: True if the file holds no rows and the data is partitioned.
+        """
+        return (
+            sources == [target]
+            and target.parent != root
+            and root.is_dir()
+            and any(root.rglob("*.parquet"))
+            and pq.read_metadata(target).num_rows == 0
+        )
+
+    def _compaction_groups(
+        self, entity_name: str, path: Path, root: Path
+    ) -> List[Tuple[Path, List[Path]]]:
+        """
+        Group the committed files of one file kind by the file they merge into.
+
+        Args:
+            entity_name (str): Name of the entity.
+            path (Path): Single-layout Parquet file.
+            root (Path): Partitioned-layout root directory.
+
+        Returns:
+            list[tuple[Path, list[Path]]]: (merged file, source files) pairs:
+            the single-layout file with its writer fragments, and
+            ``part-0.parquet`` of every partition directory with its
+            fragments.
+        """
+        groups = []
+        single = ([path] if path.exists() else []) + self._committed_fragments(path)
+        if single:
+            groups.append((path, single))
+        if root.is_dir():
+            by_directory: Dict[Path, List[Path]] = {}
+            for fragment in list_partition_fragments(
+                root, get_partition_columns(entity_name), {}
+            ):
+                by_directory.setdefault(fragment.parent, []).append(fragment)
+            groups += [
+                (directory / "part-0.parquet", fragments)
+                for directory, fragments in sorted(by_directory.items())
+            ]
+        return groups
+
+    def _merge_files(
+        self,
+        entity_name: str,
+        sources: List[Path],
+        target: Path,
+        options: CompactionOptions,
+    ):
+        """
+        Merge Parquet files into one file sorted by primary key.
+
+        The merged rows are written to a temporary file that replaces
+        ``target``; the other sources are deleted afterwards.
+
+        Args:
+            entity_name (str): Name of the entity.
+            sources (list[Path]): Files to merge; the first one's schema is
+                used for all rows.
+            target (Path): Merged file.
+            options (CompactionOptions): Compaction settings.
+        """
+        schema = pq.read_schema(sources[0])
+        pk_cols = [
+            col for col in entity.SchemaMetadata.get_pk_columns(entity_name) if col in schema.names
+        ]
+        ordering = [(col, "ascending") for col in pk_cols]
+        writer_options: Dict[str, Any] = {}
+        if ordering:
+            writer_options["sorting_columns"] = pq.SortingColumn.from_ordering(schema, ordering)
+        if options.indexes:
+            num_rows = sum(pq.read_metadata(source).num_rows for source in sources)
+            ndv = max(1, min(num_rows, self.row_group_size))
+            writer_options["write_page_index"] = True
+            writer_options["bloom_filter_options"] = {
+                col: {"ndv": ndv, "fpp": BLOOM_FILTER_FPP} for col in pk_cols
+            }
+
+        def batches() -> Iterator[pa.Table]:
+            for source in sources:
+                for batch in pq.ParquetFile(source).iter_batches(batch_size=self.row_group_size):
+                    yield conform_table(pa.Table.from_batches([batch]), schema)
+
+        spill_dir = self.data_home / STAGING_DIR
+        spill_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            sorted_rows = sort_batches(
+                batches(), ordering, options.memory_bytes, spill_dir, self.row_group_size
+            )
+            write_row_groups(
+                sorted_rows, tmp, schema, self.row_group_size, options, writer_options
+            )
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        os.replace(tmp, target)
+        for source in sources:
+            if source != target:
+                source.unlink()
+
+    def flush(self):
+        """
+        Write all buffered table, graph and image manifest rows to the
+        session's staged fragments.
+
+        Flushed rows are readable through this instance but are only
+        published to other readers by ``commit()`` or ``close()``.
+        """
+        for entity_name in list(self._buffers):
+            self._flush_table(entity_name)
+        for entity_name in list(self._graph_buffers):
+            self._flush_graph(entity_name)
+        for entity_name in list(self._manifest_buffers):
+            self._flush_manifest(entity_name)
+
+    def _close_writers(self):
+        """Finish the staged fragments of all open single-layout writers."""
+        for kind, writers in [
+            ("table", self._writers),
+            ("graph", self._graph_writers),
+            ("image manifest", self._manifest_writers),
+        ]:
+            for entity_name, writer in list(writers.items()):
+                try:
+                    writer.close()
+                except Exception as e:
+                    # Log but don't fail - try to close remaining writers
+                    warnings.warn(
+                        f"Error closing {kind} writer for entity '{entity_name}': {e}",
+                        RuntimeWarning,
+                    )
+            writers.clear()
+
     def close(self):
         """
-        Close all active Parquet writers and release file handles.
+        Commit all written rows, close all active Parquet writers and
+        release file handles.
 
         This method should be called after all write operations are complete
-        to ensure data is flushed to disk. Alternatively, use the context manager:
+        to publish the data. Alternatively, use the context manager:
 
         ```python
         with ParquetDB(data_home) as db:
             # All operations here
-            # Writers are automatically closed on exit
+            # Writes are committed on exit
         ```
         """
-        for entity_name, writer in list(self._writers.items()):
-            try:
-                writer.close()
-            except Exception as e:
-                # Log but don't fail - try to close remaining writers
-                import warnings
+        self.commit()
+        self._graph_schemas.clear()
 
-                warnings.warn(
-                    f"Error closing writer for entity '{entity_name}': {e}",
-                    RuntimeWarning,
-                )
+        for store in self._image_stores.values():
+            store.close()
 
-        for entity_name, writer in list(self._graph_writers.items()):
-            try:
-                writer.close()
-            except Exception as e:
-                import warnings
+        if self._pending_catalog is not None:
+            self.write_catalog(self._pending_catalog)
 
-                warnings.warn(
-                    f"Error closing graph writer for entity '{entity_name}': {e}",
-                    RuntimeWarning,
-                )
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Get the picklable state, e.g. for worker processes of a parallel
+        ``Dataset.load``. Writers and buffers are not part of the state.
 
-        self._writers.clear()
-        self._graph_writers.clear()
+        Rows written since the last commit belong to this instance's
+        session and are not committed as a side effect, so they must be
+        committed or rolled back first.
+
+        Returns:
+            dict: Instance state without writers and buffers.
+
+        Raises:
+            pickle.PicklingError: If rows were added since the last commit.
+        """
+        if self._has_uncommitted_writes():
+            raise pickle.PicklingError(
+                "Cannot pickle a ParquetDB with uncommitted writes; "
+                "call commit() or rollback() first"
+            )
+        state = self.__dict__.copy()
+        for name in [
+            "_writers",
+            "_graph_writers",
+            "_buffers",
+            "_graph_buffers",
+            "_graph_schemas",
+            "_manifest_writers",
+            "_manifest_buffers",
+        ]:
+            state[name] = {}
+        return state
 
     def __enter__(self):
         """
@@ -780,10 +2970,50 @@ class ParquetDB(BaseDB):
 
     def _ensure_writers_closed(self):
         """
-        Internal method to ensure writers are closed before read operations.
+        Flush buffered rows and finish the open staged fragments before a
+        read, so reads see every added row.
+
+        The write session stays open; later writes go to new fragments.
+        """
+        if self._has_buffered_rows():
+            self.flush()
+        self._close_writers()
+
+    def _has_uncommitted_writes(self) -> bool:
+        """
+        Check whether rows were added since the last commit.
+
+        Returns:
+            bool: True if rows are buffered or staged.
+        """
+        return self._session_id is not None or self._has_buffered_rows()
 
-        This is called automatically before read operations to prevent
-        "Parquet magic bytes not found" errors.
+    def _has_buffered_rows(self) -> bool:
         """
-        if self._writers or self._graph_writers:
-            self.close()
+        Check whether any added rows are still buffered in memory.
+
+        Returns:
+            bool: True if a table or graph buffer holds rows.
+        """
+        return any(
+            buffer.num_rows
+            for buffers in [self._buffers, self._graph_buffers, self._manifest_buffers]
+            for buffer in buffers.values()
+        )
+
+
+def _compact_entity_worker(
+    db: ParquetDB, entity_name: str, options: CompactionOptions
+) -> Dict[str, int]:
+    """
+    Compact one entity in a worker process of ``ParquetDB.compact``.
+
+    Args:
+        db (ParquetDB): Unpickled copy of the database.
+        entity_name (str): Name of the entity.
+        options (CompactionOptions): Compaction settings.
+
+    Returns:
+        dict: Number and total size of the files before and after compaction.
+    """
+    return db._compact_entity(entity_name, options)  # pylint: disable=protected-access
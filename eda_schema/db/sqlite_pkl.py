@@ -18,7 +18,7 @@
 
 import sqlite3
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import dill
 import numpy as np
@@ -26,7 +26,14 @@ import pandas as pd
 
 from eda_schema import entity
 from eda_schema.base import Image2D, resolve_field_type_and_nullable
-from eda_schema.db.base import BaseDB
+from eda_schema.catalog import CATALOG_FILE
+from eda_schema.db.base import (
+    DEFAULT_BATCH_SIZE,
+    BaseDB,
+    check_batch_size,
+    existing_files,
+)
+from eda_schema.db.image_store import ImageStore, image_source, validate_image_store
 from eda_schema.errors import DataNotFoundError
 
 
@@ -55,13 +62,29 @@ class SQLitePickleDB(BaseDB):
     Storage class using SQLite for table data and pickle files for graph data.
     """
 
-    def __init__(self, data_dir: str | Path):
+    def __init__(
+        self,
+        data_dir: str | Path,
+        image_store: str = "npz",
+        compressed_images: Optional[List[str]] = None,
+    ):
         """
         Initialize the database connection and graph storage directory.
 
         Args:
             data_dir (str | Path): Base directory for the SQLite DB and graph files.
+            image_store (str): How new images are written, "npz" (one file
+                per image) or "chunked" (per-entity containers, see
+                ``ImageStore``). Both are read regardless of this setting.
+            compressed_images (list[str] | None): Image fields written as
+                compressed chunks by the chunked store.
+
+        Raises:
+            ValueError: If the image store is unknown.
         """
+        self.image_store = validate_image_store(image_store)
+        self.compressed_images = set(compressed_images or [])
+        self._image_stores: Dict[str, ImageStore] = {}  # entity_name -> containers
         data_dir = Path(data_dir)
         data_dir.mkdir(parents=True, exist_ok=True)  # Ensure directory exists
 
@@ -72,6 +95,17 @@ class SQLitePickleDB(BaseDB):
         self.graph_dir = data_dir / "graph_dir"
         self.graph_dir.mkdir(parents=True, exist_ok=True)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the connection when pickled; it is reopened on unpickling."""
+        state = self.__dict__.copy()
+        del state["conn"], state["cursor"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self.conn = sqlite3.connect(self.data_dir / "tabular.db")
+        self.cursor = self.conn.cursor()
+
     def create_dataset_tables(self):
         """
         Create SQLite tables for all entities.
@@ -101,6 +135,22 @@ class SQLitePickleDB(BaseDB):
 
         self.conn.commit()
 
+    def has_table(self, entity_name: str) -> bool:
+        """
+        Check whether the table of an entity was created.
+
+        Args:
+            entity_name (str): Name of the entity.
+
+        Returns:
+            bool: True if the SQLite table exists.
+        """
+        self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?;",
+            (entity_name,),
+        )
+        return self.cursor.fetchone() is not None
+
     def add_graph_data(
         self, entity_name: str, graph: Any, key: str = None, **key_fields
     ) -> None:
@@ -213,22 +263,103 @@ class SQLitePickleDB(BaseDB):
 
         Args:
             entity_name (str): Name of the entity.
-            **filters: Column filters applied as equality comparisons.
+            **filters: Column filters; lists, tuples and sets are IN
+                filters, other values equality comparisons.
 
         Returns:
             pd.DataFrame: Retrieved rows.
         """
-        query = f"SELECT * FROM {entity_name}"
+        query, params = self._select_query(entity_name, None, filters)
+        df = pd.read_sql_query(query, self.conn, params=params)
+        return self._convert_booleans(entity_name, df)
+
+    @staticmethod
+    def _select_query(
+        entity_name: str, columns: Optional[List[str]], filters: Dict[str, Any]
+    ):
+        """
+        Build a SELECT statement with equality and IN filters.
+
+        Args:
+            entity_name (str): Name of the entity.
+            columns (list[str] | None): Columns to select; None selects all.
+            filters (dict): Column filters; lists, tuples and sets are IN
+                filters, other values equality comparisons.
+
+        Returns:
+            tuple: (query, params) for ``execute``.
+        """
+        selected = ", ".join(columns) if columns else "*"
+        query = f"SELECT {selected} FROM {entity_name}"
         params = None
 
         if filters:
-            conditions = " AND ".join([f"{col} = ?" for col in filters])
-            query += f" WHERE {conditions}"
-            params = tuple(filters.values())
+            conditions, params = [], []
+            for col, value in filters.items():
+                if isinstance(value, (list, tuple, set)):
+                    placeholders = ", ".join("?" for _ in value)
+                    conditions.append(f"{col} IN ({placeholders})")
+                    params.extend(value)
+                else:
+                    conditions.append(f"{col} = ?")
+                    params.append(value)
+            query += " WHERE " + " AND ".join(conditions)
+            params = tuple(params)
+
+        return query, params
+
+    def get_table_rows(
+        self,
+        entity_name: str,
+        keys: List[Dict[str, Any]],
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Retrieve the rows of many primary keys with one join.
 
-        df = pd.read_sql_query(query, self.conn, params=params)
+        The keys are loaded into a temporary table and joined with the
+        entity table on the primary-key columns.
+
+        Args:
+            entity_name (str): Name of the entity.
+            keys (list[dict]): Primary-key values of each requested row.
+            columns (list[str] | None): Columns to return (all if None).
 
-        # Convert boolean fields
+        Returns:
+            pd.DataFrame: Matching rows.
+        """
+        pk_cols = entity.SchemaMetadata.get_pk_columns(entity_name)
+        selected = ", ".join(f"t.{col}" for col in columns) if columns else "t.*"
+        on = " AND ".join(f"t.{pk} = k.{pk}" for pk in pk_cols)
+
+        self.cursor.execute("DROP TABLE IF EXISTS temp.requested_keys")
+        self.cursor.execute(f"CREATE TEMP TABLE requested_keys ({', '.join(pk_cols)})")
+        try:
+            self.cursor.executemany(
+                f"INSERT INTO temp.requested_keys VALUES ({', '.join('?' for _ in pk_cols)})",
+                [tuple(key[pk] for pk in pk_cols) for key in keys],
+            )
+            df = pd.read_sql_query(
+                f"SELECT DISTINCT {selected} FROM {entity_name} t "
+                f"JOIN temp.requested_keys k ON {on}",
+                self.conn,
+            )
+        finally:
+            self.cursor.execute("DROP TABLE temp.requested_keys")
+        return self._convert_booleans(entity_name, df)
+
+    @staticmethod
+    def _convert_booleans(entity_name: str, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert SQLite integer columns of boolean fields back to bool.
+
+        Args:
+            entity_name (str): Name of the entity.
+            df (pd.DataFrame): Rows read from SQLite.
+
+        Returns:
+            pd.DataFrame: The rows with boolean columns converted.
+        """
         model_cls = entity.SchemaMetadata.get_model(entity_name)
         if model_cls is not None:
             for field in entity.SchemaMetadata.get_fields(entity_name):
@@ -239,6 +370,49 @@ class SQLitePickleDB(BaseDB):
 
         return df
 
+    def iter_table_batches(
+        self,
+        entity_name: str,
+        columns: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **filters,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream table rows in batches with ``cursor.fetchmany``.
+
+        Args:
+            entity_name (str): Name of the entity.
+            columns (list[str] | None): Columns to return; None returns all.
+            batch_size (int): Maximum number of rows per batch.
+            **filters: Column filters applied as equality comparisons.
+
+        Returns:
+            Iterator[pd.DataFrame]: Non-empty batches of at most
+            ``batch_size`` rows.
+
+        Raises:
+            ValueError: If ``batch_size`` is not positive.
+        """
+        check_batch_size(batch_size)
+        query, params = self._select_query(entity_name, columns, filters)
+        # A separate cursor keeps the shared one usable while streaming
+        cursor = self.conn.cursor()
+        cursor.execute(query, params or ())
+        names = [description[0] for description in cursor.description]
+
+        def batches():
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        return
+                    df = pd.DataFrame.from_records(rows, columns=names)
+                    yield self._convert_booleans(entity_name, df)
+            finally:
+                cursor.close()
+
+        return batches()
+
     def get_table_row(self, entity_name: str, **filters):
         """
         Retrieve a single row from an entity table.
@@ -331,6 +505,37 @@ class SQLitePickleDB(BaseDB):
         """
         return self.data_dir / "images" / entity_name
 
+    def _chunked_images(self, entity_name: str) -> ImageStore:
+        """
+        Get the chunked image store of an entity.
+
+        Args:
+            entity_name: Name of the entity.
+
+        Returns:
+            ImageStore: Store rooted at the entity's image directory.
+        """
+        store = self._image_stores.get(entity_name)
+        if store is None:
+            store = ImageStore(self._image_dir(entity_name))
+            self._image_stores[entity_name] = store
+        return store
+
+    @staticmethod
+    def _image_id(image_name: str, key_fields: Dict[str, Any]) -> str:
+        """
+        Build the id of one stored image (the ``.npz`` file stem).
+
+        Args:
+            image_name: Image name (field, or ``field__dict_key``).
+            key_fields: Primary-key values identifying the row.
+
+        Returns:
+            str: Image id.
+        """
+        key_str = "__".join(f"{k}={v}" for k, v in sorted(key_fields.items()))
+        return f"{image_name}__{key_str}"
+
     def add_image(
         self, entity_name: str, image_name: str, image: Image2D, **key_fields
     ) -> None:
@@ -347,17 +552,46 @@ class SQLitePickleDB(BaseDB):
         Returns:
             None
         """
+        if self.image_store == "chunked":
+            self._chunked_images(entity_name).put(
+                self._image_id(image_name, key_fields),
+                image,
+                compress=image_name.split("__")[0] in self.compressed_images,
+            )
+            return
+
         # Ensure the image directory exists
         image_dir = self._image_dir(entity_name)
         image_dir.mkdir(parents=True, exist_ok=True)
 
         # Construct filename from field + primary keys
-        key_str = "__".join(f"{k}={v}" for k, v in sorted(key_fields.items()))
-        path = image_dir / f"{image_name}__{key_str}.npz"
+        path = image_dir / f"{self._image_id(image_name, key_fields)}.npz"
 
         # Save as compressed numpy array
         np.savez_compressed(path, image)
 
+    def get_image_source(
+        self, entity_name: str, image_name: str, **key_fields
+    ) -> Optional[str]:
+        """
+        Identify the stored bytes of an image (container location, or
+        ``.npz`` path with modification time and size).
+
+        Args:
+            entity_name (str): Name of the entity.
+            image_name (str): Name of the stored image.
+            **key_fields: Primary-key values identifying the row.
+
+        Returns:
+            str | None: Source string, or None if the image is not stored.
+        """
+        image_id = self._image_id(image_name, key_fields)
+        return image_source(
+            self._chunked_images(entity_name),
+            image_id,
+            self._image_dir(entity_name) / f"{image_id}.npz",
+        )
+
     def get_image(self, entity_name: str, field: str, **key_fields) -> Image2D:
         """
         Retrieve an Image2D stored for a specific entity row.
@@ -373,10 +607,13 @@ class SQLitePickleDB(BaseDB):
         Raises:
             DataNotFoundError: If the image file does not exist.
         """
+        # Chunked containers first, then one .npz file per image
+        image = self._chunked_images(entity_name).get(self._image_id(field, key_fields))
+        if image is not None:
+            return image
+
         # Construct expected path
-        image_dir = self._image_dir(entity_name)
-        key_str = "__".join(f"{k}={v}" for k, v in sorted(key_fields.items()))
-        path = image_dir / f"{field}__{key_str}.npz"
+        path = self._image_dir(entity_name) / f"{self._image_id(field, key_fields)}.npz"
 
         # Check if file exists
         if not path.exists():
@@ -386,3 +623,34 @@ class SQLitePickleDB(BaseDB):
         data = np.load(path)
         arr = data["arr_0"]  # np.savez_compressed saves as 'arr_0'
         return Image2D(arr)
+
+    # ------------------------------------------------------------------
+    # Catalog
+    # ------------------------------------------------------------------
+    @property
+    def catalog_path(self) -> Path:
+        """Path of the dataset catalog, ``<data_dir>/catalog.json``."""
+        return self.data_dir / CATALOG_FILE
+
+    def storage_files(self, entity_name: str, images: bool = True) -> Dict[str, List[Path]]:
+        """
+        List the files holding an entity's data.
+
+        Rows of all entities share ``tabular.db``, which is listed as the
+        table file of every entity, so any row write makes every table's
+        catalog entry stale.
+
+        Args:
+            entity_name (str): Name of the entity.
+            images (bool): Also list image files.
+
+        Returns:
+            dict: "table", "graph" and (with ``images``) "images" -> files.
+        """
+        storage = {
+            "table": existing_files(self.data_dir / "tabular.db"),
+            "graph": sorted(self.graph_dir.glob(f"{entity_name}_*.pkl")),
+        }
+        if images:
+            storage["images"] = existing_files(self._image_dir(entity_name))
+        return storage
@@ -197,6 +197,80 @@ class RoutabilityMetricsEntity(BaseEntity):
     rudy_pin: Optional[Image2D] = None
 
 
+# ============================================================
+# Summary entities
+# ============================================================
+
+
+@dataclass(slots=True)
+class StageSummaryEntity(BaseEntity):
+    """
+    Scalar netlist, cell, area, power and timing metrics of one stage.
+
+    Written by ``Dataset.dump`` next to the source tables so dashboards
+    can read every stage's headline numbers from one small table.
+    """
+
+    flow_id: str = field(metadata={"pk": True})
+    stage: str = field(metadata={"pk": True})
+
+    run_status: Optional[str] = None
+
+    # netlists
+    no_of_inputs: Optional[int] = None
+    no_of_outputs: Optional[int] = None
+    no_of_cells: Optional[int] = None
+    no_of_nets: Optional[int] = None
+    no_of_pins: Optional[int] = None
+    utilization: Optional[float] = None
+    width: Optional[float] = None
+    height: Optional[float] = None
+    total_wirelength: Optional[float] = None
+    total_hpwl: Optional[float] = None
+
+    # cell_metrics
+    no_of_combinational_cells: Optional[int] = None
+    no_of_sequential_cells: Optional[int] = None
+    no_of_buffers: Optional[int] = None
+    no_of_inverters: Optional[int] = None
+    no_of_fillers: Optional[int] = None
+    no_of_tap_cells: Optional[int] = None
+    no_of_diodes: Optional[int] = None
+    no_of_macros: Optional[int] = None
+    no_of_total_cells: Optional[int] = None
+
+    # area_metrics
+    combinational_cell_area: Optional[float] = None
+    sequential_cell_area: Optional[float] = None
+    buffer_area: Optional[float] = None
+    inverter_area: Optional[float] = None
+    filler_area: Optional[float] = None
+    tap_cell_area: Optional[float] = None
+    diode_area: Optional[float] = None
+    macro_area: Optional[float] = None
+    cell_area: Optional[float] = None
+    total_area: Optional[float] = None
+
+    # power_metrics
+    combinational_power: Optional[float] = None
+    sequential_power: Optional[float] = None
+    macro_power: Optional[float] = None
+    internal_power: Optional[float] = None
+    switching_power: Optional[float] = None
+    leakage_power: Optional[float] = None
+    total_power: Optional[float] = None
+
+    # timing_metrics
+    total_negative_slack: Optional[float] = None
+    worst_slack: Optional[float] = None
+    critical_path_startpoint: Optional[str] = None
+    critical_path_endpoint: Optional[str] = None
+    worst_arrival_time: Optional[float] = None
+    worst_required_time: Optional[float] = None
+    no_of_endpoints: Optional[int] = None
+    no_of_violating_endpoints: Optional[int] = None
+
+
 # ============================================================
 # Physical entities
 # ============================================================
@@ -581,6 +655,7 @@ class SchemaMetadata:
         "power_metrics": PowerMetricsEntity,
         "timing_metrics": TimingMetricsEntity,
         "routability_metrics": RoutabilityMetricsEntity,
+        "stage_summaries": StageSummaryEntity,
     }
 
     _GRAPH_ENTITIES: ClassVar[List[str]] = [
@@ -66,3 +66,30 @@ class DataNotFoundError(EDASchemaError):
             else:
                 message = "Requested data not found."
         super().__init__(message)
+
+
+class DuplicateKeyError(EDASchemaError):
+    """
+    Exception raised when written data repeats primary keys already stored.
+    """
+
+    def __init__(self, entity_name=None, keys=None, message=None):
+        """
+        Initialize the duplicate key error.
+
+        Args:
+            entity_name: Optional name of the entity the keys belong to.
+            keys: Optional list of the repeated key values.
+            message: Optional custom error message. If not provided, a default
+                    message is generated based on entity_name and keys.
+        """
+        self.entity_name = entity_name
+        self.keys = list(keys or [])
+        if message is None:
+            message = "Primary keys are already stored"
+            if entity_name:
+                message += f" in '{entity_name}'"
+            if self.keys:
+                message += ": " + ", ".join(repr(k) for k in self.keys)
+            message += "."
+        super().__init__(message)
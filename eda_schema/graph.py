@@ -0,0 +1,703 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : eda_schema/graph.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""
+Compressed sparse row (CSR) graph backend for GraphEntity.
+
+``CSRGraph`` implements the subset of the ``networkx.DiGraph`` API used by
+EDA-Schema graph entities. Nodes are integer ids mapped to names; node
+types are int8 codes and edges are int32 CSR arrays for successors and
+predecessors, rebuilt on demand after edges are added.
+"""
+
+from array import array
+from collections.abc import Mapping, MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import networkx as nx
+import numpy as np
+
+GRAPH_BACKENDS = ("networkx", "csr")
+
+# Node attributes stored in dedicated columns; others go to a sparse dict.
+_TYPE = "type"
+_ENTITY = "entity"
+
+# Sentinel marking an exhausted neighbor iterator in dfs_depths.
+_DONE = object()
+
+
+class CSRNodeAttrs(MutableMapping):
+    """
+    Attribute dictionary of one CSRGraph node.
+
+    ``type`` and ``entity`` are always present (None when unset), matching
+    nodes created by ``GraphEntity.load_graph_data``.
+    """
+
+    __slots__ = ("_graph", "_id")
+
+    def __init__(self, graph: "CSRGraph", node_id: int):
+        self._graph = graph
+        self._id = node_id
+
+    def __getitem__(self, key: str) -> Any:
+        graph = self._graph
+        if key == _TYPE:
+            code = graph._type_codes[self._id]
+            return None if code < 0 else graph._type_names[code]
+        if key == _ENTITY:
+            return graph._entities[self._id]
+        return graph._extra_attrs.get(self._id, {})[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        graph = self._graph
+        if key == _TYPE:
+            graph._type_codes[self._id] = graph._type_code(value)
+        elif key == _ENTITY:
+            graph._entities[self._id] = value
+        else:
+            graph._extra_attrs.setdefault(self._id, {})[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in (_TYPE, _ENTITY):
+            self[key] = None
+            return
+        extra = self._graph._extra_attrs.get(self._id, {})
+        del extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield _TYPE
+        yield _ENTITY
+        yield from self._graph._extra_attrs.get(self._id, {})
+
+    def __len__(self) -> int:
+        return 2 + len(self._graph._extra_attrs.get(self._id, {}))
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class CSRNodeView(Mapping):
+    """Node view of a CSRGraph, mirroring ``networkx`` ``G.nodes``."""
+
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph: "CSRGraph"):
+        self._graph = graph
+
+    def __getitem__(self, node: str) -> CSRNodeAttrs:
+        return CSRNodeAttrs(self._graph, self._graph._index[node])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._graph._names)
+
+    def __len__(self) -> int:
+        return len(self._graph._names)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._graph._index
+
+    def __call__(self, data: Any = False, default: Any = None):
+        return self.data(data, default) if data is not False else iter(self)
+
+    def data(self, data: Any = True, default: Any = None):
+        """
+        Iterate over (node, data) pairs.
+
+        Args:
+            data: True for the attribute dict, or an attribute name.
+            default: Value used when the attribute is missing.
+
+        Returns:
+            Iterator: (node, attrs) or (node, value) pairs.
+        """
+        graph = self._graph
+        if data is True:
+            return ((n, CSRNodeAttrs(graph, i)) for i, n in enumerate(graph._names))
+        return (
+            (n, CSRNodeAttrs(graph, i).get(data, default))
+            for i, n in enumerate(graph._names)
+        )
+
+    def __repr__(self) -> str:
+        return f"CSRNodeView({list(self._graph._names)!r})"
+
+
+class CSREdgeView:
+    """Edge view of a CSRGraph, mirroring ``networkx`` ``G.edges``."""
+
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph: "CSRGraph"):
+        self._graph = graph
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        graph = self._graph
+        indptr, indices = graph._succ()
+        names = graph._names
+        for u in range(len(names)):
+            for v in indices[indptr[u]:indptr[u + 1]]:
+                yield names[u], names[v]
+
+    def __len__(self) -> int:
+        return len(self._graph._succ()[1])
+
+    def __contains__(self, edge: object) -> bool:
+        try:
+            u, v = edge
+        except (TypeError, ValueError):
+            return False
+        return self._graph.has_edge(u, v)
+
+    def __call__(self):
+        return iter(self)
+
+    def __repr__(self) -> str:
+        return f"CSREdgeView({list(self)!r})"
+
+
+class CSRGraph:
+    """
+    Directed graph stored as int32 CSR adjacency arrays.
+
+    Node names map to integer ids in insertion order. Successor and
+    predecessor lists are kept as (indptr, indices) arrays built lazily from
+    the edge list, so iteration order matches ``networkx.DiGraph``.
+    Parallel edges are collapsed and edge attributes are not supported.
+    """
+
+    def __init__(self):
+        """Create an empty graph."""
+        self._names: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._type_names: List[Any] = []
+        self._type_codes = array("b")
+        self._entities: List[Any] = []
+        self._extra_attrs: Dict[int, Dict[str, Any]] = {}
+        self._src = array("i")
+        self._dst = array("i")
+        self._succ_csr: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._pred_csr: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_graph_data(cls, data: Dict[str, Any]) -> "CSRGraph":
+        """
+        Build a graph from the ``get_graph_data`` dictionary format.
+
+        Args:
+            data: Dictionary with "nodes", "node_types" and "edges" keys.
+
+        Returns:
+            CSRGraph: The loaded graph.
+        """
+        graph = cls()
+        for node, node_type in zip(data["nodes"], data["node_types"]):
+            graph.add_node(node, type=node_type)
+        index = graph._index
+        for u, v in data["edges"]:
+            if u not in index:
+                graph.add_node(u)
+            if v not in index:
+                graph.add_node(v)
+            graph._src.append(index[u])
+            graph._dst.append(index[v])
+        graph._invalidate()
+        return graph
+
+    def _type_code(self, node_type: Any) -> int:
+        if node_type is None:
+            return -1
+        try:
+            return self._type_names.index(node_type)
+        except ValueError:
+            if len(self._type_names) >= 127:
+                raise ValueError("CSRGraph supports at most 127 node types") from None
+            self._type_names.append(node_type)
+            return len(self._type_names) - 1
+
+    def _invalidate(self) -> None:
+        self._succ_csr = None
+        self._pred_csr = None
+
+    def add_node(self, node: str, **attrs) -> None:
+        """
+        Add a node, or update the attributes of an existing node.
+
+        Args:
+            node: Node name.
+            **attrs: Node attributes.
+        """
+        node_id = self._index.get(node)
+        if node_id is None:
+            node_id = len(self._names)
+            self._index[node] = node_id
+            self._names.append(node)
+            self._type_codes.append(-1)
+            self._entities.append(None)
+            self._invalidate()
+        node_attrs = CSRNodeAttrs(self, node_id)
+        for key, value in attrs.items():
+            node_attrs[key] = value
+
+    def add_edge(self, u: str, v: str, **attrs) -> None:
+        """
+        Add an edge, creating missing endpoints.
+
+        Args:
+            u: Source node name.
+            v: Target node name.
+
+        Raises:
+            ValueError: If edge attributes are given.
+        """
+        if attrs:
+            raise ValueError("CSRGraph does not store edge attributes")
+        for node in (u, v):
+            if node not in self._index:
+                self.add_node(node)
+        self._src.append(self._index[u])
+        self._dst.append(self._index[v])
+        self._invalidate()
+
+    def _build(self) -> None:
+        """Deduplicate the edge list and build both CSR structures."""
+        n = len(self._names)
+        src = np.frombuffer(self._src, dtype=np.int32) if self._src else np.empty(0, np.int32)
+        dst = np.frombuffer(self._dst, dtype=np.int32) if self._dst else np.empty(0, np.int32)
+
+        # Collapse parallel edges, keeping first-insertion order
+        _, first = np.unique(src.astype(np.int64) * max(n, 1) + dst, return_index=True)
+        if len(first) != len(src):
+            first.sort()
+            src, dst = src[first], dst[first]
+            self._src = array("i", src.tobytes())
+            self._dst = array("i", dst.tobytes())
+
+        self._succ_csr = _csr(src, dst, n)
+        self._pred_csr = _csr(dst, src, n)
+
+    def _succ(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._succ_csr is None:
+            self._build()
+        return self._succ_csr
+
+    def _pred(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._pred_csr is None:
+            self._build()
+        return self._pred_csr
+
+    # ------------------------------------------------------------------
+    # networkx-compatible queries
+    # ------------------------------------------------------------------
+    @property
+    def nodes(self) -> CSRNodeView:
+        """CSRNodeView: View of all nodes and their attributes."""
+        return CSRNodeView(self)
+
+    @property
+    def edges(self) -> CSREdgeView:
+        """CSREdgeView: View of all (source, target) edges."""
+        return CSREdgeView(self)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._index
+
+    def has_node(self, node: str) -> bool:
+        """Return True if the node exists."""
+        return node in self._index
+
+    def has_edge(self, u: str, v: str) -> bool:
+        """Return True if the edge u -> v exists."""
+        if u not in self._index or v not in self._index:
+            return False
+        indptr, indices = self._succ()
+        i = self._index[u]
+        return bool((indices[indptr[i]:indptr[i + 1]] == self._index[v]).any())
+
+    def number_of_nodes(self) -> int:
+        """Return the number of nodes."""
+        return len(self._names)
+
+    def number_of_edges(self) -> int:
+        """Return the number of edges."""
+        return len(self._succ()[1])
+
+    def _neighbor_ids(self, csr: Tuple[np.ndarray, np.ndarray], node: str) -> np.ndarray:
+        indptr, indices = csr
+        try:
+            i = self._index[node]
+        except KeyError:
+            raise nx.NetworkXError(f"The node {node} is not in the digraph.") from None
+        return indices[indptr[i]:indptr[i + 1]]
+
+    def successors(self, node: str) -> Iterator[str]:
+        """
+        Iterate over the successors of a node.
+
+        Raises:
+            networkx.NetworkXError: If the node is not in the graph.
+        """
+        names = self._names
+        return (names[j] for j in self._neighbor_ids(self._succ(), node))
+
+    def predecessors(self, node: str) -> Iterator[str]:
+        """
+        Iterate over the predecessors of a node.
+
+        Raises:
+            networkx.NetworkXError: If the node is not in the graph.
+        """
+        names = self._names
+        return (names[j] for j in self._neighbor_ids(self._pred(), node))
+
+    def out_degree(self, node: str) -> int:
+        """Return the number of successors of a node."""
+        return len(self._neighbor_ids(self._succ(), node))
+
+    def in_degree(self, node: str) -> int:
+        """Return the number of predecessors of a node."""
+        return len(self._neighbor_ids(self._pred(), node))
+
+    def degree(self, node: str) -> int:
+        """Return the total (in + out) degree of a node."""
+        return self.in_degree(node) + self.out_degree(node)
+
+    def subgraph(self, nodes: Iterable[str]) -> "CSRGraph":
+        """
+        Build the subgraph induced by the given nodes.
+
+        Unlike ``networkx``, the result is an independent graph rather than
+        a view; node entities are shared with this graph.
+
+        Args:
+            nodes: Node names to keep. Unknown names are ignored.
+
+        Returns:
+            CSRGraph: The induced subgraph, in this graph's node order.
+        """
+        keep = np.zeros(len(self._names), dtype=bool)
+        for node in nodes:
+            node_id = self._index.get(node)
+            if node_id is not None:
+                keep[node_id] = True
+
+        old_ids = np.flatnonzero(keep)
+        new_ids = np.full(len(self._names), -1, dtype=np.int32)
+        new_ids[old_ids] = np.arange(len(old_ids), dtype=np.int32)
+
+        sub = CSRGraph()
+        sub._names = [self._names[i] for i in old_ids]
+        sub._index = {name: i for i, name in enumerate(sub._names)}
+        sub._type_names = list(self._type_names)
+        sub._type_codes = array("b", (self._type_codes[i] for i in old_ids))
+        sub._entities = [self._entities[i] for i in old_ids]
+        sub._extra_attrs = {
+            int(new_ids[i]): dict(attrs)
+            for i, attrs in self._extra_attrs.items()
+            if keep[i]
+        }
+
+        self._succ()
+        src = np.frombuffer(self._src, dtype=np.int32) if self._src else np.empty(0, np.int32)
+        dst = np.frombuffer(self._dst, dtype=np.int32) if self._dst else np.empty(0, np.int32)
+        mask = keep[src] & keep[dst]
+        sub._src = array("i", new_ids[src[mask]].tobytes())
+        sub._dst = array("i", new_ids[dst[mask]].tobytes())
+        return sub
+
+    def copy(self) -> "CSRGraph":
+        """
+        Return an independent copy of the graph (node entities are shared).
+
+        Returns:
+            CSRGraph: The copy.
+        """
+        return self.subgraph(self._names)
+
+    def bfs_depths(
+        self,
+        sources: List[str],
+        fanin: bool = True,
+        fanout: bool = True,
+        depth_limit: int = -1,
+    ) -> Dict[str, int]:
+        """
+        Breadth-first search over the CSR arrays with a boolean visited map.
+
+        Each level is expanded with vectorized gathers; the visit order is
+        the same as ``bfs_depths`` on a NetworkX graph.
+
+        Args:
+            sources: Start nodes (depth 0).
+            fanin: If True, follow incoming edges.
+            fanout: If True, follow outgoing edges.
+            depth_limit: Maximum depth to visit (-1 for unlimited).
+
+        Returns:
+            dict: Node -> depth, in visit order.
+
+        Raises:
+            networkx.NetworkXError: If a source is not in the graph.
+        """
+        csrs = ([self._pred()] if fanin else []) + ([self._succ()] if fanout else [])
+        try:
+            frontier = np.array(
+                list(dict.fromkeys(self._index[s] for s in sources)), dtype=np.int64
+            )
+        except KeyError as e:
+            raise nx.NetworkXError(f"The node {e.args[0]} is not in the digraph.") from None
+
+        visited = np.zeros(len(self._names), dtype=bool)
+        visited[frontier] = True
+        order = [frontier]
+        depths = [np.zeros(len(frontier), dtype=np.int64)]
+
+        level = 0
+        while len(frontier) and level != depth_limit and csrs:
+            level += 1
+            owners, kinds, candidates = [], [], []
+            for kind, (indptr, indices) in enumerate(csrs):
+                starts = indptr[frontier]
+                lengths = indptr[frontier + 1] - starts
+                offsets = np.arange(lengths.sum()) - np.repeat(
+                    np.cumsum(lengths) - lengths, lengths
+                )
+                owners.append(np.repeat(np.arange(len(frontier)), lengths))
+                kinds.append(np.full(len(offsets), kind))
+                candidates.append(indices[np.repeat(starts, lengths) + offsets])
+
+            # Order by frontier position, then predecessors before successors
+            sort = np.lexsort((np.concatenate(kinds), np.concatenate(owners)))
+            candidates = np.concatenate(candidates)[sort]
+            candidates = candidates[~visited[candidates]]
+            _, first = np.unique(candidates, return_index=True)
+            frontier = candidates[np.sort(first)].astype(np.int64)
+
+            visited[frontier] = True
+            order.append(frontier)
+            depths.append(np.full(len(frontier), level, dtype=np.int64))
+
+        names = self._names
+        return {
+            names[i]: d
+            for i, d in zip(np.concatenate(order).tolist(), np.concatenate(depths).tolist())
+        }
+
+    def to_networkx(self) -> nx.DiGraph:
+        """
+        Convert to a ``networkx.DiGraph`` with the same nodes, attributes
+        and edges.
+
+        Returns:
+            nx.DiGraph: The converted graph.
+        """
+        g = nx.DiGraph()
+        g.add_nodes_from((n, dict(attrs)) for n, attrs in self.nodes.data())
+        g.add_edges_from(self.edges)
+        return g
+
+
+def _csr(rows: np.ndarray, cols: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build CSR (indptr, indices) arrays from parallel row/column id arrays.
+
+    The sort is stable, so each row keeps its columns in insertion order.
+    """
+    order = np.argsort(rows, kind="stable")
+    indices = cols[order].astype(np.int32, copy=False)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    return indptr, indices
+
+
+def _neighbor_fn(graph: Any, fanin: bool, fanout: bool):
+    """Return a function listing the predecessors and/or successors of a node."""
+    if fanin and fanout:
+        return lambda n: [*graph.predecessors(n), *graph.successors(n)]
+    if fanin:
+        return graph.predecessors
+    if fanout:
+        return graph.successors
+    return lambda n: ()
+
+
+def _check_sources(graph: Any, sources: List[str]) -> None:
+    for source in sources:
+        if source not in graph:
+            raise nx.NetworkXError(f"The node {source} is not in the digraph.")
+
+
+def bfs_depths(
+    graph: Any,
+    sources: List[str],
+    fanin: bool = True,
+    fanout: bool = True,
+    depth_limit: int = -1,
+) -> Dict[str, int]:
+    """
+    Iterative breadth-first search from one or more sources.
+
+    Nodes are visited level by level; within a level, in the order they are
+    discovered (predecessors before successors). Each node is reported once
+    with its shortest distance from any source.
+
+    Args:
+        graph: ``networkx.DiGraph`` or ``CSRGraph``.
+        sources: Start nodes (depth 0).
+        fanin: If True, follow incoming edges.
+        fanout: If True, follow outgoing edges.
+        depth_limit: Maximum depth to visit (-1 for unlimited).
+
+    Returns:
+        dict: Node -> depth, in visit order.
+
+    Raises:
+        networkx.NetworkXError: If a source is not in the graph.
+    """
+    if isinstance(graph, CSRGraph):
+        return graph.bfs_depths(sources, fanin, fanout, depth_limit)
+
+    _check_sources(graph, sources)
+    neighbors = _neighbor_fn(graph, fanin, fanout)
+    depths = dict.fromkeys(sources, 0)
+    frontier = list(depths)
+    level = 0
+    while frontier and level != depth_limit:
+        level += 1
+        next_frontier = []
+        for node in frontier:
+            for n in neighbors(node):
+                if n not in depths:
+                    depths[n] = level
+                    next_frontier.append(n)
+        frontier = next_frontier
+    return depths
+
+
+def dfs_depths(
+    graph: Any,
+    sources: List[str],
+    fanin: bool = True,
+    fanout: bool = True,
+    depth_limit: int = -1,
+) -> Dict[str, int]:
+    """
+    Iterative depth-first search (preorder) from one or more sources.
+
+    Uses an explicit stack of neighbor iterators, so deep graphs do not hit
+    the interpreter recursion limit. Depths are DFS-tree depths; sources
+    are searched in order and share the visited set.
+
+    Args:
+        graph: ``networkx.DiGraph`` or ``CSRGraph``.
+        sources: Start nodes (depth 0).
+        fanin: If True, follow incoming edges.
+        fanout: If True, follow outgoing edges.
+        depth_limit: Maximum depth to visit (-1 for unlimited).
+
+    Returns:
+        dict: Node -> depth, in visit order.
+
+    Raises:
+        networkx.NetworkXError: If a source is not in the graph.
+    """
+    _check_sources(graph, sources)
+    neighbors = _neighbor_fn(graph, fanin, fanout)
+    depths: Dict[str, int] = {}
+    for source in sources:
+        if source in depths:
+            continue
+        depths[source] = 0
+        if depth_limit == 0:
+            continue
+        stack = [iter(neighbors(source))]
+        while stack:
+            n = next(stack[-1], _DONE)
+            if n is _DONE:
+                stack.pop()
+            elif n not in depths:
+                depths[n] = len(stack)
+                if len(stack) != depth_limit:
+                    stack.append(iter(neighbors(n)))
+    return depths
+
+
+def traverse_cones(
+    graph: Any,
+    sources: List[str],
+    fanin: bool = True,
+    fanout: bool = True,
+    depth_limit: int = -1,
+) -> Dict[str, List[str]]:
+    """
+    Compute the cone of every source in a single breadth-first pass.
+
+    Each node carries a bitmask of the sources that reached it; a level
+    only propagates the bits that are new to a node, so the pass is
+    equivalent to one BFS per source run in parallel.
+
+    Args:
+        graph: ``networkx.DiGraph`` or ``CSRGraph``.
+        sources: Start nodes.
+        fanin: If True, follow incoming edges (fan-in cones).
+        fanout: If True, follow outgoing edges (fan-out cones).
+        depth_limit: Maximum depth to visit (-1 for unlimited).
+
+    Returns:
+        dict: Source -> nodes of its cone, starting with the source and
+        ordered by distance from it.
+
+    Raises:
+        networkx.NetworkXError: If a source is not in the graph.
+    """
+    _check_sources(graph, sources)
+    sources = list(dict.fromkeys(sources))
+    neighbors = _neighbor_fn(graph, fanin, fanout)
+
+    cones: Dict[str, List[str]] = {source: [source] for source in sources}
+    reached = {source: 1 << i for i, source in enumerate(sources)}
+    frontier = dict(reached)
+    level = 0
+    while frontier and level != depth_limit:
+        level += 1
+        next_frontier: Dict[str, int] = {}
+        for node, bits in frontier.items():
+            for n in neighbors(node):
+                new_bits = bits & ~reached.get(n, 0)
+                if new_bits:
+                    next_frontier[n] = next_frontier.get(n, 0) | new_bits
+        for n, bits in next_frontier.items():
+            reached[n] = reached.get(n, 0) | bits
+            i = 0
+            while bits:
+                if bits & 1:
+                    cones[sources[i]].append(n)
+                bits >>= 1
+                i += 1
+        frontier = next_frontier
+    return cones
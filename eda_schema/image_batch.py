@@ -0,0 +1,274 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : eda_schema/image_batch.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""
+Batched image loading for model training.
+
+``load_image_batch`` stacks image fields of many entity rows into one
+preallocated ``(N, C, H, W)`` array, resizing or padding every image to a
+common shape. Images are decoded on a thread pool and resized results can
+be kept in an on-disk ``ImageCache``.
+"""
+
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from eda_schema import entity
+from eda_schema.db.base import BaseDB
+from eda_schema.errors import DataNotFoundError
+
+IMAGE_FIT_MODES = ("resize", "pad")
+DEFAULT_IMAGE_WORKERS = 8
+
+
+def resize_image(image: np.ndarray, shape: Tuple[int, int]) -> np.ndarray:
+    """
+    Resize a 2D image with bilinear interpolation (pixel-center aligned).
+
+    Args:
+        image (np.ndarray): Source image.
+        shape (tuple[int, int]): Target (height, width).
+
+    Returns:
+        np.ndarray: Resized float32 image.
+    """
+    image = np.asarray(image, dtype=np.float32)
+    if image.shape == tuple(shape):
+        return image
+
+    def axis_weights(size: int, target: int):
+        coords = np.clip((np.arange(target) + 0.5) * size / target - 0.5, 0, size - 1)
+        lo = np.floor(coords).astype(np.intp)
+        hi = np.minimum(lo + 1, size - 1)
+        return lo, hi, (coords - lo).astype(np.float32)
+
+    y0, y1, wy = axis_weights(image.shape[0], shape[0])
+    x0, x1, wx = axis_weights(image.shape[1], shape[1])
+
+    top = image[y0][:, x0] * (1 - wx) + image[y0][:, x1] * wx
+    bottom = image[y1][:, x0] * (1 - wx) + image[y1][:, x1] * wx
+    return top * (1 - wy)[:, None] + bottom * wy[:, None]
+
+
+def pad_image(
+    image: np.ndarray, shape: Tuple[int, int], fill_value: float = 0.0
+) -> np.ndarray:
+    """
+    Pad (or crop) a 2D image to a shape, keeping it in the top-left corner.
+
+    Args:
+        image (np.ndarray): Source image.
+        shape (tuple[int, int]): Target (height, width).
+        fill_value (float): Value of padded pixels.
+
+    Returns:
+        np.ndarray: Padded float32 image.
+    """
+    out = np.full(shape, fill_value, dtype=np.float32)
+    h, w = min(image.shape[0], shape[0]), min(image.shape[1], shape[1])
+    out[:h, :w] = image[:h, :w]
+    return out
+
+
+class ImageCache:
+    """
+    On-disk cache of resized images.
+
+    Entries are ``.npy`` files named by a hash of the image source (see
+    ``BaseDB.get_image_source``), target shape and fit mode, so a rewritten
+    source image never hits a stale entry.
+
+    Attributes:
+        root (Path): Cache directory.
+    """
+
+    def __init__(self, root: str | Path):
+        """
+        Initialize the cache.
+
+        Args:
+            root (str | Path): Cache directory; created on first write.
+        """
+        self.root = Path(root)
+
+    @staticmethod
+    def key(source: str, shape: Tuple[int, int], mode: str, fill_value: float) -> str:
+        """
+        Build the cache key of a resized image.
+
+        Args:
+            source (str): Source of the stored image.
+            shape (tuple[int, int]): Target (height, width).
+            mode (str): Fit mode ("resize" or "pad").
+            fill_value (float): Fill value of padded pixels.
+
+        Returns:
+            str: Hex digest naming the cache entry.
+        """
+        text = f"{source}|{shape[0]}x{shape[1]}|{mode}|{fill_value}"
+        return hashlib.sha1(text.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """
+        Read a cached image.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            np.ndarray | None: Memory-mapped cached image, or None on a miss.
+        """
+        path = self.root / f"{key}.npy"
+        if not path.exists():
+            return None
+        return np.load(path, mmap_mode="r")
+
+    def put(self, key: str, image: np.ndarray):
+        """
+        Write a cached image atomically.
+
+        Args:
+            key (str): Cache key.
+            image (np.ndarray): Resized image.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, image)
+        os.replace(tmp, self.root / f"{key}.npy")
+
+
+def _key_fields(entity_name: str, key: Any) -> Dict[str, Any]:
+    """
+    Turn a row key into primary-key fields.
+
+    Args:
+        entity_name (str): Name of the entity.
+        key (tuple | dict): Primary-key values in column order, or a dict.
+
+    Returns:
+        dict: Primary-key column -> value, in column order.
+
+    Raises:
+        ValueError: If a tuple key does not match the primary-key columns.
+    """
+    pk_cols = entity.SchemaMetadata.get_pk_columns(entity_name)
+    if isinstance(key, dict):
+        return {pk: key[pk] for pk in pk_cols}
+    if len(key) != len(pk_cols):
+        raise ValueError(
+            f"Key {key!r} does not match the primary key {pk_cols} of '{entity_name}'"
+        )
+    return dict(zip(pk_cols, key))
+
+
+def load_image_batch(
+    db: BaseDB,
+    entity_name: str,
+    keys: Sequence[Any],
+    fields: List[str],
+    shape: Tuple[int, int],
+    mode: str = "resize",
+    dtype: Any = np.float32,
+    fill_value: float = 0.0,
+    missing: str = "raise",
+    workers: int = DEFAULT_IMAGE_WORKERS,
+    cache_dir: Optional[str | Path] = None,
+) -> np.ndarray:
+    """
+    Load image fields of many entity rows into one ``(N, C, H, W)`` array.
+
+    Args:
+        db (BaseDB): Database holding the images.
+        entity_name (str): Name of the entity (e.g. "routability_metrics").
+        keys (list): One primary-key tuple (e.g. ``(flow_id, stage)``) or
+            dict per row.
+        fields (list[str]): Image fields, one channel each.
+        shape (tuple[int, int]): Target (height, width).
+        mode (str): "resize" interpolates every image to ``shape``; "pad"
+            pads or crops it, anchored at the top-left corner.
+        dtype: Dtype of the returned array.
+        fill_value (float): Value of padded pixels and missing images.
+        missing (str): "raise" or "fill" for images that are not stored.
+        workers (int): Threads decoding images.
+        cache_dir (str | Path | None): Directory of an ``ImageCache`` for
+            resized images; None disables caching.
+
+    Returns:
+        np.ndarray: Array of shape ``(len(keys), len(fields), H, W)``.
+
+    Raises:
+        ValueError: If an option is invalid or a key does not match the
+            entity's primary key.
+        DataNotFoundError: If an image is missing and ``missing="raise"``.
+    """
+    if mode not in IMAGE_FIT_MODES:
+        raise ValueError(f"Unknown mode '{mode}'. Expected one of {IMAGE_FIT_MODES}")
+    if missing not in ("raise", "fill"):
+        raise ValueError(f"Unknown missing policy '{missing}'. Expected 'raise' or 'fill'")
+    if len(shape) != 2 or min(shape) <= 0:
+        raise ValueError(f"shape must be a positive (height, width), got {shape}")
+    if workers <= 0:
+        raise ValueError(f"workers must be positive, got {workers}")
+
+    shape = (int(shape[0]), int(shape[1]))
+    key_fields = [_key_fields(entity_name, key) for key in keys]
+    cache = ImageCache(cache_dir) if cache_dir is not None else None
+    out = np.full((len(key_fields), len(fields), *shape), fill_value, dtype=dtype)
+
+    def fit(image: np.ndarray) -> np.ndarray:
+        if mode == "resize":
+            return resize_image(image, shape)
+        return pad_image(image, shape, fill_value)
+
+    def load(slot: Tuple[int, int]):
+        row, channel = slot
+        field = fields[channel]
+        cache_key = None
+        if cache is not None:
+            source = db.get_image_source(entity_name, field, **key_fields[row])
+            if source is not None:
+                cache_key = cache.key(source, shape, mode, fill_value)
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    out[row, channel] = cached
+                    return
+
+        try:
+            image = db.get_image(entity_name, field, **key_fields[row])
+        except DataNotFoundError:
+            if missing == "raise":
+                raise
+            return
+
+        fitted = fit(image)
+        out[row, channel] = fitted
+        if cache_key is not None:
+            cache.put(cache_key, fitted)
+
+    slots = [(row, channel) for row in range(len(key_fields)) for channel in range(len(fields))]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # list() re-raises the first worker exception
+        list(pool.map(load, slots))
+    return out
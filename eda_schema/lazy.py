@@ -0,0 +1,305 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : eda_schema/lazy.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""
+Proxies used by ``Dataset.load(lazy=True)`` to defer loading of design
+stages, netlists, timing paths and clock trees until first access.
+"""
+
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Optional, Tuple
+
+# Approximate resident size of one graph node or edge of a loaded netlist,
+# including its node entity (measured on OpenROAD netlists).
+GRAPH_ELEMENT_BYTES = 768
+
+
+class LazyDict(MutableMapping):
+    """
+    Mapping with a known set of keys whose values are loaded one by one
+    on first access.
+
+    Attributes:
+        loader (Callable): Called as ``loader(key)`` to load a value.
+    """
+
+    def __init__(self, keys: Iterable[Hashable], loader: Callable[[Hashable], Any]):
+        """
+        Initialize the lazy mapping.
+
+        Args:
+            keys (Iterable): Keys available in the mapping, in order.
+            loader (Callable): Function loading the value of a key.
+        """
+        self.loader = loader
+        self._keys = list(keys)
+        self._data: Dict[Hashable, Any] = {}
+
+    def is_loaded(self, key: Hashable) -> bool:
+        """
+        Check whether the value of a key has been loaded.
+
+        Args:
+            key: Mapping key.
+
+        Returns:
+            bool: True if the value is in memory.
+        """
+        return key in self._data
+
+    def __getitem__(self, key: Hashable) -> Any:
+        if key not in self._data:
+            if key not in self._keys:
+                raise KeyError(key)
+            self._data[key] = self.loader(key)
+        return self._data[key]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        if key not in self._keys:
+            self._keys.append(key)
+        self._data[key] = value
+
+    def __delitem__(self, key: Hashable) -> None:
+        self._keys.remove(key)
+        self._data.pop(key, None)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._keys))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __repr__(self) -> str:
+        loaded = sum(1 for key in self._keys if key in self._data)
+        return f"LazyDict(keys={self._keys!r}, loaded={loaded})"
+
+
+class LazyMapping(MutableMapping):
+    """
+    Mapping whose full contents are loaded by a single call on first access.
+
+    Attributes:
+        loader (Callable): Called without arguments to load the mapping.
+    """
+
+    def __init__(self, loader: Callable[[], Dict[Hashable, Any]]):
+        """
+        Initialize the lazy mapping.
+
+        Args:
+            loader (Callable): Function returning the full mapping.
+        """
+        self.loader = loader
+        self._data: Optional[Dict[Hashable, Any]] = None
+
+    @property
+    def loaded(self) -> bool:
+        """bool: True once the mapping has been loaded."""
+        return self._data is not None
+
+    def _materialize(self) -> Dict[Hashable, Any]:
+        if self._data is None:
+            self._data = dict(self.loader())
+        return self._data
+
+    def __getitem__(self, key: Hashable) -> Any:
+        return self._materialize()[key]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self._materialize()[key] = value
+
+    def __delitem__(self, key: Hashable) -> None:
+        del self._materialize()[key]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._materialize())
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._materialize()
+
+    def __repr__(self) -> str:
+        if self._data is None:
+            return "LazyMapping(<not loaded>)"
+        return f"LazyMapping({self._data!r})"
+
+
+def estimate_netlist_bytes(netlist: Any) -> int:
+    """
+    Estimate the memory held by a loaded netlist.
+
+    Counts the nodes and edges of the netlist graph and of its timing paths
+    and clock trees; lazy mappings that are not loaded yet count as empty.
+
+    Args:
+        netlist (NetlistEntity): Loaded netlist.
+
+    Returns:
+        int: Approximate size in bytes.
+    """
+    elements = len(netlist.nodes) + len(netlist.edges)
+    for graphs in (netlist.timing_paths, netlist.clock_trees):
+        if isinstance(graphs, LazyMapping) and not graphs.loaded:
+            continue
+        for graph in graphs.values():
+            elements += len(graph.nodes) + len(graph.edges)
+    return elements * GRAPH_ELEMENT_BYTES
+
+
+class NetlistCache:
+    """
+    Least-recently-used cache of materialized netlists bounded by an
+    approximate memory budget.
+
+    Sizes are estimated with ``estimate_netlist_bytes`` when a netlist is
+    inserted. The most recently loaded netlist is never evicted, even if it
+    alone exceeds the budget.
+
+    Attributes:
+        memory_budget (int | None): Budget in bytes, or None for no limit.
+    """
+
+    def __init__(self, memory_budget: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            memory_budget (int | None): Budget in bytes, or None for no limit.
+
+        Raises:
+            ValueError: If the budget is not positive.
+        """
+        if memory_budget is not None and memory_budget <= 0:
+            raise ValueError(f"memory_budget must be positive, got {memory_budget}")
+        self.memory_budget = memory_budget
+        self._entries: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+
+    def get(self, key: Tuple[str, str], loader: Callable[[], Any]) -> Any:
+        """
+        Return a cached netlist, loading and inserting it on a miss.
+
+        Args:
+            key (tuple[str, str]): (flow_id, stage) of the netlist.
+            loader (Callable): Function loading the netlist.
+
+        Returns:
+            NetlistEntity: The materialized netlist.
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        netlist = loader()
+        self._entries[key] = netlist
+        self._evict()
+        return netlist
+
+    def _evict(self) -> None:
+        """Drop least-recently-used netlists until the budget is met."""
+        if self.memory_budget is None:
+            return
+
+        sizes = {key: estimate_netlist_bytes(n) for key, n in self._entries.items()}
+        total = sum(sizes.values())
+        while total > self.memory_budget and len(self._entries) > 1:
+            key, _ = self._entries.popitem(last=False)
+            total -= sizes[key]
+
+    @property
+    def nbytes(self) -> int:
+        """int: Estimated size of all cached netlists in bytes."""
+        return sum(estimate_netlist_bytes(n) for n in self._entries.values())
+
+    def clear(self) -> None:
+        """Drop all cached netlists."""
+        self._entries.clear()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LazyNetlist:
+    """
+    Proxy for a ``NetlistEntity`` that is loaded on first attribute access.
+
+    The materialized netlist lives in a shared ``NetlistCache`` and may be
+    evicted; the next access reloads it from the database, so changes made
+    through the proxy are not kept across evictions.
+    """
+
+    __slots__ = ("_cache", "_key", "_loader")
+
+    def __init__(
+        self,
+        cache: NetlistCache,
+        key: Tuple[str, str],
+        loader: Callable[[], Any],
+    ):
+        """
+        Initialize the proxy.
+
+        Args:
+            cache (NetlistCache): Cache holding materialized netlists.
+            key (tuple[str, str]): (flow_id, stage) of the netlist.
+            loader (Callable): Function loading the netlist.
+        """
+        object.__setattr__(self, "_cache", cache)
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_loader", loader)
+
+    @property
+    def loaded(self) -> bool:
+        """bool: True if the netlist is currently held by the cache."""
+        return self._key in self._cache
+
+    def materialize(self) -> Any:
+        """
+        Load (or fetch from the cache) the proxied netlist.
+
+        Returns:
+            NetlistEntity: The materialized netlist.
+        """
+        return self._cache.get(self._key, self._loader)
+
+    def __getattr__(self, name: str) -> Any:
+        # Never materialize for protocol lookups (pickle, copy, ...)
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in LazyNetlist.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.materialize(), name, value)
+
+    def __repr__(self) -> str:
+        flow_id, stage = self._key
+        return (
+            f"LazyNetlist(flow_id={flow_id!r}, stage={stage!r}, "
+            f"loaded={self.loaded})"
+        )
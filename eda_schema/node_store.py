@@ -0,0 +1,209 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : eda_schema/node_store.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""
+Columnar storage for netlist node entities.
+
+A ``NodeTable`` keeps the rows of one node type (gates, pins, nets or ports)
+as one NumPy array per column with a name index. Netlist nodes reference
+their row through a ``NodeView`` that reads fields on demand and only
+builds the entity dataclass when ``to_entity()`` is called.
+"""
+
+from typing import Any, Dict, List, Type
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from eda_schema.base import BaseEntity
+
+NODE_STORES = ("object", "columnar")
+
+
+def _to_python(value: Any) -> Any:
+    """Convert NumPy scalars to the equivalent Python value."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class NodeTable:
+    """
+    Column store holding every node entity of one node type.
+
+    Attributes:
+        entity_cls (type): Entity class of the rows (e.g. GateEntity).
+        columns (dict[str, np.ndarray]): Column name -> values.
+        index (pd.Index): Node names, positionally aligned with the columns.
+    """
+
+    def __init__(
+        self,
+        entity_cls: Type[BaseEntity],
+        df: pd.DataFrame | pa.Table,
+        name_column: str = "name",
+    ):
+        """
+        Build the store from a node table.
+
+        Args:
+            entity_cls (type): Entity class of the rows.
+            df (pd.DataFrame | pa.Table): Node rows as returned by
+                ``get_table_data`` or ``get_table_arrow``.
+            name_column (str): Column holding the node names.
+        """
+        self.entity_cls = entity_cls
+        if isinstance(df, pa.Table):
+            self.columns: Dict[str, np.ndarray] = {
+                col: df.column(col).to_numpy(zero_copy_only=False)
+                for col in df.column_names
+                if not col.startswith("_")
+            }
+        else:
+            self.columns = {
+                col: df[col].to_numpy() for col in df.columns if not col.startswith("_")
+            }
+        self.index = pd.Index(self.columns[name_column])
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def value(self, column: str, row: int) -> Any:
+        """
+        Read one field of one row.
+
+        Args:
+            column (str): Column name.
+            row (int): Row position.
+
+        Returns:
+            Any: The field value as a Python object.
+        """
+        return _to_python(self.columns[column][row])
+
+    def row_dict(self, row: int) -> Dict[str, Any]:
+        """
+        Read all fields of one row.
+
+        Args:
+            row (int): Row position.
+
+        Returns:
+            dict: Column name -> value.
+        """
+        return {col: _to_python(values[row]) for col, values in self.columns.items()}
+
+    def rows_for(self, names: List[str]) -> np.ndarray:
+        """
+        Look up the row positions of many node names at once.
+
+        Args:
+            names (list[str]): Node names.
+
+        Returns:
+            np.ndarray: Row positions, aligned with ``names``.
+
+        Raises:
+            KeyError: If a name has no row in the table.
+        """
+        rows = self.index.get_indexer(names)
+        if (rows < 0).any():
+            missing = [name for name, row in zip(names, rows) if row < 0]
+            raise KeyError(
+                f"No {self.entity_cls.__name__} rows for nodes: {missing[:10]}"
+            )
+        return rows
+
+    def view(self, row: int) -> "NodeView":
+        """
+        Get a row view.
+
+        Args:
+            row (int): Row position.
+
+        Returns:
+            NodeView: View over the row.
+        """
+        return NodeView(self, row)
+
+
+class NodeView:
+    """
+    Read-only view of one row of a ``NodeTable``.
+
+    Attribute access reads the column value; ``to_entity()`` materializes
+    the entity dataclass.
+    """
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: NodeTable, row: int):
+        """
+        Initialize the view.
+
+        Args:
+            table (NodeTable): Table holding the row.
+            row (int): Row position.
+        """
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_row", int(row))
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        table = self._table
+        if name in table.columns:
+            return table.value(name, self._row)
+        # Methods and non-tabular fields come from the entity class
+        return getattr(self.to_entity(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            f"{type(self).__name__} is read-only; call to_entity() to get a "
+            f"mutable {self._table.entity_cls.__name__}"
+        )
+
+    def to_entity(self) -> BaseEntity:
+        """
+        Materialize the row as an entity dataclass.
+
+        Returns:
+            BaseEntity: A new entity instance holding the row values.
+        """
+        return self._table.entity_cls(**self._table.row_dict(self._row))
+
+    def get_tabular_data(self) -> Dict[str, Any]:
+        """
+        Return Arrow-compatible primitive fields, as the entity would.
+
+        Returns:
+            dict: Dictionary of field names to primitive values.
+        """
+        return self.to_entity().get_tabular_data()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, NodeView):
+            return self.to_entity() == other.to_entity()
+        if isinstance(other, BaseEntity):
+            return self.to_entity() == other
+        return NotImplemented
+
+    def __reduce__(self):
+        return (NodeView, (self._table, self._row))
+
+    def __repr__(self) -> str:
+        return f"{self._table.entity_cls.__name__}View({self._table.row_dict(self._row)})"
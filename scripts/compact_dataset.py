@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Compact an EDA-Schema ParquetDB dataset.
+
+Datasets written by several concurrent writers (``ParquetDB(...,
+writer_id=...)``) or by many appending dumps hold one fragment per commit.
+This script merges them into one file per table, graph table and image
+manifest (one per partition directory in the partitioned layout), sorted
+by primary key. Unless ``--merge-only`` is given, files without fragments
+are rewritten too, so every file gets the target row-group and page sizes,
+per-column codecs and dictionary encoding, statistics, a page index and
+primary-key bloom filters. Run it once no writer is active.
+
+Bytes on disk, and the latency of a full table scan and of a primary-key
+lookup, are reported per entity before and after compaction.
+
+Usage:
+    python scripts/compact_dataset.py dataset/nangate45_fullrun_combined
+    python scripts/compact_dataset.py dataset/nangate45_fullrun_combined --workers 8
+    python scripts/compact_dataset.py dataset/nangate45_fullrun_combined --entities gates nets
+    python scripts/compact_dataset.py dataset/nangate45_fullrun_combined --merge-only --no-latency
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+try:
+    from eda_schema import entity
+    from eda_schema.db import ParquetDB
+    from eda_schema.db.compaction import (
+        DEFAULT_COMPACTION_MEMORY,
+        DEFAULT_DATA_PAGE_SIZE,
+        DEFAULT_DICTIONARY_RATIO,
+        CompactionOptions,
+    )
+    from eda_schema.db.parquet import _read_arrow_table
+except ImportError as e:
+    print(f"Error: Missing required dependency: {e}")
+    print("Install with: pip install eda-schema")
+    sys.exit(1)
+
+
+def _best_of(repeat: int, read) -> float:
+    """
+    Time a read with a cold file cache of ParquetDB.
+
+    Args:
+        repeat (int): Number of timed runs.
+        read (callable): Read to time.
+
+    Returns:
+        float: Fastest run in milliseconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        _read_arrow_table.cache_clear()
+        start = time.perf_counter()
+        read()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def measure_latency(
+    dataset_dir: Path, entity_name: str, repeat: int
+) -> Optional[Tuple[float, float]]:
+    """
+    Measure the read latency of an entity table.
+
+    Args:
+        dataset_dir (Path): Dataset directory.
+        entity_name (str): Name of the entity.
+        repeat (int): Number of timed runs; the fastest is kept.
+
+    Returns:
+        tuple[float, float] | None: Full scan and primary-key lookup times
+        in milliseconds, or None if the entity has no rows.
+    """
+    db = ParquetDB(dataset_dir)
+    if not db.has_table(entity_name):
+        return None
+    pk_cols = entity.SchemaMetadata.get_pk_columns(entity_name)
+    first = db.get_table_arrow(entity_name, columns=pk_cols).slice(0, 1).to_pylist()
+    if not first:
+        return None
+    scan = _best_of(repeat, lambda: db.get_table_arrow(entity_name))
+    lookup = _best_of(repeat, lambda: db.get_table_arrow(entity_name, **first[0]))
+    return scan, lookup
+
+
+def _format_ms(latency: Optional[Tuple[float, float]], i: int) -> str:
+    """Format one latency of ``measure_latency``."""
+    return "-" if latency is None else f"{latency[i]:.1f}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compact an EDA-Schema ParquetDB dataset.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Compact and re-encode every entity
+  python scripts/compact_dataset.py dataset/nangate45_fullrun_combined
+
+  # Compact entities in 8 worker processes, with 1 GiB per sorted run
+  python scripts/compact_dataset.py dataset/nangate45_fullrun_combined --workers 8 --memory-mb 1024
+
+  # Only merge fragments, zstd for every column
+  python scripts/compact_dataset.py dataset/nangate45_fullrun_combined --merge-only --compression zstd
+        """
+    )
+    parser.add_argument(
+        "dataset_dir",
+        help="Path to dataset directory",
+    )
+    parser.add_argument(
+        "--entities",
+        nargs="+",
+        default=None,
+        help="Entities to compact (default: all)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes compacting entities in parallel (default: 1)",
+    )
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=None,
+        help="Maximum rows per row group (default: ParquetDB default)",
+    )
+    parser.add_argument(
+        "--merge-only",
+        action="store_true",
+        help="Only rewrite files with fragments to merge",
+    )
+    parser.add_argument(
+        "--compression",
+        default=None,
+        help="Codec for every column (default: zstd, snappy for floats)",
+    )
+    parser.add_argument(
+        "--data-page-size",
+        type=int,
+        default=DEFAULT_DATA_PAGE_SIZE,
+        help=f"Target uncompressed bytes per data page (default: {DEFAULT_DATA_PAGE_SIZE})",
+    )
+    parser.add_argument(
+        "--dictionary-ratio",
+        type=float,
+        default=DEFAULT_DICTIONARY_RATIO,
+        help="Distinct-to-row ratio up to which a column is dictionary-encoded "
+             f"(default: {DEFAULT_DICTIONARY_RATIO})",
+    )
+    parser.add_argument(
+        "--memory-mb",
+        type=int,
+        default=DEFAULT_COMPACTION_MEMORY // 2**20,
+        help="Memory per sorted run and worker in MiB "
+             f"(default: {DEFAULT_COMPACTION_MEMORY // 2**20})",
+    )
+    parser.add_argument(
+        "--no-indexes",
+        action="store_true",
+        help="Do not write page indexes and primary-key bloom filters",
+    )
+    parser.add_argument(
+        "--no-latency",
+        action="store_true",
+        help="Do not measure read latency before and after compaction",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Timed runs per latency measurement; the fastest is reported (default: 3)",
+    )
+    args = parser.parse_args()
+
+    dataset_dir = Path(args.dataset_dir).expanduser().resolve()
+    if not dataset_dir.exists():
+        print(f"Error: Dataset directory not found: {dataset_dir}")
+        return 1
+    known = {entity_name for entity_name, _ in entity.SchemaMetadata.items()}
+    unknown = sorted(set(args.entities or []) - known)
+    if unknown:
+        print(f"Error: Unknown entities: {', '.join(unknown)}")
+        return 1
+
+    try:
+        compaction = CompactionOptions(
+            rewrite=not args.merge_only,
+            data_page_size=args.data_page_size,
+            compression=args.compression,
+            dictionary_ratio=args.dictionary_ratio,
+            memory_bytes=args.memory_mb * 2**20,
+            indexes=not args.no_indexes,
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    names = args.entities or [entity_name for entity_name, _ in entity.SchemaMetadata.items()]
+    latency_before: Dict[str, Optional[Tuple[float, float]]] = {}
+    if not args.no_latency:
+        latency_before = {name: measure_latency(dataset_dir, name, args.repeat) for name in names}
+
+    options = {}
+    if args.row_group_size is not None:
+        options["row_group_size"] = args.row_group_size
+    db = ParquetDB(dataset_dir, **options)
+    results = db.compact(entities=names, workers=args.workers, options=compaction)
+
+    print(
+        f"{'entity':<24} {'files':>13} {'MB':>17}"
+        + ("" if args.no_latency else f" {'scan ms':>17} {'lookup ms':>17}")
+    )
+    for entity_name, counts in results.items():
+        if not counts["files_before"]:
+            continue
+        line = (
+            f"{entity_name:<24} {counts['files_before']:>6} → {counts['files_after']:<4}"
+            f" {counts['bytes_before'] / 2**20:>8.2f} → {counts['bytes_after'] / 2**20:<6.2f}"
+        )
+        if not args.no_latency:
+            before = latency_before[entity_name]
+            after = measure_latency(dataset_dir, entity_name, args.repeat)
+            line += (
+                f" {_format_ms(before, 0):>8} → {_format_ms(after, 0):<6}"
+                f" {_format_ms(before, 1):>8} → {_format_ms(after, 1):<6}"
+            )
+        print(line)
+
+    before = sum(counts["files_before"] for counts in results.values())
+    after = sum(counts["files_after"] for counts in results.values())
+    bytes_before = sum(counts["bytes_before"] for counts in results.values())
+    bytes_after = sum(counts["bytes_after"] for counts in results.values())
+    print(
+        f"\n✓ Compacted {before} file(s) into {after}, "
+        f"{bytes_before / 2**20:.2f} MB → {bytes_after / 2**20:.2f} MB"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,7 @@ This script runs comprehensive validation checks on a dataset, including:
 - Power delivery network (PDN) validation
 - Timing path consistency
 - Routability metrics validation
+- Catalog (catalog.json) consistency
 
 Uses lightweight get_graph_data() and get_table_data() to avoid expensive entity building.
 Optimized to load data once per (flow_id, phase) and cache for all validators.
@@ -25,7 +26,6 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import math
 import random
 import sys
@@ -44,8 +44,10 @@ from tqdm import tqdm
 
 try:
     from eda_schema.base import Image2D
+    from eda_schema.catalog import SCHEMA_VERSION, stale_files
     from eda_schema.dataset import Dataset
     from eda_schema.db import ParquetDB
+    from eda_schema.db.parquet import decode_graph_table
 except ImportError as e:
     print(f"Error: Missing required dependency: {e}")
     print("Install with: pip install eda-schema")
@@ -189,13 +191,12 @@ def load_validation_data(dataset: Dataset, flow_id: str, phase: str) -> Validati
             mask = pc.and_(flow_mask, stage_mask)
             filtered_table = table.filter(mask)
 
-            for i in range(filtered_table.num_rows):
-                row = filtered_table.slice(i, 1)
-                startpoint = row["startpoint"][0].as_py()
-                endpoint = row["endpoint"][0].as_py()
-                path_type = row["path_type"][0].as_py()
-                graph_json_str = row["graph_json"][0].as_py()
-                cache.timing_paths_graph_lookup[(startpoint, endpoint, path_type)] = json.loads(graph_json_str)
+            graphs = decode_graph_table(filtered_table)
+            for i, graph in enumerate(graphs):
+                startpoint = filtered_table["startpoint"][i].as_py()
+                endpoint = filtered_table["endpoint"][i].as_py()
+                path_type = filtered_table["path_type"][i].as_py()
+                cache.timing_paths_graph_lookup[(startpoint, endpoint, path_type)] = graph
     except Exception:
         pass
 
@@ -266,6 +267,65 @@ def validate_dataset_structure(dataset: Dataset, result: ValidationResult) -> No
             result.add_fail(f"Standard cell {cell_name} has invalid height: {std_cell.height}")
 
 
+def validate_catalog(dataset: Dataset, result: ValidationResult) -> None:
+    """Validate catalog.json against the files and flow/stage tables it describes."""
+    print("\n=== Catalog ===")
+    try:
+        catalog = dataset.db.read_catalog()
+    except Exception as e:
+        result.add_fail(f"Could not read catalog: {e}")
+        return
+    if catalog is None:
+        result.add_skip("No catalog.json (written by Dataset.dump)")
+        return
+
+    if catalog.get("schema_version") != SCHEMA_VERSION:
+        result.add_warning(
+            f"Catalog schema version {catalog.get('schema_version')} != {SCHEMA_VERSION}"
+        )
+
+    stale = stale_files(catalog, dataset.db)
+    if stale:
+        result.add_fail(
+            f"Catalog is out of date: {len(stale)} storage path(s) changed since it was written "
+            f"(e.g. {stale[0]})"
+        )
+    else:
+        result.add_pass()
+
+    flows_df = dataset.db.get_table_data("design_flows")
+    if sorted(flows_df["flow_id"]) != sorted(catalog["flows"]):
+        result.add_fail("Catalog flows do not match the design_flows table")
+    else:
+        result.add_pass()
+
+    stages_df = dataset.db.get_table_data("design_stages")
+    table_stages = set(zip(stages_df["flow_id"], stages_df["stage"]))
+    catalog_stages = {
+        (flow_id, stage)
+        for flow_id, flow in catalog["flows"].items()
+        for stage in flow["stages"]
+    }
+    if table_stages != catalog_stages:
+        result.add_fail(
+            f"Catalog stages do not match the design_stages table "
+            f"({len(catalog_stages)} vs {len(table_stages)})"
+        )
+    else:
+        result.add_pass()
+
+    for entity_name in ["design_flows", "design_stages", "standard_cells"]:
+        rows = catalog["tables"][entity_name]["rows"]
+        actual = len(dataset.db.get_table_data(entity_name))
+        if rows != actual:
+            result.add_fail(f"Catalog row count of {entity_name}: {rows} != {actual}")
+        else:
+            result.add_pass()
+
+    total_rows = sum(table["rows"] for table in catalog["tables"].values())
+    print(f"✓ Catalog: {len(catalog['flows'])} flow(s), {total_rows} rows")
+
+
 def validate_flow_structure(dataset: Dataset, flow_id: str, result: ValidationResult) -> None:
     """Validate a single flow's structure using table data."""
     # Check flow exists in database
@@ -1160,12 +1220,17 @@ Examples:
         if args.flow_id:
             flow_ids = [args.flow_id]
         else:
-            # Get flow IDs from database without loading full flows
-            flows_df = dataset.db.get_table_data("design_flows")
-            flow_ids = list(flows_df["flow_id"].unique())
+            # Get flow IDs from the catalog, or the database without loading full flows
+            catalog = dataset.catalog
+            if catalog is not None:
+                flow_ids = list(catalog["flows"])
+            else:
+                flows_df = dataset.db.get_table_data("design_flows")
+                flow_ids = list(flows_df["flow_id"].unique())
             if args.sample and args.sample < len(flow_ids):
+                total_flows = len(flow_ids)
                 flow_ids = random.sample(flow_ids, args.sample)
-                print(f"Sampling {args.sample} flows from {len(flows_df)} total flows")
+                print(f"Sampling {args.sample} flows from {total_flows} total flows")
 
         print(f"Validating {len(flow_ids)} flow(s) across {len(args.phases)} phase(s)")
         print("(Using cached data loading - each (flow_id, phase) loaded once)")
@@ -1178,6 +1243,7 @@ Examples:
 
     # Dataset-level validation
     validate_dataset_structure(dataset, result)
+    validate_catalog(dataset, result)
 
     # Flow-level validation
     print("\n=== Flow Structure ===")
@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : tests/data/test_columnar_nodes.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""Node store tests - verify columnar node views match entity dataclasses."""
+import math
+
+import pytest
+
+from eda_schema.dataset import Dataset
+from eda_schema.db import ParquetDB
+from eda_schema.node_store import NodeView
+from tests.data.conftest import DATASET_DIR, FLOW_ID, PHASES, get_netlist
+
+
+@pytest.fixture(scope="module")
+def columnar_dataset():
+    """Load the dataset with the columnar node store."""
+    dataset = Dataset(ParquetDB(DATASET_DIR), node_store="columnar")
+    dataset.load(flow_id=FLOW_ID)
+    return dataset
+
+
+def _same(a, b):
+    return a == b or (isinstance(a, float) and isinstance(b, float)
+                      and math.isnan(a) and math.isnan(b))
+
+
+@pytest.mark.parametrize("phase", PHASES)
+def test_columnar_nodes_match_objects(dataset, columnar_dataset, phase):
+    """Check every node view reads the same values as the loaded entity."""
+    eager = get_netlist(dataset, phase)
+    columnar = get_netlist(columnar_dataset, phase)
+
+    for node, data in columnar.nodes.items():
+        view = data["entity"]
+        assert isinstance(view, NodeView)
+        expected = eager.nodes[node]["entity"].get_tabular_data()
+        actual = view.get_tabular_data()
+        assert expected.keys() == actual.keys()
+        assert all(_same(expected[k], actual[k]) for k in expected), node
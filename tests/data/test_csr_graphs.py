@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : tests/data/test_csr_graphs.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""CSR graph tests - verify CSR-backed graphs match the NetworkX backend."""
+import pytest
+
+from eda_schema.dataset import Dataset
+from eda_schema.db import ParquetDB
+from tests.data.conftest import DATASET_DIR, FLOW_ID, PHASES, get_netlist
+
+
+@pytest.fixture(scope="module")
+def csr_dataset():
+    """Load the dataset with the CSR graph backend."""
+    dataset = Dataset(ParquetDB(DATASET_DIR), graph_backend="csr")
+    dataset.load(flow_id=FLOW_ID)
+    return dataset
+
+
+@pytest.mark.parametrize("phase", PHASES)
+def test_csr_netlist_matches_networkx(dataset, csr_dataset, phase):
+    """Check netlist graphs and node entities match the NetworkX backend."""
+    expected = get_netlist(dataset, phase)
+    actual = get_netlist(csr_dataset, phase)
+
+    assert actual.graph_backend == "csr"
+    assert list(actual.nodes) == list(expected.nodes)
+    assert list(actual.edges) == list(expected.edges)
+    for node in list(expected.nodes)[:200]:
+        node_entity = actual.nodes[node]["entity"]
+        assert type(node_entity) is type(expected.nodes[node]["entity"])
+        assert node_entity.name == node
+
+
+@pytest.mark.parametrize("phase", PHASES)
+def test_csr_sub_graphs_match_networkx(dataset, csr_dataset, phase):
+    """Check timing path and clock tree graphs match the NetworkX backend."""
+    expected = get_netlist(dataset, phase)
+    actual = get_netlist(csr_dataset, phase)
+
+    for graphs, csr_graphs in [(expected.timing_paths, actual.timing_paths),
+                               (expected.clock_trees, actual.clock_trees)]:
+        assert graphs.keys() == csr_graphs.keys()
+        for key, graph in graphs.items():
+            assert csr_graphs[key].get_graph_data() == graph.get_graph_data()
@@ -0,0 +1,90 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : tests/data/test_lazy_loading.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""Lazy loading tests - verify a lazily loaded dataset matches the eager one."""
+import shutil
+
+import pytest
+
+from eda_schema import entity
+from eda_schema.dataset import Dataset
+from eda_schema.db import ParquetDB
+from eda_schema.lazy import LazyNetlist
+from tests.data.conftest import DATASET_DIR, FLOW_ID, PHASES, get_netlist
+
+
+@pytest.fixture(scope="module")
+def lazy_dataset():
+    """Load the dataset lazily with a budget that holds a single netlist."""
+    dataset = Dataset(ParquetDB(DATASET_DIR), netlist_memory_budget=1)
+    dataset.load(flow_id=FLOW_ID, lazy=True)
+    return dataset
+
+
+def test_lazy_load_defers_stages(lazy_dataset):
+    """Check no stage is loaded until accessed."""
+    stages = lazy_dataset[FLOW_ID].stages
+    assert list(stages) == PHASES
+    assert not any(stages.is_loaded(phase) for phase in stages)
+
+
+@pytest.mark.parametrize("phase", PHASES)
+def test_lazy_netlist_matches_eager(dataset, lazy_dataset, phase):
+    """Check lazily loaded netlists match the eagerly loaded ones."""
+    eager = get_netlist(dataset, phase)
+    lazy = get_netlist(lazy_dataset, phase)
+
+    assert isinstance(lazy, LazyNetlist)
+    assert lazy.get_tabular_data() == eager.get_tabular_data()
+    assert set(lazy.nodes) == set(eager.nodes)
+    assert set(lazy.edges) == set(eager.edges)
+    assert set(lazy.timing_paths) == set(eager.timing_paths)
+    assert set(lazy.clock_trees) == set(eager.clock_trees)
+
+
+def test_lazy_netlist_cache_budget(lazy_dataset):
+    """Check the memory budget keeps only the most recently used netlist."""
+    for phase in PHASES[:2]:
+        get_netlist(lazy_dataset, phase).materialize()
+    assert len(lazy_dataset.netlist_cache) == 1
+    assert get_netlist(lazy_dataset, PHASES[1]).loaded
+    assert not get_netlist(lazy_dataset, PHASES[0]).loaded
+
+
+
+@pytest.mark.parametrize("target", ["same", "other"])
+def test_lazy_load_then_dump(tmp_path, target):
+    """Check a lazily loaded dataset dumps every row, to its own db or another."""
+    source_dir = tmp_path / "source"
+    shutil.copytree(DATASET_DIR, source_dir)
+    dataset = Dataset(ParquetDB(source_dir))
+    dataset.load(flow_id=FLOW_ID, lazy=True)
+    dataset[FLOW_ID].constraints = dataset.db.get_entity("constraints", flow_id=FLOW_ID)
+    if target == "other":
+        dataset.db = ParquetDB(tmp_path / "target")
+    dataset.dump()
+    dataset.db.close()
+
+    source, dumped = ParquetDB(DATASET_DIR), ParquetDB(dataset.db.data_home)
+    for table in ["design_stages", "gates", "nets", "timing_paths", "clock_trees"]:
+        columns = entity.SchemaMetadata.get_pk_columns(table)
+        expected = source.get_table_data(table, flow_id=FLOW_ID)[columns]
+        assert not expected.empty, table
+        assert sorted(map(tuple, dumped.get_table_data(table)[columns].values)) == sorted(
+            map(tuple, expected.values)
+        ), table
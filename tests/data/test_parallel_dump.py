@@ -0,0 +1,164 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : tests/data/test_parallel_dump.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""Parallel dump tests - verify a pipelined dump writes the same tables as a serial one."""
+import multiprocessing
+import pickle
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from eda_schema import dataset as dataset_module
+from eda_schema import entity
+from eda_schema.catalog import build_catalog
+from eda_schema.dataset import Dataset, design_stage_writes
+from eda_schema.db import ParquetDB
+from eda_schema.db.image_store import EncodedImage
+from tests.data.conftest import DATASET_DIR, FLOW_ID
+
+
+def _without_fingerprints(catalog):
+    """Drop the storage fingerprints of a catalog's tables."""
+    tables = {
+        name: {key: value for key, value in table.items() if key != "fingerprint"}
+        for name, table in catalog["tables"].items()
+    }
+    return dict(catalog, tables=tables)
+
+
+@pytest.fixture(scope="module")
+def dumped(dataset, tmp_path_factory):
+    """Dump the dataset serially and with two workers."""
+    source = ParquetDB(DATASET_DIR)
+    dataset[FLOW_ID].constraints = source.get_entity("constraints", flow_id=FLOW_ID)
+    original_db = dataset.db
+
+    dirs = {}
+    for workers in [None, 2]:
+        dirs[workers] = tmp_path_factory.mktemp(f"dump_{workers}")
+        dataset.db = ParquetDB(dirs[workers])
+        dataset.dump(workers=workers)
+        dataset.db.close()
+    dataset.db = original_db
+    return dirs
+
+
+def test_parallel_dump_tables_match(dumped):
+    """Check every table matches the serial dump."""
+    serial, parallel = ParquetDB(dumped[None]), ParquetDB(dumped[2])
+    for entity_name, _ in entity.SchemaMetadata.items():
+        if not (Path(dumped[None]) / entity_name).exists():
+            continue
+        expected = serial.get_table_data(entity_name)
+        assert parallel.get_table_data(entity_name).equals(expected), entity_name
+
+
+def test_parallel_dump_graphs_match(dumped):
+    """Check graph payloads match the serial dump."""
+    serial, parallel = ParquetDB(dumped[None]), ParquetDB(dumped[2])
+    for stage in ["floorplan", "final"]:
+        assert (parallel.get_graph_data("netlists", flow_id=FLOW_ID, stage=stage)
+                == serial.get_graph_data("netlists", flow_id=FLOW_ID, stage=stage))
+
+
+def test_dump_catalog(dumped):
+    """Check the dump catalogs match each other and the written tables."""
+    serial, parallel = ParquetDB(dumped[None]), ParquetDB(dumped[2])
+    catalog = serial.read_catalog()
+    # Fingerprints hold file modification times, which differ between dumps
+    assert _without_fingerprints(parallel.read_catalog()) == _without_fingerprints(catalog)
+    assert list(catalog["flows"]) == [FLOW_ID]
+    assert list(catalog["flows"][FLOW_ID]["stages"]) == [s.value for s in entity.DesignStages]
+
+    for entity_name, table in catalog["tables"].items():
+        assert table["rows"] == len(serial.get_table_data(entity_name)), entity_name
+    stage = catalog["flows"][FLOW_ID]["stages"]["final"]
+    gates = serial.get_table_data("gates", flow_id=FLOW_ID, stage="final")
+    assert stage["rows"]["gates"] == len(gates)
+    assert stage["graphs"]["timing_paths"] == stage["rows"]["timing_paths"]
+
+
+def test_rebuilt_catalog_matches_dump(dumped):
+    """Check a catalog rebuilt from the stored tables matches the dumped one."""
+    db = ParquetDB(dumped[None])
+    catalog = build_catalog(db)
+    dumped_catalog = db.read_catalog()
+    assert catalog["flows"] == dumped_catalog["flows"]
+    for entity_name, table in catalog["tables"].items():
+        expected = dumped_catalog["tables"][entity_name]
+        assert {key: expected[key] for key in table} == table, entity_name
+
+
+def test_dump_stage_summaries(dumped):
+    """Check the dumped stage summaries match a join of the source tables."""
+    summary = Dataset(ParquetDB(dumped[None])).summary()
+    assert list(summary["stage"]) == [s.value for s in entity.DesignStages]
+    pd.testing.assert_frame_equal(
+        Dataset(ParquetDB(dumped[2])).summary(), summary, check_dtype=False
+    )
+    pd.testing.assert_frame_equal(
+        Dataset(ParquetDB(DATASET_DIR)).summary(flow_id=FLOW_ID), summary, check_dtype=False
+    )
+
+
+def test_dump_worker_encodes_writes(dataset, tmp_path, monkeypatch):
+    """Check a forked worker reads its stage from the dumped dataset and encodes it."""
+    design_stage = dataset[FLOW_ID].stages["cts"]
+    monkeypatch.setattr(dataset, "db", ParquetDB(tmp_path))
+    monkeypatch.setattr(dataset_module, "_dump_dataset", dataset)
+    writes, counts = pickle.loads(dataset_module._dump_stage_worker(FLOW_ID, "cts"))
+
+    methods = {method for method, _, _ in writes}
+    assert methods == {"add_table_arrow", "add_graph_arrow", "add_images"}
+    images = [image for method, args, _ in writes if method == "add_images"
+              for image in args[1].values() if image is not None]
+    assert images and all(isinstance(image, EncodedImage) for image in images)
+    assert counts.to_dict()["flows"][FLOW_ID]["stages"]["cts"]["rows"]["gates"] > 0
+
+    # Without the inherited dataset the stage comes with the task, unencoded
+    monkeypatch.setattr(dataset_module, "_dump_dataset", None)
+    writes, _ = pickle.loads(dataset_module._dump_stage_worker(FLOW_ID, "cts", design_stage))
+    assert "add_graph_data" in {method for method, _, _ in writes}
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(),
+                    reason="workers only encode when forked")
+def test_parallel_dump_parent_cost(dataset, tmp_path):
+    """Check the dumping process spends less CPU than serial extraction alone."""
+    source = ParquetDB(DATASET_DIR)
+    dataset[FLOW_ID].constraints = source.get_entity("constraints", flow_id=FLOW_ID)
+    original_db = dataset.db
+
+    start = time.process_time()
+    for stage_enum in entity.DesignStages:
+        stage = stage_enum.value
+        design_stage_writes(dataset[FLOW_ID].stages[stage], FLOW_ID, stage)
+    extraction = time.process_time() - start
+
+    dataset.db = ParquetDB(tmp_path)
+    try:
+        # process_time excludes the worker processes
+        start = time.process_time()
+        dataset.dump(workers=2)
+        dataset.db.close()
+        parent = time.process_time() - start
+    finally:
+        dataset.db = original_db
+    assert parent < extraction
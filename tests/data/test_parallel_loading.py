@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : tests/data/test_parallel_loading.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""Parallel loading tests - verify a multi-process load matches the eager one."""
+import pytest
+
+from eda_schema.dataset import Dataset
+from eda_schema.db import ParquetDB
+from tests.data.conftest import DATASET_DIR, FLOW_ID, PHASES, get_design_stage, get_netlist
+
+
+@pytest.fixture(scope="module")
+def parallel_dataset():
+    """Load the dataset with two worker processes."""
+    dataset = Dataset(ParquetDB(DATASET_DIR))
+    dataset.load(flow_id=FLOW_ID, workers=2)
+    return dataset
+
+
+def test_parallel_load_flow(dataset, parallel_dataset):
+    """Check flows and their stages are assembled in order."""
+    assert list(parallel_dataset) == [FLOW_ID]
+    assert list(parallel_dataset[FLOW_ID].stages) == PHASES
+    assert parallel_dataset[FLOW_ID].get_tabular_data() == dataset[FLOW_ID].get_tabular_data()
+    assert parallel_dataset.standard_cells.keys() == dataset.standard_cells.keys()
+
+
+@pytest.mark.parametrize("phase", PHASES)
+def test_parallel_stage_matches_eager(dataset, parallel_dataset, phase):
+    """Check stages loaded by workers match the eagerly loaded ones."""
+    eager_stage = get_design_stage(dataset, phase)
+    stage = get_design_stage(parallel_dataset, phase)
+    assert stage.get_tabular_data() == eager_stage.get_tabular_data()
+    assert stage.timing_metrics == eager_stage.timing_metrics
+
+    eager = get_netlist(dataset, phase)
+    netlist = get_netlist(parallel_dataset, phase)
+    assert netlist.get_tabular_data() == eager.get_tabular_data()
+    assert set(netlist.nodes) == set(eager.nodes)
+    assert set(netlist.edges) == set(eager.edges)
+    assert set(netlist.timing_paths) == set(eager.timing_paths)
+    assert set(netlist.clock_trees) == set(eager.clock_trees)
+
+
+def test_parallel_load_single_stage():
+    """Check a stage filter limits the shards to that stage."""
+    dataset = Dataset(ParquetDB(DATASET_DIR), graph_backend="csr", node_store="columnar")
+    dataset.load(flow_id=FLOW_ID, stage="cts", workers=2)
+    assert list(dataset[FLOW_ID].stages) == ["cts"]
+    assert len(get_netlist(dataset, "cts").nodes) > 0
@@ -27,7 +27,7 @@ import numpy as np
 
 from eda_schema.dataset import Dataset
 from eda_schema.db import ParquetDB
-from eda_schema.db.parquet import _load_arrow_table
+from eda_schema.db.parquet import _read_arrow_table
 from eda_schema import entity
 from eda_schema.base import Image2D
 from eda_schema.errors import DataNotFoundError
@@ -538,7 +538,7 @@ class TestErrorHandlingIntegration:
         db.close()
 
         # Clear cache to ensure fresh read
-        _load_arrow_table.cache_clear()
+        _read_arrow_table.cache_clear()
 
         # Create new DB instance to avoid cache issues
         db2 = ParquetDB(str(db_path))
@@ -0,0 +1,207 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : tests/unit/test_caching_db.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""
+Tests for the read-through caching database wrapper.
+"""
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from eda_schema import entity
+from eda_schema.base import Image2D
+from eda_schema.db import CachingDB, FileDB, ParquetDB
+from eda_schema.db.caching import estimate_bytes
+from eda_schema.errors import DataNotFoundError
+
+
+def _metrics_row(data, stage):
+    """A timing_metrics row of flow f1."""
+    return entity.TimingMetricsEntity(**dict(data, flow_id='f1', stage=stage)).get_tabular_data()
+
+
+@pytest.fixture(params=['file', 'parquet'])
+def cached_db(request, temp_dir, sample_timing_metrics_data):
+    """CachingDB over a backend holding one timing_metrics row."""
+    path = Path(temp_dir) / 'db'
+    if request.param == 'file':
+        db = FileDB(path)
+    else:
+        db = ParquetDB(path, layout='partitioned')
+    db.create_dataset_tables()
+    db.add_table_row('timing_metrics', _metrics_row(sample_timing_metrics_data, 'cts'))
+    if request.param == 'parquet':
+        db.commit()
+    return CachingDB(db)
+
+
+def _count_calls(monkeypatch, db, method):
+    """Record the calls reaching a method of the wrapped database."""
+    calls = []
+    original = getattr(db, method)
+    monkeypatch.setattr(db, method, lambda *a, **k: calls.append((a, k)) or original(*a, **k))
+    return calls
+
+
+class TestCachingDB:
+    """Test caching, invalidation and eviction."""
+
+    def test_table_reads_are_cached(self, cached_db, monkeypatch):
+        """Test repeated reads are answered from the cache with copies."""
+        calls = _count_calls(monkeypatch, cached_db.db, 'get_table_data')
+        df = cached_db.get_table_data('timing_metrics', flow_id='f1', stage=['cts'])
+        df['worst_slack'] = 0.0
+
+        again = cached_db.get_table_data('timing_metrics', flow_id='f1', stage=['cts'])
+        assert len(calls) == 1
+        assert (again['worst_slack'] != 0.0).all()
+        assert cached_db.stats.to_dict() == {
+            'hits': 1, 'misses': 1, 'evictions': 0,
+            'spills': 0, 'spill_hits': 0, 'invalidations': 0,
+        }
+
+        cached_db.get_table_data('timing_metrics', flow_id='f1', stage=['final'])
+        assert len(calls) == 2
+
+    def test_writes_invalidate(self, cached_db, sample_timing_metrics_data):
+        """Test writes through the wrapper drop the entity's cached results."""
+        assert len(cached_db.get_table_data('timing_metrics')) == 1
+        cached_db.get_table_data('design_flows')
+
+        cached_db.add_table_row('timing_metrics', _metrics_row(sample_timing_metrics_data, 'final'))
+        assert cached_db.stats.invalidations == 1
+        assert len(cached_db) == 1
+        assert len(cached_db.get_table_data('timing_metrics')) == 2
+
+    def test_delegates_other_attributes(self, cached_db):
+        """Test methods and attributes of the wrapped database stay reachable."""
+        assert cached_db.catalog_path == Path(cached_db.db.data_home) / 'catalog.json'
+        assert len(cached_db.get_table_row('timing_metrics', flow_id='f1', stage='cts')) > 0
+        assert 'table' in cached_db.storage_files('timing_metrics')
+
+    def test_rollback_clears(self, temp_dir, sample_timing_metrics_data):
+        """Test rolled-back rows are not served from the cache."""
+        db = CachingDB(ParquetDB(Path(temp_dir) / 'db', layout='partitioned'))
+        db.create_dataset_tables()
+        db.add_table_row('timing_metrics', _metrics_row(sample_timing_metrics_data, 'floorplan'))
+        db.commit()
+        db.add_table_row('timing_metrics', _metrics_row(sample_timing_metrics_data, 'cts'))
+        assert sorted(db.get_table_data('timing_metrics')['stage']) == ['cts', 'floorplan']
+
+        db.rollback()
+        assert db.get_table_data('timing_metrics')['stage'].tolist() == ['floorplan']
+        db.get_table_data('timing_metrics')
+        db.compact(entities=['timing_metrics'])
+        assert len(db) == 0
+
+    def test_graphs(self, temp_dir, monkeypatch):
+        """Test graphs are cached and batched reads fetch only the misses."""
+        db = CachingDB(FileDB(Path(temp_dir) / 'db'))
+        db.create_dataset_tables()
+        for stage in ['cts', 'final']:
+            db.add_graph_data('netlists', {'nodes': [stage]}, flow_id='f1', stage=stage)
+
+        assert db.get_graph_data('netlists', flow_id='f1', stage='cts') == {'nodes': ['cts']}
+        calls = _count_calls(monkeypatch, db.db, 'get_graph_data_for_keys')
+        keys = [{'flow_id': 'f1', 'stage': 'cts'}, {'flow_id': 'f1', 'stage': 'final'}]
+        assert db.get_graph_data_for_keys('netlists', keys) == [
+            {'nodes': ['cts']}, {'nodes': ['final']}
+        ]
+        assert calls == [(('netlists', keys[1:]), {})]
+        assert db.get_graph_data('netlists', flow_id='f1', stage='final') == {'nodes': ['final']}
+        assert db.stats.hits == 2
+
+        db.add_graph_data_batch('netlists', [{'flow_id': 'f1', 'stage': 'cts', 'data': {'nodes': []}}])
+        assert db.get_graph_data('netlists', flow_id='f1', stage='cts') == {'nodes': []}
+
+    def test_eviction_by_bytes(self, temp_dir):
+        """Test least-recently-used results are evicted to stay in budget."""
+        image = Image2D(np.ones((32, 32)))
+        db = CachingDB(FileDB(Path(temp_dir) / 'db'), max_bytes=2 * image.nbytes)
+        for stage in ['floorplan', 'cts', 'final']:
+            db.add_image('netlists', 'cell_placement', image, flow_id='f1', stage=stage)
+
+        for stage in ['floorplan', 'cts', 'floorplan', 'final']:
+            loaded = db.get_image('netlists', 'cell_placement', flow_id='f1', stage=stage)
+            assert np.array_equal(loaded, image) and not loaded.flags.writeable
+        assert db.stats.evictions == 1
+        assert db.nbytes == 2 * image.nbytes
+
+        db.get_image('netlists', 'cell_placement', flow_id='f1', stage='floorplan')
+        db.get_image('netlists', 'cell_placement', flow_id='f1', stage='cts')
+        assert (db.stats.hits, db.stats.misses) == (2, 4)
+
+    def test_spill_to_disk(self, temp_dir, monkeypatch):
+        """Test evicted results are read back from the spill directory."""
+        image = Image2D(np.arange(16.0).reshape(4, 4))
+        spill_dir = Path(temp_dir) / 'spill'
+        db = CachingDB(FileDB(Path(temp_dir) / 'db'), max_bytes=image.nbytes, spill_dir=spill_dir)
+        for stage in ['cts', 'final']:
+            db.add_image('netlists', 'cell_placement', image * len(stage), flow_id='f1', stage=stage)
+        for stage in ['cts', 'final']:
+            db.get_image('netlists', 'cell_placement', flow_id='f1', stage=stage)
+        assert db.stats.spills == 1 and len(list(spill_dir.glob('*.pkl'))) == 1
+
+        calls = _count_calls(monkeypatch, db.db, 'get_image')
+        loaded = db.get_image('netlists', 'cell_placement', flow_id='f1', stage='cts')
+        assert np.array_equal(loaded, image * 3) and isinstance(loaded, Image2D)
+        assert calls == [] and db.stats.spill_hits == 1
+
+        db.add_image('netlists', 'cell_placement', image, flow_id='f1', stage='final')
+        assert list(spill_dir.glob('*.pkl')) == []
+
+    def test_missing_images_are_cached(self, temp_dir, monkeypatch):
+        """Test probes for images that are not stored reach the backend once."""
+        db = CachingDB(FileDB(Path(temp_dir) / 'db'))
+        calls = _count_calls(monkeypatch, db.db, 'get_image')
+        for _ in range(2):
+            with pytest.raises(DataNotFoundError, match="cell_placement"):
+                db.get_image('netlists', 'cell_placement', flow_id='f1', stage='cts')
+        assert len(calls) == 1
+
+        db.add_image('netlists', 'cell_placement', Image2D(np.ones((2, 2))), flow_id='f1', stage='cts')
+        assert db.get_image('netlists', 'cell_placement', flow_id='f1', stage='cts').sum() == 4
+
+    def test_oversized_results_not_cached(self, temp_dir):
+        """Test a result larger than the budget is returned but not kept."""
+        image = Image2D(np.ones((8, 8)))
+        db = CachingDB(FileDB(Path(temp_dir) / 'db'), max_bytes=image.nbytes - 1)
+        db.add_image('netlists', 'cell_placement', image, flow_id='f1', stage='cts')
+        assert np.array_equal(db.get_image('netlists', 'cell_placement', flow_id='f1', stage='cts'), image)
+        assert len(db) == 0 and db.nbytes == 0
+
+    def test_pickle_drops_entries(self, cached_db):
+        """Test pickled wrappers start with an empty cache."""
+        cached_db.get_table_data('timing_metrics')
+        restored = pickle.loads(pickle.dumps(cached_db))
+        assert len(restored) == 0 and restored.stats.misses == 0
+        assert len(restored.get_table_data('timing_metrics')) == 1
+
+    def test_invalid_budget(self, temp_dir):
+        """Test budgets must be positive."""
+        with pytest.raises(ValueError, match="max_bytes"):
+            CachingDB(FileDB(Path(temp_dir) / 'db'), max_bytes=0)
+
+    def test_estimate_bytes(self):
+        """Test graph dictionaries count their contents."""
+        small = estimate_bytes({'nodes': ['a'], 'edges': []})
+        large = estimate_bytes({'nodes': [f'n{i}' for i in range(1000)], 'edges': []})
+        assert large > small + 1000 * 40
+        assert estimate_bytes(np.zeros(10)) == 80
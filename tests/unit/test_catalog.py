@@ -0,0 +1,241 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : tests/unit/test_catalog.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""
+Tests for dataset catalogs.
+"""
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from eda_schema import entity
+from eda_schema.base import Image2D
+from eda_schema.catalog import (
+    CATALOG_VERSION,
+    SCHEMA_VERSION,
+    CatalogBuilder,
+    stage_rows,
+    stale_files,
+)
+from eda_schema.dataset import Dataset
+from eda_schema.db import FileDB, ParquetDB, SQLitePickleDB
+
+
+def _writes():
+    """Writes of one flow with two stages and a standard cell."""
+    image = Image2D(np.zeros((2, 2)))
+    return [
+        ('add_table_data', ('standard_cells', [{'name': 'INV_X1'}]), {}),
+        ('add_table_row', ('design_flows', {'flow_id': 'f1'}), {}),
+        ('add_table_data', ('gates', [{'flow_id': 'f1', 'stage': 'floorplan', 'name': 'u1'},
+                                      {'flow_id': 'f1', 'stage': 'floorplan', 'name': 'u2'},
+                                      {'flow_id': 'f1', 'stage': 'cts', 'name': 'u1'}]), {}),
+        ('add_graph_data', ('netlists', {}), {'flow_id': 'f1', 'stage': 'cts'}),
+        ('add_graph_data_batch', ('timing_paths', [{'flow_id': 'f1', 'stage': 'cts', 'data': {}}]), {}),
+        ('add_images', ('routability_metrics', {'rudy_net': image, 'rudy_pin': None},
+                        {'congestion': {'met1': image, 'met2': image}}),
+         {'flow_id': 'f1', 'stage': 'cts'}),
+        ('flush', (), {}),
+    ]
+
+
+def _metrics_row(data, stage):
+    """A timing_metrics row of flow f1."""
+    return entity.TimingMetricsEntity(**dict(data, flow_id='f1', stage=stage)).get_tabular_data()
+
+
+def _db(kind, path, data):
+    """Create a backend with one stored timing_metrics row."""
+    db = {'parquet': ParquetDB, 'file': FileDB, 'sqlite': SQLitePickleDB}[kind](path)
+    db.create_dataset_tables()
+    db.add_table_row('timing_metrics', _metrics_row(data, 'cts'))
+    if kind == 'parquet':
+        db.close()
+    return db
+
+
+class TestCatalogBuilder:
+    """Test collecting catalogs from dump writes."""
+
+    def test_counts(self):
+        """Test rows, graphs and images are counted per table and per stage."""
+        builder = CatalogBuilder()
+        builder.record(_writes())
+        catalog = builder.to_dict()
+
+        assert catalog['catalog_version'] == CATALOG_VERSION
+        assert catalog['schema_version'] == SCHEMA_VERSION
+        assert list(catalog['flows']) == ['f1']
+        flow = catalog['flows']['f1']
+        assert flow['rows'] == {'design_flows': 1}
+        assert list(flow['stages']) == ['floorplan', 'cts']
+        assert flow['stages']['floorplan']['rows'] == {'gates': 2}
+        assert flow['stages']['cts'] == {
+            'rows': {'gates': 1},
+            'graphs': {'netlists': 1, 'timing_paths': 1},
+            'images': {'routability_metrics': {'rudy_net': 1, 'congestion': 2}},
+        }
+
+        tables = catalog['tables']
+        assert tables['standard_cells']['rows'] == 1
+        assert tables['gates']['rows'] == 3
+        assert tables['timing_paths']['graphs'] == 1
+        assert tables['routability_metrics']['images'] == {'rudy_net': 1, 'congestion': 2}
+        assert tables['nets'] == {'rows': 0, 'graphs': 0, 'images': {}}
+
+    def test_merge(self):
+        """Test merging builders that recorded parts of the writes."""
+        writes = _writes()
+        builder, part = CatalogBuilder(), CatalogBuilder()
+        builder.record(writes[:3])
+        part.record(writes[3:])
+        builder.merge(part)
+
+        expected = CatalogBuilder()
+        expected.record(writes)
+        assert builder.to_dict() == expected.to_dict()
+
+    def test_stage_rows(self):
+        """Test total rows of a stage across tables."""
+        builder = CatalogBuilder()
+        builder.record(_writes())
+        catalog = builder.to_dict()
+        assert stage_rows(catalog, 'f1', 'floorplan') == 2
+        assert stage_rows(catalog, 'f1', 'final') == 0
+        assert stage_rows(catalog, 'f9', 'cts') == 0
+
+
+class TestCatalogFile:
+    """Test writing, reading and checking catalog.json."""
+
+    @pytest.mark.parametrize('kind', ['parquet', 'file', 'sqlite'])
+    def test_round_trip(self, temp_dir, kind, sample_timing_metrics_data):
+        """Test the written catalog adds sizes and is read back unchanged."""
+        db = _db(kind, Path(temp_dir) / 'db', sample_timing_metrics_data)
+        builder = CatalogBuilder()
+        builder.record(_writes()[1:2])
+        db.write_catalog(builder.to_dict())
+
+        assert db.catalog_path == Path(temp_dir) / 'db' / 'catalog.json'
+        catalog = db.read_catalog()
+        assert catalog['backend'] == type(db).__name__
+        assert catalog['flows'] == {'f1': {'rows': {'design_flows': 1}, 'stages': {}}}
+        table = catalog['tables']['timing_metrics']
+        assert table['bytes']['table'] == sum(table['files'].values()) > 0
+        if kind == 'sqlite':
+            assert list(table['files']) == ['tabular.db']
+        assert stale_files(catalog, db) == []
+
+        db.remove_catalog()
+        assert db.read_catalog() is None
+        db.remove_catalog()
+
+    @pytest.mark.parametrize('layout', ['single', 'partitioned'])
+    def test_parquet_files(self, temp_dir, layout, sample_timing_metrics_data):
+        """Test table and graph files are listed for both layouts."""
+        db = ParquetDB(Path(temp_dir) / 'db', layout=layout)
+        db.create_dataset_tables()
+        for stage in ['floorplan', 'cts']:
+            db.add_table_row('timing_metrics', _metrics_row(sample_timing_metrics_data, stage))
+        db.add_graph_data('netlists', {'nodes': [], 'node_types': [], 'edges': []},
+                          flow_id='f1', stage='cts')
+        db.close()
+        db.write_catalog(CatalogBuilder().to_dict())
+
+        tables = db.read_catalog()['tables']
+        files, graph_files = tables['timing_metrics']['files'], tables['netlists']['files']
+        if layout == 'single':
+            assert list(files) == ['timing_metrics/table.parquet']
+            assert list(graph_files) == ['netlists/table.parquet', 'netlists/graph.parquet']
+        else:
+            assert sorted(files) == [
+                'timing_metrics/table/flow_id=f1/stage=cts/part-0.parquet',
+                'timing_metrics/table/flow_id=f1/stage=floorplan/part-0.parquet',
+            ]
+            assert list(graph_files) == ['netlists/graph/flow_id=f1/stage=cts/part-0.parquet']
+
+    def test_parquet_fingerprint(self, temp_dir, sample_timing_metrics_data):
+        """Test partitioned tables are fingerprinted by their root directory."""
+        db = ParquetDB(Path(temp_dir) / 'db', layout='partitioned')
+        db.create_dataset_tables()
+        db.add_table_row('timing_metrics', _metrics_row(sample_timing_metrics_data, 'cts'))
+        db.close()
+        db.write_catalog(CatalogBuilder().to_dict())
+        table = db.read_catalog()['tables']['timing_metrics']
+        assert list(table['fingerprint']) == ['timing_metrics/table']
+        assert stale_files(db.read_catalog(), db) == []
+
+        # A fragment added to an existing partition directory
+        writer = ParquetDB(Path(temp_dir) / 'db', layout='partitioned')
+        writer.add_table_row('timing_metrics', _metrics_row(sample_timing_metrics_data, 'cts'))
+        writer.close()
+        assert stale_files(db.read_catalog(), db) == ['timing_metrics/table']
+
+    def test_parquet_waits_for_close(self, temp_dir, sample_timing_metrics_data):
+        """Test ParquetDB writes the catalog only once its files are complete."""
+        db = ParquetDB(Path(temp_dir) / 'db')
+        db.create_dataset_tables()
+        db.add_table_row('timing_metrics', _metrics_row(sample_timing_metrics_data, 'cts'))
+        db.write_catalog(CatalogBuilder().to_dict())
+        assert db.read_catalog() is None
+
+        db.close()
+        catalog = db.read_catalog()
+        assert catalog is not None and stale_files(catalog, db) == []
+
+    def test_stale_files(self, temp_dir, sample_timing_metrics_data):
+        """Test files changed after the catalog was written are reported."""
+        db = _db('file', Path(temp_dir) / 'db', sample_timing_metrics_data)
+        db.write_catalog(CatalogBuilder().to_dict())
+        db.add_table_row('timing_metrics', _metrics_row(sample_timing_metrics_data, 'final'))
+        db.add_graph_data('netlists', {'nodes': []}, flow_id='f1', stage='cts')
+
+        stale = stale_files(db.read_catalog(), db)
+        assert stale == ['netlists/graphs/flow_id=f1__stage=cts.json', 'timing_metrics/table.csv']
+
+    def test_sqlite_row_writes_stale(self, temp_dir, sample_timing_metrics_data):
+        """Test a row write to any SQLite table makes the catalog stale."""
+        db = _db('sqlite', Path(temp_dir) / 'db', sample_timing_metrics_data)
+        db.write_catalog(CatalogBuilder().to_dict())
+        dataset = Dataset(db)
+        assert dataset.catalog is not None
+
+        db.add_table_row('timing_metrics', _metrics_row(sample_timing_metrics_data, 'final'))
+        assert dataset.catalog is None
+        assert 'tabular.db' in stale_files(db.read_catalog(), db)
+
+    def test_newer_version_rejected(self, temp_dir):
+        """Test catalogs written by a newer release are rejected."""
+        db = FileDB(Path(temp_dir) / 'db')
+        db.catalog_path.write_text(json.dumps({'catalog_version': CATALOG_VERSION + 1}))
+        with pytest.raises(ValueError, match="newer than the supported version"):
+            db.read_catalog()
+
+    def test_dataset_ignores_stale_catalog(self, temp_dir, sample_timing_metrics_data):
+        """Test Dataset only uses a catalog matching the files."""
+        db = _db('file', Path(temp_dir) / 'db', sample_timing_metrics_data)
+        builder = CatalogBuilder()
+        builder.record(_writes()[1:2])
+        db.write_catalog(builder.to_dict())
+        dataset = Dataset(db)
+        assert list(dataset.catalog['flows']) == ['f1']
+
+        db.add_table_row('timing_metrics', _metrics_row(sample_timing_metrics_data, 'final'))
+        assert dataset.catalog is None
@@ -0,0 +1,176 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : tests/unit/test_compaction.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""
+Tests for sorting, encoding and writing compacted Parquet files.
+"""
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from eda_schema import entity
+from eda_schema.db import ParquetDB
+from eda_schema.db.compaction import (
+    CompactionOptions,
+    column_encodings,
+    sort_batches,
+    write_row_groups,
+)
+
+
+def _batches(table, rows):
+    """Split a table into tables of ``rows`` rows."""
+    return [table.slice(i, rows) for i in range(0, table.num_rows, rows)]
+
+
+@pytest.fixture
+def unsorted_table():
+    """Rows with a two-column key in no particular order."""
+    keys = [(i * 7919) % 100 for i in range(100)]
+    return pa.table({
+        'stage': ['cts' if k % 3 else 'final' for k in keys],
+        'name': [f'u{k:03d}' for k in keys],
+        'slack': [k / 10 for k in keys],
+        'fanout': [[k, k + 1] for k in keys],
+    })
+
+
+class TestColumnEncodings:
+    """Test the per-column codec and dictionary policy."""
+
+    def test_policy(self, unsorted_table):
+        """Test floats use the float codec and repetitive strings a dictionary."""
+        codecs, dictionary = column_encodings(unsorted_table, CompactionOptions())
+        assert codecs['slack'] == 'snappy'
+        assert codecs['name'] == codecs['fanout.list.element'] == 'zstd'
+        assert 'stage' in dictionary
+        assert 'name' not in dictionary and 'slack' not in dictionary
+
+    def test_overrides(self, unsorted_table):
+        """Test a global codec and the dictionary ratio are honoured."""
+        options = CompactionOptions(compression='gzip', dictionary_ratio=1.0)
+        codecs, dictionary = column_encodings(unsorted_table, options)
+        assert set(codecs.values()) == {'gzip'}
+        assert {'stage', 'name', 'slack', 'fanout.list.element'} <= set(dictionary)
+
+    def test_empty_sample(self, unsorted_table):
+        """Test empty tables dictionary-encode strings only."""
+        _, dictionary = column_encodings(unsorted_table.slice(0, 0), CompactionOptions())
+        assert dictionary == ['stage', 'name']
+
+
+class TestSortBatches:
+    """Test the external merge sort."""
+
+    @pytest.mark.parametrize('memory_bytes', [1, 500, 10**9])
+    def test_sorted_output(self, unsorted_table, temp_dir, memory_bytes):
+        """Test spilled and in-memory sorts match a full sort."""
+        ordering = [('stage', 'ascending'), ('name', 'ascending')]
+        result = pa.concat_tables(sort_batches(
+            _batches(unsorted_table, 8), ordering, memory_bytes, Path(temp_dir), batch_rows=5
+        ))
+        assert result.equals(unsorted_table.sort_by(ordering))
+        assert list(Path(temp_dir).iterdir()) == []
+
+    def test_no_ordering(self, unsorted_table, temp_dir):
+        """Test rows pass through unchanged without sort keys."""
+        result = pa.concat_tables(sort_batches(
+            _batches(unsorted_table, 8), [], 1, Path(temp_dir), batch_rows=5
+        ))
+        assert result.equals(unsorted_table)
+
+
+class TestWriteRowGroups:
+    """Test writing compacted files."""
+
+    def test_row_groups_and_statistics(self, unsorted_table, temp_dir):
+        """Test row groups have exactly the target size and carry statistics."""
+        path = Path(temp_dir) / 'out.parquet'
+        write_row_groups(_batches(unsorted_table, 7), path, unsorted_table.schema, 30,
+                         CompactionOptions(), {'write_page_index': True})
+
+        metadata = pq.read_metadata(path)
+        sizes = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+        assert sizes == [30, 30, 30, 10]
+        column = metadata.row_group(0).column(2)
+        assert column.path_in_schema == 'slack'
+        assert column.compression == 'SNAPPY' and column.is_stats_set
+        assert column.has_column_index
+        assert pq.read_table(path).equals(unsorted_table)
+
+    def test_empty_input(self, unsorted_table, temp_dir):
+        """Test no rows still give a readable file."""
+        path = Path(temp_dir) / 'out.parquet'
+        write_row_groups([], path, unsorted_table.schema, 30, CompactionOptions(), {})
+        assert pq.read_table(path).schema.names == unsorted_table.schema.names
+
+
+class TestCompactionOptions:
+    """Test option validation."""
+
+    @pytest.mark.parametrize('kwargs, match', [
+        ({'memory_bytes': 0}, 'memory_bytes'),
+        ({'data_page_size': -1}, 'data_page_size'),
+        ({'dictionary_ratio': 1.5}, 'dictionary_ratio'),
+        ({'compression': 'nope'}, 'nope'),
+    ])
+    def test_invalid(self, kwargs, match):
+        """Test invalid settings are rejected."""
+        with pytest.raises(ValueError, match=match):
+            CompactionOptions(**kwargs)
+
+
+class TestParquetDBRewrite:
+    """Test ParquetDB.compact with re-encoding options."""
+
+    @pytest.fixture(params=['single', 'partitioned'])
+    def db(self, request, temp_dir, sample_gate_data):
+        """Dataset with gates written in one unsorted commit."""
+        db = ParquetDB(Path(temp_dir) / 'test_db', layout=request.param,
+                       row_group_size=4, sort_by_pk=False)
+        db.create_dataset_tables()
+        for i in [7, 3, 9, 1, 5, 8, 2, 6, 4, 0]:
+            gate = entity.GateEntity(**dict(sample_gate_data, name=f'u{i}'))
+            db.add_table_row('gates', gate.get_tabular_data())
+        db.commit()
+        return db
+
+    def test_rewrite(self, db):
+        """Test a rewrite sorts with spilled runs and writes indexes."""
+        options = CompactionOptions(rewrite=True, memory_bytes=1)
+        results = db.compact(entities=['gates'], options=options)
+
+        files = db.storage_files('gates')['table']
+        assert results['gates']['files_after'] == len(files) == 1
+        assert results['gates']['bytes_after'] == files[0].stat().st_size
+        assert results['gates']['bytes_before'] > 0
+        metadata = pq.read_metadata(files[0])
+        assert [metadata.row_group(i).num_rows for i in range(3)] == [4, 4, 2]
+        assert metadata.row_group(0).sorting_columns
+        assert metadata.row_group(0).column(0).has_offset_index
+        assert pq.read_table(files[0]).column('name').to_pylist() == [f'u{i}' for i in range(10)]
+        assert not (db.data_home / '.staging').exists()
+
+    def test_merge_only_keeps_files(self, db):
+        """Test files without fragments are left alone by default."""
+        files = db.storage_files('gates')['table']
+        mtimes = [p.stat().st_mtime_ns for p in files]
+        db.compact(entities=['gates'])
+        assert [p.stat().st_mtime_ns for p in db.storage_files('gates')['table']] == mtimes
@@ -19,13 +19,16 @@
 """
 Tests for Dataset class.
 """
+import shutil
 from pathlib import Path
 
 import pytest
 
+from eda_schema import dataset as dataset_module
 from eda_schema.dataset import Dataset, StandardCellData
-from eda_schema.db import ParquetDB
+from eda_schema.db import FileDB, ParquetDB
 from eda_schema import entity
+from eda_schema.errors import DuplicateKeyError
 
 
 class TestDataset:
@@ -39,6 +42,41 @@ class TestDataset:
         assert dataset is not None
         assert dataset.db == db
 
+    def test_dataset_invalid_table_format(self, temp_dir):
+        """Test unknown table formats are rejected."""
+        with pytest.raises(ValueError, match="Unknown table format"):
+            Dataset(FileDB(str(temp_dir)), table_format='polars')
+
+    def test_dataset_load_invalid_workers(self, temp_dir):
+        """Test worker counts are validated before loading."""
+        dataset = Dataset(ParquetDB(str(temp_dir)))
+        with pytest.raises(ValueError, match="workers must be positive"):
+            dataset.load(workers=0)
+        with pytest.raises(ValueError, match="lazy"):
+            dataset.load(lazy=True, workers=4)
+
+    @pytest.mark.parametrize('table_format', ['pandas', 'arrow'])
+    def test_dataset_attach_node_entities(self, temp_dir, sample_netlist_data,
+                                          sample_gate_data, sample_net_data,
+                                          table_format):
+        """Test netlist nodes get entities in both table formats."""
+        db = ParquetDB(str(temp_dir))
+        db.create_dataset_tables()
+        db.add_table_row('gates', entity.GateEntity(**sample_gate_data).get_tabular_data())
+        db.add_table_row('nets', entity.NetEntity(**sample_net_data).get_tabular_data())
+        netlist = entity.NetlistEntity(**sample_netlist_data)
+        netlist.add_node('gate_001', type='GATE', entity=None)
+        netlist.add_node('net_001', type='NET', entity=None)
+
+        dataset = Dataset(db, table_format=table_format)
+        dataset._attach_node_entities(netlist, netlist.flow_id, netlist.stage)  # pylint: disable=protected-access
+
+        gate = netlist.nodes['gate_001']['entity']
+        assert isinstance(gate, entity.GateEntity)
+        assert gate.standard_cell == sample_gate_data['standard_cell']
+        assert gate.x_min == sample_gate_data['x_min']
+        assert netlist.nodes['net_001']['entity'].length == sample_net_data['length']
+
     def test_dataset_standard_cells(self, sample_dataset, sample_standard_cell_data):
         """Test Dataset standard cells management."""
         std_cell = entity.StandardCellEntity(**sample_standard_cell_data)
@@ -178,6 +216,22 @@ class TestStandardCellData:
         with pytest.raises(ValueError, match="empty design flow entry"):
             dataset.dump()
 
+    def test_dataset_dump_invalid_options(self, temp_dir):
+        """Test worker and queue sizes are validated before dumping."""
+        dataset = Dataset(ParquetDB(str(Path(temp_dir) / "test_db")))
+        dataset['test_flow'] = None
+        with pytest.raises(ValueError, match="workers must be positive"):
+            dataset.dump(workers=0)
+        with pytest.raises(ValueError, match="queue_size must be positive"):
+            dataset.dump(workers=2, queue_size=0)
+
+    def test_dataset_dump_parallel_none_flow(self, temp_dir):
+        """Test a parallel dump checks every flow before starting workers."""
+        dataset = Dataset(ParquetDB(str(Path(temp_dir) / "test_db")))
+        dataset['test_flow'] = None
+        with pytest.raises(ValueError, match="empty design flow entry"):
+            dataset.dump(workers=2)
+
     def test_dataset_dump_design_stage_none_netlist(self, temp_dir):
         """Test dump_design_stage handles None netlist."""
         db_path = Path(temp_dir) / "test_db"
@@ -200,3 +254,347 @@ class TestStandardCellData:
 
         # Should not raise
         dataset.dump_design_stage(design_stage, 'test_flow', 'floorplan')
+
+
+class TestGroupArcRecords:
+    """Test grouping of timing arc rows by timing path."""
+
+    def test_group_arc_records(self):
+        """Test arcs are grouped per (startpoint, endpoint, path_type)."""
+        import pandas as pd
+
+        from eda_schema.dataset import group_arc_records
+
+        arc_df = pd.DataFrame({
+            'startpoint': ['a', 'a', 'b'],
+            'endpoint': ['z', 'z', 'z'],
+            'path_type': ['max', 'max', 'min'],
+            'net_name': ['n1', 'n2', 'n1'],
+            'delay': [0.1, 0.2, 0.3],
+        })
+
+        grouped = group_arc_records(arc_df, 'net_name')
+        assert set(grouped) == {('a', 'z', 'max'), ('b', 'z', 'min')}
+        assert set(grouped[('a', 'z', 'max')]) == {'n1', 'n2'}
+        assert grouped[('b', 'z', 'min')]['n1']['delay'] == 0.3
+
+    def test_group_arc_rows_matches_records(self):
+        """Test grouping row dicts matches grouping the DataFrame."""
+        import pandas as pd
+
+        from eda_schema.dataset import group_arc_records, group_arc_rows
+
+        rows = [
+            {'startpoint': 'a', 'endpoint': 'z', 'path_type': 'max', 'gate_name': 'g1', 'delay': 0.1},
+            {'startpoint': 'a', 'endpoint': 'z', 'path_type': 'max', 'gate_name': 'g2', 'delay': 0.2},
+            {'startpoint': 'b', 'endpoint': 'z', 'path_type': 'min', 'gate_name': 'g1', 'delay': 0.3},
+        ]
+        assert group_arc_rows(rows, 'gate_name') == group_arc_records(pd.DataFrame(rows), 'gate_name')
+        assert group_arc_rows([], 'gate_name') == {}
+
+    def test_group_arc_records_empty(self):
+        """Test an empty arc table yields no groups."""
+        import pandas as pd
+
+        from eda_schema.dataset import group_arc_records
+
+        assert group_arc_records(pd.DataFrame(), 'gate_name') == {}
+
+
+class TestDumpPipeline:
+    """Test deferred writes and the writer thread of pipelined dumps."""
+
+    def test_design_stage_writes_none_netlist(self):
+        """Test a stage without netlist only writes its own row and summary."""
+        from eda_schema.dataset import design_stage_writes
+
+        design_stage = entity.DesignStageEntity(flow_id='f', stage='floorplan', netlist=None)
+        writes = design_stage_writes(design_stage, 'f', 'floorplan')
+        summary = entity.StageSummaryEntity(flow_id='f', stage='floorplan')
+        assert writes == [
+            ('add_table_row', ('design_stages', design_stage.get_tabular_data()), {}),
+            ('add_table_row', ('stage_summaries', summary.get_tabular_data()), {}),
+        ]
+
+    def test_writer_thread_applies_in_order(self):
+        """Test queued writes are applied in order by close()."""
+        from eda_schema.dataset import WriterThread
+
+        class RecordingDB:  # pylint: disable=too-few-public-methods
+            """Records add_table_row calls."""
+            def __init__(self):
+                self.rows = []
+
+            def add_table_row(self, entity_name, row):
+                """Record a row."""
+                self.rows.append((entity_name, row))
+
+        db = RecordingDB()
+        writer = WriterThread(db, queue_size=1)
+        writer.start()
+        for i in range(5):
+            writer.put([('add_table_row', ('gates', {'i': i}), {})])
+        writer.close()
+        assert db.rows == [('gates', {'i': i}) for i in range(5)]
+
+    def test_writer_thread_reraises(self):
+        """Test a failed write is re-raised by close() and later puts."""
+        from eda_schema.dataset import WriterThread
+
+        class FailingDB:  # pylint: disable=too-few-public-methods
+            """Fails every write."""
+            def add_table_row(self, entity_name, row):
+                """Fail."""
+                raise OSError(f"disk full writing {entity_name}")
+
+        writer = WriterThread(FailingDB(), queue_size=1)
+        writer.start()
+        writer.put([('add_table_row', ('gates', {}), {})])
+        with pytest.raises(OSError, match="disk full"):
+            writer.close()
+        assert not writer.is_alive()
+        with pytest.raises(OSError, match="disk full"):
+            writer.put([('add_table_row', ('gates', {}), {})])
+
+
+
+class TestStageSummary:
+    """Test stage summary rows and Dataset.summary."""
+
+    @pytest.fixture
+    def summary_db(self, temp_dir, sample_timing_metrics_data, sample_area_metrics_data):
+        """ParquetDB with summaries of two flows, written out of stage order."""
+        db = ParquetDB(Path(temp_dir) / "test_db")
+        db.create_dataset_tables()
+        for flow_id in ['f2', 'f1']:
+            for i, stage in enumerate(['final', 'floorplan', 'cts']):
+                design_stage = entity.DesignStageEntity(
+                    flow_id=flow_id, stage=stage, run_status='ok',
+                    timing_metrics=entity.TimingMetricsEntity(
+                        **dict(sample_timing_metrics_data, worst_slack=float(i))),
+                    area_metrics=entity.AreaMetricsEntity(**sample_area_metrics_data))
+                db.add_table_row('design_stages', design_stage.get_tabular_data())
+                db.add_table_row('stage_summaries', dataset_module.stage_summary(
+                    design_stage, flow_id, stage).get_tabular_data())
+        db.close()
+        return db
+
+    def test_stage_summary(self, sample_netlist_data, sample_power_metrics_data,
+                           sample_timing_metrics_data):
+        """Test a summary row takes the stage's scalar metrics."""
+        design_stage = entity.DesignStageEntity(
+            flow_id='f', stage='cts', run_status='ok',
+            netlist=entity.NetlistEntity(**sample_netlist_data),
+            power_metrics=entity.PowerMetricsEntity(**sample_power_metrics_data),
+            timing_metrics=entity.TimingMetricsEntity(**sample_timing_metrics_data))
+        summary = dataset_module.stage_summary(design_stage, 'f', 'cts')
+
+        assert (summary.flow_id, summary.stage, summary.run_status) == ('f', 'cts', 'ok')
+        assert summary.no_of_cells == sample_netlist_data['no_of_cells']
+        assert summary.total_power == sample_power_metrics_data['total_power']
+        assert summary.worst_slack == sample_timing_metrics_data['worst_slack']
+        assert summary.total_area is None
+
+    def test_summary_covers_source_columns(self, sample_netlist_data, sample_cell_metrics_data,
+                                           sample_area_metrics_data, sample_power_metrics_data,
+                                           sample_timing_metrics_data):
+        """Test every scalar column of the source tables is summarized."""
+        sources = {
+            'netlists': entity.NetlistEntity(**sample_netlist_data),
+            'cell_metrics': entity.CellMetricsEntity(**sample_cell_metrics_data),
+            'area_metrics': entity.AreaMetricsEntity(**sample_area_metrics_data),
+            'power_metrics': entity.PowerMetricsEntity(**sample_power_metrics_data),
+            'timing_metrics': entity.TimingMetricsEntity(**sample_timing_metrics_data),
+        }
+        assert list(sources) == dataset_module.STAGE_SUMMARY_SOURCES
+
+        columns = set(entity.SchemaMetadata.get_columns('stage_summaries'))
+        for source, source_obj in sources.items():
+            assert set(source_obj.get_tabular_data()) <= columns, source
+
+    def test_summary_sorted_by_stage(self, summary_db):
+        """Test summaries are sorted by flow and stage order."""
+        df = Dataset(summary_db).summary(columns=['worst_slack', 'total_area'])
+
+        assert list(df.columns) == ['flow_id', 'stage', 'worst_slack', 'total_area']
+        assert list(df['flow_id']) == ['f1'] * 3 + ['f2'] * 3
+        assert list(df['stage']) == ['floorplan', 'cts', 'final'] * 2
+        assert list(df['worst_slack']) == [1.0, 2.0, 0.0] * 2
+
+        filtered = Dataset(summary_db).summary(flow_id='f2', stage=['cts', 'final'])
+        assert list(zip(filtered['flow_id'], filtered['stage'])) == [('f2', 'cts'), ('f2', 'final')]
+
+    def test_summary_pivot(self, summary_db):
+        """Test the per-flow stage evolution table."""
+        evolution = Dataset(summary_db).summary(columns=['worst_slack', 'total_area'], pivot=True)
+
+        assert list(evolution.index) == ['f1', 'f2']
+        assert list(evolution.columns) == [
+            (metric, stage) for metric in ['worst_slack', 'total_area']
+            for stage in ['floorplan', 'cts', 'final']
+        ]
+        assert list(evolution.loc['f1', 'worst_slack']) == [1.0, 2.0, 0.0]
+
+    def test_summary_unknown_column(self, summary_db):
+        """Test unknown summary columns are rejected."""
+        with pytest.raises(ValueError, match="Unknown summary columns"):
+            Dataset(summary_db).summary(columns=['slack'])
+
+    def test_summary_without_table(self, summary_db, sample_timing_metrics_data):
+        """Test datasets without a summary table are summarized from the sources."""
+        expected = Dataset(summary_db).summary()
+        for stage in ['final', 'floorplan', 'cts']:
+            for flow_id in ['f1', 'f2']:
+                summary_db.add_table_row('timing_metrics', entity.TimingMetricsEntity(**dict(
+                    sample_timing_metrics_data, flow_id=flow_id, stage=stage,
+                    worst_slack=expected.set_index(['flow_id', 'stage']).loc[
+                        (flow_id, stage), 'worst_slack'])).get_tabular_data())
+        summary_db.close()
+        shutil.rmtree(Path(summary_db.data_home) / 'stage_summaries')
+
+        df = Dataset(summary_db).summary()
+        assert list(df['worst_slack']) == list(expected['worst_slack'])
+        assert df['total_area'].isna().all()
+        assert list(df.columns) == list(expected.columns)
+
+
+class TestAppendDump:
+    """Test dumping new flows into an existing dataset."""
+
+    @staticmethod
+    def _dataset(db, flow_ids, cells=()):
+        """Dataset of flows whose stages have no netlist."""
+        dataset = Dataset(db)
+        for flow_id in flow_ids:
+            dataset[flow_id] = entity.DesignFlowEntity(
+                flow_id=flow_id, design='aes',
+                constraints=entity.ConstraintEntity(flow_id=flow_id, clock_period=2.0),
+                stages={s.value: entity.DesignStageEntity(flow_id=flow_id, stage=s.value)
+                        for s in entity.DesignStages})
+        for cell in cells:
+            dataset.standard_cells.add_cell(cell)
+        return dataset
+
+    @pytest.fixture
+    def appended(self, temp_dir, sample_standard_cell_data):
+        """Partitioned dataset with f1 dumped, then f2 appended."""
+        path = Path(temp_dir) / "test_db"
+        cell = entity.StandardCellEntity(**sample_standard_cell_data)
+        inv = entity.StandardCellEntity(**dict(sample_standard_cell_data, name='INV_X1'))
+        with ParquetDB(path, layout='partitioned') as db:
+            self._dataset(db, ['f1'], [cell]).dump(mode='append')
+        with ParquetDB(path, layout='partitioned') as db:
+            self._dataset(db, ['f2'], [cell, inv]).dump(mode='append')
+        return path
+
+    def test_append_adds_flows(self, appended):
+        """Test appended flows are added next to the stored ones."""
+        db = ParquetDB(appended)
+        dataset = Dataset(db)
+        assert sorted(dataset.stored_flow_ids()) == ['f1', 'f2']
+        assert sorted(db.get_table_data('standard_cells')['name']) == ['INV_X1', 'NAND2_X1']
+        assert len(db.get_table_data('design_stages', flow_id='f1')) == len(entity.DesignStages)
+        assert list((appended / 'design_flows' / 'table' / 'flow_id=f1').glob('*.parquet')) == [
+            appended / 'design_flows' / 'table' / 'flow_id=f1' / 'part-0.parquet'
+        ]
+
+        catalog = dataset.catalog
+        assert list(catalog['flows']) == ['f1', 'f2']
+        assert catalog['tables']['design_flows']['rows'] == 2
+        assert catalog['tables']['standard_cells']['rows'] == 2
+
+    def test_append_single_layout_adds_fragments(self, temp_dir):
+        """Test appending in the single layout never rewrites stored files."""
+        path = Path(temp_dir) / "test_db"
+        with ParquetDB(path) as db:
+            self._dataset(db, ['f1']).dump()
+        table = path / 'design_stages' / 'table.parquet'
+        before = table.stat()
+        with ParquetDB(path) as db:
+            self._dataset(db, ['f2']).dump(mode='append')
+
+        after = table.stat()
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+        assert len(list(table.parent.glob('table-*.parquet'))) == 1
+        db = ParquetDB(path)
+        assert sorted(Dataset(db).stored_flow_ids()) == ['f1', 'f2']
+        assert len(db.get_table_data('design_stages')) == 2 * len(entity.DesignStages)
+        assert list(Dataset(db).catalog['flows']) == ['f1', 'f2']
+
+    def test_append_rejects_stored_flows(self, appended):
+        """Test appending a stored flow fails before anything is written."""
+        with ParquetDB(appended, layout='partitioned') as db:
+            dataset = self._dataset(db, ['f3', 'f1'])
+            with pytest.raises(DuplicateKeyError, match="'f1'") as error:
+                dataset.dump(mode='append')
+            assert error.value.keys == ['f1']
+            with pytest.raises(DuplicateKeyError):
+                dataset.dump_design_flow('f1', mode='append')
+        assert sorted(Dataset(ParquetDB(appended)).stored_flow_ids()) == ['f1', 'f2']
+
+    def test_append_drops_stale_catalog(self, appended):
+        """Test a catalog that no longer matches the files is not extended."""
+        db = ParquetDB(appended, layout='partitioned')
+        db.add_table_row('design_flows', entity.DesignFlowEntity(flow_id='f3', design='aes').get_tabular_data())
+        db.close()
+        with ParquetDB(appended, layout='partitioned') as db:
+            self._dataset(db, ['f4']).dump(mode='append')
+        assert ParquetDB(appended).read_catalog() is None
+
+    def test_append_design_flow_catalog(self, appended):
+        """Test dump_design_flow(mode="append") extends an up-to-date catalog."""
+        with ParquetDB(appended, layout='partitioned') as db:
+            self._dataset(db, ['f3']).dump_design_flow('f3', mode='append')
+        catalog = Dataset(ParquetDB(appended)).catalog
+        assert list(catalog['flows']) == ['f1', 'f2', 'f3']
+        assert catalog['tables']['design_flows']['rows'] == 3
+
+        db = ParquetDB(appended, layout='partitioned')
+        db.add_table_row('design_flows', entity.DesignFlowEntity(flow_id='f4', design='aes').get_tabular_data())
+        db.close()
+        with ParquetDB(appended, layout='partitioned') as db:
+            self._dataset(db, ['f5']).dump_design_flow('f5', mode='append')
+        assert ParquetDB(appended).read_catalog() is None
+
+    def test_concurrent_writers_drop_catalog(self, appended):
+        """Test writers with a writer_id never publish a catalog missing flows."""
+        writers = {w: ParquetDB(appended, layout='partitioned', writer_id=w) for w in ['a', 'b']}
+        datasets = {w: self._dataset(db, [f'f-{w}']) for w, db in writers.items()}
+        for dataset in datasets.values():
+            dataset.dump(mode='append')
+        for db in writers.values():
+            db.close()
+
+        db = ParquetDB(appended)
+        assert db.read_catalog() is None
+        assert sorted(Dataset(db).stored_flow_ids()) == ['f-a', 'f-b', 'f1', 'f2']
+
+        db.compact()
+        catalog = Dataset(db).catalog
+        assert sorted(catalog['flows']) == ['f-a', 'f-b', 'f1', 'f2']
+        assert catalog['tables']['design_stages']['rows'] == 4 * len(entity.DesignStages)
+        assert catalog['flows']['f-a']['rows'] == {'design_flows': 1, 'constraints': 1}
+
+    def test_dump_invalid_mode(self, temp_dir):
+        """Test unknown dump modes are rejected."""
+        dataset = self._dataset(ParquetDB(Path(temp_dir) / "test_db"), ['f1'])
+        with pytest.raises(ValueError, match="Unknown dump mode"):
+            dataset.dump(mode='upsert')
+        with pytest.raises(ValueError, match="Unknown dump mode"):
+            dataset.dump_design_flow('f1', mode='upsert')
+
+    def test_append_backfills_summaries(self, temp_dir):
+        """Test stored flows stay summarized after appending to an old dataset."""
+        import shutil
+
+        path = Path(temp_dir) / "test_db"
+        with ParquetDB(path, layout='partitioned') as db:
+            self._dataset(db, ['f1']).dump()
+        shutil.rmtree(path / 'stage_summaries')  # dumped before the table existed
+        assert Dataset(ParquetDB(path)).summary()['flow_id'].unique().tolist() == ['f1']
+
+        with ParquetDB(path, layout='partitioned') as db:
+            self._dataset(db, ['f2']).dump(mode='append')
+        summary = Dataset(ParquetDB(path)).summary()
+        assert summary['flow_id'].unique().tolist() == ['f1', 'f2']
+        assert len(summary) == 2 * len(entity.DesignStages)
@@ -46,6 +46,14 @@ class TestParquetDB:
         # Should not raise
         assert db is not None
 
+    @pytest.mark.parametrize('layout', ['single', 'partitioned'])
+    def test_parquetdb_has_table(self, temp_dir, layout):
+        """Test created tables are detected in both layouts."""
+        db = ParquetDB(str(Path(temp_dir) / "test_db"), layout=layout)
+        assert not db.has_table('design_flows')
+        db.create_dataset_tables()
+        assert db.has_table('design_flows')
+
     def test_parquetdb_add_table_row(self, temp_dir, sample_netlist_data):
         """Test adding a table row."""
         db_path = Path(temp_dir) / "test_db"
@@ -122,6 +130,29 @@ class TestFileDB:
         # Should not raise
         assert db is not None
 
+    def test_has_table(self, temp_dir):
+        """Test FileDB and SQLitePickleDB detect created tables."""
+        from eda_schema.db import SQLitePickleDB
+
+        for db in [FileDB(str(Path(temp_dir) / "file_db")),
+                   SQLitePickleDB(str(Path(temp_dir) / "sqlite_db"))]:
+            assert not db.has_table('gates')
+            db.create_dataset_tables()
+            assert db.has_table('gates')
+
+    def test_default_has_table(self, temp_dir):
+        """Test the BaseDB fallback reads the table to detect it."""
+        from eda_schema.db.base import BaseDB
+
+        class FallbackHasTableDB(FileDB):  # pylint: disable=too-few-public-methods
+            """FileDB without its own has_table."""
+            has_table = BaseDB.has_table
+
+        db = FallbackHasTableDB(str(Path(temp_dir) / "file_db"))
+        assert not db.has_table('gates')
+        db.create_dataset_tables()
+        assert db.has_table('gates')
+
     def test_filedb_add_table_row(self, temp_dir, sample_netlist_data):
         """Test adding a table row."""
         db_path = Path(temp_dir) / "test_filedb"
@@ -135,6 +166,18 @@ class TestFileDB:
         table_path = db._table_path('netlists')  # pylint: disable=protected-access
         assert table_path.exists()
 
+    def test_filedb_add_table_data_aligns_columns(self, temp_dir, sample_gate_data):
+        """Test bulk rows are written in the table's column order."""
+        db = FileDB(str(Path(temp_dir) / "test_filedb"))
+        db.create_dataset_tables()
+
+        row = entity.GateEntity(**sample_gate_data).get_tabular_data()
+        db.add_table_data('gates', [dict(reversed(list(row.items())))])
+
+        df = db.get_table_data('gates')
+        assert df['name'].tolist() == [sample_gate_data['name']]
+        assert df['x_max'].tolist() == [sample_gate_data['x_max']]
+
     def test_filedb_get_entity(self, temp_dir, sample_netlist_data):
         """Test getting an entity."""
         db_path = Path(temp_dir) / "test_filedb"
@@ -231,3 +274,1154 @@ class TestFileDB:
         assert retrieved_power is not None
         assert retrieved_netlist.flow_id == netlist.flow_id
         assert retrieved_power.flow_id == power.flow_id
+
+
+class TestParquetDBPartitioned:
+    """Test the Hive-partitioned ParquetDB layout."""
+
+    def test_partitioned_invalid_layout(self, temp_dir):
+        """Test unknown layouts are rejected."""
+        with pytest.raises(ValueError, match="Unknown ParquetDB layout"):
+            ParquetDB(str(Path(temp_dir) / "test_db"), layout="sharded")
+
+    def test_partitioned_writes_fragments(self, temp_dir, sample_netlist_data):
+        """Test rows land in flow_id=/stage= partition directories."""
+        db = ParquetDB(str(Path(temp_dir) / "test_db"), layout="partitioned")
+        db.create_dataset_tables()
+
+        netlist = entity.NetlistEntity(**sample_netlist_data)
+        db.add_table_row('netlists', netlist.get_tabular_data())
+        db.add_graph_data('netlists', netlist.get_graph_data(),
+                          flow_id=netlist.flow_id, stage=netlist.stage)
+        db.commit()
+
+        partition = Path("flow_id=test_flow_001") / "stage=floorplan" / "part-0.parquet"
+        assert (db._table_dir('netlists') / partition).exists()  # pylint: disable=protected-access
+        assert (db._graph_dir('netlists') / partition).exists()  # pylint: disable=protected-access
+        assert not db._table_path('netlists').exists()  # pylint: disable=protected-access
+
+    def test_partitioned_get_table_data_prunes(self, temp_dir, sample_netlist_data):
+        """Test reads filtered by flow_id/stage only return matching partitions."""
+        db = ParquetDB(str(Path(temp_dir) / "test_db"), layout="partitioned")
+        db.create_dataset_tables()
+
+        for flow_id in ['flow/a', 'flow_b']:
+            for stage in ['floorplan', 'cts']:
+                data = dict(sample_netlist_data, flow_id=flow_id, stage=stage)
+                db.add_table_row('netlists', entity.NetlistEntity(**data).get_tabular_data())
+
+        df = db.get_table_data('netlists', flow_id='flow/a')
+        assert sorted(df['stage']) == ['cts', 'floorplan']
+        assert set(df['flow_id']) == {'flow/a'}
+
+        df = db.get_table_data('netlists', stage='cts')
+        assert sorted(df['flow_id']) == ['flow/a', 'flow_b']
+
+        df = db.get_table_data('netlists', flow_id='missing')
+        assert df.empty
+
+    def test_partitioned_get_entity(self, temp_dir, sample_netlist_data):
+        """Test entities round-trip through the partitioned layout."""
+        db = ParquetDB(str(Path(temp_dir) / "test_db"), layout="partitioned")
+        db.create_dataset_tables()
+
+        netlist = entity.NetlistEntity(**sample_netlist_data)
+        netlist.add_node('node1', type='GATE', entity=None)
+        netlist.add_node('node2', type='NET', entity=None)
+        netlist.add_edge('node1', 'node2')
+        db.add_table_row('netlists', netlist.get_tabular_data())
+        db.add_graph_data('netlists', netlist.get_graph_data(),
+                          flow_id=netlist.flow_id, stage=netlist.stage)
+        db.commit()
+
+        # A reader opened with the default layout understands partitions too
+        retrieved = ParquetDB(str(Path(temp_dir) / "test_db")).get_entity(
+            'netlists', load_sub_entities=False,
+            flow_id=netlist.flow_id, stage=netlist.stage)
+        assert retrieved.flow_id == netlist.flow_id
+        assert ('node1', 'node2') in retrieved.edges
+
+    @pytest.mark.parametrize('layout', ['single', 'partitioned'])
+    def test_create_dataset_tables_truncates(self, temp_dir, sample_netlist_data, layout):
+        """Test re-creating the tables removes rows stored in either layout."""
+        path = str(Path(temp_dir) / "test_db")
+        netlist = entity.NetlistEntity(**sample_netlist_data)
+        for previous in ['single', 'partitioned']:
+            db = ParquetDB(path, layout=previous)
+            db.create_dataset_tables()
+            db.add_table_row('netlists', netlist.get_tabular_data())
+            db.add_graph_data('netlists', {'nodes': [previous]},
+                              flow_id=netlist.flow_id, stage=netlist.stage)
+            db.close()
+
+            db = ParquetDB(path, layout=layout)
+            db.create_dataset_tables()
+            db.add_table_row('netlists', netlist.get_tabular_data())
+            db.add_graph_data('netlists', {'nodes': [layout]},
+                              flow_id=netlist.flow_id, stage=netlist.stage)
+            db.close()
+
+            reader = ParquetDB(path)
+            assert len(reader.get_table_data('netlists')) == 1
+            assert reader.get_graph_data('netlists', flow_id=netlist.flow_id,
+                                         stage=netlist.stage)['nodes'] == [layout]
+
+
+class TestParquetDBGraphFormat:
+    """Test columnar and legacy JSON graph encodings in ParquetDB."""
+
+    @staticmethod
+    def _graph():
+        return {
+            'nodes': ['u1', 'n1', 'u2'],
+            'node_types': ['GATE', 'NET', 'GATE'],
+            'edges': [['u1', 'n1'], ['n1', 'u2']],
+        }
+
+    def test_graph_format_invalid(self, temp_dir):
+        """Test unknown graph formats are rejected."""
+        with pytest.raises(ValueError, match="Unknown graph format"):
+            ParquetDB(str(Path(temp_dir) / "test_db"), graph_format="xml")
+
+    def test_columnar_graph_round_trip(self, temp_dir):
+        """Test graphs are stored as dictionary-encoded columns and decoded back."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        with ParquetDB(str(Path(temp_dir) / "test_db")) as db:
+            db.create_dataset_tables()
+            db.add_graph_data('netlists', self._graph(), flow_id='f1', stage='cts')
+
+        schema = pq.read_schema(db._graph_path('netlists'))  # pylint: disable=protected-access
+        assert 'graph_json' not in schema.names
+        assert pa.types.is_dictionary(schema.field('nodes').type.value_type)
+        assert schema.field('edges').type == pa.list_(pa.list_(pa.int32(), 2))
+
+        assert db.get_graph_data('netlists', flow_id='f1', stage='cts') == self._graph()
+
+    def test_columnar_graph_adds_missing_edge_nodes(self, temp_dir):
+        """Test edge endpoints missing from the node list become untyped nodes."""
+        db = ParquetDB(str(Path(temp_dir) / "test_db"))
+        db.create_dataset_tables()
+        db.add_graph_data('netlists', {'nodes': [], 'node_types': [], 'edges': [['a', 'b']]},
+                          flow_id='f1', stage='cts')
+
+        graph = db.get_graph_data('netlists', flow_id='f1', stage='cts')
+        assert graph == {'nodes': ['a', 'b'], 'node_types': [None, None],
+                         'edges': [['a', 'b']]}
+
+    @pytest.mark.parametrize('layout', ['single', 'partitioned'])
+    def test_json_graph_format(self, temp_dir, layout):
+        """Test the legacy graph_json encoding is still written and read."""
+        import pyarrow.parquet as pq
+
+        db = ParquetDB(str(Path(temp_dir) / "test_db"), layout=layout, graph_format='json')
+        db.create_dataset_tables()
+        db.add_graph_data('netlists', self._graph(), flow_id='f1', stage='cts')
+        db.close()
+
+        # A columnar-default reader decodes JSON graphs transparently
+        reader = ParquetDB(str(Path(temp_dir) / "test_db"))
+        assert reader.get_graph_data('netlists', flow_id='f1', stage='cts') == self._graph()
+        graph_files = [path for path in Path(temp_dir, "test_db", "netlists").rglob("*.parquet")
+                       if path.name == 'graph.parquet' or 'graph' in path.parts]
+        assert graph_files
+        for path in graph_files:
+            assert 'graph_json' in pq.read_schema(path).names
+
+    def test_append_keeps_existing_json_format(self, temp_dir):
+        """Test appends to a legacy graph.parquet keep the graph_json format."""
+        db = ParquetDB(str(Path(temp_dir) / "test_db"), graph_format='json')
+        db.create_dataset_tables()
+
+        db = ParquetDB(str(Path(temp_dir) / "test_db"))
+        db.add_graph_data('netlists', self._graph(), flow_id='f1', stage='cts')
+        assert db.get_graph_data('netlists', flow_id='f1', stage='cts') == self._graph()
+
+
+class TestGetGraphDataMany:
+    """Test bulk graph retrieval by partial primary keys."""
+
+    @staticmethod
+    def _add_paths(db):
+        db.create_dataset_tables()
+        for stage in ['floorplan', 'cts']:
+            for i in range(3):
+                keys = dict(flow_id='f1', stage=stage, startpoint=f'in{i}',
+                            endpoint='u1/D', path_type='max')
+                db.add_table_row('timing_paths', entity.TimingPathEntity(
+                    **keys, arrival_time=1.0, required_time=2.0, slack=1.0,
+                    no_of_pins=2, is_critical_path=False).get_tabular_data())
+                db.add_graph_data('timing_paths',
+                                  {'nodes': [f'in{i}', 'u1/D'], 'node_types': ['PORT', 'PIN'],
+                                   'edges': [[f'in{i}', 'u1/D']]},
+                                  **keys)
+
+    @pytest.mark.parametrize('make_db', [
+        lambda path: ParquetDB(path),
+        lambda path: ParquetDB(path, layout='partitioned'),
+        lambda path: FileDB(path),
+    ], ids=['parquet', 'parquet-partitioned', 'file'])
+    def test_get_graph_data_many(self, temp_dir, make_db):
+        """Test every graph of a flow/stage is returned with its keys."""
+        db = make_db(str(Path(temp_dir) / "test_db"))
+        self._add_paths(db)
+
+        rows = db.get_graph_data_many('timing_paths', flow_id='f1', stage='cts')
+        assert sorted(row['startpoint'] for row in rows) == ['in0', 'in1', 'in2']
+        for row in rows:
+            assert row['stage'] == 'cts'
+            assert row['endpoint'] == 'u1/D'
+            assert row['data']['edges'] == [[row['startpoint'], 'u1/D']]
+
+        assert len(db.get_graph_data_many('timing_paths', flow_id='f1')) == 6
+        assert db.get_graph_data_many('timing_paths', flow_id='missing') == []
+
+    def test_get_graph_data_many_rejects_non_key_fields(self, temp_dir):
+        """Test partial keys must be primary-key columns."""
+        db = ParquetDB(str(Path(temp_dir) / "test_db"))
+        db.create_dataset_tables()
+
+        with pytest.raises(ValueError, match="Unexpected key fields"):
+            db.get_graph_data_many('timing_paths', slack=0.0)
+
+
+class TestParquetDBBuffering:
+    """Test buffered writes and row-group sizing in ParquetDB."""
+
+    @staticmethod
+    def _add_netlists(db, sample_netlist_data, n_rows):
+        for i in range(n_rows):
+            data = dict(sample_netlist_data, stage=f'stage_{i}')
+            db.add_table_row('netlists', entity.NetlistEntity(**data).get_tabular_data())
+
+    @staticmethod
+    def _row_groups(path):
+        import pyarrow.parquet as pq
+
+        metadata = pq.read_metadata(path)
+        return [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+
+    def test_rows_buffered_into_one_row_group(self, temp_dir, sample_netlist_data):
+        """Test single-row adds are written as one row group on close."""
+        with ParquetDB(str(Path(temp_dir) / "test_db")) as db:
+            db.create_dataset_tables()
+            self._add_netlists(db, sample_netlist_data, 20)
+            for stage in ['floorplan', 'cts']:
+                db.add_graph_data('netlists', {'nodes': ['a'], 'node_types': ['NET'],
+                                               'edges': []},
+                                  flow_id='f1', stage=stage)
+
+        assert self._row_groups(db._table_path('netlists')) == [20]  # pylint: disable=protected-access
+        assert self._row_groups(db._graph_path('netlists')) == [2]  # pylint: disable=protected-access
+
+    def test_buffer_flushes_at_row_limit(self, temp_dir, sample_netlist_data):
+        """Test buffers are written once they reach buffer_rows."""
+        with ParquetDB(str(Path(temp_dir) / "test_db"), buffer_rows=4) as db:
+            db.create_dataset_tables()
+            self._add_netlists(db, sample_netlist_data, 10)
+            assert db._buffers['netlists'].num_rows == 2  # pylint: disable=protected-access
+
+        assert self._row_groups(db._table_path('netlists')) == [4, 4, 2]  # pylint: disable=protected-access
+
+    def test_buffer_flushes_at_byte_limit(self, temp_dir, sample_netlist_data):
+        """Test buffers are written once they reach buffer_bytes."""
+        with ParquetDB(str(Path(temp_dir) / "test_db"), buffer_bytes=1) as db:
+            db.create_dataset_tables()
+            self._add_netlists(db, sample_netlist_data, 3)
+
+        assert self._row_groups(db._table_path('netlists')) == [1, 1, 1]  # pylint: disable=protected-access
+
+    def test_row_group_size(self, temp_dir, sample_netlist_data):
+        """Test large flushes are split into row groups of row_group_size rows."""
+        with ParquetDB(str(Path(temp_dir) / "test_db"), row_group_size=4) as db:
+            db.create_dataset_tables()
+            self._add_netlists(db, sample_netlist_data, 10)
+
+        assert self._row_groups(db._table_path('netlists')) == [4, 4, 2]  # pylint: disable=protected-access
+
+    @pytest.mark.parametrize('layout', ['single', 'partitioned'])
+    def test_reads_flush_buffers(self, temp_dir, sample_netlist_data, layout):
+        """Test reads see rows that are still buffered."""
+        db = ParquetDB(str(Path(temp_dir) / "test_db"), layout=layout)
+        db.create_dataset_tables()
+        self._add_netlists(db, sample_netlist_data, 3)
+
+        assert len(db.get_table_data('netlists')) == 3
+        assert not db._has_buffered_rows()  # pylint: disable=protected-access
+
+    @pytest.mark.parametrize('option', ['buffer_rows', 'buffer_bytes', 'row_group_size'])
+    def test_invalid_buffer_options(self, temp_dir, option):
+        """Test non-positive buffer and row-group sizes are rejected."""
+        with pytest.raises(ValueError, match=option):
+            ParquetDB(str(Path(temp_dir) / "test_db"), **{option: 0})
+
+
+class TestParquetDBWriteSessions:
+    """Test staged writes, commit and rollback in ParquetDB."""
+
+    @staticmethod
+    def _add_netlist(db, sample_netlist_data, stage):
+        data = dict(sample_netlist_data, stage=stage)
+        db.add_table_row('netlists', entity.NetlistEntity(**data).get_tabular_data())
+
+    @pytest.mark.parametrize('layout', ['single', 'partitioned'])
+    def test_reads_between_writes_keep_rows(self, temp_dir, sample_netlist_data, layout):
+        """Test reading between appends does not drop earlier rows."""
+        db = ParquetDB(str(Path(temp_dir) / "test_db"), layout=layout)
+        db.create_dataset_tables()
+        for i, stage in enumerate(['floorplan', 'place', 'cts']):
+            self._add_netlist(db, sample_netlist_data, stage)
+            assert len(db.get_table_data('netlists')) == i + 1
+            db.add_graph_data('netlists', {'nodes': [stage], 'node_types': ['NET'], 'edges': []},
+                              flow_id='test_flow_001', stage=stage)
+            assert db.get_graph_data('netlists', flow_id='test_flow_001',
+                                     stage=stage)['nodes'] == [stage]
+        db.close()
+
+        reopened = ParquetDB(str(Path(temp_dir) / "test_db"))
+        assert sorted(reopened.get_table_data('netlists')['stage']) == ['cts', 'floorplan', 'place']
+        assert reopened.get_graph_data('netlists', flow_id='test_flow_001',
+                                       stage='floorplan')['nodes'] == ['floorplan']
+        assert not (Path(temp_dir) / "test_db" / ".staging").exists()
+
+    @pytest.mark.parametrize('layout', ['single', 'partitioned'])
+    def test_other_readers_see_commits_only(self, temp_dir, sample_netlist_data, layout):
+        """Test rows become visible to other instances on commit."""
+        db = ParquetDB(str(Path(temp_dir) / "test_db"), layout=layout)
+        db.create_dataset_tables()
+        self._add_netlist(db, sample_netlist_data, 'floorplan')
+        db.commit()
+        self._add_netlist(db, sample_netlist_data, 'cts')
+        db.flush()
+
+        reader = ParquetDB(str(Path(temp_dir) / "test_db"))
+        assert list(reader.get_table_data('netlists')['stage']) == ['floorplan']
+        db.commit()
+        assert sorted(reader.get_table_data('netlists')['stage']) == ['cts', 'floorplan']
+
+    def test_commit_appends_to_existing_file(self, temp_dir, sample_netlist_data):
+        """Test a new session adds a fragment instead of rewriting stored rows."""
+        path = str(Path(temp_dir) / "test_db")
+        with ParquetDB(path) as db:
+            db.create_dataset_tables()
+            self._add_netlist(db, sample_netlist_data, 'floorplan')
+        table_path = ParquetDB(path)._table_path('netlists')  # pylint: disable=protected-access
+        before = table_path.stat()
+        with ParquetDB(path) as db:
+            self._add_netlist(db, sample_netlist_data, 'cts')
+            assert len(db.get_table_data('netlists')) == 2
+            self._add_netlist(db, sample_netlist_data, 'final')
+
+        import pyarrow.parquet as pq
+
+        after = table_path.stat()
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+        # The read ended the first staged fragment
+        fragments = sorted(table_path.parent.glob('table-*.parquet'))
+        assert [pq.read_table(f).column('stage').to_pylist() for f in fragments] == [
+            ['cts'], ['final']
+        ]
+        assert sorted(ParquetDB(path).get_table_data('netlists')['stage']) == [
+            'cts', 'final', 'floorplan'
+        ]
+
+        ParquetDB(path).compact()
+        assert not list(table_path.parent.glob('table-*.parquet'))
+        assert len(pq.read_table(table_path)) == 3
+
+    def test_rollback(self, temp_dir, sample_netlist_data):
+        """Test rollback discards buffered and staged rows."""
+        db = ParquetDB(str(Path(temp_dir) / "test_db"), layout='partitioned')
+        db.create_dataset_tables()
+        self._add_netlist(db, sample_netlist_data, 'floorplan')
+        db.commit()
+        self._add_netlist(db, sample_netlist_data, 'cts')
+        db.flush()
+        self._add_netlist(db, sample_netlist_data, 'final')
+        db.rollback()
+
+        assert list(db.get_table_data('netlists')['stage']) == ['floorplan']
+        assert not (Path(temp_dir) / "test_db" / ".staging").exists()
+        db.close()
+        assert list(db.get_table_data('netlists')['stage']) == ['floorplan']
+
+
+class TestParquetDBMultiWriter:
+    """Test concurrent writers and fragment compaction in ParquetDB."""
+
+    @staticmethod
+    def _write(db, sample_gate_data, stage, names):
+        for name in names:
+            gate = entity.GateEntity(**dict(sample_gate_data, stage=stage, name=name))
+            db.add_table_row('gates', gate.get_tabular_data())
+        db.add_graph_data('netlists', {'nodes': [stage], 'node_types': ['NET'], 'edges': []},
+                          flow_id=sample_gate_data['flow_id'], stage=stage)
+        db.commit()
+
+    @pytest.fixture(params=['single', 'partitioned'])
+    def shared_root(self, request, temp_dir, sample_gate_data):
+        """Dataset written by two interleaved writers."""
+        path = Path(temp_dir) / "test_db"
+        ParquetDB(path, layout=request.param).create_dataset_tables()
+        writers = [ParquetDB(path, layout=request.param, writer_id=w) for w in ['a', 'b']]
+        self._write(writers[0], sample_gate_data, 'cts', ['u3', 'u1'])
+        self._write(writers[1], sample_gate_data, 'cts', ['u2'])
+        self._write(writers[0], sample_gate_data, 'final', ['u9', 'u4'])
+        self._write(writers[1], sample_gate_data, 'floorplan', ['u5'])
+        return path
+
+    @pytest.mark.parametrize('layout', ['single', 'partitioned'])
+    def test_late_create_keeps_other_writers_rows(self, temp_dir, sample_gate_data, layout):
+        """Test a writer creating tables after another writer's commit keeps its rows."""
+        path = Path(temp_dir) / "test_db"
+        writer_a = ParquetDB(path, layout=layout, writer_id='a')
+        writer_b = ParquetDB(path, layout=layout, writer_id='b')
+        assert not writer_b.has_table('gates')
+
+        writer_a.create_dataset_tables()
+        self._write(writer_a, dict(sample_gate_data, flow_id='fa'), 'cts', ['u1'])
+        writer_b.create_dataset_tables()
+        self._write(writer_b, dict(sample_gate_data, flow_id='fb'), 'cts', ['u2'])
+
+        db = ParquetDB(path, layout=layout)
+        assert sorted(db.get_table_data('gates')['flow_id']) == ['fa', 'fb']
+        assert db.get_graph_data('netlists', flow_id='fa', stage='cts')['nodes'] == ['cts']
+
+    def test_writers_publish_own_fragments(self, shared_root):
+        """Test commits add uniquely named fragments that reads include."""
+        db = ParquetDB(shared_root)
+        table_files = db.storage_files('gates')['table']
+        fragments = [p for p in table_files if '-' in p.name]
+        assert len(fragments) == 4
+        assert {p.name.split('-')[1] for p in fragments} == {'a', 'b'}
+
+        df = db.get_table_data('gates')
+        assert sorted(df['name']) == ['u1', 'u2', 'u3', 'u4', 'u5', 'u9']
+        assert db.get_graph_data('netlists', flow_id='test_flow_001',
+                                 stage='floorplan')['nodes'] == ['floorplan']
+
+    @pytest.mark.parametrize('workers', [None, 2])
+    def test_compact_merges_fragments(self, shared_root, workers):
+        """Test compaction leaves one sorted file per file or partition."""
+        import pyarrow.parquet as pq
+
+        db = ParquetDB(shared_root, row_group_size=2)
+        expected = db.get_table_data('gates').sort_values(['stage', 'name'])
+        results = db.compact(workers=workers)
+
+        assert results['gates']['files_before'] > results['gates']['files_after']
+        files = db.storage_files('gates')['table']
+        assert {p.name for p in files} <= {'table.parquet', 'part-0.parquet'}
+        if db._table_path('gates').exists():  # pylint: disable=protected-access
+            assert files == [db._table_path('gates')]  # pylint: disable=protected-access
+            metadata = pq.read_metadata(files[0])
+            assert metadata.num_row_groups == 3
+            assert metadata.row_group(0).sorting_columns
+            assert pq.read_table(files[0]).column('name').to_pylist() == [
+                'u1', 'u2', 'u3', 'u4', 'u9', 'u5'
+            ]
+        else:
+            assert [p.name for p in files] == ['part-0.parquet'] * 3
+
+        actual = ParquetDB(shared_root).get_table_data('gates').sort_values(['stage', 'name'])
+        assert actual['name'].tolist() == expected['name'].tolist()
+        assert db.get_graph_data('netlists', flow_id='test_flow_001',
+                                 stage='cts')['nodes'] == ['cts']
+
+    def test_compact_rewrites_catalog(self, shared_root):
+        """Test an up-to-date catalog still matches the files after compaction."""
+        from eda_schema.catalog import CatalogBuilder, stale_files
+
+        db = ParquetDB(shared_root)
+        db.write_catalog(CatalogBuilder().to_dict())
+        db.compact(entities=['gates'])
+        assert stale_files(db.read_catalog(), db) == []
+
+    def test_create_removes_fragments(self, shared_root, sample_gate_data):
+        """Test re-creating the tables without a writer id drops every writer's fragments."""
+        ParquetDB(shared_root).create_dataset_tables()
+        db = ParquetDB(shared_root, writer_id='c')
+        db.create_dataset_tables()
+        self._write(db, sample_gate_data, 'cts', ['u7'])
+
+        reader = ParquetDB(shared_root)
+        assert reader.get_table_data('gates')['name'].tolist() == ['u7']
+        assert [p.name for p in reader.storage_files('gates')['table']] == [
+            'table.parquet', 'table-c-00000.parquet'
+        ]
+        with pytest.raises(DataNotFoundError):
+            reader.get_graph_data('netlists', flow_id='test_flow_001', stage='final')
+
+    def test_invalid_writer_id(self, temp_dir):
+        """Test writer ids that cannot name fragments are rejected."""
+        with pytest.raises(ValueError, match="writer_id"):
+            ParquetDB(str(Path(temp_dir) / "test_db"), writer_id='host-1')
+
+    def test_compact_invalid_workers(self, temp_dir):
+        """Test the worker count is validated."""
+        with pytest.raises(ValueError, match="workers must be positive"):
+            ParquetDB(str(Path(temp_dir) / "test_db")).compact(workers=0)
+
+
+class TestParquetDBKeyIndexes:
+    """Test primary-key sorting, page indexes and bloom filters."""
+
+    @staticmethod
+    def _add_gates(db, sample_gate_data):
+        db.create_dataset_tables()
+        for name in ['u3', 'u1', 'u2']:
+            for stage in ['cts', 'floorplan']:
+                gate = entity.GateEntity(**dict(sample_gate_data, name=name, stage=stage))
+                db.add_table_row('gates', gate.get_tabular_data())
+        db.close()
+
+    @pytest.mark.parametrize('layout', ['single', 'partitioned'])
+    def test_sort_by_pk(self, temp_dir, sample_gate_data, layout):
+        """Test flushes are sorted by primary key and record the sort order."""
+        import pyarrow.parquet as pq
+
+        db = ParquetDB(str(Path(temp_dir) / "test_db"), layout=layout, sort_by_pk=True)
+        self._add_gates(db, sample_gate_data)
+
+        files = sorted(Path(temp_dir, "test_db", "gates").rglob("*.parquet"))
+        for path in files:
+            table = pq.read_table(path)
+            if table.num_rows == 0:
+                continue
+            keys = list(zip(*(table[c].to_pylist() for c in ['flow_id', 'stage', 'name'])))
+            assert keys == sorted(keys)
+            sorting = pq.read_metadata(path).row_group(0).sorting_columns
+            assert [table.schema.names[c.column_index] for c in sorting] == [
+                'flow_id', 'stage', 'name']
+
+        gate = db.get_entity('gates', flow_id=sample_gate_data['flow_id'],
+                             stage='cts', name='u2')
+        assert gate.name == 'u2' and gate.stage == 'cts'
+
+    def test_pk_indexes(self, temp_dir, sample_gate_data):
+        """Test key columns get bloom filters and the file gets a page index."""
+        import pyarrow.parquet as pq
+
+        db = ParquetDB(str(Path(temp_dir) / "test_db"), pk_indexes=True)
+        self._add_gates(db, sample_gate_data)
+
+        metadata = pq.read_metadata(db._table_path('gates'))  # pylint: disable=protected-access
+        row_group = metadata.row_group(0)
+        columns = {row_group.column(i).path_in_schema: row_group.column(i)
+                   for i in range(row_group.num_columns)}
+        for col in ['flow_id', 'stage', 'name']:
+            assert columns[col].bloom_filter_length > 0
+            assert columns[col].has_column_index
+        assert not columns['standard_cell'].bloom_filter_length
+
+    def test_default_writes_unsorted(self, temp_dir, sample_gate_data):
+        """Test rows keep insertion order without sort_by_pk."""
+        import pyarrow.parquet as pq
+
+        db = ParquetDB(str(Path(temp_dir) / "test_db"))
+        self._add_gates(db, sample_gate_data)
+
+        path = db._table_path('gates')  # pylint: disable=protected-access
+        assert pq.read_table(path)['name'].to_pylist()[:2] == ['u3', 'u3']
+        assert not pq.read_metadata(path).row_group(0).sorting_columns
+
+
+class TestParquetDBImageManifest:
+    """Test the per-entity image manifest."""
+
+    @staticmethod
+    def _net(sample_net_data, routing_by_metal):
+        import numpy as np
+
+        return entity.NetEntity(
+            **sample_net_data,
+            routing=entity.Image2D(np.ones((2, 3), dtype=np.float32)),
+            routing_by_metal={
+                key: entity.Image2D(np.full((4, 4), i)) for i, key in enumerate(routing_by_metal)
+            },
+        )
+
+    @staticmethod
+    def _keys(net):
+        return {'flow_id': net.flow_id, 'stage': net.stage, 'name': net.name}
+
+    def _store(self, db, net):
+        db.create_dataset_tables()
+        db.add_table_row('nets', net.get_tabular_data())
+        db.add_entity_images('nets', net)
+        db.close()
+
+    @pytest.mark.parametrize('layout', ['single', 'partitioned'])
+    def test_manifest_round_trip(self, temp_dir, sample_net_data, layout):
+        """Test dict image keys outside the legacy metal names round-trip."""
+        import numpy as np
+
+        db = ParquetDB(str(Path(temp_dir) / "test_db"), layout=layout)
+        net = self._net(sample_net_data, ['M6', 'Metal7'])
+        self._store(db, net)
+
+        manifest = db.get_image_manifest('nets', **self._keys(net))
+        assert [(m['image_field'], m['dict_key']) for m in manifest] == [
+            ('routing', None), ('routing_by_metal', 'M6'), ('routing_by_metal', 'Metal7')]
+        assert manifest[0]['shape'] == [2, 3] and manifest[0]['dtype'] == 'float32'
+        assert all((db._image_dir('nets') / m['path']).exists()  # pylint: disable=protected-access
+                   for m in manifest)
+
+        loaded = db.get_entity('nets', **self._keys(net))
+        assert np.array_equal(loaded.routing, net.routing)
+        assert list(loaded.routing_by_metal) == ['M6', 'Metal7']
+        assert np.array_equal(loaded.routing_by_metal['Metal7'], net.routing_by_metal['Metal7'])
+
+    @pytest.mark.parametrize('layout', ['single', 'partitioned'])
+    def test_create_resets_manifest(self, temp_dir, sample_net_data, layout):
+        """Test re-creating the tables drops the stored manifest entries."""
+        net = self._net(sample_net_data, ['M6'])
+        for _ in range(2):
+            db = ParquetDB(str(Path(temp_dir) / "test_db"), layout=layout)
+            self._store(db, net)
+        manifest = ParquetDB(str(Path(temp_dir) / "test_db")).get_image_manifest(
+            'nets', **self._keys(net))
+        assert len(manifest) == 2
+
+    def test_manifest_missing_image(self, temp_dir, sample_net_data):
+        """Test a listed image that no longer exists loads as an empty field."""
+        db = ParquetDB(str(Path(temp_dir) / "test_db"))
+        net = self._net(sample_net_data, ['M6'])
+        self._store(db, net)
+        manifest = db.get_image_manifest('nets', **self._keys(net))
+        (db._image_dir('nets') / manifest[0]['path']).unlink()  # pylint: disable=protected-access
+
+        loaded = db.get_entity('nets', **self._keys(net))
+        assert loaded.routing is None
+        assert list(loaded.routing_by_metal) == ['M6']
+
+    def test_manifest_loads_listed_images_only(self, temp_dir, sample_net_data, monkeypatch):
+        """Test loading reads exactly the manifest entries without probing."""
+        db = ParquetDB(str(Path(temp_dir) / "test_db"))
+        net = self._net(sample_net_data, ['met1'])
+        net.routing = None
+        self._store(db, net)
+
+        calls = []
+        get_image = db.get_image
+        monkeypatch.setattr(db, 'get_image',
+                            lambda e, image, **k: calls.append(image) or get_image(e, image, **k))
+        loaded = db.get_entity('nets', **self._keys(net))
+
+        assert calls == ['routing_by_metal__met1']
+        assert loaded.routing is None
+        assert list(loaded.routing_by_metal) == ['met1']
+
+    def test_manifest_empty_dict_field(self, temp_dir, sample_net_data, monkeypatch):
+        """Test an empty dict image field is recorded and loads as empty."""
+        db = ParquetDB(str(Path(temp_dir) / "test_db"))
+        net = self._net(sample_net_data, [])
+        self._store(db, net)
+
+        manifest = db.get_image_manifest('nets', **self._keys(net))
+        assert ('routing_by_metal', None, None) in [
+            (m['image_field'], m['dict_key'], m['path']) for m in manifest]
+
+        monkeypatch.setattr(db, '_probe_entity_dict_images',
+                            lambda *args: pytest.fail("probed"))
+        assert db.get_entity('nets', **self._keys(net)).routing_by_metal == {}
+
+    def test_legacy_rows_without_manifest(self, temp_dir, sample_net_data):
+        """Test rows stored without a manifest fall back to probing."""
+        import numpy as np
+
+        db = ParquetDB(str(Path(temp_dir) / "test_db"))
+        net = self._net(sample_net_data, ['met2'])
+        db.create_dataset_tables()
+        db.add_table_row('nets', net.get_tabular_data())
+        db.add_image('nets', 'routing', net.routing, **self._keys(net))
+        db.add_image('nets', 'routing_by_metal__met2', net.routing_by_metal['met2'],
+                     **self._keys(net))
+        db.close()
+
+        assert db.get_image_manifest('nets', **self._keys(net)) is None
+        loaded = db.get_entity('nets', **self._keys(net))
+        assert np.array_equal(loaded.routing, net.routing)
+        assert list(loaded.routing_by_metal) == ['met2']
+
+
+class TestChunkedImages:
+    """Test backends writing images to chunked containers."""
+
+    @pytest.mark.parametrize('db_cls', [ParquetDB, FileDB])
+    def test_chunked_image_round_trip(self, temp_dir, db_cls):
+        """Test chunked images round-trip without writing .npz files."""
+        import numpy as np
+
+        db = db_cls(str(Path(temp_dir) / "test_db"), image_store='chunked',
+                    compressed_images=['routing_by_metal'])
+        keys = {'flow_id': 'f1', 'stage': 'cts', 'name': 'n1'}
+        routing = entity.Image2D(np.arange(12.0).reshape(3, 4))
+        db.add_image('nets', 'routing', routing, **keys)
+        db.add_image('nets', 'routing_by_metal__M6', routing * 2, **keys)
+
+        assert np.array_equal(db.get_image('nets', 'routing', **keys), routing)
+        assert np.array_equal(db.get_image('nets', 'routing_by_metal__M6', **keys), routing * 2)
+        assert not list(Path(temp_dir).rglob("*.npz"))
+        with pytest.raises(DataNotFoundError):
+            db.get_image('nets', 'routing', **dict(keys, name='n2'))
+
+    def test_chunked_images_with_manifest(self, temp_dir, sample_net_data):
+        """Test get_entity loads chunked images listed in the manifest."""
+        import numpy as np
+
+        db = ParquetDB(str(Path(temp_dir) / "test_db"), image_store='chunked')
+        net = entity.NetEntity(**sample_net_data,
+                               routing=entity.Image2D(np.eye(3)),
+                               routing_by_metal={'M6': entity.Image2D(np.ones((2, 2)))})
+        db.create_dataset_tables()
+        db.add_table_row('nets', net.get_tabular_data())
+        db.add_entity_images('nets', net)
+        db.close()
+
+        keys = {'flow_id': net.flow_id, 'stage': net.stage, 'name': net.name}
+        assert {m['path'] for m in db.get_image_manifest('nets', **keys)} == {'chunk-00000.bin'}
+        loaded = db.get_entity('nets', **keys)
+        assert np.array_equal(loaded.routing, net.routing)
+        assert np.array_equal(loaded.routing_by_metal['M6'], net.routing_by_metal['M6'])
+
+    def test_npz_store_reads_chunked_images(self, temp_dir):
+        """Test the default store still reads images written to containers."""
+        import numpy as np
+
+        path = str(Path(temp_dir) / "test_db")
+        keys = {'flow_id': 'f1', 'stage': 'cts'}
+        writer = ParquetDB(path, image_store='chunked')
+        writer.add_image('netlists', 'cell_placement', entity.Image2D(np.ones((2, 2))), **keys)
+        writer.close()
+
+        assert ParquetDB(path).get_image('netlists', 'cell_placement', **keys).shape == (2, 2)
+
+    def test_invalid_image_store(self, temp_dir):
+        """Test unknown image stores are rejected."""
+        with pytest.raises(ValueError, match="Unknown image store"):
+            ParquetDB(str(Path(temp_dir) / "test_db"), image_store='zip')
+
+
+class TestEncodedWrites:
+    """Test writes encoded ahead of applying them (parallel dumps)."""
+
+    @staticmethod
+    def _writes(sample_net_data):
+        import numpy as np
+
+        net = entity.NetEntity(**sample_net_data,
+                               routing=entity.Image2D(np.eye(3)),
+                               routing_by_metal={'M6': entity.Image2D(np.ones((2, 2)))})
+        keys = {'flow_id': net.flow_id, 'stage': net.stage, 'name': net.name}
+        images = (net.get_image_data(), net.get_dict_image_data())
+        graph = {'nodes': ['a', 'b'], 'node_types': ['PIN', 'NET'], 'edges': [['a', 'b']]}
+        return keys, [
+            ('add_table_row', ('nets', net.get_tabular_data()), {}),
+            ('add_table_data', ('gates', []), {}),
+            ('add_graph_data', ('netlists', graph), {'flow_id': net.flow_id, 'stage': 'cts'}),
+            ('add_images', ('nets', *images), keys),
+        ]
+
+    @pytest.mark.parametrize('options', [{}, {'image_store': 'chunked'},
+                                         {'image_store': 'chunked',
+                                          'compressed_images': ['routing']}])
+    def test_encoded_writes_match(self, temp_dir, sample_net_data, options):
+        """Test encoded writes store the same rows, graphs and images."""
+        import numpy as np
+        from eda_schema.dataset import apply_writes
+        from eda_schema.db.image_store import EncodedImage
+
+        keys, writes = self._writes(sample_net_data)
+        dbs = []
+        for name, encode in [('raw', False), ('encoded', True)]:
+            db = ParquetDB(str(Path(temp_dir) / name), **options)
+            db.create_dataset_tables()
+            applied = db.encode_writes(writes) if encode else writes
+            apply_writes(db, applied)
+            db.close()
+            dbs.append(db)
+
+        encoded = dbs[1].encode_writes(writes)
+        assert [w[0] for w in encoded] == ['add_table_arrow', 'add_graph_arrow', 'add_images']
+        routing = encoded[2][1][1]['routing']
+        assert isinstance(routing, EncodedImage) == (options.get('image_store') != 'chunked'
+                                                     or 'compressed_images' in options)
+
+        raw, enc = dbs
+        assert enc.get_table_data('nets').equals(raw.get_table_data('nets'))
+        assert (enc.get_graph_data('netlists', flow_id=keys['flow_id'], stage='cts')
+                == raw.get_graph_data('netlists', flow_id=keys['flow_id'], stage='cts'))
+        assert enc.get_image_manifest('nets', **keys) == raw.get_image_manifest('nets', **keys)
+        loaded = enc.get_entity('nets', **keys)
+        assert np.array_equal(loaded.routing, np.eye(3))
+        assert np.array_equal(loaded.routing_by_metal['M6'], np.ones((2, 2)))
+
+    def test_mismatched_encoding_rejected(self, temp_dir):
+        """Test an image encoded for another store is not written."""
+        import numpy as np
+        from eda_schema.db.image_store import EncodedImage
+
+        db = ParquetDB(str(Path(temp_dir) / "test_db"))
+        image = EncodedImage.encode(entity.Image2D(np.eye(2)), 'zlib')
+        with pytest.raises(ValueError, match="encoded as 'zlib'"):
+            db.add_image('nets', 'routing', image, flow_id='f1', stage='cts', name='n1')
+
+
+class TestTableFilters:
+    """Test filter expressions and keyword filters on table reads."""
+
+    NETS = [('clk', True, None), ('clk_buf', False, 10.0), ('n1', False, 5.0), ('n2', True, 20.0)]
+
+    def _add_nets(self, db, sample_net_data):
+        db.create_dataset_tables()
+        for name, special, length in self.NETS:
+            net = entity.NetEntity(**dict(sample_net_data, name=name, is_special_net=special,
+                                          length=length))
+            db.add_table_row('nets', net.get_tabular_data())
+        if isinstance(db, ParquetDB):
+            db.close()
+
+    @pytest.fixture(params=['parquet-single', 'parquet-partitioned', 'file'])
+    def nets_db(self, request, temp_dir, sample_net_data):
+        path = str(Path(temp_dir) / "test_db")
+        if request.param == 'file':
+            db = FileDB(path)
+        else:
+            db = ParquetDB(path, layout=request.param.split('-')[1])
+        self._add_nets(db, sample_net_data)
+        return db
+
+    @staticmethod
+    def _names(df):
+        return sorted(df['name'])
+
+    def test_keyword_filters(self, nets_db):
+        """Test booleans, IN lists and None keyword filters."""
+        assert self._names(nets_db.get_table_data('nets', is_special_net=True)) == ['clk', 'n2']
+        assert self._names(nets_db.get_table_data('nets', name=['n1', 'clk'])) == ['clk', 'n1']
+        assert self._names(nets_db.get_table_data('nets', length=None)) == ['clk']
+        assert nets_db.get_table_data('nets', name=[]).empty
+
+    def test_where_expressions(self, nets_db):
+        """Test comparisons, prefixes and combinations in where=."""
+        from eda_schema.db.filters import col
+
+        assert self._names(nets_db.get_table_data('nets', where=col('length') > 5)) == [
+            'clk_buf', 'n2']
+        assert self._names(nets_db.get_table_data(
+            'nets', where=col('name').startswith('clk') & col('length').not_null())) == ['clk_buf']
+        assert self._names(nets_db.get_table_data(
+            'nets', stage='floorplan',
+            where=(col('length') < 10) | (col('is_special_net') == True))) == [  # noqa: E712
+            'clk', 'n1', 'n2']
+
+    def test_where_requires_expression(self, nets_db):
+        """Test where= rejects other filter formats."""
+        with pytest.raises(TypeError):
+            nets_db.get_table_data('nets', where=[('length', '>', 5)])
+
+    def test_filters_pushed_into_scan(self, temp_dir, sample_net_data, monkeypatch):
+        """Test IN filters reach the Parquet reader instead of a full load."""
+        import pyarrow.parquet as pq
+
+        from eda_schema.db.parquet import _read_arrow_table
+
+        db = ParquetDB(str(Path(temp_dir) / "test_db"))
+        self._add_nets(db, sample_net_data)
+        _read_arrow_table.cache_clear()
+
+        calls = []
+        read_table = pq.read_table
+        monkeypatch.setattr(pq, 'read_table',
+                            lambda *a, **k: calls.append(k['filters']) or read_table(*a, **k))
+        assert len(db.get_table_data('nets', name=['n1', 'n2'])) == 2
+        assert 'is_in' in str(calls[0])
+
+
+class TestIterTableBatches:
+    """Test streaming table reads."""
+
+    @pytest.fixture(params=['parquet-single', 'parquet-partitioned', 'file', 'sqlite'])
+    def gates_db(self, request, temp_dir, sample_gate_data):
+        from eda_schema.db import SQLitePickleDB
+
+        path = str(Path(temp_dir) / "test_db")
+        if request.param == 'file':
+            db = FileDB(path)
+        elif request.param == 'sqlite':
+            db = SQLitePickleDB(path)
+        else:
+            db = ParquetDB(path, layout=request.param.split('-')[1], row_group_size=4)
+        db.create_dataset_tables()
+        for stage in ['cts', 'route']:
+            for i in range(10):
+                gate = entity.GateEntity(**dict(sample_gate_data, stage=stage, name=f'u{i}',
+                                                no_of_inputs=i))
+                db.add_table_row('gates', gate.get_tabular_data())
+        if isinstance(db, ParquetDB):
+            db.close()
+        return db
+
+    def test_batches_cover_table(self, gates_db):
+        """Test batches are bounded and together hold every matching row."""
+        batches = list(gates_db.iter_table_batches('gates', batch_size=3, stage='route'))
+
+        assert all(0 < len(batch) <= 3 for batch in batches)
+        rows = [row for batch in batches for row in batch['name']]
+        assert sorted(rows) == sorted(f'u{i}' for i in range(10))
+
+    def test_batches_select_columns(self, gates_db):
+        """Test column selection."""
+        batches = list(gates_db.iter_table_batches('gates', columns=['name', 'no_of_inputs']))
+        assert all(list(batch.columns) == ['name', 'no_of_inputs'] for batch in batches)
+        assert sum(len(batch) for batch in batches) == 20
+
+    def test_invalid_batch_size(self, gates_db):
+        """Test non-positive batch sizes are rejected when called."""
+        with pytest.raises(ValueError, match="batch_size"):
+            gates_db.iter_table_batches('gates', batch_size=0)
+
+    def test_parquet_batches_with_where(self, temp_dir, sample_gate_data):
+        """Test ParquetDB streams with filter expressions pushed down."""
+        from eda_schema.db.filters import col
+
+        db = ParquetDB(str(Path(temp_dir) / "test_db"))
+        db.create_dataset_tables()
+        db.add_table_data('gates', [
+            entity.GateEntity(**dict(sample_gate_data, name=f'u{i}', no_of_inputs=i))
+            .get_tabular_data() for i in range(10)])
+        db.close()
+
+        batches = db.iter_table_batches('gates', columns=['name'],
+                                        where=col('no_of_inputs') >= 7)
+        assert [name for batch in batches for name in batch['name']] == ['u7', 'u8', 'u9']
+
+    def test_parquet_batches_missing_table(self, temp_dir):
+        """Test a missing table raises when the iterator is requested."""
+        with pytest.raises(DataNotFoundError):
+            ParquetDB(str(Path(temp_dir) / "test_db")).iter_table_batches('gates')
+
+
+class TestArrowTables:
+    """Test Arrow-native table reads."""
+
+    @pytest.fixture(params=['parquet-single', 'parquet-partitioned', 'file'])
+    def gates_db(self, request, temp_dir, sample_gate_data):
+        path = str(Path(temp_dir) / "test_db")
+        if request.param == 'file':
+            db = FileDB(path)
+        else:
+            db = ParquetDB(path, layout=request.param.split('-')[1])
+        db.create_dataset_tables()
+        for stage in ['cts', 'route']:
+            for i in range(5):
+                gate = entity.GateEntity(**dict(sample_gate_data, stage=stage, name=f'u{i}',
+                                                no_of_inputs=i))
+                db.add_table_row('gates', gate.get_tabular_data())
+        if isinstance(db, ParquetDB):
+            db.close()
+        return db
+
+    def test_get_table_arrow(self, gates_db):
+        """Test Arrow reads return the same rows as DataFrame reads."""
+        import pyarrow as pa
+
+        table = gates_db.get_table_arrow('gates', columns=['name', 'no_of_inputs'],
+                                         stage='route')
+        assert isinstance(table, pa.Table)
+        assert table.column_names == ['name', 'no_of_inputs']
+        assert sorted(table.column('name').to_pylist()) == [f'u{i}' for i in range(5)]
+
+        df = gates_db.get_table_data('gates', stage='route')[['name', 'no_of_inputs']]
+        assert table.to_pandas().sort_values('name').reset_index(drop=True).equals(
+            df.sort_values('name').reset_index(drop=True))
+
+    def test_get_table_arrow_where(self, gates_db):
+        """Test filter expressions apply to Arrow reads."""
+        from eda_schema.db.filters import col
+
+        table = gates_db.get_table_arrow('gates', columns=['name'],
+                                         where=col('no_of_inputs') > 2, stage='cts')
+        assert sorted(table.column('name').to_pylist()) == ['u3', 'u4']
+
+    @pytest.mark.parametrize('pandas_dtypes', ['arrow', 'categorical'])
+    def test_pandas_dtypes(self, temp_dir, sample_gate_data, pandas_dtypes):
+        """Test ParquetDB can return Arrow-backed or categorical DataFrames."""
+        import pandas as pd
+
+        db = ParquetDB(str(Path(temp_dir) / "test_db"), pandas_dtypes=pandas_dtypes)
+        db.create_dataset_tables()
+        db.add_table_row('gates', entity.GateEntity(**sample_gate_data).get_tabular_data())
+        db.close()
+
+        df = db.get_table_data('gates', columns=['name', 'no_of_inputs'])
+        if pandas_dtypes == 'arrow':
+            assert isinstance(df['name'].dtype, pd.ArrowDtype)
+            assert isinstance(df['no_of_inputs'].dtype, pd.ArrowDtype)
+        else:
+            assert isinstance(df['name'].dtype, pd.CategoricalDtype)
+        assert df['name'].tolist() == [sample_gate_data['name']]
+
+        batches = list(db.iter_table_batches('gates', columns=['name']))
+        assert batches[0]['name'].dtype == df['name'].dtype
+
+    def test_invalid_pandas_dtypes(self, temp_dir):
+        """Test unknown pandas dtype modes are rejected."""
+        with pytest.raises(ValueError, match="Unknown pandas dtypes"):
+            ParquetDB(str(temp_dir), pandas_dtypes='polars')
+
+    def test_read_cache_sees_rewritten_file(self, temp_dir, sample_gate_data):
+        """Test the Parquet read cache is keyed by the file's version."""
+        path = str(Path(temp_dir) / "test_db")
+        for name in ['u1', 'u2']:
+            db = ParquetDB(path)
+            db.create_dataset_tables()
+            db.add_table_row('gates', entity.GateEntity(
+                **dict(sample_gate_data, name=name)).get_tabular_data())
+            db.close()
+            assert db.get_table_data('gates')['name'].tolist() == [name]
+
+
+class TestPickleDB:
+    """Test databases can be pickled for worker processes."""
+
+    def test_parquet_db_pickle_requires_commit(self, temp_dir, sample_gate_data):
+        """Test pickling never commits the open session."""
+        import pickle
+
+        db = ParquetDB(str(Path(temp_dir) / "test_db"))
+        db.create_dataset_tables()
+        db.add_table_row('gates', entity.GateEntity(**sample_gate_data).get_tabular_data())
+        with pytest.raises(pickle.PicklingError, match="uncommitted"):
+            pickle.dumps(db)
+        db.rollback()
+        assert ParquetDB(str(Path(temp_dir) / "test_db")).get_table_data('gates').empty
+
+        db.add_table_row('gates', entity.GateEntity(**sample_gate_data).get_tabular_data())
+        db.commit()
+        copy = pickle.loads(pickle.dumps(db))
+        assert copy.get_table_data('gates')['name'].tolist() == [sample_gate_data['name']]
+        assert copy.layout == db.layout
+
+    def test_sqlite_db_pickle_reconnects(self, temp_dir, sample_gate_data):
+        """Test an unpickled SQLitePickleDB opens its own connection."""
+        import pickle
+
+        from eda_schema.db import SQLitePickleDB
+
+        db = SQLitePickleDB(str(Path(temp_dir) / "test_db"))
+        db.create_dataset_tables()
+        db.add_table_row('gates', entity.GateEntity(**sample_gate_data).get_tabular_data())
+
+        copy = pickle.loads(pickle.dumps(db))
+        assert copy.conn is not db.conn
+        assert copy.get_table_data('gates')['name'].tolist() == [sample_gate_data['name']]
+
+
+
+class TestGetEntities:
+    """Test bulk multi-key entity retrieval."""
+
+    @pytest.fixture(params=['parquet', 'parquet-partitioned', 'file', 'sqlite'])
+    def metrics_db(self, request, temp_dir, sample_timing_metrics_data):
+        from eda_schema.db import SQLitePickleDB
+
+        path = str(Path(temp_dir) / "test_db")
+        if request.param == 'file':
+            db = FileDB(path)
+        elif request.param == 'sqlite':
+            db = SQLitePickleDB(path)
+        elif request.param == 'parquet':
+            db = ParquetDB(path)
+        else:
+            db = ParquetDB(path, layout='partitioned')
+        db.create_dataset_tables()
+        for i in range(4):
+            for stage in ['floorplan', 'cts']:
+                db.add_table_row('timing_metrics', entity.TimingMetricsEntity(
+                    **dict(sample_timing_metrics_data, flow_id=f'f{i}', stage=stage,
+                           worst_slack=float(i))).get_tabular_data())
+        return db
+
+    def test_entities_in_key_order(self, metrics_db):
+        """Test entities come back in key order and match get_entity."""
+        keys = [{'flow_id': 'f3', 'stage': 'cts'}, {'flow_id': 'f0', 'stage': 'floorplan'},
+                {'flow_id': 'f2', 'stage': 'cts'}]
+        entities = metrics_db.get_entities('timing_metrics', keys)
+
+        assert [(e.flow_id, e.stage) for e in entities] == [tuple(k.values()) for k in keys]
+        assert [e.worst_slack for e in entities] == [3.0, 0.0, 2.0]
+        assert entities[0] == metrics_db.get_entity('timing_metrics', **keys[0])
+        assert metrics_db.get_entities('timing_metrics', []) == []
+
+    def test_entities_fields(self, metrics_db):
+        """Test unread fields are None and keys are always read."""
+        (metrics,) = metrics_db.get_entities('timing_metrics', [{'flow_id': 'f1', 'stage': 'cts'}],
+                                             fields=['worst_slack'])
+        assert metrics.worst_slack == 1.0
+        assert metrics.flow_id == 'f1' and metrics.stage == 'cts'
+        assert metrics.total_negative_slack is None
+
+    def test_entities_errors(self, metrics_db):
+        """Test missing rows, incomplete keys and unknown fields raise."""
+        with pytest.raises(DataNotFoundError, match="f9"):
+            metrics_db.get_entities('timing_metrics', [{'flow_id': 'f0', 'stage': 'cts'},
+                                                       {'flow_id': 'f9', 'stage': 'cts'}])
+        with pytest.raises(ValueError, match="Missing primary-key values"):
+            metrics_db.get_entities('timing_metrics', [{'flow_id': 'f0'}])
+        with pytest.raises(ValueError, match="Unknown fields"):
+            metrics_db.get_entities('timing_metrics', [{'flow_id': 'f0', 'stage': 'cts'}],
+                                    fields=['slack'])
+
+    @pytest.mark.parametrize('make_db', [
+        lambda path: ParquetDB(path),
+        lambda path: ParquetDB(path, layout='partitioned'),
+        lambda path: FileDB(path),
+    ], ids=['parquet', 'parquet-partitioned', 'file'])
+    def test_graph_entities_with_sub_entities(self, temp_dir, make_db, sample_port_data,
+                                              sample_pin_data):
+        """Test graph entities get graphs and node entities like get_entity."""
+        db = make_db(str(Path(temp_dir) / "test_db"))
+        TestGetGraphDataMany._add_paths(db)  # pylint: disable=protected-access
+        for stage in ['floorplan', 'cts']:
+            for i in range(3):
+                db.add_table_row('ports', entity.PortEntity(**dict(
+                    sample_port_data, flow_id='f1', stage=stage, name=f'in{i}')).get_tabular_data())
+            db.add_table_row('pins', entity.PinEntity(**dict(
+                sample_pin_data, flow_id='f1', stage=stage, name='u1/D')).get_tabular_data())
+
+        keys = [dict(flow_id='f1', stage=stage, startpoint=f'in{i}', endpoint='u1/D',
+                     path_type='max') for i in [2, 0] for stage in ['cts', 'floorplan']]
+        paths = db.get_entities('timing_paths', keys)
+
+        for key, path in zip(keys, paths):
+            expected = db.get_entity('timing_paths', **key)
+            assert path.get_tabular_data() == expected.get_tabular_data()
+            assert list(path.edges) == list(expected.edges)
+            assert path.nodes[key['startpoint']]['entity'].stage == key['stage']
+            pin, expected_pin = path.nodes['u1/D']['entity'], expected.nodes['u1/D']['entity']
+            assert (pin.stage, pin.x_min) == (expected_pin.stage, expected_pin.x_min)
+
+    def test_entities_load_images(self, temp_dir, sample_routability_metrics_data):
+        """Test image fields are loaded from one manifest read."""
+        import numpy as np
+
+        from eda_schema.base import Image2D
+
+        db = ParquetDB(str(Path(temp_dir) / "test_db"))
+        db.create_dataset_tables()
+        keys = []
+        for i in range(3):
+            metrics = entity.RoutabilityMetricsEntity(**dict(
+                sample_routability_metrics_data, flow_id=f'f{i}',
+                rudy_net=Image2D(np.full((2, 2), i, dtype=np.float32))))
+            db.add_table_row('routability_metrics', metrics.get_tabular_data())
+            db.add_entity_images('routability_metrics', metrics)
+            keys.append({'flow_id': f'f{i}', 'stage': metrics.stage})
+        db.close()
+
+        entities = db.get_entities('routability_metrics', keys[::-1])
+        assert [float(e.rudy_net[0, 0]) for e in entities] == [2.0, 1.0, 0.0]
+        assert all(e.rudy_pin is None for e in entities)
@@ -0,0 +1,113 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : tests/unit/test_filters.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""
+Tests for filter expressions.
+"""
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pytest
+
+from eda_schema.db.filters import (
+    And,
+    IsIn,
+    IsNull,
+    Predicate,
+    col,
+    combine_predicates,
+    ensure_predicate,
+    filters_to_predicate,
+)
+
+ROWS = pd.DataFrame({
+    'row': [0, 1, 2, 3, 4],
+    'name': ['clk_buf', 'clk', 'net_1', 'net_2', None],
+    'slack': [-1.5, 0.0, 2.0, None, -0.1],
+    'is_endpoint': [True, False, True, False, True],
+})
+
+PREDICATES = [
+    col('slack') < 0,
+    col('slack') >= 0,
+    col('slack') != 0,
+    col('name').isin(['clk', 'net_2', 'missing']),
+    col('name').isin([]),
+    col('is_endpoint') == True,  # noqa: E712
+    col('slack') == None,  # noqa: E711
+    col('slack').not_null(),
+    col('name').startswith('clk'),
+    col('name').startswith(''),
+    (col('slack') < 0) & col('is_endpoint').isin([True]),
+    (col('slack') > 1) | col('name').startswith('net'),
+    ~(col('slack') < 0),
+    ~col('name').startswith('clk'),
+    ~((col('slack') < 0) | col('is_endpoint').isin([False])),
+    ~((col('slack') > 1) & col('name').startswith('net')),
+    ~(col('slack') == None),  # noqa: E711
+]
+
+
+class TestPredicates:
+    """Test compiling predicates to Arrow expressions and pandas masks."""
+
+    @pytest.mark.parametrize('predicate', PREDICATES, ids=repr)
+    def test_expression_matches_mask(self, predicate):
+        """Test both evaluations select the same rows."""
+        dataset = ds.dataset(pa.Table.from_pandas(ROWS, preserve_index=False))
+        arrow_rows = dataset.to_table(filter=predicate.to_expression())['row'].to_pylist()
+        assert arrow_rows == ROWS[predicate.mask(ROWS)]['row'].tolist()
+
+    def test_negation_excludes_nulls(self):
+        """Test a negated comparison never selects rows where the column is null."""
+        predicate = ~(col('slack') < 0)
+        assert ROWS[predicate.mask(ROWS)]['row'].tolist() == [1, 2]
+
+    def test_predicates_are_hashable(self):
+        """Test equal predicates hash equally (they key read caches)."""
+        assert hash(col('name').isin(['a', 'b'])) == hash(IsIn('name', ('a', 'b')))
+        assert {col('slack') < 0, col('slack') < 0} == {col('slack') < 0}
+
+    def test_unhashable_values(self):
+        """Test values that cannot key a cache are rejected."""
+        with pytest.raises(TypeError, match="'slack' must be hashable"):
+            col('slack') < [0]
+        with pytest.raises(TypeError, match="'name' must be hashable"):
+            col('name').isin([['a'], ['b']])
+
+    def test_predicate_is_abstract(self):
+        """Test the base class cannot be instantiated."""
+        with pytest.raises(TypeError):
+            Predicate()  # pylint: disable=abstract-class-instantiated
+
+    def test_filters_to_predicate(self):
+        """Test keyword filters become equality, IN and null tests."""
+        predicate = filters_to_predicate({'stage': 'cts', 'name': ['a', 'b'], 'x': None})
+        assert predicate == And((col('stage') == 'cts', IsIn('name', ('a', 'b')), IsNull('x')))
+        assert filters_to_predicate({}) is None
+        assert combine_predicates(None, col('x') == 1) == (col('x') == 1)
+
+    def test_prefix_bounds(self):
+        """Test prefix matches add range bounds usable by statistics."""
+        expression = str(col('name').startswith('clk').to_expression())
+        assert 'clk' in expression and 'cll' in expression
+
+    def test_invalid_where(self):
+        """Test where= only accepts predicates."""
+        with pytest.raises(TypeError, match="col()"):
+            ensure_predicate([('slack', '<', 0)])
@@ -0,0 +1,223 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : tests/unit/test_graph.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""
+Tests for the CSR graph backend.
+"""
+import random
+import sys
+
+import networkx as nx
+import pytest
+
+from eda_schema import entity
+from eda_schema.graph import CSRGraph
+
+GRAPH_DATA = {
+    "nodes": ["in", "u1/A", "u1", "u1/Y", "n1", "u2/A", "u2", "out"],
+    "node_types": ["PORT", "PIN", "GATE", "PIN", "NET", "PIN", "GATE", "PORT"],
+    "edges": [
+        ["in", "u1/A"], ["u1/A", "u1"], ["u1", "u1/Y"], ["u1/Y", "n1"],
+        ["n1", "u2/A"], ["u2/A", "u2"], ["u2", "out"], ["n1", "out"],
+        ["n1", "out"],
+    ],
+}
+
+
+def load_netlist(sample_netlist_data, backend):
+    netlist = entity.NetlistEntity(**sample_netlist_data)
+    netlist.load_graph_data(GRAPH_DATA, backend=backend)
+    return netlist
+
+
+class TestCSRGraph:
+    """Test CSRGraph against the NetworkX backend."""
+
+    def test_csr_graph_matches_networkx(self, sample_netlist_data):
+        """Test nodes, edges and neighbors match the NetworkX backend."""
+        nx_netlist = load_netlist(sample_netlist_data, "networkx")
+        csr_netlist = load_netlist(sample_netlist_data, "csr")
+
+        assert csr_netlist.graph_backend == "csr"
+        assert nx_netlist.graph_backend == "networkx"
+        assert list(csr_netlist.nodes) == list(nx_netlist.nodes)
+        assert list(csr_netlist.edges) == list(nx_netlist.edges)
+        assert len(csr_netlist.edges) == len(nx_netlist.edges) == 8
+        assert list(csr_netlist.nodes(data="type")) == list(nx_netlist.nodes(data="type"))
+        assert csr_netlist.nodes["u1"] == {"type": "GATE", "entity": None}
+        for node in nx_netlist.nodes:
+            assert list(csr_netlist.successors(node)) == list(nx_netlist.successors(node))
+            assert list(csr_netlist.predecessors(node)) == list(
+                nx_netlist.predecessors(node)
+            )
+        assert csr_netlist.get_graph_data() == nx_netlist.get_graph_data()
+
+    def test_csr_graph_traversal(self, sample_netlist_data):
+        """Test BFS and DFS visit the same nodes as the NetworkX backend."""
+        nx_netlist = load_netlist(sample_netlist_data, "networkx")
+        csr_netlist = load_netlist(sample_netlist_data, "csr")
+
+        for node in ["in", "n1", "out"]:
+            assert csr_netlist.bfs_traverse(node) == nx_netlist.bfs_traverse(node)
+            assert csr_netlist.dfs_traverse(node, fanin=False) == nx_netlist.dfs_traverse(
+                node, fanin=False
+            )
+
+    def test_csr_graph_node_attrs(self, sample_netlist_data, sample_gate_data):
+        """Test node attributes write back into the graph."""
+        netlist = load_netlist(sample_netlist_data, "csr")
+        gate = entity.GateEntity(**sample_gate_data)
+        netlist.nodes["u1"]["entity"] = gate
+        netlist.nodes["u1"]["weight"] = 2
+
+        assert netlist.nodes["u1"]["entity"] is gate
+        assert dict(netlist.nodes["u1"]) == {"type": "GATE", "entity": gate, "weight": 2}
+        with pytest.raises(KeyError):
+            _ = netlist.nodes["u2"]["weight"]
+
+    def test_csr_graph_subgraph(self, sample_netlist_data):
+        """Test induced subgraphs keep node order, attributes and edges."""
+        netlist = load_netlist(sample_netlist_data, "csr")
+        sub = netlist.subgraph(["out", "n1", "u2/A", "missing"]).copy()
+
+        assert isinstance(sub, CSRGraph)
+        assert list(sub.nodes) == ["n1", "u2/A", "out"]
+        assert list(sub.edges) == [("n1", "u2/A"), ("n1", "out")]
+        assert sub.nodes["out"]["type"] == "PORT"
+        assert sub.in_degree("out") == 1 and sub.out_degree("n1") == 2
+
+    def test_csr_graph_mutation(self):
+        """Test adding nodes and edges after the CSR arrays are built."""
+        graph = CSRGraph()
+        graph.add_node("a", type="NET")
+        graph.add_edge("a", "b")
+        assert list(graph.successors("a")) == ["b"]
+
+        graph.add_edge("b", "c")
+        graph.add_edge("a", "c")
+        assert list(graph.successors("a")) == ["b", "c"]
+        assert list(graph.predecessors("c")) == ["b", "a"]
+        assert graph.nodes["c"]["type"] is None
+        assert graph.has_edge("a", "c") and not graph.has_edge("c", "a")
+
+        with pytest.raises(nx.NetworkXError):
+            list(graph.successors("z"))
+        with pytest.raises(ValueError, match="edge attributes"):
+            graph.add_edge("a", "b", weight=1)
+
+    def test_csr_graph_to_networkx(self, sample_netlist_data):
+        """Test conversion back to a NetworkX DiGraph."""
+        netlist = load_netlist(sample_netlist_data, "csr")
+        graph = netlist.to_networkx()
+
+        assert isinstance(graph, nx.DiGraph)
+        assert nx.is_isomorphic(graph, load_netlist(sample_netlist_data, "networkx")._graph)
+        assert graph.nodes["n1"]["type"] == "NET"
+
+    def test_invalid_graph_backend(self, sample_netlist_data):
+        """Test unknown backends are rejected."""
+        netlist = entity.NetlistEntity(**sample_netlist_data)
+        with pytest.raises(ValueError, match="graph backend"):
+            netlist.load_graph_data(GRAPH_DATA, backend="igraph")
+
+
+def random_graph_data(n_nodes=300, n_edges=900, seed=7):
+    rng = random.Random(seed)
+    nodes = [f"n{i}" for i in range(n_nodes)]
+    edges = [[rng.choice(nodes), rng.choice(nodes)] for _ in range(n_edges)]
+    return {"nodes": nodes, "node_types": ["NET"] * n_nodes, "edges": edges}
+
+
+class TestTraversal:
+    """Test iterative BFS/DFS and multi-source cones."""
+
+    @pytest.fixture
+    def diamond(self, sample_netlist_data):
+        netlist = entity.NetlistEntity(**sample_netlist_data)
+        for u, v in [("a", "b"), ("a", "c"), ("b", "d"), ("d", "e"), ("c", "e")]:
+            netlist.add_edge(u, v)
+        return netlist
+
+    def test_bfs_is_level_order(self, diamond):
+        """Test BFS visits nodes level by level with shortest depths."""
+        assert diamond.bfs_traverse("a", fanin=False) == ["a", "b", "c", "d", "e"]
+        assert diamond.bfs_traverse("a", fanin=False, with_depth=True) == {
+            "a": 0, "b": 1, "c": 1, "d": 2, "e": 2,
+        }
+        assert diamond.bfs_traverse("e", fanout=False, depth_limit=1) == ["e", "d", "c"]
+        assert diamond.bfs_traverse("a", depth_limit=0) == ["a"]
+
+    def test_dfs_is_preorder(self, diamond):
+        """Test DFS follows each branch before the next one."""
+        assert diamond.dfs_traverse("a", fanin=False, with_depth=True) == {
+            "a": 0, "b": 1, "d": 2, "e": 3, "c": 1,
+        }
+        assert diamond.dfs_traverse("a", fanin=False, depth_limit=2) == ["a", "b", "d", "c", "e"]
+
+    def test_multi_source_traversal(self, diamond):
+        """Test a list of start nodes is searched in one traversal."""
+        assert diamond.bfs_traverse(["b", "c"], fanin=False, with_depth=True) == {
+            "b": 0, "c": 0, "d": 1, "e": 1,
+        }
+        assert diamond.dfs_traverse(["c", "b"], fanin=False) == ["c", "e", "b", "d"]
+
+    def test_get_cones(self, diamond):
+        """Test cones of many nodes match one BFS per node."""
+        cones = diamond.get_cones(["e", "d", "b"])
+        assert cones == {
+            "e": ["e", "d", "c", "b", "a"], "d": ["d", "b", "a"], "b": ["b", "a"],
+        }
+        assert diamond.get_cones(["a"], fanin=False, fanout=True, depth_limit=1) == {
+            "a": ["a", "b", "c"],
+        }
+
+    def test_deep_graph_does_not_recurse(self, sample_netlist_data):
+        """Test traversal of a chain deeper than the recursion limit."""
+        netlist = entity.NetlistEntity(**sample_netlist_data)
+        n_nodes = sys.getrecursionlimit() + 100
+        for i in range(n_nodes - 1):
+            netlist.add_edge(f"n{i}", f"n{i + 1}")
+
+        assert len(netlist.dfs_traverse("n0")) == n_nodes
+        assert netlist.bfs_traverse("n0", with_depth=True)[f"n{n_nodes - 1}"] == n_nodes - 1
+
+    @pytest.mark.parametrize("fanin,fanout", [(True, True), (True, False), (False, True)])
+    def test_csr_traversal_matches_networkx(self, sample_netlist_data, fanin, fanout):
+        """Test the vectorized CSR BFS and cones match the NetworkX backend."""
+        data = random_graph_data()
+        nx_graph = entity.NetlistEntity(**sample_netlist_data)
+        nx_graph.load_graph_data(data)
+        csr_graph = entity.NetlistEntity(**sample_netlist_data)
+        csr_graph.load_graph_data(data, backend="csr")
+
+        sources = ["n0", "n5", "n17"]
+        for depth_limit in [-1, 0, 2]:
+            args = (fanin, fanout, depth_limit, True)
+            assert csr_graph.bfs_traverse(sources, *args) == nx_graph.bfs_traverse(sources, *args)
+            assert csr_graph.dfs_traverse(sources, *args) == nx_graph.dfs_traverse(sources, *args)
+
+        cones = csr_graph.get_cones(sources, fanin, fanout)
+        for source in sources:
+            assert set(cones[source]) == set(nx_graph.bfs_traverse(source, fanin, fanout))
+
+    def test_unknown_start_node(self, diamond):
+        """Test traversal from a missing node raises a NetworkX error."""
+        with pytest.raises(nx.NetworkXError):
+            diamond.bfs_traverse("z")
+        with pytest.raises(nx.NetworkXError):
+            diamond.get_cones(["a", "z"])
@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : tests/unit/test_image_batch.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""
+Tests for batched image loading.
+"""
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from eda_schema.base import Image2D
+from eda_schema.dataset import Dataset
+from eda_schema.db import ParquetDB
+from eda_schema.errors import DataNotFoundError
+from eda_schema.image_batch import load_image_batch, pad_image, resize_image
+
+KEYS = [('f1', 'route'), ('f2', 'route')]
+FIELDS = ['rudy_net', 'rudy_pin']
+
+
+@pytest.fixture(params=['npz', 'chunked'])
+def image_db(request, temp_dir):
+    """A ParquetDB holding routability images of different sizes."""
+    db = ParquetDB(str(Path(temp_dir) / "test_db"), image_store=request.param)
+    for i, (flow_id, stage) in enumerate(KEYS):
+        size = 4 * (i + 1)
+        db.add_image('routability_metrics', 'rudy_net',
+                     Image2D(np.full((size, size), i + 1.0)), flow_id=flow_id, stage=stage)
+        db.add_image('routability_metrics', 'rudy_pin',
+                     Image2D(np.arange(size * size).reshape(size, size)),
+                     flow_id=flow_id, stage=stage)
+    db.close()
+    return db
+
+
+class TestFitImage:
+    """Test resizing and padding single images."""
+
+    def test_resize_image(self):
+        """Test bilinear resizing keeps constants and interpolates ramps."""
+        assert np.allclose(resize_image(np.full((3, 5), 2.0), (8, 8)), 2.0)
+
+        ramp = np.array([[0.0, 1.0]])
+        assert np.allclose(resize_image(ramp, (1, 4)), [[0.0, 0.25, 0.75, 1.0]])
+        assert np.allclose(resize_image(np.arange(16.0).reshape(4, 4), (2, 2)),
+                           [[2.5, 4.5], [10.5, 12.5]])
+
+    def test_pad_image(self):
+        """Test padding fills the remainder and cropping keeps the corner."""
+        padded = pad_image(np.ones((2, 3)), (3, 4), fill_value=-1)
+        assert padded.shape == (3, 4)
+        assert padded[:2, :3].sum() == 6 and (padded[2] == -1).all()
+        assert pad_image(np.arange(9.0).reshape(3, 3), (2, 2)).tolist() == [[0, 1], [3, 4]]
+
+
+class TestLoadImageBatch:
+    """Test stacking images of many rows."""
+
+    def test_batch_shape_and_values(self, image_db):
+        """Test images of different sizes are stacked into one array."""
+        batch = load_image_batch(image_db, 'routability_metrics', KEYS, FIELDS, (6, 6))
+
+        assert batch.shape == (2, 2, 6, 6) and batch.dtype == np.float32
+        assert np.allclose(batch[0, 0], 1.0) and np.allclose(batch[1, 0], 2.0)
+
+    def test_batch_pad_mode(self, image_db):
+        """Test pad mode places each image in the top-left corner."""
+        batch = load_image_batch(image_db, 'routability_metrics', KEYS, ['rudy_net'], (6, 6),
+                                 mode='pad', fill_value=-1, workers=1)
+
+        assert (batch[0, 0, :4, :4] == 1).all() and (batch[0, 0, 4:] == -1).all()
+        assert (batch[1, 0] == 2).all()
+
+    def test_batch_accepts_dict_keys(self, image_db):
+        """Test keys may be given as dicts."""
+        keys = [{'flow_id': 'f2', 'stage': 'route'}]
+        batch = load_image_batch(image_db, 'routability_metrics', keys, ['rudy_net'], (2, 2))
+        assert np.allclose(batch, 2.0)
+
+    def test_missing_images(self, image_db):
+        """Test missing images raise by default or keep the fill value."""
+        keys = KEYS + [('f3', 'route')]
+        with pytest.raises(DataNotFoundError):
+            load_image_batch(image_db, 'routability_metrics', keys, FIELDS, (4, 4))
+
+        batch = load_image_batch(image_db, 'routability_metrics', keys, FIELDS, (4, 4),
+                                 missing='fill', fill_value=-1)
+        assert (batch[2] == -1).all()
+
+    def test_cache(self, image_db, temp_dir, monkeypatch):
+        """Test resized images are served from the cache until rewritten."""
+        cache_dir = Path(temp_dir) / "cache"
+        first = load_image_batch(image_db, 'routability_metrics', KEYS, FIELDS, (5, 5),
+                                 cache_dir=cache_dir)
+        assert len(list(cache_dir.glob("*.npy"))) == 4
+
+        get_image = image_db.get_image
+        monkeypatch.setattr(image_db, 'get_image', lambda *a, **k: pytest.fail("cache miss"))
+        cached = load_image_batch(image_db, 'routability_metrics', KEYS, FIELDS, (5, 5),
+                                  cache_dir=cache_dir)
+        assert np.array_equal(first, cached)
+
+        monkeypatch.setattr(image_db, 'get_image', get_image)
+        image_db.add_image('routability_metrics', 'rudy_net', Image2D(np.full((3, 3), 9.0)),
+                           flow_id='f1', stage='route')
+        updated = load_image_batch(image_db, 'routability_metrics', KEYS, FIELDS, (5, 5),
+                                   cache_dir=cache_dir)
+        assert np.allclose(updated[0, 0], 9.0)
+
+    @pytest.mark.parametrize('option', [
+        {'mode': 'stretch'}, {'missing': 'skip'}, {'workers': 0}, {'shape': (0, 4)}])
+    def test_invalid_options(self, image_db, option):
+        """Test invalid options are rejected."""
+        kwargs = dict({'shape': (4, 4)}, **option)
+        with pytest.raises(ValueError):
+            load_image_batch(image_db, 'routability_metrics', KEYS, FIELDS, **kwargs)
+
+    def test_invalid_key(self, image_db):
+        """Test keys must match the entity's primary key."""
+        with pytest.raises(ValueError, match="primary key"):
+            load_image_batch(image_db, 'routability_metrics', [('f1',)], FIELDS, (4, 4))
+
+    def test_dataset_load_image_batch(self, image_db):
+        """Test the Dataset method loads from its database."""
+        batch = Dataset(image_db).load_image_batch('routability_metrics', KEYS, FIELDS, (4, 4))
+        assert batch.shape == (2, 2, 4, 4)
@@ -0,0 +1,164 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : tests/unit/test_image_store.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""
+Tests for chunked image containers.
+"""
+import json
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from eda_schema.base import Image2D
+from eda_schema.db.image_store import (
+    IMAGE_ALIGNMENT,
+    EncodedImage,
+    ImageStore,
+    validate_image_store,
+)
+
+
+@pytest.fixture
+def images():
+    """A few images of different shapes and dtypes."""
+    rng = np.random.default_rng(0)
+    return {
+        'a': Image2D(rng.random((8, 5)).astype(np.float32)),
+        'b': Image2D(rng.integers(0, 100, (3, 7), dtype=np.int16)),
+        'c': Image2D(np.zeros((64, 64))),
+    }
+
+
+class TestImageStore:
+    """Test writing and reading image containers."""
+
+    def test_round_trip_is_memory_mapped(self, temp_dir, images):
+        """Test raw images come back as read-only views of the container."""
+        store = ImageStore(Path(temp_dir) / "images")
+        for image_id, image in images.items():
+            store.put(image_id, image)
+
+        for image_id, image in images.items():
+            loaded = store.get(image_id)
+            assert isinstance(loaded, Image2D)
+            assert loaded.dtype == image.dtype and np.array_equal(loaded, image)
+            assert not loaded.flags.writeable
+            assert isinstance(loaded.base.base, np.memmap)
+        assert store.get('missing') is None
+        assert sorted(p.name for p in store.root.iterdir()) == ['chunk-00000.bin', 'index.jsonl']
+
+    def test_raw_images_are_aligned(self, temp_dir, images):
+        """Test uncompressed images start on an aligned offset."""
+        store = ImageStore(Path(temp_dir) / "images")
+        for image_id, image in images.items():
+            store.put(image_id, image)
+        store.close()
+
+        offsets = [json.loads(line)['offset'] for line in store.index_path.read_text().splitlines()]
+        assert all(offset % IMAGE_ALIGNMENT == 0 for offset in offsets)
+
+    def test_compressed_images(self, temp_dir, images):
+        """Test compressed chunks round-trip and take less space."""
+        store = ImageStore(Path(temp_dir) / "images")
+        store.put('c', images['c'], compress=True)
+        store.close()
+
+        assert store.chunk_path(0).stat().st_size < images['c'].nbytes
+        assert np.array_equal(store.get('c'), images['c'])
+
+    def test_encoded_images(self, temp_dir, images):
+        """Test images compressed ahead of time are stored as zlib chunks."""
+        store = ImageStore(Path(temp_dir) / "images")
+        encoded = EncodedImage.encode(images['b'], 'zlib')
+        assert pickle.loads(pickle.dumps(encoded)).payload == encoded.payload
+        store.put('b', encoded)
+
+        loaded = ImageStore(Path(temp_dir) / "images").get('b')
+        assert loaded.dtype == images['b'].dtype and np.array_equal(loaded, images['b'])
+        with pytest.raises(ValueError, match="encoded as 'npz'"):
+            store.put('a', EncodedImage.encode(images['a'], 'npz'))
+
+    @pytest.mark.parametrize('compress', [False, True])
+    def test_empty_image(self, temp_dir, compress):
+        """Test an empty image round-trips as the only data of a container."""
+        store = ImageStore(Path(temp_dir) / "images")
+        store.put('empty', Image2D(np.zeros((0, 4), dtype=np.int32)), compress=compress)
+        store.close()
+
+        loaded = ImageStore(Path(temp_dir) / "images").get('empty')
+        assert isinstance(loaded, Image2D)
+        assert loaded.shape == (0, 4) and loaded.dtype == np.int32
+
+    def test_chunk_rollover(self, temp_dir, images):
+        """Test a new container is started once one is full."""
+        store = ImageStore(Path(temp_dir) / "images", chunk_bytes=256)
+        for image_id, image in images.items():
+            store.put(image_id, image)
+
+        assert store.location('a') == 'chunk-00000.bin'
+        assert store.location('c') == 'chunk-00002.bin'
+        for image_id, image in images.items():
+            assert np.array_equal(store.get(image_id), image)
+
+    def test_reopen_and_overwrite(self, temp_dir, images):
+        """Test a reopened store reads existing images and appends new ones."""
+        root = Path(temp_dir) / "images"
+        store = ImageStore(root)
+        store.put('a', images['a'])
+        store.close()
+
+        reopened = ImageStore(root)
+        reopened.put('a', images['b'])
+        reopened.put('c', images['c'])
+        reopened.close()
+
+        reader = ImageStore(root)
+        assert reader.ids() == ['a', 'c']
+        assert np.array_equal(reader.get('a'), images['b'])
+
+    def test_reader_sees_later_writes(self, temp_dir, images):
+        """Test an open reader picks up images written after it started."""
+        root = Path(temp_dir) / "images"
+        writer = ImageStore(root)
+        writer.put('a', images['a'])
+        reader = ImageStore(root)
+        assert reader.get('a') is not None
+
+        writer.put('b', images['b'])
+        assert np.array_equal(reader.get('b'), images['b'])
+
+    def test_pickle(self, temp_dir, images):
+        """Test a pickled store reopens its containers."""
+        store = ImageStore(Path(temp_dir) / "images")
+        store.put('a', images['a'])
+        store.get('a')
+
+        copy = pickle.loads(pickle.dumps(store))
+        assert np.array_equal(copy.get('a'), images['a'])
+        copy.put('b', images['b'])
+        assert np.array_equal(store.get('b'), images['b'])
+
+    def test_invalid_options(self, temp_dir):
+        """Test invalid store names and chunk sizes are rejected."""
+        assert validate_image_store('chunked') == 'chunked'
+        with pytest.raises(ValueError, match="Unknown image store"):
+            validate_image_store('zip')
+        with pytest.raises(ValueError, match="chunk_bytes"):
+            ImageStore(temp_dir, chunk_bytes=0)
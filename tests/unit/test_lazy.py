@@ -0,0 +1,152 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : tests/unit/test_lazy.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""
+Tests for lazy-loading proxies.
+"""
+import pickle
+
+import pytest
+
+from eda_schema import entity
+from eda_schema.lazy import (
+    GRAPH_ELEMENT_BYTES,
+    LazyDict,
+    LazyMapping,
+    LazyNetlist,
+    NetlistCache,
+    estimate_netlist_bytes,
+)
+
+
+def make_netlist(sample_netlist_data, stage, n_nodes):
+    """Build a netlist with n_nodes unconnected NET nodes."""
+    netlist = entity.NetlistEntity(**dict(sample_netlist_data, stage=stage))
+    for i in range(n_nodes):
+        netlist.add_node(f'n{i}', type='NET', entity=None)
+    return netlist
+
+
+class TestLazyDict:
+    """Test per-key lazy mappings."""
+
+    def test_lazy_dict_loads_on_access(self):
+        """Test values are loaded once, on first access."""
+        calls = []
+        lazy = LazyDict(['a', 'b'], lambda key: calls.append(key) or key.upper())
+
+        assert list(lazy) == ['a', 'b']
+        assert 'a' in lazy and len(lazy) == 2
+        assert calls == []
+
+        assert lazy['a'] == 'A'
+        assert lazy['a'] == 'A'
+        assert calls == ['a']
+        assert lazy.is_loaded('a') and not lazy.is_loaded('b')
+
+    def test_lazy_dict_missing_key(self):
+        """Test unknown keys raise KeyError without calling the loader."""
+        lazy = LazyDict(['a'], lambda key: pytest.fail("loader called"))
+        with pytest.raises(KeyError):
+            _ = lazy['z']
+
+    def test_lazy_dict_set_and_delete(self):
+        """Test assigned values bypass the loader."""
+        lazy = LazyDict(['a'], str.upper)
+        lazy['b'] = 'bee'
+        del lazy['a']
+        assert dict(lazy) == {'b': 'bee'}
+
+
+class TestLazyMapping:
+    """Test whole-mapping lazy loading."""
+
+    def test_lazy_mapping_loads_once(self):
+        """Test the loader runs on first access only."""
+        calls = []
+        lazy = LazyMapping(lambda: calls.append(1) or {'x': 1})
+
+        assert not lazy.loaded
+        assert 'not loaded' in repr(lazy)
+        assert lazy['x'] == 1
+        assert len(lazy) == 1
+        assert calls == [1]
+        assert lazy.loaded
+
+
+class TestNetlistCache:
+    """Test the memory-bounded netlist LRU."""
+
+    def test_netlist_cache_evicts_lru(self, sample_netlist_data):
+        """Test least-recently-used netlists are evicted over budget."""
+        cache = NetlistCache(memory_budget=25 * GRAPH_ELEMENT_BYTES)
+        netlists = {stage: make_netlist(sample_netlist_data, stage, 10)
+                    for stage in ['floorplan', 'cts', 'final']}
+
+        cache.get(('f', 'floorplan'), lambda: netlists['floorplan'])
+        cache.get(('f', 'cts'), lambda: netlists['cts'])
+        cache.get(('f', 'floorplan'), lambda: pytest.fail("should be cached"))
+        cache.get(('f', 'final'), lambda: netlists['final'])
+
+        assert ('f', 'cts') not in cache
+        assert ('f', 'floorplan') in cache and ('f', 'final') in cache
+        assert cache.nbytes == 20 * GRAPH_ELEMENT_BYTES
+
+    def test_netlist_cache_keeps_latest(self, sample_netlist_data):
+        """Test a netlist larger than the budget is still returned and kept."""
+        cache = NetlistCache(memory_budget=1)
+        netlist = make_netlist(sample_netlist_data, 'cts', 5)
+        assert cache.get(('f', 'cts'), lambda: netlist) is netlist
+        assert len(cache) == 1
+
+    def test_netlist_cache_invalid_budget(self):
+        """Test non-positive budgets are rejected."""
+        with pytest.raises(ValueError, match="memory_budget"):
+            NetlistCache(memory_budget=0)
+
+    def test_estimate_skips_unloaded_mappings(self, sample_netlist_data):
+        """Test unloaded timing paths do not count towards the estimate."""
+        netlist = make_netlist(sample_netlist_data, 'cts', 4)
+        netlist.timing_paths = LazyMapping(lambda: pytest.fail("loaded"))
+        assert estimate_netlist_bytes(netlist) == 4 * GRAPH_ELEMENT_BYTES
+
+
+class TestLazyNetlist:
+    """Test the netlist proxy."""
+
+    def test_lazy_netlist_forwards_attributes(self, sample_netlist_data):
+        """Test attribute access materializes the netlist through the cache."""
+        cache = NetlistCache()
+        netlist = make_netlist(sample_netlist_data, 'cts', 3)
+        proxy = LazyNetlist(cache, ('f', 'cts'), lambda: netlist)
+
+        assert not proxy.loaded
+        assert proxy.no_of_cells == netlist.no_of_cells
+        assert len(proxy.nodes) == 3
+        assert proxy.loaded
+        assert proxy.materialize() is netlist
+
+        proxy.utilization = 0.5
+        assert netlist.utilization == 0.5
+
+    def test_lazy_netlist_pickle_does_not_materialize(self):
+        """Test pickling a proxy does not load the netlist."""
+        proxy = LazyNetlist(NetlistCache(), ('f', 'cts'), dict)
+        restored = pickle.loads(pickle.dumps(proxy))
+        assert not restored.loaded
+        assert 'cts' in repr(restored)
@@ -0,0 +1,129 @@
+# SPDX-License-Identifier: CC-BY-NC-SA-4.0
+# SPDX-FileCopyrightText: Copyright (c) 2026 Drexel University,
+#                         Integrated Circuits and Electronics (ICE) Laboratory
+#
+# Project : EDA-Schema -- Multimodal datamodel for digital circuit design
+# Module  : tests/unit/test_node_store.py
+# Authors :
+#     Pratik Shrestha       <ps937@drexel.edu>
+#
+# Licensed under the Creative Commons Attribution-NonCommercial-ShareAlike
+# 4.0 International License (CC BY-NC-SA 4.0). You may obtain a copy of the
+# license at: https://creativecommons.org/licenses/by-nc-sa/4.0/
+#
+# This software is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. Commercial use is
+# expressly prohibited; derivative works must be shared under the same
+# license terms (ShareAlike).
+
+"""
+Tests for the columnar node store.
+"""
+import pickle
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from eda_schema import entity
+from eda_schema.dataset import Dataset
+from eda_schema.db import ParquetDB
+from eda_schema.node_store import NodeTable, NodeView
+
+
+@pytest.fixture
+def gate_table(sample_gate_data):
+    """NodeTable with two gates."""
+    rows = [sample_gate_data, dict(sample_gate_data, name='gate_002', x_min=1.5)]
+    return NodeTable(entity.GateEntity, pd.DataFrame(rows))
+
+
+class TestNodeTable:
+    """Test NodeTable lookups."""
+
+    def test_rows_for(self, gate_table):
+        """Test names resolve to row positions in one call."""
+        assert list(gate_table.rows_for(['gate_002', 'gate_001'])) == [1, 0]
+        assert len(gate_table) == 2
+
+    def test_from_arrow_table(self, sample_gate_data):
+        """Test Arrow tables build the same store as DataFrames."""
+        rows = [sample_gate_data, dict(sample_gate_data, name='gate_002', x_min=1.5)]
+        table = NodeTable(entity.GateEntity, pa.Table.from_pylist(rows))
+        assert list(table.rows_for(['gate_002'])) == [1]
+        assert table.view(1).x_min == 1.5
+        assert table.view(0) == entity.GateEntity(**sample_gate_data)
+
+    def test_rows_for_missing(self, gate_table):
+        """Test unknown names raise KeyError."""
+        with pytest.raises(KeyError, match="missing_gate"):
+            gate_table.rows_for(['gate_001', 'missing_gate'])
+
+
+class TestNodeView:
+    """Test NodeView row views."""
+
+    def test_view_reads_columns(self, gate_table, sample_gate_data):
+        """Test field access returns Python values from the columns."""
+        view = gate_table.view(1)
+        assert view.name == 'gate_002'
+        assert view.x_min == 1.5
+        assert type(view.no_of_inputs) is int  # pylint: disable=unidiomatic-typecheck
+        assert view.standard_cell == sample_gate_data['standard_cell']
+
+    def test_view_to_entity(self, gate_table, sample_gate_data):
+        """Test views materialize equal entity dataclasses."""
+        view = gate_table.view(0)
+        gate = view.to_entity()
+        assert isinstance(gate, entity.GateEntity)
+        assert gate == entity.GateEntity(**sample_gate_data)
+        assert view == gate
+        assert view.get_tabular_data() == gate.get_tabular_data()
+
+    def test_view_is_read_only(self, gate_table):
+        """Test assignments are rejected."""
+        with pytest.raises(AttributeError, match="read-only"):
+            gate_table.view(0).x_min = 0.0
+
+    def test_view_pickle(self, gate_table):
+        """Test views survive a pickle round trip."""
+        view = pickle.loads(pickle.dumps(gate_table.view(1)))
+        assert isinstance(view, NodeView)
+        assert view.name == 'gate_002'
+
+
+class TestDatasetNodeStore:
+    """Test the Dataset node_store option."""
+
+    def test_invalid_node_store(self, temp_dir):
+        """Test unknown node stores are rejected."""
+        with pytest.raises(ValueError, match="Unknown node store"):
+            Dataset(ParquetDB(str(temp_dir)), node_store='arrow')
+
+    @pytest.mark.parametrize('table_format', ['pandas', 'arrow'])
+    def test_columnar_node_store_attaches_views(self, temp_dir, sample_netlist_data,
+                                                sample_gate_data, sample_net_data,
+                                                table_format):
+        """Test netlist nodes reference NodeView rows."""
+        db = ParquetDB(str(temp_dir))
+        db.create_dataset_tables()
+        netlist = entity.NetlistEntity(**sample_netlist_data)
+        netlist.add_node('gate_001', type='GATE', entity=None)
+        netlist.add_node('net_001', type='NET', entity=None)
+        netlist.add_edge('gate_001', 'net_001')
+        db.add_table_row('netlists', netlist.get_tabular_data())
+        db.add_graph_data('netlists', netlist.get_graph_data(),
+                          flow_id=netlist.flow_id, stage=netlist.stage)
+        db.add_table_row('gates', entity.GateEntity(**sample_gate_data).get_tabular_data())
+        db.add_table_row('nets', entity.NetEntity(**sample_net_data).get_tabular_data())
+
+        dataset = Dataset(db, node_store='columnar', table_format=table_format)
+        netlist_entity = db.get_entity('netlists', load_sub_entities=False,
+                                       flow_id=netlist.flow_id, stage=netlist.stage)
+        dataset._attach_node_tables(netlist_entity, netlist.flow_id, netlist.stage)  # pylint: disable=protected-access
+
+        gate = netlist_entity.nodes['gate_001']['entity']
+        assert isinstance(gate, NodeView)
+        assert isinstance(gate.to_entity(), entity.GateEntity)
+        assert gate.standard_cell == sample_gate_data['standard_cell']
+        assert netlist_entity.nodes['net_001']['entity'].length == sample_net_data['length']